@@ -1,33 +1,41 @@
 """Gestor de Secretos de Azure Key Vault."""
 
-# Logging
-from loguru import logger
+# Sistema
+import os
+import time
 
-# Credenciales Azure
-from azure.identity import DefaultAzureCredential
-
-# Manejo de secretos en Key Vault
-from azure.keyvault.secrets import SecretClient
-from azure.core.exceptions import ResourceNotFoundError, ClientAuthenticationError
+# Tipado
+from typing import Literal
 
 # Pydantic Settings
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
-# Exceptions
-from app.core.exceptions import SecretNotFoundError, SecretEmptyError, AzureAuthError
+# Carga paralela de secretos
+from app.core.secrets import SecretLoader
 
 VAULT_NAME = "posgrado"
 KV_URL = f"https://{VAULT_NAME}.vault.azure.net"
 
-try:
-    logger.debug("Obteniendo credenciales de Azure Key Vault...")
-    credential = DefaultAzureCredential()
-    client = SecretClient(vault_url=KV_URL, credential=credential)
-    logger.debug("Credenciales obtenidas correctamente.")
+# Secretos que Settings necesita; se resuelven juntos en el primer acceso
+SECRET_NAMES: tuple[str, ...] = (
+    "DATABASE-NAME",
+    "DATABASE-PASSWORD",
+    "DATABASE-USER",
+    "DATABASE-HOST",
+    "DATABASE-PORT",
+    "BETTER-STACK-TOKEN",
+    "BETTER-STACK-HOST",
+    "SESSION-SECRET-KEY",
+)
 
-except Exception as e:
-    raise AzureAuthError("Error al obtener credenciales de Azure Key Vault.") from e
+secret_loader = SecretLoader(
+    vault_url=KV_URL,
+    names=SECRET_NAMES,
+    cache_path=os.getenv("SECRETS_CACHE_PATH", ".cache/secrets.bin"),
+    cache_key=os.getenv("SECRETS_CACHE_KEY"),
+    cache_ttl=int(os.getenv("SECRETS_CACHE_TTL", "900")),
+)
 
 def get_secret(name: str) -> str:
     """
@@ -37,24 +45,23 @@ def get_secret(name: str) -> str:
     Returns:
         str: Valor del secreto.
     """
-    logger.debug(f"Obteniendo secreto: {name}")
-    try:
-        secret = client.get_secret(name)
-        if secret.value is None:
-            raise SecretEmptyError(f"Secreto {name} no tiene un valor.")
-        return secret.value
-    except ResourceNotFoundError as e:
-        raise SecretNotFoundError(f"Secreto {name} no encontrado en Key Vault.") from e
-    except ClientAuthenticationError as e:
-        raise AzureAuthError("Error de autenticación al acceder a Key Vault.") from e
+    return secret_loader.get(name)
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Posgrado Backend API"
     GLOBAL_PREFIX: str = "/api/v1"
     STAGE_PREFIX: str = f"{GLOBAL_PREFIX}/stage"
     DASHBOARD_PREFIX: str = f"{GLOBAL_PREFIX}/dashboard"
+    INTERNAL_PREFIX: str = f"{GLOBAL_PREFIX}/internal"
+    # Endpoints de métricas bajo INTERNAL_PREFIX: no se montan salvo que se habiliten;
+    # con INTERNAL_TOKEN exigen la cabecera X-Internal-Token
+    INTERNAL_ENDPOINTS_ENABLED: bool = False
+    INTERNAL_TOKEN: str = ""
     CORS_ORIGINS: list[str] = ["http://localhost:8000", "http://localhost:3000"]
 
+    # Routers a montar: claves de app.factory.ROUTERS o grupos "modules", "dashboard", "stage"
+    ENABLED_MODULES: list[str] = ["*"]
+
     DATABASE_NAME: str = Field(default_factory=lambda: get_secret("DATABASE-NAME"))
     DATABASE_PASSWORD: str = Field(default_factory=lambda: get_secret("DATABASE-PASSWORD"))
     DATABASE_USER: str = Field(default_factory=lambda: get_secret("DATABASE-USER"))
@@ -65,6 +72,71 @@ class Settings(BaseSettings):
     BETTER_STACK_HOST: str = Field(default_factory=lambda: "https://" + get_secret("BETTER-STACK-HOST"))
     SECRET_KEY: str = Field(default_factory=lambda: get_secret("SESSION-SECRET-KEY"))
     LOG_LEVEL: str = "INFO"
+    LOG_IGNORED_LOGGERS: list[str] = []
+
+    # Envío de logs a Better Stack: buffer acotado, lotes por tamaño o intervalo
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 500
+    LOG_FLUSH_INTERVAL: float = 2.0
+    LOG_OVERFLOW_POLICY: Literal["drop", "block"] = "drop"
+
+    # Pool de conexiones; pre-ping "idle" valida solo conexiones inactivas más de DATABASE_PRE_PING_IDLE segundos
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DATABASE_PRE_PING_IDLE: int = 60
+
+    # Motor asíncrono (asyncpg en producción, aiosqlite en pruebas). Los endpoints que usan run_db
+    # corren sobre él sin ocupar el threadpool; exportaciones, cargas y descargas en streaming siguen en el síncrono
+    DATABASE_ASYNC: bool = False
+
+    # Caché por docente del dashboard; se invalida al cambiar los procesos de sus asesorados
+    TEACHER_DASHBOARD_CACHE_TTL: float = 30.0
+
+    # Caché de respuestas de catálogos: "memory" por proceso o "redis" compartido
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CATALOG_CACHE_TTL: float = 300.0
+
+    # Planificador de recordatorios; se ejecuta dentro del lifespan solo si está habilitado
+    REMINDERS_ENABLED: bool = False
+    REMINDER_POLL_INTERVAL: float = 30.0
+    REMINDER_BATCH_SIZE: int = 200
+    REMINDER_MAX_ATTEMPTS: int = 5
+    # Canal de envío "modulo:Clase"; por defecto solo registra en el log
+    REMINDER_SENDER: str = "app.modules.recordatorios.services.sender:LogSender"
+    REMINDER_SEND_HOUR: int = 8
+    REMINDER_LICENSE_NOTICE_DAYS: int = 15
+    REMINDER_STAGE_DEADLINE_DAYS: int = 120
+
+    # Cargas de archivos de tesis: "local" (disco) o "azure" (Blob Storage)
+    UPLOAD_STORAGE: Literal["local", "azure"] = "local"
+    UPLOAD_LOCAL_ROOT: str = "./storage"
+    UPLOAD_AZURE_ACCOUNT_URL: str = ""
+    UPLOAD_AZURE_CONTAINER: str = "tesis"
+    UPLOAD_MAX_SIZE: int = 200 * 1024 * 1024
+    # Bytes acumulados antes de cada escritura al almacenamiento
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    UPLOAD_ALLOWED_EXTENSIONS: tuple[str, ...] = (".pdf",)
+
+    # Cola de trabajos en segundo plano; la ejecuta app.worker
+    JOB_CONCURRENCY: int = 4
+    JOB_POLL_INTERVAL: float = 5.0
+    JOB_LEASE_SECONDS: int = 300
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: int = 30
+    JOB_RETRY_MAX_SECONDS: int = 3600
+
+    # Resoluciones y constancias de otorgamiento de grado, generadas en lote
+    GRANTING_INSTITUTION: str = "Escuela de Posgrado"
+    # Procesos del pool de render; 0 renderiza en el proceso de la API
+    GRANTING_WORKERS: int = 2
+    # Documentos por tarea enviada al pool
+    GRANTING_CHUNK_SIZE: int = 25
+    # Logo JPEG opcional para el encabezado de los documentos
+    GRANTING_LOGO_PATH: str = ""
 
     @property
     def DATABASE_URL(self) -> str:  # pylint: disable=invalid-name
@@ -73,9 +145,18 @@ class Settings(BaseSettings):
             return "sqlite:///./test.db"
         return f"postgresql+psycopg2://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}?sslmode=require"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:  # pylint: disable=invalid-name
+        """URL de la base de datos para el motor asíncrono."""
+        if not self.DATABASE_HOST:
+            return "sqlite+aiosqlite:///./test.db"
+        return f"postgresql+asyncpg://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
     )
 
+_start = time.perf_counter()
 settings = Settings()
+CONFIG_LOAD_MS: float = (time.perf_counter() - _start) * 1000
@@ -1,33 +1,107 @@
 """Conexión a la base de datos y gestión de sesiones."""
 
+# Sistema
+from contextlib import asynccontextmanager
+from typing import Any, Callable, TypeVar
+
 # Logging
 from loguru import logger
 
+# Threadpool de FastAPI para el modo síncrono
+from fastapi.concurrency import run_in_threadpool
+
 # SQLAlchemy y SQLModel
 from sqlmodel import Session, create_engine
 from sqlalchemy.exc import OperationalError, IntegrityError, SQLAlchemyError
 
+# Soporte asíncrono (requiere greenlet y asyncpg/aiosqlite)
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+    from sqlalchemy.util import greenlet_spawn
+    from sqlmodel.ext.asyncio.session import AsyncSession
+except ImportError:
+    AsyncEngine = AsyncSession = create_async_engine = greenlet_spawn = None
+
 # Excepciones personalizadas
-from app.core.exceptions import DatabaseConnectionError, DatabaseQueryError, DatabaseIntegrityError
+from app.core.exceptions import AppError, DatabaseConnectionError, DatabaseQueryError, DatabaseIntegrityError
 
 # Importar configuración
 from app.core.config import settings
 
+# Métricas del pool de conexiones
+from app.core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument
+
+T = TypeVar("T")
+
 DATABASE_URL: str = settings.DATABASE_URL
 
+# Tamaño y reciclaje del pool, comunes al motor síncrono y al asíncrono
+QUEUE_POOL_ARGS = {
+    "pool_size": settings.DATABASE_POOL_SIZE,
+    "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+}
+
 try:
-    # Si es SQLite (para tests), no usamos sslmode
+    # Si es SQLite (para tests), no usamos sslmode ni configuramos el pool
     connect_args = {}
+    pool_args = {}
     if DATABASE_URL and not str(DATABASE_URL).startswith("sqlite"):
         connect_args = {"sslmode": "require"}
+        pool_args = {
+            "poolclass": InstrumentedQueuePool,
+            **QUEUE_POOL_ARGS,
+        }
 
     engine = create_engine(
         DATABASE_URL, echo=False, future=True,
-        pool_pre_ping=True, connect_args=connect_args
+        pool_pre_ping=settings.DATABASE_PRE_PING == "always",
+        connect_args=connect_args, **pool_args
         )
+    instrument(engine, pre_ping=settings.DATABASE_PRE_PING, idle_seconds=settings.DATABASE_PRE_PING_IDLE)
 except OperationalError as e:
     raise DatabaseConnectionError("Error de configuración a la BD.") from e
 
+async_engine: "AsyncEngine | None" = None
+if settings.DATABASE_ASYNC:
+    if create_async_engine is None:
+        raise DatabaseConnectionError("DATABASE_ASYNC requiere instalar sqlalchemy[asyncio].")
+    ASYNC_DATABASE_URL: str = settings.ASYNC_DATABASE_URL
+    try:
+        # asyncpg no entiende sslmode, usa ssl
+        async_connect_args = {}
+        async_pool_args = {}
+        if not ASYNC_DATABASE_URL.startswith("sqlite"):
+            async_connect_args = {"ssl": "require"}
+            async_pool_args = {"poolclass": InstrumentedAsyncQueuePool, **QUEUE_POOL_ARGS}
+
+        # "idle" no activa pool_pre_ping: lo resuelve instrument() al entregar la conexión
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL, echo=False,
+            pool_pre_ping=settings.DATABASE_PRE_PING == "always",
+            connect_args=async_connect_args, **async_pool_args
+            )
+        instrument(async_engine.sync_engine, pre_ping=settings.DATABASE_PRE_PING, idle_seconds=settings.DATABASE_PRE_PING_IDLE)
+    except OperationalError as e:
+        raise DatabaseConnectionError("Error de configuración a la BD asíncrona.") from e
+
+def _database_error(error: Exception) -> AppError | None:
+    """
+    Traduce una excepción de SQLAlchemy a la excepción equivalente de la aplicación.
+    Args:
+        error (Exception): Excepción capturada durante la sesión.
+    Returns:
+        AppError | None: Excepción de la aplicación, o None si no es un error de BD.
+    """
+    if isinstance(error, IntegrityError):
+        return DatabaseIntegrityError("Violación de integridad en la BD.")
+    if isinstance(error, OperationalError):
+        return DatabaseConnectionError("Error de conexión a la BD.")
+    if isinstance(error, SQLAlchemyError):
+        return DatabaseQueryError("Error al ejecutar la consulta en la BD.")
+    return None
+
 def get_session():
     """Proporciona una sesión de base de datos."""
     with Session(engine) as session:
@@ -36,18 +110,55 @@ def get_session():
             session.commit()
             logger.debug("Sesión de base de datos comprometida exitosamente.")
 
-        except IntegrityError as e:
+        except Exception as e:
             session.rollback()
-            raise DatabaseIntegrityError("Violación de integridad en la BD.") from e
+            error = _database_error(e)
+            if error is None:
+                raise
+            raise error from e
 
-        except OperationalError as e:
-            session.rollback()
-            raise DatabaseConnectionError("Error de conexión a la BD.") from e
+@asynccontextmanager
+async def _async_transaction():
+    """AsyncSession con el mismo commit/rollback y traducción de errores que get_session."""
+    if async_engine is None:
+        raise DatabaseConnectionError("El motor asíncrono de BD no está habilitado (DATABASE_ASYNC).")
 
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise DatabaseQueryError("Error al ejecutar la consulta en la BD.") from e
+    async with AsyncSession(async_engine, expire_on_commit=False) as session: # type: ignore[misc]
+        try:
+            yield session
+            await session.commit()
+            logger.debug("Sesión asíncrona de base de datos comprometida exitosamente.")
 
-        except Exception:
-            session.rollback()
-            raise
+        except Exception as e:
+            await session.rollback()
+            error = _database_error(e)
+            if error is None:
+                raise
+            raise error from e
+
+async def get_async_session():
+    """Proporciona una sesión asíncrona de base de datos (requiere DATABASE_ASYNC)."""
+    async with _async_transaction() as session:
+        yield session
+
+async def _get_async_backed_session():
+    """Sesión síncrona de una AsyncSession; solo se usa dentro de run_db."""
+    async with _async_transaction() as session:
+        yield session.sync_session
+
+# Sesión de los servicios que los endpoints ejecutan con run_db. Con DATABASE_ASYNC es la vista
+# síncrona de una AsyncSession sobre el motor asíncrono; si no, la misma de get_session.
+get_db_session = _get_async_backed_session if settings.DATABASE_ASYNC else get_session
+
+async def run_db(function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Ejecuta código de servicio que usa la sesión de get_db_session.
+    Con DATABASE_ASYNC corre en un greenlet sobre el event loop: cada consulta espera al driver
+    asíncrono sin ocupar un hilo del threadpool. Si no, corre en el threadpool como un endpoint síncrono.
+    Args:
+        function (Callable): Función síncrona (p. ej. un método del servicio).
+        *args, **kwargs: Argumentos de la función.
+    """
+    if settings.DATABASE_ASYNC:
+        return await greenlet_spawn(function, *args, **kwargs) # type: ignore[misc]
+    return await run_in_threadpool(function, *args, **kwargs)
@@ -16,6 +16,10 @@ class AzureAuthError(AppError):
     """Error de autenticación con Azure."""
     status_code = 503
 
+class InternalAccessDeniedError(AppError):
+    """Error cuando se llama a un endpoint interno sin el token configurado."""
+    status_code = 403
+
 
 #Errores genericos de la base de datos
 class DatabaseConnectionError(AppError):
@@ -0,0 +1,126 @@
+"""Envío de logs por lotes y sin bloqueo hacia Better Stack."""
+
+# Sistema
+import queue
+import threading
+import time
+from datetime import timezone
+from typing import Any, Callable, Literal
+
+class BatchingSink:
+    """
+    Sink de Loguru con buffer acotado en memoria.
+
+    ``write`` solo encola el registro; un hilo en segundo plano envía lotes cuando
+    se alcanza ``batch_size`` o pasan ``flush_interval`` segundos. Si el buffer se
+    llena, la política ``drop`` descarta el registro y ``block`` espera espacio.
+    """
+
+    def __init__(
+        self,
+        ship: Callable[[list[dict[str, Any]]], Any],
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        overflow: Literal["drop", "block"] = "drop",
+    ) -> None:
+        self.ship = ship
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.shipped = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+        # write() corre en los hilos que loguean y _ship() en el del envío
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="log-shipper", daemon=True)
+        self._worker.start()
+
+    def write(self, message) -> None:
+        """Recibe un mensaje de Loguru y lo encola como frame de Better Stack."""
+        if self._stop.is_set():
+            self._count("dropped")
+            return
+        frame = self._frame(message.record)
+        if self.overflow == "block":
+            self._queue.put(frame)
+            return
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self._count("dropped")
+
+    def stop(self) -> None:
+        """Loguru lo invoca al remover el sink: envía lo pendiente y detiene el hilo."""
+        self._stop.set()
+        self._worker.join(timeout=self.flush_interval + 5)
+
+    def stats(self) -> dict[str, int]:
+        """Contadores de registros enviados, descartados y fallidos."""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "shipped": self.shipped,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """Incrementa un contador por nombre."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def _run(self) -> None:
+        """Arma lotes por tamaño o por intervalo y los envía."""
+        while not self._stop.is_set() or not self._queue.empty():
+            batch: list[dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (self._stop.is_set() and self._queue.empty()):
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=min(remaining, 0.2)))
+                except queue.Empty:
+                    continue
+            if batch:
+                self._ship(batch)
+
+    def _ship(self, batch: list[dict[str, Any]]) -> None:
+        """Envía un lote sin dejar que un error de red detenga el hilo."""
+        self._count("batches")
+        try:
+            response = self.ship(batch)
+            ok = getattr(response, "status_code", 202) < 300
+        except Exception: # pylint: disable=broad-except
+            ok = False
+        self._count("shipped" if ok else "failed", len(batch))
+
+    @staticmethod
+    def _frame(record: dict[str, Any]) -> dict[str, Any]:
+        """Convierte un registro de Loguru al formato de frame de Better Stack."""
+        frame: dict[str, Any] = {
+            "dt": record["time"].astimezone(timezone.utc).isoformat(),
+            "level": record["level"].name.lower(),
+            "message": record["message"],
+            "context": {
+                "runtime": {
+                    "function": record["function"],
+                    "file": record["file"].path,
+                    "line": record["line"],
+                    "logger_name": record["name"],
+                    "thread_name": record["thread"].name,
+                },
+                "system": {"pid": record["process"].id},
+            },
+        }
+        if record["extra"]:
+            frame["extra"] = {k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v) for k, v in record["extra"].items()}
+        if record["exception"] is not None:
+            frame["exception"] = repr(record["exception"].value)
+        return frame
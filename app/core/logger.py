@@ -4,33 +4,64 @@
 import sys
 
 # Logging
-import inspect
 import logging
+from typing import Iterable
 
 # Simplificación de logging
 from loguru import logger
 
 # Integración con Logtail (Better Stack) Logging en la nube
 try:
-    from logtail import LogtailHandler
+    from logtail.uploader import Uploader
 except ImportError:
-    LogtailHandler = None
+    Uploader = None
 
 # Configuración de la aplicación
 from app.core.config import settings
+
+# Envío por lotes hacia Better Stack
+from app.core.log_shipping import BatchingSink
+
+better_stack_sink: BatchingSink | None = None
+
 class InterceptHandler(logging.Handler):
-    """Documentación oficial de Loguru para interceptar logs estándar de logging."""
+    """
+    Documentación oficial de Loguru para interceptar logs estándar de logging.
+
+    Los registros por debajo de ``min_level`` o de loggers en ``ignored`` se descartan
+    antes de llegar a ``emit``, y la traducción de niveles se cachea por nombre.
+    """
+
+    def __init__(self, min_level: int = 0, ignored: Iterable[str] = ()) -> None:
+        super().__init__(level=min_level)
+        self._levels: dict[str, str | int] = {}
+        self._ignored = tuple(ignored)
+        self._ignored_children = tuple(f"{name}." for name in self._ignored)
+        if self._ignored:
+            self.addFilter(self._accept)
+
+    def _accept(self, record: logging.LogRecord) -> bool:
+        """Descarta loggers completos (y sus hijos) antes de emitir."""
+        name = record.name
+        return name not in self._ignored and not name.startswith(self._ignored_children)
+
+    def _level(self, record: logging.LogRecord) -> str | int:
+        """Traduce el nivel de logging al de Loguru una sola vez por nombre."""
+        level = self._levels.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
+        return level
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emite un registro de log."""
-        level: str | int
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+        level = self._level(record)
+
+        frame, depth = sys._getframe(1), 1 # pylint: disable=protected-access
+        while frame and frame.f_code.co_filename == logging.__file__:
             frame = frame.f_back
             depth += 1
 
@@ -38,7 +69,7 @@ class InterceptHandler(logging.Handler):
 
 def setup():
     """Configura el logging de la aplicación."""
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    global better_stack_sink # pylint: disable=global-statement
 
     handlers = [
         {
@@ -47,6 +78,7 @@ def setup():
             "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             "diagnose": False,
             "backtrace": False,
+            "enqueue": True,
         },
         {
             "sink": "logs/app.log",
@@ -57,19 +89,35 @@ def setup():
             "level": "INFO",
             "diagnose": True,
             "backtrace": True,
+            "enqueue": True,
         },
     ]
-    if LogtailHandler and settings.BETTER_STACK_TOKEN:
-        handler_better_stack = LogtailHandler(source_token=settings.BETTER_STACK_TOKEN, host=settings.BETTER_STACK_HOST)
+    better_stack_sink = None
+    if Uploader and settings.BETTER_STACK_TOKEN:
+        # El sink solo encola; el envío ocurre por lotes en su propio hilo
+        better_stack_sink = BatchingSink(
+            ship=Uploader(settings.BETTER_STACK_TOKEN, settings.BETTER_STACK_HOST, timeout=10),
+            max_queue=settings.LOG_QUEUE_SIZE,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL,
+            overflow=settings.LOG_OVERFLOW_POLICY,
+        )
         handlers.append(
             {
-                "sink": handler_better_stack,
+                "sink": better_stack_sink,
                 "level": "INFO",
                 "format": "{message}",
             }
         )
 
     logger.configure(handlers =handlers) # type: ignore
+
+    # Nada por debajo del sink más permisivo llega a Loguru; el nivel en root evita
+    # incluso crear el LogRecord en logging.
+    min_level = min(logger.level(handler["level"]).no for handler in handlers) # type: ignore[arg-type]
+    intercept = InterceptHandler(min_level=min_level, ignored=settings.LOG_IGNORED_LOGGERS)
+    logging.basicConfig(handlers=[intercept], level=min_level, force=True)
+
     logging.getLogger("uvicorn.error").handlers = []
     logging.getLogger("uvicorn.error").propagate = False
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -83,3 +131,16 @@ def setup():
 
     logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+def shutdown():
+    """Vacía las colas de logging antes de cerrar la aplicación."""
+    if better_stack_sink is not None:
+        # Antes de detenerlo: después de stop() este registro se contaría como descartado
+        logger.info(f"Cerrando el envío a Better Stack: {better_stack_sink.stats()}")
+    logger.complete()
+    if better_stack_sink is not None:
+        better_stack_sink.stop()
+
+def shipping_stats() -> dict[str, int] | None:
+    """Contadores del envío a Better Stack, o None si no está configurado."""
+    return better_stack_sink.stats() if better_stack_sink is not None else None
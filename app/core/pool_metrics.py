@@ -0,0 +1,144 @@
+"""Métricas del pool de conexiones alimentadas por eventos de SQLAlchemy."""
+
+# Sistema
+import time
+from threading import Lock
+
+# SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+class PoolMetrics:
+    """Contadores acumulados del pool; los valores instantáneos se leen del propio pool."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reinicia los contadores acumulados."""
+        with self._lock:
+            self.connections_created = 0
+            self.connections_closed = 0
+            self.connections_invalidated = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.pre_pings = 0
+            self.timeouts = 0
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        """Registra cuánto esperó una petición por una conexión del pool."""
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def incr(self, counter: str) -> None:
+        """Incrementa un contador por nombre."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool) -> dict:
+        """
+        Combina el estado actual del pool con los contadores acumulados.
+        Args:
+            pool: Pool de SQLAlchemy del motor instrumentado.
+        Returns:
+            dict: Métricas listas para serializar.
+        """
+        with self._lock:
+            counters = {
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "connections_invalidated": self.connections_invalidated,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "pre_pings": self.pre_pings,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(self.wait_total_ms / self.wait_count, 3) if self.wait_count else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+            }
+        gauges = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            gauges.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # overflow() es negativo mientras el pool no ha alcanzado su tamaño base
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow, # pylint: disable=protected-access
+                "timeout": pool.timeout(),
+            })
+        return {**gauges, **counters}
+
+pool_metrics = PoolMetrics()
+
+class _TimedConnect:
+    """Mide el tiempo de espera para obtener una conexión del pool."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.record_wait((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        pool_metrics.record_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+class InstrumentedQueuePool(_TimedConnect, QueuePool):
+    """QueuePool que mide el tiempo de espera para obtener una conexión."""
+
+class InstrumentedAsyncQueuePool(_TimedConnect, AsyncAdaptedQueuePool):
+    """Equivalente de InstrumentedQueuePool para el motor asíncrono."""
+
+def instrument(engine: Engine, pre_ping: str = "always", idle_seconds: int = 60) -> None:
+    """
+    Registra los eventos del pool que alimentan las métricas.
+    Args:
+        engine (Engine): Motor a instrumentar.
+        pre_ping (str): "idle" valida solo conexiones que pasaron más de idle_seconds sin uso.
+        idle_seconds (int): Umbral de inactividad para el pre-ping "idle".
+    """
+    @event.listens_for(engine, "connect")
+    def on_connect(_dbapi_connection, _connection_record):
+        pool_metrics.incr("connections_created")
+
+    @event.listens_for(engine, "close")
+    def on_close(_dbapi_connection, _connection_record):
+        pool_metrics.incr("connections_closed")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(_dbapi_connection, _connection_record, _exception):
+        pool_metrics.incr("connections_invalidated")
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(_dbapi_connection, connection_record):
+        pool_metrics.incr("checkins")
+        if connection_record is not None:
+            connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, _connection_proxy):
+        pool_metrics.incr("checkouts")
+        if pre_ping != "idle":
+            return
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        pool_metrics.incr("pre_pings")
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            # El pool descarta la conexión y reintenta con una nueva
+            raise DisconnectionError() from e
@@ -0,0 +1,43 @@
+"""Perfilador del arranque de la aplicación."""
+
+# Sistema
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """Registra la duración de cada etapa del arranque (config, import y montaje de routers)."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Registra una duración ya medida."""
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+
+    @contextmanager
+    def measure(self, name: str):
+        """Mide el bloque y lo acumula bajo `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    @property
+    def total_ms(self) -> float:
+        """Duración total registrada."""
+        return sum(self.timings.values())
+
+    def summary(self) -> str:
+        """Resumen de una línea para el log de arranque."""
+        if not self.timings:
+            return "Arranque sin mediciones."
+        slowest = max(self.timings, key=self.timings.__getitem__)
+        return f"Arranque en {self.total_ms:.1f} ms ({len(self.timings)} etapas) | más lenta: {slowest} {self.timings[slowest]:.1f} ms"
+
+    def table(self) -> str:
+        """Detalle por etapa ordenado de mayor a menor duración."""
+        width = max((len(name) for name in self.timings), default=0)
+        lines = [f"{name:<{width}}  {elapsed:>9.2f} ms" for name, elapsed in sorted(self.timings.items(), key=lambda item: item[1], reverse=True)]
+        lines.append(f"{'TOTAL':<{width}}  {self.total_ms:>9.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,195 @@
+"""Carga paralela y cacheada de secretos de Azure Key Vault."""
+
+# Sistema
+import os
+import json
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING
+
+# Logging
+from loguru import logger
+
+# Credenciales Azure
+from azure.identity import DefaultAzureCredential
+
+# Manejo de secretos en Key Vault
+from azure.keyvault.secrets import SecretClient
+from azure.core.exceptions import ResourceNotFoundError, ClientAuthenticationError
+
+# Exceptions
+from app.core.exceptions import SecretNotFoundError, SecretEmptyError, AzureAuthError
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+class SecretLoader:
+    """
+    Obtiene un conjunto declarado de secretos en una sola ronda contra Key Vault.
+
+    El orden de resolución de cada secreto es:
+    1. Variable de entorno con el mismo nombre del secreto (p. ej. ``DATABASE-HOST``).
+    2. Caché local cifrado con Fernet, válido mientras no supere ``cache_ttl`` segundos.
+    3. Key Vault, consultando en paralelo todos los secretos faltantes.
+    """
+
+    def __init__(
+        self,
+        vault_url: str,
+        names: tuple[str, ...],
+        cache_path: str | None = None,
+        cache_key: str | None = None,
+        cache_ttl: int = 900,
+        max_workers: int = 8,
+    ) -> None:
+        self.vault_url = vault_url
+        self.names = names
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_ttl = cache_ttl
+        self.max_workers = max_workers
+        self.latencies: dict[str, float] = {}
+        self.sources: dict[str, str] = {}
+
+        self._fernet: "Fernet | None" = None
+        if cache_key:
+            try:
+                # Cifrado del caché local: solo se importa si el caché está habilitado
+                from cryptography.fernet import Fernet # pylint: disable=import-outside-toplevel,redefined-outer-name
+                self._fernet = Fernet(cache_key)
+            except ImportError:
+                logger.warning("SECRETS_CACHE_KEY requiere el paquete 'cryptography', se omitirá el caché local.")
+            except ValueError:
+                logger.warning("Clave del caché de secretos inválida, se omitirá el caché local.")
+        self._client: SecretClient | None = None
+        self._values: dict[str, str] = {}
+        self._errors: dict[str, Exception] = {}
+        self._loaded = False
+        self._lock = Lock()
+
+    @property
+    def client(self) -> SecretClient:
+        """Crea el cliente de Key Vault solo cuando realmente se necesita."""
+        if self._client is None:
+            try:
+                logger.debug("Obteniendo credenciales de Azure Key Vault...")
+                self._client = SecretClient(vault_url=self.vault_url, credential=DefaultAzureCredential())
+                logger.debug("Credenciales obtenidas correctamente.")
+            except Exception as e:
+                raise AzureAuthError("Error al obtener credenciales de Azure Key Vault.") from e
+        return self._client
+
+    def get(self, name: str) -> str:
+        """
+        Recupera el valor de un secreto, cargando todos los declarados en el primer acceso.
+        Args:
+            name (str): Nombre del secreto a recuperar.
+        Returns:
+            str: Valor del secreto.
+        """
+        self.load()
+        if name not in self._values and name not in self._errors:
+            # Secreto no declarado: se consulta de forma individual
+            if name in os.environ:
+                return os.environ[name]
+            self._store(name, *self._timed_fetch(name))
+        if name in self._errors:
+            raise self._errors[name]
+        return self._values[name]
+
+    def load(self) -> None:
+        """Resuelve todos los secretos declarados una única vez por proceso."""
+        with self._lock:
+            if self._loaded:
+                return
+            start = time.perf_counter()
+
+            pending = []
+            for name in self.names:
+                if name in os.environ:
+                    self._values[name] = os.environ[name]
+                    self.sources[name] = "entorno"
+                else:
+                    pending.append(name)
+
+            cached = self._read_cache()
+            for name in [n for n in pending if n in cached]:
+                self._values[name] = cached[name]
+                self.sources[name] = "cache"
+                pending.remove(name)
+
+            if pending:
+                workers = min(self.max_workers, len(pending))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keyvault") as pool:
+                    for name, result in zip(pending, pool.map(self._timed_fetch, pending)):
+                        self._store(name, *result)
+                self._write_cache()
+
+            self._loaded = True
+            self._report((time.perf_counter() - start) * 1000)
+
+    def _timed_fetch(self, name: str) -> tuple[str | None, Exception | None, float]:
+        """Consulta un secreto en Key Vault midiendo su latencia."""
+        start = time.perf_counter()
+        try:
+            return self._fetch(name), None, (time.perf_counter() - start) * 1000
+        except Exception as e: # pylint: disable=broad-except
+            return None, e, (time.perf_counter() - start) * 1000
+
+    def _fetch(self, name: str) -> str:
+        """Consulta un secreto en Key Vault y traduce los errores de Azure."""
+        try:
+            secret = self.client.get_secret(name)
+            if secret.value is None:
+                raise SecretEmptyError(f"Secreto {name} no tiene un valor.")
+            return secret.value
+        except ResourceNotFoundError as e:
+            raise SecretNotFoundError(f"Secreto {name} no encontrado en Key Vault.") from e
+        except ClientAuthenticationError as e:
+            raise AzureAuthError("Error de autenticación al acceder a Key Vault.") from e
+
+    def _store(self, name: str, value: str | None, error: Exception | None, latency_ms: float) -> None:
+        """Guarda el resultado de una consulta a Key Vault."""
+        self.latencies[name] = latency_ms
+        self.sources[name] = "vault"
+        if error is not None:
+            logger.debug(f"Secreto {name} no se pudo obtener de Key Vault en {latency_ms:.1f} ms: {error}")
+            self._errors[name] = error
+        else:
+            logger.debug(f"Secreto {name} obtenido de Key Vault en {latency_ms:.1f} ms")
+            self._values[name] = value # type: ignore[assignment]
+
+    def _read_cache(self) -> dict[str, str]:
+        """Lee el caché local si existe, está cifrado con la clave actual y no ha expirado."""
+        if not self._fernet or not self.cache_path or not self.cache_path.exists():
+            return {}
+        from cryptography.fernet import InvalidToken # pylint: disable=import-outside-toplevel
+        try:
+            payload = self._fernet.decrypt(self.cache_path.read_bytes(), ttl=self.cache_ttl)
+            return json.loads(payload)
+        except (InvalidToken, ValueError, OSError):
+            logger.debug("Caché de secretos expirado o inválido, se consultará Key Vault.")
+            return {}
+
+    def _write_cache(self) -> None:
+        """Persiste los secretos cifrados; Fernet registra la fecha para validar el TTL."""
+        if not self._fernet or not self.cache_path:
+            return
+        cacheable = {n: v for n, v in self._values.items() if self.sources.get(n) != "entorno"}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._fernet.encrypt(json.dumps(cacheable).encode()))
+        except OSError as e:
+            logger.warning(f"No se pudo escribir el caché de secretos: {e}")
+
+    def _report(self, total_ms: float) -> None:
+        """Resume el origen y la latencia de la carga de secretos."""
+        counts = {source: list(self.sources.values()).count(source) for source in ("entorno", "cache", "vault")}
+        summary = f"Secretos cargados en {total_ms:.1f} ms (entorno: {counts['entorno']}, caché: {counts['cache']}, vault: {counts['vault']})"
+        if self.latencies:
+            slowest = max(self.latencies, key=self.latencies.__getitem__)
+            summary += f" | más lento: {slowest} {self.latencies[slowest]:.1f} ms"
+        logger.info(summary)
@@ -3,49 +3,115 @@
 # Context manager para lifespan
 from contextlib import asynccontextmanager
 
+# Importación diferida de routers
+import sys
+import hmac
+import importlib
+from typing import Iterable
+
 # Logging
 from loguru import logger
 
 # FastAPI y middlewares
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, Depends, FastAPI, Header, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 # Configuración del sistema
-from app.core.config import settings
+from app.core.config import settings, CONFIG_LOAD_MS
 
 # Configuración de logging
-from app.core.logger import setup
+from app.core.logger import setup, shutdown, shipping_stats
 
 # Middleware para logging
 from app.middleware import LoguruMiddleware
 
 # Excepciones personalizadas
-from app.core.exceptions import AppError
-
-# Importar routers de feature modules
-from app.feature_modules.dashboard_estudiantes.controller.router import router as router_dashboard_estudiantes
-from app.feature_modules.dashboard_docentes.controller.router import router as router_dashboard_docentes
-from app.feature_modules.inscripcion.controller.router import router as router_inscripcion
-from app.feature_modules.turnitin.controller.router import router as router_turnitin
-from app.feature_modules.expedito.controller.router import router as router_expedito
-from app.feature_modules.designacion_de_jurados.controller.router import router as router_designacion_jurados
-from app.feature_modules.acto_publico.controller.router import router as router_acto_publico
-from app.feature_modules.cybertesis.controller.router import router as router_cybertesis
-from app.feature_modules.otorgamiento.controller.router import router as router_otorgamiento
-
-# Importar routers módulos
-from app.modules.estudiantes.controller.router import router as router_estudiantes
-from app.modules.docentes.controller.router import router as router_docentes
-from app.modules.documentos.controller.router import router as router_documentos
-from app.modules.proceso.controller.router import router as router_proceso
-from app.modules.recordatorios.controller.router import router as router_recordatorios
-from app.modules.tareas.controller.router import router as router_tareas
-
-
-def create() -> FastAPI:
-    """Crea y configura la aplicación FastAPI."""
+from app.core.exceptions import AppError, InternalAccessDeniedError
+
+# Motor de BD y métricas del pool
+from app.core.database import engine
+from app.core.pool_metrics import pool_metrics
+
+# Perfilador de arranque
+from app.core.profiler import StartupProfiler
+
+# Routers montables: clave -> (módulo del router, prefijo, tag, grupo). Se importan solo si se montan.
+ROUTERS: dict[str, tuple[str, str, str, str]] = {
+    "estudiantes": ("app.modules.estudiantes.controller.router", f"{settings.GLOBAL_PREFIX}/estudiantes", "Estudiantes", "modules"),
+    "docentes": ("app.modules.docentes.controller.router", f"{settings.GLOBAL_PREFIX}/docentes", "Docentes", "modules"),
+    "documentos": ("app.modules.documentos.controller.router", f"{settings.GLOBAL_PREFIX}/documentos", "Documentos", "modules"),
+    "procesos": ("app.modules.proceso.controller.router", f"{settings.GLOBAL_PREFIX}/procesos", "Procesos", "modules"),
+    "recordatorios": ("app.modules.recordatorios.controller.router", f"{settings.GLOBAL_PREFIX}/recordatorios", "Recordatorios", "modules"),
+    "tareas": ("app.modules.tareas.controller.router", f"{settings.GLOBAL_PREFIX}/tareas", "Tareas", "modules"),
+    "archivos": ("app.modules.archivos.controller.router", f"{settings.GLOBAL_PREFIX}/archivos", "Archivos", "modules"),
+    "trabajos": ("app.modules.trabajos.controller.router", f"{settings.GLOBAL_PREFIX}/trabajos", "Trabajos", "modules"),
+    "dashboard_estudiantes": ("app.feature_modules.dashboard_estudiantes.controller.router", f"{settings.DASHBOARD_PREFIX}/estudiantes", "Dashboard: Estudiante", "dashboard"),
+    "dashboard_docentes": ("app.feature_modules.dashboard_docentes.controller.router", f"{settings.DASHBOARD_PREFIX}/docentes", "Dashboard: Docente", "dashboard"),
+    "dashboard_etapas": ("app.feature_modules.dashboard_etapas.controller.router", f"{settings.DASHBOARD_PREFIX}/etapas", "Dashboard: Etapas", "dashboard"),
+    "inscripcion": ("app.feature_modules.inscripcion.controller.router", f"{settings.STAGE_PREFIX}/inscripcion", "Inscripcion", "stage"),
+    "turnitin": ("app.feature_modules.turnitin.controller.router", f"{settings.STAGE_PREFIX}/turnitin", "Turnitin", "stage"),
+    "expedito": ("app.feature_modules.expedito.controller.router", f"{settings.STAGE_PREFIX}/expedito", "Expedito", "stage"),
+    "designacion_de_jurados": ("app.feature_modules.designacion_de_jurados.controller.router", f"{settings.STAGE_PREFIX}/designacion_de_jurados", "Designacion de jurados", "stage"),
+    "acto_publico": ("app.feature_modules.acto_publico.controller.router", f"{settings.STAGE_PREFIX}/acto_publico", "Acto publico", "stage"),
+    "cybertesis": ("app.feature_modules.cybertesis.controller.router", f"{settings.STAGE_PREFIX}/cybertesis", "Cybertesis", "stage"),
+    "otorgamiento": ("app.feature_modules.otorgamiento.controller.router", f"{settings.STAGE_PREFIX}/otorgamiento", "Otorgamiento", "stage"),
+}
+
+# Registro de todos los modelos; se importa una vez al arrancar
+MODELS: str = "app.modules.models"
+
+# Suscriptores del change feed: se importan siempre para que las proyecciones no queden
+# desactualizadas aunque su router no esté montado en esta instancia. Solo importan modelos;
+# cada uno carga su servicio en el primer cambio. Su costo aparece en el perfil de arranque
+# como subscribe:<módulo>
+SUBSCRIBERS: tuple[str, ...] = (
+    "app.feature_modules.dashboard_estudiantes.services.subscribers",
+    "app.feature_modules.dashboard_docentes.services.subscribers",
+    "app.feature_modules.dashboard_etapas.services.subscribers",
+    "app.modules.documentos.services.subscribers",
+    "app.modules.estudiantes.services.subscribers",
+    "app.modules.recordatorios.services.subscribers",
+)
+
+# Módulos con manejadores de trabajos (@job_handler); los importan la API, para validar
+# los tipos al encolar, y app.worker, para ejecutarlos
+JOB_HANDLERS: tuple[str, ...] = (
+    "app.modules.archivos.services.jobs",
+)
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)) -> None:
+    """Exige la cabecera X-Internal-Token cuando INTERNAL_TOKEN está configurado."""
+    if settings.INTERNAL_TOKEN and not hmac.compare_digest(x_internal_token or "", settings.INTERNAL_TOKEN):
+        raise InternalAccessDeniedError("Token interno inválido o ausente.")
+
+def resolve_modules(modules: Iterable[str] | None = None) -> list[str]:
+    """
+    Traduce una lista de routers o grupos ("modules", "dashboard", "stage", "*") a claves de ROUTERS.
+    Args:
+        modules (Iterable[str] | None): Selección explícita; si es None se usa settings.ENABLED_MODULES.
+    Returns:
+        list[str]: Claves de ROUTERS a montar, en el orden declarado.
+    """
+    selected = set(settings.ENABLED_MODULES if modules is None else modules)
+    if "*" in selected:
+        return list(ROUTERS)
+    unknown = selected - set(ROUTERS) - {group for *_, group in ROUTERS.values()}
+    if unknown:
+        raise ValueError(f"Módulos desconocidos: {', '.join(sorted(unknown))}")
+    return [key for key, (*_, group) in ROUTERS.items() if key in selected or group in selected]
+
+def create(modules: Iterable[str] | None = None) -> FastAPI:
+    """
+    Crea y configura la aplicación FastAPI.
+    Args:
+        modules (Iterable[str] | None): Routers o grupos a montar (ver resolve_modules).
+    Returns:
+        FastAPI: Aplicación configurada; el perfil de arranque queda en app.state.startup_profile.
+    """
+    profiler = StartupProfiler()
+    profiler.record("config", CONFIG_LOAD_MS)
 
     @asynccontextmanager
     async def lifespan(_: FastAPI):
@@ -54,26 +120,45 @@ def create() -> FastAPI:
         """
         setup()
         logger.info("Iniciando la aplicación Posgrado Backend...")
+        logger.info(profiler.summary())
+        logger.debug(f"Perfil de arranque:\n{profiler.table()}")
+        scheduler = None
+        if settings.REMINDERS_ENABLED:
+            from app.modules.recordatorios.services.scheduler import ReminderScheduler # pylint: disable=import-outside-toplevel
+            scheduler = ReminderScheduler.from_settings()
+            scheduler.start()
         yield
         logger.info("Cerrando la aplicación Posgrado Backend...")
+        if scheduler is not None:
+            await scheduler.stop()
+        # El pool de render solo existe si se cargó el módulo de otorgamiento
+        granting = sys.modules.get("app.feature_modules.otorgamiento.services.service")
+        if granting is not None:
+            granting.close_rendering_pool()
+        shutdown()
 
     app = FastAPI(title=settings.PROJECT_NAME, version="1.0.0", lifespan=lifespan)
 
-    app.include_router(router_estudiantes, prefix=f"{settings.GLOBAL_PREFIX}/estudiantes", tags=["Estudiantes"])
-    app.include_router(router_docentes, prefix=f"{settings.GLOBAL_PREFIX}/docentes", tags=["Docentes"])
-    app.include_router(router_documentos, prefix=f"{settings.GLOBAL_PREFIX}/documentos", tags=["Documentos"])
-    app.include_router(router_proceso, prefix=f"{settings.GLOBAL_PREFIX}/procesos", tags=["Procesos"])
-    app.include_router(router_recordatorios, prefix=f"{settings.GLOBAL_PREFIX}/recordatorios", tags=["Recordatorios"])
-    app.include_router(router_tareas, prefix=f"{settings.GLOBAL_PREFIX}/tareas", tags=["Tareas"])
-    app.include_router(router_dashboard_estudiantes, prefix=f"{settings.DASHBOARD_PREFIX}/estudiantes", tags=["Dashboard: Estudiante"])
-    app.include_router(router_dashboard_docentes, prefix=f"{settings.DASHBOARD_PREFIX}/docentes", tags=["Dashboard: Docente"])
-    app.include_router(router_inscripcion, prefix=f"{settings.STAGE_PREFIX}/inscripcion", tags=["Inscripcion"])
-    app.include_router(router_turnitin, prefix=f"{settings.STAGE_PREFIX}/turnitin", tags=["Turnitin"])
-    app.include_router(router_expedito, prefix=f"{settings.STAGE_PREFIX}/expedito", tags=["Expedito"])
-    app.include_router(router_designacion_jurados, prefix=f"{settings.STAGE_PREFIX}/designacion_de_jurados", tags=["Designacion de jurados"])
-    app.include_router(router_acto_publico, prefix=f"{settings.STAGE_PREFIX}/acto_publico", tags=["Acto publico"])
-    app.include_router(router_cybertesis, prefix=f"{settings.STAGE_PREFIX}/cybertesis", tags=["Cybertesis"])
-    app.include_router(router_otorgamiento, prefix=f"{settings.STAGE_PREFIX}/otorgamiento", tags=["Otorgamiento"])
+    app.state.startup_profile = profiler
+
+    # Registro de modelos: resuelve las relaciones declaradas por nombre entre módulos
+    with profiler.measure("models"):
+        importlib.import_module(MODELS)
+
+    for module_path in SUBSCRIBERS:
+        with profiler.measure(f"subscribe:{module_path.split('.')[-3]}"):
+            importlib.import_module(module_path)
+
+    for module_path in JOB_HANDLERS:
+        with profiler.measure(f"jobs:{module_path.split('.')[-3]}"):
+            importlib.import_module(module_path)
+
+    for key in resolve_modules(modules):
+        module_path, prefix, tag, _ = ROUTERS[key]
+        with profiler.measure(f"import:{key}"):
+            router = importlib.import_module(module_path).router
+        with profiler.measure(f"mount:{key}"):
+            app.include_router(router, prefix=prefix, tags=[tag])
 
     # CORS (ajusta origins a tu front real)
     app.add_middleware(
@@ -149,4 +234,19 @@ def create() -> FastAPI:
         """Endpoint raíz para verificar que la API está activa."""
         return {"ok": True, "msg": "API de Posgrado activa."}
 
+    if settings.INTERNAL_ENDPOINTS_ENABLED:
+        internal = APIRouter(prefix=settings.INTERNAL_PREFIX, include_in_schema=False, dependencies=[Depends(require_internal_token)])
+
+        @internal.get("/db-pool")
+        def db_pool_metrics():
+            """Estado del pool de conexiones para dimensionarlo con datos reales."""
+            return pool_metrics.snapshot(engine.pool)
+
+        @internal.get("/logs")
+        def log_shipping_metrics():
+            """Contadores del envío de logs por lotes a Better Stack."""
+            return {"better_stack": shipping_stats()}
+
+        app.include_router(internal)
+
     return app
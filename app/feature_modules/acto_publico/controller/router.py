@@ -1,3 +1,36 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.feature_modules.acto_publico.schemas.schema import (
+    DefenseManagement, RescheduleRequest, RoomCreate, RoomManagement, ScheduleReport, ScheduleRequest,
+)
+from app.feature_modules.acto_publico.services.service import DefenseService, get_defense_service
+
+router = APIRouter()
+
+@router.get("/salas", response_model=list[RoomManagement])
+async def list_rooms(service: DefenseService = Depends(get_defense_service)):
+    """Salas registradas para actos públicos."""
+    return await run_db(service.list_rooms)
+
+@router.post("/salas", response_model=RoomManagement, status_code=201)
+async def create_room(room: RoomCreate, service: DefenseService = Depends(get_defense_service)):
+    """Registra una sala."""
+    return await run_db(service.add_room, room)
+
+@router.post("/programacion", response_model=ScheduleReport)
+async def schedule_season(
+    request: ScheduleRequest,
+    service: DefenseService = Depends(get_defense_service),
+):
+    """Programa (y opcionalmente registra) los actos públicos de una temporada sin cruces."""
+    return await run_db(service.schedule, request)
+
+@router.patch("/{process_id}/programacion", response_model=DefenseManagement)
+async def reschedule_defense(
+    process_id: int,
+    request: RescheduleRequest,
+    service: DefenseService = Depends(get_defense_service),
+):
+    """Reprograma un acto al primer turno libre de la ventana, sin tocar los demás."""
+    return await run_db(service.reschedule, process_id, request)
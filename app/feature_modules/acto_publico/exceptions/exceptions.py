@@ -0,0 +1,18 @@
+"""Excepciones del acto público."""
+from app.core.exceptions import AppError
+
+class InvalidSeasonError(AppError):
+    """Error cuando la temporada o la jornada de sustentaciones no es válida."""
+    status_code = 400
+
+class NoActiveRoomsError(AppError):
+    """Error cuando no hay salas activas para programar."""
+    status_code = 400
+
+class DefenseNotFoundError(AppError):
+    """Error cuando el proceso no tiene acto público programado."""
+    status_code = 404
+
+class NoSlotAvailableError(AppError):
+    """Error cuando no hay un horario libre para todos los participantes y alguna sala."""
+    status_code = 409
@@ -0,0 +1,28 @@
+"""Modelo de datos para las salas y la programación de actos públicos."""
+from typing import ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
+
+class Room(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'sala'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_sala", Integer, primary_key=True))
+    name: str = Field(sa_column=Column("nombre", String(100), unique=True, nullable=False))
+    is_active: bool = Field(default=True, sa_column=Column("activo", Boolean, nullable=False))
+
+class Defense(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'acto_publico'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_acto", Integer, primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), unique=True, nullable=False))
+    id_room: int = Field(sa_column=Column("id_sala", Integer, ForeignKey("sala.id_sala"), nullable=False))
+    start: datetime = Field(sa_column=Column("fecha_inicio", DateTime(timezone=False), nullable=False))
+    end: datetime = Field(sa_column=Column("fecha_fin", DateTime(timezone=False), nullable=False))
+
+    __table_args__ = (
+        # Ocupación de una temporada o ventana de reprogramación: WHERE fecha_inicio BETWEEN ...
+        Index("ix_acto_publico_inicio", "fecha_inicio"),
+        Index("ix_acto_publico_sala_inicio", "id_sala", "fecha_inicio"),
+    )
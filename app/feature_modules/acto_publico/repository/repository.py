@@ -0,0 +1,127 @@
+"""Repositorio del acto público."""
+from datetime import date, datetime, timedelta
+from sqlalchemy import bindparam, insert, update
+from sqlmodel import Session, select
+
+from app.shared.bulk import id_in
+from app.shared.locks import LockNamespace, advisory_xact_lock
+from app.feature_modules.acto_publico.models.defense import Defense, Room
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+
+class DefenseRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def add_room(self, room: Room) -> Room:
+        self.session.add(room)
+        self.session.commit()
+        self.session.refresh(room)
+        return room
+
+    def rooms(self, active_only: bool = True) -> list[Room]:
+        statement = select(Room)
+        if active_only:
+            statement = statement.where(Room.is_active)
+        return list(self.session.exec(statement.order_by(Room.id)).all()) # type: ignore[arg-type]
+
+    def get(self, process_id: int) -> Defense | None:
+        return self.session.exec(select(Defense).where(Defense.id_process == process_id)).first()
+
+    def lock_days(self, first: date, last: date) -> None:
+        """
+        Serializa hasta el fin de la transacción las programaciones que tocan los días [first, last].
+        Se incluye el día anterior porque bookings() también lee los actos que empiezan ese día.
+        Sin esto, dos programaciones concurrentes leen la misma agenda libre y reservan el mismo turno.
+        """
+        advisory_xact_lock(self.session, LockNamespace.DEFENSE_SCHEDULE, range(first.toordinal() - 1, last.toordinal() + 1))
+
+    def participants(self, ids: list[int] | None) -> list:
+        """
+        Procesos a programar con su asesor y estudiante.
+        Sin ids, los procesos en curso en la etapa de acto público que aún no tienen fecha.
+        Returns:
+            list: Filas (id, id_advisor, student_id, current_stage, general_status, has_defense).
+        """
+        has_defense = select(Defense.id).where(Defense.id_process == Process.id).exists()
+        statement = (
+            select(Process.id, Process.id_advisor, ProgramStudent.student_id, Process.current_stage, Process.general_status, has_defense.label("has_defense"))
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+        )
+        if ids is None:
+            statement = statement.where(
+                Process.current_stage == ProcessStage.PUBLIC_DEFENSE,
+                Process.general_status == ProcessStatus.IN_PROCESS,
+                ~has_defense,
+            )
+        else:
+            statement = statement.where(id_in(self.session, Process.id, ids))
+        return list(self.session.exec(statement.order_by(Process.id)).all()) # type: ignore[arg-type]
+
+    def jurors(self, ids: list[int]) -> dict[int, list[int]]:
+        """Jurados designados por proceso."""
+        jurors: dict[int, list[int]] = {}
+        if ids:
+            rows = self.session.exec(
+                select(JuryMember.id_process, JuryMember.id_teacher).where(id_in(self.session, JuryMember.id_process, ids))
+            ).all()
+            for process_id, teacher_id in rows:
+                jurors.setdefault(process_id, []).append(teacher_id)
+        return jurors
+
+    def bookings(self, start: datetime, end: datetime, exclude: int | None = None) -> tuple[list, list]:
+        """
+        Actos ya programados que se cruzan con [start, end) y sus jurados.
+        Un acto dura menos de un día, así que basta recorrer ix_acto_publico_inicio desde el día anterior.
+        Returns:
+            tuple: Filas (id_process, id_room, start, end, id_advisor, student_id) y filas (id_process, id_teacher).
+        """
+        window = [
+            Defense.start >= start - timedelta(days=1), # type: ignore[operator]
+            Defense.start < end, # type: ignore[operator]
+            Defense.end > start, # type: ignore[operator]
+        ]
+        if exclude is not None:
+            window.append(Defense.id_process != exclude)
+        defenses = self.session.exec(
+            select(Defense.id_process, Defense.id_room, Defense.start, Defense.end, Process.id_advisor, ProgramStudent.student_id)
+            .join(Process, Process.id == Defense.id_process) # type: ignore[arg-type]
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .where(*window)
+        ).all()
+        jurors = self.session.exec(
+            select(JuryMember.id_process, JuryMember.id_teacher)
+            .join(Defense, Defense.id_process == JuryMember.id_process) # type: ignore[arg-type]
+            .where(*window)
+        ).all()
+        return list(defenses), list(jurors)
+
+    def licenses(self, teacher_ids: list[int]) -> list:
+        """Licencias registradas de los docentes: filas (id, license_start_date, license_end_date)."""
+        if not teacher_ids:
+            return []
+        return list(self.session.exec(
+            select(Teacher.id, Teacher.license_start_date, Teacher.license_end_date)
+            .where(
+                id_in(self.session, Teacher.id, teacher_ids),
+                Teacher.license_start_date.is_not(None), # type: ignore[union-attr]
+                Teacher.license_end_date.is_not(None), # type: ignore[union-attr]
+            )
+        ).all())
+
+    def add_defenses(self, rows: list[dict]) -> None:
+        """Registra actos en bloque (claves por nombre de columna)."""
+        if rows:
+            self.session.connection().execute(insert(Defense.__table__), rows) # type: ignore[attr-defined]
+
+    def set_jury_dates(self, dates: dict[int, datetime]) -> None:
+        """Alinea la fecha de sustentación del jurado con la programación (un executemany)."""
+        if not dates:
+            return
+        table = JuryMember.__table__ # type: ignore[attr-defined]
+        self.session.connection().execute(
+            update(table).where(table.c.id_proceso == bindparam("process_id")).values(fecha_sustentacion=bindparam("defense_date")),
+            [{"process_id": process_id, "defense_date": moment.date()} for process_id, moment in dates.items()],
+        )
@@ -0,0 +1,53 @@
+"""Esquemas para el acto público"""
+from datetime import date, datetime, time
+from pydantic import BaseModel, ConfigDict, Field
+
+class RoomCreate(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+
+
+class RoomManagement(BaseModel):
+    id: int
+    name: str
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlotSettings(BaseModel):
+    """Jornada de sustentaciones: cada acto ocupa un turno de slot_minutes"""
+    day_start: time = time(8, 0)
+    day_end: time = time(20, 0)
+    slot_minutes: int = Field(default=90, ge=30, le=480)
+    weekdays: list[int] = Field(default=[0, 1, 2, 3, 4], min_length=1, description="0 = lunes")
+
+
+class ScheduleRequest(SlotSettings):
+    """Temporada a programar; sin process_ids se toman todos los procesos en acto público sin fecha"""
+    process_ids: list[int] | None = Field(default=None, max_length=5000)
+    start_date: date
+    end_date: date
+    apply: bool = Field(default=False, description="Registra la programación")
+
+
+class RescheduleRequest(SlotSettings):
+    """Nueva ventana para un acto ya programado"""
+    not_before: datetime
+    until: date
+    room_id: int | None = None
+
+
+class DefenseManagement(BaseModel):
+    process_id: int
+    room_id: int | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    error: str | None = None
+
+
+class ScheduleReport(BaseModel):
+    scheduled: int
+    unscheduled: int
+    applied: bool
+    last_day: date | None = None
+    defenses: list[DefenseManagement]
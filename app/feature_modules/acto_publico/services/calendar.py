@@ -0,0 +1,154 @@
+"""
+Calendarios en bitsets para programar actos públicos.
+
+La temporada se divide en turnos de igual duración (SlotGrid); cada docente, estudiante y
+sala tiene un entero cuyo bit i indica que el turno i está ocupado. Buscar el primer turno
+común es un OR de las agendas de los participantes y un AND con la sala.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Hashable, Iterable
+
+def teacher_key(teacher_id: int) -> tuple[str, int]:
+    return ("docente", teacher_id)
+
+def student_key(student_id: int) -> tuple[str, int]:
+    return ("estudiante", student_id)
+
+def room_key(room_id: int) -> tuple[str, int]:
+    return ("sala", room_id)
+
+class SlotGrid:
+    """
+    Turnos de la temporada: días hábiles entre `start` y `end`, de `day_start` a `day_end`.
+    Args:
+        start (date): Primer día.
+        end (date): Último día (incluido).
+        day_start (time): Inicio de la jornada.
+        day_end (time): Fin de la jornada; el último turno incompleto se descarta.
+        slot_minutes (int): Duración de cada acto.
+        weekdays (Iterable[int]): Días de la semana con sustentaciones (0 = lunes).
+    """
+
+    def __init__(self, start: date, end: date, day_start: time, day_end: time, slot_minutes: int, weekdays: Iterable[int] = range(5)) -> None:
+        allowed = set(weekdays)
+        self.days = [start + timedelta(days=n) for n in range((end - start).days + 1) if (start + timedelta(days=n)).weekday() in allowed]
+        self.day_index = {day: i for i, day in enumerate(self.days)}
+        self.day_start = day_start
+        self.slot = timedelta(minutes=slot_minutes)
+        self.slots_per_day = (datetime.combine(start, day_end) - datetime.combine(start, day_start)) // self.slot
+        self.size = len(self.days) * self.slots_per_day
+        self.all = (1 << self.size) - 1
+
+    def start_of(self, slot: int) -> datetime:
+        day, k = divmod(slot, self.slots_per_day)
+        return datetime.combine(self.days[day], self.day_start) + k * self.slot
+
+    def end_of(self, slot: int) -> datetime:
+        return self.start_of(slot) + self.slot
+
+    def _day_range(self, day: int, first: int, last: int) -> int:
+        if first > last:
+            return 0
+        return ((1 << (last - first + 1)) - 1) << (day * self.slots_per_day + first)
+
+    def interval(self, start: datetime, end: datetime) -> int:
+        """Turnos que se cruzan con [start, end)."""
+        mask = 0
+        day = start.date()
+        while day <= end.date():
+            if day in self.day_index:
+                opening = datetime.combine(day, self.day_start)
+                first = max(0, (start - opening) // self.slot)
+                last = min(self.slots_per_day - 1, -((opening - end) // self.slot) - 1)
+                mask |= self._day_range(self.day_index[day], first, last)
+            day += timedelta(days=1)
+        return mask
+
+    def days_between(self, first: date, last: date) -> int:
+        """Todos los turnos de los días entre `first` y `last` (incluidos)."""
+        mask = 0
+        for day, i in self.day_index.items():
+            if first <= day <= last:
+                mask |= self._day_range(i, 0, self.slots_per_day - 1)
+        return mask
+
+    def from_moment(self, moment: datetime) -> int:
+        """Turnos que empiezan en `moment` o después."""
+        mask = 0
+        for day, i in self.day_index.items():
+            opening = datetime.combine(day, self.day_start)
+            if moment > opening:
+                # Turnos de ese día que empiezan antes de `moment` (división con techo)
+                mask |= self._day_range(i, 0, min(self.slots_per_day, -((opening - moment) // self.slot)) - 1)
+        return self.all & ~mask
+
+def lowest(mask: int) -> int:
+    """Posición del bit encendido más bajo (turno más temprano)."""
+    return (mask & -mask).bit_length() - 1
+
+@dataclass(frozen=True)
+class DefenseNeeds:
+    """Participantes de un acto: asesor y jurados (docentes) y el estudiante."""
+    process_id: int
+    teacher_ids: tuple[int, ...]
+    student_id: int
+
+    def keys(self) -> list[Hashable]:
+        return [*map(teacher_key, self.teacher_ids), student_key(self.student_id)]
+
+class Calendar:
+    """Agendas ocupadas por participante y sala sobre una misma SlotGrid."""
+
+    def __init__(self, grid: SlotGrid) -> None:
+        self.grid = grid
+        self.busy: defaultdict[Hashable, int] = defaultdict(int)
+
+    def block(self, key: Hashable, mask: int) -> None:
+        self.busy[key] |= mask
+
+    def free_for(self, keys: Iterable[Hashable]) -> int:
+        taken = 0
+        for key in keys:
+            taken |= self.busy.get(key, 0)
+        return self.grid.all & ~taken
+
+    def book(self, keys: Iterable[Hashable], slot: int) -> None:
+        for key in keys:
+            self.busy[key] |= 1 << slot
+
+    def place(self, needs: DefenseNeeds, rooms: list[int], window: int | None = None) -> tuple[int, int] | None:
+        """
+        Primer turno libre para todos los participantes y alguna sala, sin reservarlo.
+        Returns:
+            tuple[int, int] | None: (id_sala, turno) o None si no hay hueco en la ventana.
+        """
+        people = self.free_for(needs.keys())
+        if window is not None:
+            people &= window
+        best: tuple[int, int] | None = None
+        for room_id in rooms:
+            candidates = people & ~self.busy.get(room_key(room_id), 0)
+            if candidates and (best is None or lowest(candidates) < best[1]):
+                best = (room_id, lowest(candidates))
+        return best
+
+def pack(needs: list[DefenseNeeds], calendar: Calendar, rooms: list[int]) -> tuple[dict[int, tuple[int, int]], list[int]]:
+    """
+    Programa una temporada completa: primero los actos con menos turnos libres en común
+    y cada uno en el turno más temprano disponible, con lo que la temporada queda compacta.
+    Returns:
+        tuple: ({id_proceso: (id_sala, turno)}, procesos sin horario).
+    """
+    order = sorted(needs, key=lambda need: (calendar.free_for(need.keys()).bit_count(), need.process_id))
+    placed: dict[int, tuple[int, int]] = {}
+    unplaced: list[int] = []
+    for need in order:
+        found = calendar.place(need, rooms)
+        if found is None:
+            unplaced.append(need.process_id)
+            continue
+        calendar.book([*need.keys(), room_key(found[0])], found[1])
+        placed[need.process_id] = found
+    return placed, unplaced
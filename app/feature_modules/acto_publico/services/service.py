@@ -0,0 +1,158 @@
+"""Servicios del acto público."""
+from datetime import date, datetime
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.feature_modules.acto_publico.exceptions.exceptions import (
+    DefenseNotFoundError, InvalidSeasonError, NoActiveRoomsError, NoSlotAvailableError,
+)
+from app.feature_modules.acto_publico.models.defense import Room
+from app.feature_modules.acto_publico.repository.repository import DefenseRepository
+from app.feature_modules.acto_publico.schemas.schema import (
+    DefenseManagement, RescheduleRequest, RoomCreate, ScheduleReport, ScheduleRequest, SlotSettings,
+)
+from app.feature_modules.acto_publico.services.calendar import (
+    Calendar, DefenseNeeds, SlotGrid, pack, room_key, student_key, teacher_key,
+)
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+
+# Una temporada más larga no aporta y solo agranda las agendas
+MAX_SEASON_DAYS = 366
+
+def build_grid(settings: SlotSettings, start: date, end: date) -> SlotGrid:
+    """Valida la jornada y la temporada y construye la grilla de turnos."""
+    if end < start:
+        raise InvalidSeasonError("La fecha final es anterior a la inicial")
+    if (end - start).days >= MAX_SEASON_DAYS:
+        raise InvalidSeasonError(f"La temporada no puede superar {MAX_SEASON_DAYS} días")
+    if any(day not in range(7) for day in settings.weekdays):
+        raise InvalidSeasonError("Los días de la semana van de 0 (lunes) a 6 (domingo)")
+    grid = SlotGrid(start, end, settings.day_start, settings.day_end, settings.slot_minutes, settings.weekdays)
+    if grid.size == 0:
+        raise InvalidSeasonError("La jornada no tiene turnos en el rango indicado")
+    return grid
+
+class DefenseService:
+    def __init__(self, repository: DefenseRepository) -> None:
+        self.repository = repository
+
+    def add_room(self, room: RoomCreate) -> Room:
+        return self.repository.add_room(Room(name=room.name))
+
+    def list_rooms(self) -> list[Room]:
+        return self.repository.rooms(active_only=False)
+
+    def _calendar(self, grid: SlotGrid, needs: list[DefenseNeeds], exclude: int | None = None) -> Calendar:
+        """Agendas con los actos ya programados en la grilla y las licencias de los docentes involucrados."""
+        calendar = Calendar(grid)
+        opening, closing = grid.start_of(0), grid.end_of(grid.size - 1)
+        defenses, jurors = self.repository.bookings(opening, closing, exclude)
+        occupied = {}
+        for process_id, room_id, start, end, advisor_id, student_id in defenses:
+            mask = grid.interval(start, end)
+            occupied[process_id] = mask
+            calendar.block(room_key(room_id), mask)
+            calendar.block(teacher_key(advisor_id), mask)
+            calendar.block(student_key(student_id), mask)
+        for process_id, teacher_id in jurors:
+            calendar.block(teacher_key(teacher_id), occupied[process_id])
+        teacher_ids = sorted({teacher_id for need in needs for teacher_id in need.teacher_ids})
+        for teacher_id, first, last in self.repository.licenses(teacher_ids):
+            calendar.block(teacher_key(teacher_id), grid.days_between(first, last))
+        return calendar
+
+    def _rooms(self, room_id: int | None = None) -> list[int]:
+        rooms = [room.id for room in self.repository.rooms() if room_id is None or room.id == room_id]
+        if not rooms:
+            raise NoActiveRoomsError("No hay salas activas para programar" if room_id is None else f"La sala {room_id} no existe o no está activa")
+        return rooms # type: ignore[return-value]
+
+    def schedule(self, request: ScheduleRequest) -> ScheduleReport:
+        """
+        Programa una temporada completa en una sola pasada sobre las agendas en bitsets.
+        Los procesos fuera de la etapa, detenidos, sin jurado o ya programados se reportan con su motivo.
+        Con `apply` los actos se registran en la misma transacción, que retiene el bloqueo de los días
+        de la temporada desde antes de leer las agendas.
+        """
+        grid = build_grid(request, request.start_date, request.end_date)
+        self.repository.lock_days(request.start_date, request.end_date)
+        rooms = self._rooms()
+        ids = None if request.process_ids is None else list(dict.fromkeys(request.process_ids))
+        rows = {row.id: row for row in self.repository.participants(ids)}
+        order = ids if ids is not None else list(rows)
+        jurors = self.repository.jurors(list(rows))
+
+        errors: dict[int, str] = {}
+        needs = []
+        for process_id in order:
+            row = rows.get(process_id)
+            if row is None:
+                errors[process_id] = "El proceso no existe"
+            elif row.current_stage != ProcessStage.PUBLIC_DEFENSE:
+                errors[process_id] = f"El proceso está en la etapa {row.current_stage.value}"
+            elif row.general_status != ProcessStatus.IN_PROCESS:
+                errors[process_id] = f"El proceso está {row.general_status.value}"
+            elif row.has_defense:
+                errors[process_id] = "El proceso ya tiene acto público programado"
+            elif process_id not in jurors:
+                errors[process_id] = "El proceso no tiene jurado designado"
+            else:
+                needs.append(DefenseNeeds(process_id, (row.id_advisor, *jurors[process_id]), row.student_id))
+
+        placed, unplaced = pack(needs, self._calendar(grid, needs), rooms)
+        for process_id in unplaced:
+            errors[process_id] = "No hay un turno común libre para asesor, jurados, estudiante y sala"
+
+        if request.apply and placed:
+            self.repository.add_defenses([
+                {"id_proceso": process_id, "id_sala": room_id, "fecha_inicio": grid.start_of(slot), "fecha_fin": grid.end_of(slot)}
+                for process_id, (room_id, slot) in placed.items()
+            ])
+            self.repository.set_jury_dates({process_id: grid.start_of(slot) for process_id, (_, slot) in placed.items()})
+            self.repository.session.commit()
+
+        return ScheduleReport(
+            scheduled=len(placed),
+            unscheduled=len(errors),
+            applied=request.apply and bool(placed),
+            last_day=grid.start_of(max(slot for _, slot in placed.values())).date() if placed else None,
+            defenses=[
+                DefenseManagement(
+                    process_id=process_id, error=errors.get(process_id),
+                    **({"room_id": placed[process_id][0], "start": grid.start_of(placed[process_id][1]),
+                        "end": grid.end_of(placed[process_id][1])} if process_id in placed else {}),
+                )
+                for process_id in order
+            ],
+        )
+
+    def reschedule(self, process_id: int, request: RescheduleRequest) -> DefenseManagement:
+        """
+        Mueve un acto al primer turno libre desde `not_before`. Solo se cargan los actos de la
+        ventana y se busca un hueco para este; el resto de la temporada no se recalcula. Los días de la
+        ventana quedan bloqueados hasta el commit.
+        """
+        defense = self.repository.get(process_id)
+        if defense is None:
+            raise DefenseNotFoundError(f"El proceso {process_id} no tiene acto público programado")
+        grid = build_grid(request, request.not_before.date(), request.until)
+        self.repository.lock_days(request.not_before.date(), request.until)
+        rooms = self._rooms(request.room_id)
+        row = self.repository.participants([process_id])[0]
+        need = DefenseNeeds(process_id, (row.id_advisor, *self.repository.jurors([process_id]).get(process_id, [])), row.student_id)
+
+        found = self._calendar(grid, [need], exclude=process_id).place(need, rooms, grid.from_moment(request.not_before))
+        if found is None:
+            raise NoSlotAvailableError("No hay un turno común libre en la ventana indicada")
+        room_id, slot = found
+        defense.id_room, defense.start, defense.end = room_id, grid.start_of(slot), grid.end_of(slot)
+        self.repository.session.add(defense)
+        self.repository.set_jury_dates({process_id: defense.start})
+        self.repository.session.commit()
+        return DefenseManagement(process_id=process_id, room_id=room_id, start=defense.start, end=defense.end)
+
+def get_defense_service(session: Session = Depends(get_db_session)) -> DefenseService:
+    """Dependencia que construye el servicio del acto público."""
+    return DefenseService(DefenseRepository(session))
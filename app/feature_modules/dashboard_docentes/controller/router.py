@@ -1,3 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.feature_modules.dashboard_docentes.schemas.schema import TeacherDashboardView
+from app.feature_modules.dashboard_docentes.services.service import TeacherDashboardService, get_teacher_dashboard_service
+
+router = APIRouter()
+
+@router.get("/{teacher_id}", response_model=TeacherDashboardView)
+async def get_teacher_dashboard(
+    teacher_id: int,
+    service: TeacherDashboardService = Depends(get_teacher_dashboard_service),
+):
+    """Dashboard del docente con sus asesorados por etapa y estado."""
+    return await run_db(service.get_dashboard, teacher_id)
@@ -0,0 +1,6 @@
+"""Excepciones del dashboard del docente."""
+from app.core.exceptions import AppError
+
+class TeacherDashboardNotFoundError(AppError):
+    """Error cuando el docente no existe."""
+    status_code = 404
@@ -0,0 +1,54 @@
+"""Repositorio del dashboard del docente."""
+from sqlmodel import Session, select, and_, or_, func
+
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.proceso.models.process import Process
+
+# Documento que aún espera recepción o entrega
+PENDING_DOCUMENT = or_(
+    ExternalProcessDocument.reception_status == ReceptionStatus.NO_RECIBIDO,
+    ExternalProcessDocument.delivery_status == DeliveryStatus.NO_ENTREGADO,
+)
+
+class TeacherDashboardRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_teacher(self, teacher_id: int) -> Teacher | None:
+        """Busca el docente por clave primaria."""
+        return self.session.get(Teacher, teacher_id)
+
+    def advisee_breakdown(self, teacher_id: int) -> list:
+        """
+        Cuenta procesos y documentos pendientes por etapa y estado en una sola consulta agrupada.
+        Usa ix_proceso_tesis_asesor_etapa_estado para filtrar y agrupar.
+        Returns:
+            list: Filas (stage, status, processes, pending_documents).
+        """
+        statement = (
+            select(
+                Process.current_stage.label("stage"), # type: ignore[attr-defined]
+                Process.general_status.label("status"), # type: ignore[attr-defined]
+                func.count(func.distinct(Process.id)).label("processes"),
+                func.count(ExternalProcessDocument.id).label("pending_documents"),
+            )
+            .outerjoin(ExternalProcessDocument, and_(ExternalProcessDocument.id_process == Process.id, PENDING_DOCUMENT))
+            .where(Process.id_advisor == teacher_id)
+            .group_by(Process.current_stage, Process.general_status)
+            .order_by(Process.current_stage, Process.general_status)
+        )
+        return list(self.session.exec(statement).all())
+
+    def advisors_of(self, changes: dict[type, set[int]]) -> set[int]:
+        """Traduce ids cambiados de docentes, procesos y documentos a ids de asesor."""
+        advisor_ids = set(changes.get(Teacher, ()))
+        if ids := changes.get(Process):
+            advisor_ids.update(self.session.exec(select(Process.id_advisor).where(Process.id.in_(ids))).all()) # type: ignore[union-attr]
+        if ids := changes.get(ExternalProcessDocument):
+            advisor_ids.update(self.session.exec(
+                select(Process.id_advisor)
+                .join(ExternalProcessDocument, ExternalProcessDocument.id_process == Process.id) # type: ignore[arg-type]
+                .where(ExternalProcessDocument.id.in_(ids)) # type: ignore[union-attr]
+            ).all())
+        return advisor_ids
@@ -0,0 +1,18 @@
+"""Esquemas para el dashboard del docente"""
+from pydantic import BaseModel
+
+from app.modules.docentes.schemas.schema import TeacherDashboard
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+
+class AdviseeGroup(BaseModel):
+    """Asesorados de una etapa y estado, con sus documentos pendientes"""
+    stage: ProcessStage
+    status: ProcessStatus
+    processes: int
+    pending_documents: int
+
+class TeacherDashboardView(TeacherDashboard):
+    """Dashboard del docente con el resumen de sus asesorados"""
+    advisees: int = 0
+    pending_documents: int = 0
+    breakdown: list[AdviseeGroup] = []
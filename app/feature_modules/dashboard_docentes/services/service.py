@@ -0,0 +1,38 @@
+"""Servicios del dashboard del docente."""
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.shared.cache import TTLCache
+from app.feature_modules.dashboard_docentes.exceptions.exceptions import TeacherDashboardNotFoundError
+from app.feature_modules.dashboard_docentes.repository.repository import TeacherDashboardRepository
+from app.feature_modules.dashboard_docentes.schemas.schema import AdviseeGroup, TeacherDashboardView
+from app.modules.docentes.schemas.schema import TeacherDashboard
+
+# Dashboard por id de docente
+dashboard_cache = TTLCache(ttl=settings.TEACHER_DASHBOARD_CACHE_TTL)
+
+class TeacherDashboardService:
+    def __init__(self, repository: TeacherDashboardRepository) -> None:
+        self.repository = repository
+
+    def get_dashboard(self, teacher_id: int) -> TeacherDashboardView:
+        """Devuelve el dashboard del docente desde la caché o lo calcula."""
+        return dashboard_cache.get_or_set(teacher_id, lambda: self._build(teacher_id))
+
+    def _build(self, teacher_id: int) -> TeacherDashboardView:
+        teacher = self.repository.get_teacher(teacher_id)
+        if teacher is None:
+            raise TeacherDashboardNotFoundError(f"No existe el docente {teacher_id}.")
+        breakdown = [AdviseeGroup.model_validate(row, from_attributes=True) for row in self.repository.advisee_breakdown(teacher_id)]
+        return TeacherDashboardView(
+            **TeacherDashboard.model_validate(teacher).model_dump(),
+            advisees=sum(group.processes for group in breakdown),
+            pending_documents=sum(group.pending_documents for group in breakdown),
+            breakdown=breakdown,
+        )
+
+def get_teacher_dashboard_service(session: Session = Depends(get_db_session)) -> TeacherDashboardService:
+    """Dependencia que construye el servicio del dashboard del docente."""
+    return TeacherDashboardService(TeacherDashboardRepository(session))
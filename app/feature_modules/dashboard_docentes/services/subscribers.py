@@ -0,0 +1,23 @@
+"""
+Suscriptor del change feed del dashboard del docente.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import on_commit, subscribe
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.documentos.models.document import ExternalProcessDocument
+from app.modules.proceso.models.process import Process
+
+# El historial de id_asesor entrega el asesor anterior de una reasignación, y el de un proceso borrado
+@subscribe(
+    Teacher, Process, ExternalProcessDocument,
+    references={Process: ("id_advisor", Teacher), ExternalProcessDocument: ("id_process", Process)},
+)
+def invalidate_teacher_dashboards(session: Session, changes: dict[type, set[int]]) -> None:
+    """Descarta el dashboard de los asesores afectados una vez confirmado el cambio."""
+    from app.feature_modules.dashboard_docentes.repository.repository import TeacherDashboardRepository # pylint: disable=import-outside-toplevel
+    from app.feature_modules.dashboard_docentes.services.service import dashboard_cache # pylint: disable=import-outside-toplevel
+    advisor_ids = TeacherDashboardRepository(session).advisors_of(changes)
+    if advisor_ids:
+        on_commit(session, lambda: dashboard_cache.invalidate(advisor_ids))
@@ -1,3 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.feature_modules.dashboard_estudiantes.schemas.schema import StudentDashboardView
+from app.feature_modules.dashboard_estudiantes.services.service import StudentDashboardService, get_student_dashboard_service
+
+router = APIRouter()
+
+@router.get("/{student_id}", response_model=StudentDashboardView)
+async def get_student_dashboard(
+    student_id: int,
+    service: StudentDashboardService = Depends(get_student_dashboard_service),
+):
+    """Dashboard del estudiante servido desde la proyección, con su antigüedad."""
+    return await run_db(service.get_dashboard, student_id)
@@ -0,0 +1,6 @@
+"""Excepciones del dashboard del estudiante."""
+from app.core.exceptions import AppError
+
+class StudentDashboardNotFoundError(AppError):
+    """Error cuando el estudiante no existe o no está matriculado en ningún programa."""
+    status_code = 404
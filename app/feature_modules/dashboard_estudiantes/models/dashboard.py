@@ -0,0 +1,19 @@
+"""Modelo de lectura desnormalizado del dashboard del estudiante."""
+from typing import Any, ClassVar
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, DateTime, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+class StudentDashboardProjection(SQLModel, table=True):
+    """
+    Una fila por estudiante con el dashboard ya armado.
+    Se reconstruye desde app.feature_modules.dashboard_estudiantes.services.service
+    cada vez que cambian sus filas de origen.
+    """
+    __tablename__: ClassVar[str] = 'dashboard_estudiante'
+
+    student_id: int = Field(sa_column=Column("id_estudiante", Integer, primary_key=True, autoincrement=False))
+    data: dict[str, Any] = Field(sa_column=Column("datos", JSON().with_variant(JSONB(), "postgresql"), nullable=False))
+    refreshed_at: datetime = Field(default_factory=datetime.now, sa_column=Column("actualizado_en", DateTime(timezone=False), nullable=False))
@@ -0,0 +1,132 @@
+"""Repositorio de la proyección del dashboard del estudiante."""
+from typing import Any, Iterable
+
+from datetime import datetime
+from sqlalchemy import delete
+from sqlmodel import Session, select, or_
+
+from app.shared.bulk import upsert
+from app.feature_modules.dashboard_estudiantes.models.dashboard import StudentDashboardProjection
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.estudiantes.models.student import Student
+from app.modules.proceso.models.process import Process
+
+class StudentDashboardRepository:
+    """
+    Lecturas de las tablas de origen y escritura de la proyección.
+    Lee solo columnas y escribe con sentencias Core, así puede ejecutarse dentro de un flush.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, student_id: int) -> StudentDashboardProjection | None:
+        """Busca la proyección por clave primaria."""
+        return self.session.get(StudentDashboardProjection, student_id)
+
+    def affected_students(self, changes: dict[type, set[int]]) -> set[int]:
+        """
+        Traduce los ids cambiados de cada tabla de origen a ids de estudiante.
+        Args:
+            changes (dict[type, set[int]]): Ids cambiados por modelo.
+        Returns:
+            set[int]: Estudiantes cuyo dashboard debe reconstruirse.
+        """
+        student_ids = set(changes.get(Student, ()))
+        statements = []
+        if ids := changes.get(ProgramStudent):
+            statements.append(select(ProgramStudent.student_id).where(ProgramStudent.id.in_(ids))) # type: ignore[union-attr]
+        if ids := changes.get(Program):
+            statements.append(select(ProgramStudent.student_id).where(ProgramStudent.program_id.in_(ids))) # type: ignore[attr-defined]
+        if ids := changes.get(Process):
+            statements.append(
+                select(ProgramStudent.student_id)
+                .join(Process, Process.id_student_program == ProgramStudent.id) # type: ignore[arg-type]
+                .where(Process.id.in_(ids)) # type: ignore[union-attr]
+            )
+        if ids := changes.get(ExternalProcessDocument):
+            statements.append(
+                select(ProgramStudent.student_id)
+                .join(Process, Process.id_student_program == ProgramStudent.id) # type: ignore[arg-type]
+                .join(ExternalProcessDocument, ExternalProcessDocument.id_process == Process.id) # type: ignore[arg-type]
+                .where(ExternalProcessDocument.id.in_(ids)) # type: ignore[union-attr]
+            )
+        for statement in statements:
+            student_ids.update(self.session.exec(statement).all())
+        return student_ids
+
+    def load_sources(self, student_ids: Iterable[int]) -> dict[str, list]:
+        """
+        Lee en cuatro consultas todo lo necesario para armar los dashboards de un lote de estudiantes.
+        Returns:
+            dict[str, list]: Filas de "students", "programs", "processes" y "documents".
+        """
+        ids = list(student_ids)
+        students = self.session.exec(
+            select(
+                Student.id, Student.name, Student.paternal_surname, Student.maternal_surname, Student.status,
+                Student.identity_document, Student.type_document, Student.nationality, Student.phone,
+                Student.academic_email, Student.personal_email,
+            ).where(Student.id.in_(ids)) # type: ignore[union-attr]
+        ).all()
+        programs = self.session.exec(
+            select(
+                ProgramStudent.id, ProgramStudent.student_id, ProgramStudent.code, ProgramStudent.status,
+                ProgramStudent.curriculum, ProgramStudent.admission_year, ProgramStudent.graduation_year,
+                Program.id.label("program_id"), Program.name.label("program_name"), Program.degree, Program.mention, # type: ignore[union-attr, attr-defined]
+            )
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+            .where(ProgramStudent.student_id.in_(ids)) # type: ignore[attr-defined]
+            .order_by(ProgramStudent.admission_year, ProgramStudent.id) # type: ignore[arg-type]
+        ).all()
+        processes = self.session.exec(
+            select(
+                Process.id, ProgramStudent.student_id, Process.current_thesis_title, Process.general_status,
+                Process.current_stage, Process.start_date, Process.end_date,
+            )
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .where(ProgramStudent.student_id.in_(ids)) # type: ignore[attr-defined]
+            .order_by(Process.start_date, Process.id) # type: ignore[arg-type]
+        ).all()
+        # El último proceso de cada estudiante es el que se muestra
+        latest_process = {row.student_id: row.id for row in processes}
+        documents = self.session.exec(
+            select(
+                ExternalProcessDocument.id, ExternalProcessDocument.id_process,
+                ExternalDocumentCategory.full_name.label("category"), # type: ignore[union-attr]
+                ExternalProcessDocument.reception_status, ExternalProcessDocument.delivery_status,
+            )
+            .outerjoin(ExternalDocumentCategory, ExternalDocumentCategory.id == ExternalProcessDocument.id_external_doc_category) # type: ignore[arg-type]
+            .where(
+                ExternalProcessDocument.id_process.in_(latest_process.values()), # type: ignore[attr-defined]
+                or_(
+                    ExternalProcessDocument.reception_status == ReceptionStatus.NO_RECIBIDO,
+                    ExternalProcessDocument.delivery_status == DeliveryStatus.NO_ENTREGADO,
+                ),
+            )
+            .order_by(ExternalProcessDocument.id) # type: ignore[arg-type]
+        ).all() if latest_process else []
+        return {"students": students, "programs": programs, "processes": processes, "documents": documents}
+
+    def replace(self, student_ids: Iterable[int], payloads: dict[int, dict[str, Any]]) -> None:
+        """
+        Reemplaza las filas de la proyección de los estudiantes indicados.
+        Los estudiantes sin payload (sin matrícula o eliminados) quedan sin fila.
+        Se escribe con upsert, no con DELETE + INSERT: corre dentro de la transacción del llamador y
+        dos transacciones que tocan al mismo estudiante no deben chocar en la clave primaria.
+        """
+        removed = sorted(set(student_ids) - payloads.keys())
+        if removed:
+            self.session.connection().execute(
+                delete(StudentDashboardProjection).where(StudentDashboardProjection.student_id.in_(removed)) # type: ignore[attr-defined]
+            )
+        now = datetime.now()
+        # En orden de clave, así dos lotes concurrentes bloquean las filas en el mismo orden
+        upsert(
+            self.session, StudentDashboardProjection.__table__, # type: ignore[attr-defined]
+            [{"id_estudiante": student_id, "datos": payloads[student_id], "actualizado_en": now} for student_id in sorted(payloads)],
+            conflict=["id_estudiante"], update=["datos", "actualizado_en"],
+        )
@@ -0,0 +1,36 @@
+"""Esquemas para el dashboard del estudiante"""
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+
+from app.modules.documentos.models.document import DeliveryStatus, ReceptionStatus
+from app.modules.estudiantes.schemas.schema import StudentDashboard
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+
+class DashboardProcess(BaseModel):
+    """Proceso de tesis vigente del estudiante"""
+    id: int
+    current_thesis_title: str | None = None
+    general_status: ProcessStatus
+    current_stage: ProcessStage
+    start_date: datetime
+    end_date: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class PendingDocument(BaseModel):
+    """Documento externo aún no recibido o no entregado"""
+    id: int
+    category: str | None = None
+    reception_status: ReceptionStatus | None = None
+    delivery_status: DeliveryStatus | None = None
+
+class DashboardFreshness(BaseModel):
+    """Antigüedad de la proyección servida"""
+    refreshed_at: datetime
+    age_seconds: float
+
+class StudentDashboardView(StudentDashboard):
+    """Dashboard completo del estudiante, servido desde la proyección"""
+    process: DashboardProcess | None = None
+    pending_documents: list[PendingDocument] = []
+    freshness: DashboardFreshness | None = None
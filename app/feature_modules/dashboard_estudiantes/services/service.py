@@ -0,0 +1,84 @@
+"""Servicios del dashboard del estudiante."""
+from typing import Any, Iterable
+
+from datetime import datetime
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.feature_modules.dashboard_estudiantes.exceptions.exceptions import StudentDashboardNotFoundError
+from app.feature_modules.dashboard_estudiantes.repository.repository import StudentDashboardRepository
+from app.feature_modules.dashboard_estudiantes.schemas.schema import (
+    DashboardFreshness, DashboardProcess, PendingDocument, StudentDashboardView,
+)
+from app.modules.estudiantes.schemas.schema import AcademicInfo, PersonInfo, ProgramInfo
+
+class StudentDashboardService:
+    def __init__(self, repository: StudentDashboardRepository) -> None:
+        self.repository = repository
+
+    def get_dashboard(self, student_id: int) -> StudentDashboardView:
+        """
+        Devuelve el dashboard desde la proyección con una sola búsqueda por clave primaria.
+        Si la fila aún no existe (p. ej. datos previos a la proyección), la construye al vuelo.
+        """
+        projection = self.repository.get(student_id)
+        if projection is None:
+            self.refresh([student_id])
+            self.repository.session.commit()
+            projection = self.repository.get(student_id)
+        if projection is None:
+            raise StudentDashboardNotFoundError(f"No hay dashboard para el estudiante {student_id}.")
+        return StudentDashboardView.model_validate({
+            **projection.data,
+            "freshness": DashboardFreshness(
+                refreshed_at=projection.refreshed_at,
+                age_seconds=max((datetime.now() - projection.refreshed_at).total_seconds(), 0.0),
+            ),
+        })
+
+    def refresh(self, student_ids: Iterable[int]) -> None:
+        """Reconstruye la proyección de los estudiantes indicados."""
+        ids = set(student_ids)
+        if ids:
+            self.repository.replace(ids, build_payloads(self.repository.load_sources(ids)))
+
+def build_payloads(sources: dict[str, list]) -> dict[int, dict[str, Any]]:
+    """
+    Arma el JSON del dashboard de cada estudiante con matrícula.
+    Se muestran el último programa (por año de ingreso) y el último proceso (por fecha de inicio).
+    """
+    programs = {row.student_id: row for row in sources["programs"]}
+    processes = {row.student_id: row for row in sources["processes"]}
+    documents: dict[int, list[PendingDocument]] = {}
+    for row in sources["documents"]:
+        documents.setdefault(row.id_process, []).append(PendingDocument(
+            id=row.id, category=row.category, reception_status=row.reception_status, delivery_status=row.delivery_status,
+        ))
+
+    payloads = {}
+    for student in sources["students"]:
+        program = programs.get(student.id)
+        if program is None:
+            continue
+        process = processes.get(student.id)
+        view = StudentDashboardView(
+            id=student.id,
+            personal=PersonInfo.model_validate(student),
+            academic=AcademicInfo(
+                code=program.code,
+                status=program.status,
+                curriculum=program.curriculum,
+                admission_year=program.admission_year,
+                graduation_year=program.graduation_year,
+                program=ProgramInfo(id=program.program_id, name=program.program_name, degree=program.degree, mention=program.mention),
+            ),
+            process=DashboardProcess.model_validate(process) if process else None,
+            pending_documents=documents.get(process.id, []) if process else [],
+        )
+        payloads[student.id] = view.model_dump(mode="json", exclude={"freshness"})
+    return payloads
+
+def get_student_dashboard_service(session: Session = Depends(get_db_session)) -> StudentDashboardService:
+    """Dependencia que construye el servicio del dashboard del estudiante."""
+    return StudentDashboardService(StudentDashboardRepository(session))
@@ -0,0 +1,28 @@
+"""
+Suscriptor del change feed del dashboard del estudiante.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import subscribe
+from app.modules.documentos.models.document import ExternalProcessDocument
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.estudiantes.models.student import Student
+from app.modules.proceso.models.process import Process
+
+# Las filas borradas ya no se encuentran tras el flush: su padre llega por la columna que lo referencia
+@subscribe(
+    Student, ProgramStudent, Program, Process, ExternalProcessDocument,
+    references={
+        ProgramStudent: ("student_id", Student),
+        Process: ("id_student_program", ProgramStudent),
+        ExternalProcessDocument: ("id_process", Process),
+    },
+)
+def refresh_student_dashboards(session: Session, changes: dict[type, set[int]]) -> None:
+    """Mantiene la proyección al día en la misma transacción que los cambios de origen."""
+    from app.feature_modules.dashboard_estudiantes.repository.repository import StudentDashboardRepository # pylint: disable=import-outside-toplevel
+    from app.feature_modules.dashboard_estudiantes.services.service import StudentDashboardService # pylint: disable=import-outside-toplevel
+    repository = StudentDashboardRepository(session)
+    StudentDashboardService(repository).refresh(repository.affected_students(changes))
@@ -0,0 +1,21 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.database import run_db
+from app.feature_modules.dashboard_etapas.schemas.schema import StageFunnelReport
+from app.feature_modules.dashboard_etapas.services.service import GroupBy, StageAnalyticsService, get_stage_analytics_service
+
+router = APIRouter()
+
+@router.get("/embudo", response_model=StageFunnelReport)
+async def get_stage_funnel(
+    date_from: date | None = Query(default=None, description="Primer día (inclusive)"),
+    date_to: date | None = Query(default=None, description="Último día (inclusive)"),
+    program_id: int | None = Query(default=None),
+    cohort: int | None = Query(default=None, description="Año de ingreso al programa"),
+    group_by: GroupBy = Query(default="total"),
+    service: StageAnalyticsService = Depends(get_stage_analytics_service),
+):
+    """Embudo por etapa con entradas, salidas y p50/p90 de permanencia, leído del resumen diario."""
+    return await run_db(service.funnel, date_from=date_from, date_to=date_to, program_id=program_id, cohort=cohort, group_by=group_by)
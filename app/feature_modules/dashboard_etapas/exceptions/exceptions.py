@@ -0,0 +1,6 @@
+"""Excepciones del embudo de etapas."""
+from app.core.exceptions import AppError
+
+class InvalidDateRangeError(AppError):
+    """Error cuando la fecha inicial del rango es posterior a la final."""
+    status_code = 400
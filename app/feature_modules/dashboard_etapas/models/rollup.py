@@ -0,0 +1,26 @@
+"""Modelo de lectura con el resumen diario del embudo de etapas."""
+from typing import ClassVar
+
+from datetime import date
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Date, Integer, JSON
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum, JSONB
+
+from app.modules.proceso.models.process import ProcessStage
+
+class StageDailyRollup(SQLModel, table=True):
+    """
+    Entradas, salidas e histograma de duraciones de una etapa en un día, por programa y cohorte.
+    Se recalcula desde etapa_proceso solo para los días y etapas que cambian
+    (app.feature_modules.dashboard_etapas.services.service).
+    """
+    __tablename__: ClassVar[str] = 'resumen_etapa_diario'
+
+    day: date = Field(sa_column=Column("fecha", Date, primary_key=True))
+    stage: ProcessStage = Field(sa_column=Column("etapa", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), primary_key=True))
+    program_id: int = Field(sa_column=Column("id_programa", Integer, primary_key=True, autoincrement=False))
+    cohort: int = Field(sa_column=Column("cohorte", Integer, primary_key=True, autoincrement=False))
+    entered: int = Field(default=0, sa_column=Column("ingresos", Integer, nullable=False))
+    exited: int = Field(default=0, sa_column=Column("salidas", Integer, nullable=False))
+    # Conteo de salidas por cubeta de DURATION_BUCKETS (días en la etapa)
+    durations: list[int] = Field(sa_column=Column("duraciones", JSON().with_variant(JSONB(), "postgresql"), nullable=False))
@@ -0,0 +1,116 @@
+"""Repositorio del resumen diario del embudo de etapas."""
+from typing import Any, Iterable
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, delete, insert
+from sqlmodel import Session, select, or_
+
+from app.shared.locks import LockNamespace, advisory_xact_lock
+from app.feature_modules.dashboard_etapas.models.rollup import StageDailyRollup
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+
+def day_ranges(days: Iterable[date]) -> list[tuple[datetime, datetime]]:
+    """Agrupa días en rangos contiguos [inicio, fin) para filtrar con pocas condiciones."""
+    ranges: list[tuple[datetime, datetime]] = []
+    for day in sorted(set(days)):
+        start = datetime.combine(day, datetime.min.time())
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], start + timedelta(days=1))
+        else:
+            ranges.append((start, start + timedelta(days=1)))
+    return ranges
+
+class StageRollupRepository:
+    """
+    Lecturas del historial de etapas y escritura del resumen diario.
+    Usa solo columnas y sentencias Core, así puede ejecutarse dentro de un flush.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def touched_days(self, record_ids: Iterable[int]) -> set[tuple[ProcessStage, date]]:
+        """
+        Días de entrada y de salida de las filas de etapa_proceso cambiadas.
+        Returns:
+            set[tuple]: Pares (etapa, día) cuyo resumen debe recalcularse.
+        """
+        rows = self.session.exec(
+            select(ProcessStageRecord.stage, ProcessStageRecord.start_date, ProcessStageRecord.end_date)
+            .where(ProcessStageRecord.id.in_(list(record_ids))) # type: ignore[union-attr]
+        ).all()
+        touched = set()
+        for stage, start_date, end_date in rows:
+            touched.add((stage, start_date.date()))
+            if end_date is not None:
+                touched.add((stage, end_date.date()))
+        return touched
+
+    def lock_days(self, touched: Iterable[tuple[ProcessStage, date]]) -> None:
+        """
+        Serializa los recálculos de los mismos pares (etapa, día) hasta el fin de la transacción.
+        Bajo READ COMMITTED, quien espera lee después las filas de etapa_proceso que confirmó el otro,
+        así ningún recálculo pisa la celda con un conteo hecho sobre una foto anterior.
+        """
+        stages = list(ProcessStage)
+        advisory_xact_lock(
+            self.session, LockNamespace.STAGE_ROLLUP,
+            (stages.index(stage) * 1_000_000 + day.toordinal() for stage, day in touched),
+        )
+
+    def stage_movements(self, stage: ProcessStage, days: Iterable[date]) -> tuple[list, list]:
+        """
+        Entradas y salidas de `stage` en los días indicados, con programa y cohorte del proceso.
+        Los filtros son rangos sobre (etapa, fecha_inicio) y (etapa, fecha_fin), cubiertos por índices.
+        Returns:
+            tuple[list, list]: Filas de entradas (program_id, cohort, start_date) y de salidas
+            (program_id, cohort, start_date, end_date).
+        """
+        ranges = day_ranges(days)
+        base = (
+            select(ProgramStudent.program_id, ProgramStudent.admission_year.label("cohort"), ProcessStageRecord.start_date) # type: ignore[attr-defined]
+            .join(Process, Process.id == ProcessStageRecord.id_process) # type: ignore[arg-type]
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .where(ProcessStageRecord.stage == stage)
+        )
+        entries = self.session.exec(base.where(or_(*(
+            and_(ProcessStageRecord.start_date >= start, ProcessStageRecord.start_date < end) for start, end in ranges
+        )))).all()
+        exits = self.session.exec(base.add_columns(ProcessStageRecord.end_date).where(or_(*(
+            and_(ProcessStageRecord.end_date >= start, ProcessStageRecord.end_date < end) for start, end in ranges # type: ignore[operator]
+        )))).all()
+        return list(entries), list(exits)
+
+    def replace(self, stage: ProcessStage, days: Iterable[date], rows: list[dict[str, Any]]) -> None:
+        """
+        Reemplaza el resumen de `stage` en los días indicados (claves por nombre de columna).
+        Requiere haber tomado lock_days para esos días en la misma transacción.
+        """
+        connection = self.session.connection()
+        connection.execute(
+            delete(StageDailyRollup)
+            .where(StageDailyRollup.stage == stage, StageDailyRollup.day.in_(list(days))) # type: ignore[attr-defined]
+        )
+        if rows:
+            connection.execute(insert(StageDailyRollup.__table__), rows) # type: ignore[attr-defined]
+
+    def read(
+        self,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        program_id: int | None = None,
+        cohort: int | None = None,
+    ) -> list[StageDailyRollup]:
+        """Filas del resumen en el rango (inclusive), filtradas por programa y cohorte."""
+        statement = select(StageDailyRollup)
+        if date_from is not None:
+            statement = statement.where(StageDailyRollup.day >= date_from)
+        if date_to is not None:
+            statement = statement.where(StageDailyRollup.day <= date_to)
+        if program_id is not None:
+            statement = statement.where(StageDailyRollup.program_id == program_id)
+        if cohort is not None:
+            statement = statement.where(StageDailyRollup.cohort == cohort)
+        return list(self.session.exec(statement).all())
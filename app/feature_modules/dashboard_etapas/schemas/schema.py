@@ -0,0 +1,25 @@
+"""Esquemas para el embudo de etapas"""
+from datetime import date
+from pydantic import BaseModel
+
+from app.modules.proceso.models.process import ProcessStage
+
+class StageFunnel(BaseModel):
+    """Entradas y salidas de una etapa, con percentiles de permanencia en días"""
+    stage: ProcessStage
+    entered: int
+    exited: int
+    p50_days: float | None = None
+    p90_days: float | None = None
+
+class FunnelSegment(BaseModel):
+    """Embudo completo de un segmento; program_id y cohort son None si no se agrupa por ellos"""
+    program_id: int | None = None
+    cohort: int | None = None
+    stages: list[StageFunnel]
+
+class StageFunnelReport(BaseModel):
+    """Embudo de etapas en un rango de fechas"""
+    date_from: date | None = None
+    date_to: date | None = None
+    segments: list[FunnelSegment]
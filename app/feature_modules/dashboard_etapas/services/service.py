@@ -0,0 +1,140 @@
+"""Servicios del embudo de etapas."""
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable, Literal
+
+from datetime import date
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.shared.bulk import to_columns
+from app.feature_modules.dashboard_etapas.exceptions.exceptions import InvalidDateRangeError
+from app.feature_modules.dashboard_etapas.models.rollup import StageDailyRollup
+from app.feature_modules.dashboard_etapas.repository.repository import StageRollupRepository
+from app.feature_modules.dashboard_etapas.schemas.schema import FunnelSegment, StageFunnel, StageFunnelReport
+from app.modules.proceso.models.process import ProcessStage
+
+# Límite superior (en días) de cada cubeta del histograma de permanencia; la última cubeta es abierta
+DURATION_BUCKETS: tuple[float, ...] = (1, 3, 7, 14, 30, 60, 90, 120, 180, 270, 365, 545, 730)
+
+GroupBy = Literal["total", "program", "cohort"]
+
+def bucket_of(days: float) -> int:
+    """Índice de la cubeta que contiene una duración en días."""
+    return bisect_left(DURATION_BUCKETS, days)
+
+def percentile(histogram: list[int], q: float) -> float | None:
+    """
+    Percentil aproximado a partir del histograma, interpolando linealmente dentro de la cubeta.
+    El error está acotado por el ancho de la cubeta; en la cubeta abierta se devuelve su límite inferior.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for index, count in enumerate(histogram):
+        if count and seen + count >= rank:
+            lower = DURATION_BUCKETS[index - 1] if index else 0.0
+            if index == len(DURATION_BUCKETS):
+                return float(lower)
+            return round(lower + (DURATION_BUCKETS[index] - lower) * (rank - seen) / count, 1)
+        seen += count
+    return float(DURATION_BUCKETS[-1])
+
+class StageTotals:
+    """Acumulado de varias filas del resumen para una etapa."""
+
+    def __init__(self) -> None:
+        self.entered = 0
+        self.exited = 0
+        self.durations = [0] * (len(DURATION_BUCKETS) + 1)
+
+    def add(self, row: StageDailyRollup) -> None:
+        self.entered += row.entered
+        self.exited += row.exited
+        for index, count in enumerate(row.durations):
+            self.durations[index] += count
+
+    def funnel(self, stage: ProcessStage) -> StageFunnel:
+        return StageFunnel(
+            stage=stage, entered=self.entered, exited=self.exited,
+            p50_days=percentile(self.durations, 0.5), p90_days=percentile(self.durations, 0.9),
+        )
+
+class StageAnalyticsService:
+    def __init__(self, repository: StageRollupRepository) -> None:
+        self.repository = repository
+
+    def refresh(self, touched: Iterable[tuple[ProcessStage, date]]) -> None:
+        """
+        Recalcula el resumen de los pares (etapa, día) indicados desde etapa_proceso.
+        Solo se leen las entradas y salidas de esos días, y el resultado es idempotente:
+        recibir el mismo cambio dos veces no duplica conteos. Los pares se bloquean antes de leer,
+        así dos transacciones concurrentes que tocan el mismo día recalculan una después de la otra.
+        """
+        touched = set(touched)
+        self.repository.lock_days(touched)
+        days_by_stage: dict[ProcessStage, set[date]] = defaultdict(set)
+        for stage, day in touched:
+            days_by_stage[stage].add(day)
+        for stage, days in days_by_stage.items():
+            entries, exits = self.repository.stage_movements(stage, days)
+            cells: dict[tuple[date, int, int], dict] = {}
+
+            def cell(day: date, program_id: int, cohort: int) -> dict:
+                return cells.setdefault((day, program_id, cohort), {
+                    "day": day, "stage": stage, "program_id": program_id, "cohort": cohort,
+                    "entered": 0, "exited": 0, "durations": [0] * (len(DURATION_BUCKETS) + 1),
+                })
+
+            for program_id, cohort, start_date in entries:
+                if start_date.date() in days:
+                    cell(start_date.date(), program_id, cohort)["entered"] += 1
+            for program_id, cohort, start_date, end_date in exits:
+                if end_date.date() in days:
+                    row = cell(end_date.date(), program_id, cohort)
+                    row["exited"] += 1
+                    row["durations"][bucket_of((end_date - start_date).total_seconds() / 86400)] += 1
+            self.repository.replace(stage, days, [to_columns(StageDailyRollup, row) for row in cells.values()])
+
+    def funnel(
+        self,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        program_id: int | None = None,
+        cohort: int | None = None,
+        group_by: GroupBy = "total",
+    ) -> StageFunnelReport:
+        """
+        Embudo por etapa desde el resumen diario: entradas, salidas y p50/p90 de permanencia.
+        Args:
+            date_from (date | None): Primer día del rango (inclusive).
+            date_to (date | None): Último día del rango (inclusive).
+            program_id (int | None): Filtra por programa.
+            cohort (int | None): Filtra por cohorte (año de ingreso al programa).
+            group_by (str): "total", "program" o "cohort"; un segmento por valor.
+        """
+        if date_from is not None and date_to is not None and date_from > date_to:
+            raise InvalidDateRangeError("La fecha inicial no puede ser posterior a la final.")
+        totals: dict[tuple[int | None, int | None], dict[ProcessStage, StageTotals]] = defaultdict(dict)
+        for row in self.repository.read(date_from, date_to, program_id, cohort):
+            key = (row.program_id if group_by == "program" else None, row.cohort if group_by == "cohort" else None)
+            totals[key].setdefault(row.stage, StageTotals()).add(row)
+        return StageFunnelReport(
+            date_from=date_from,
+            date_to=date_to,
+            segments=[
+                FunnelSegment(
+                    program_id=key[0],
+                    cohort=key[1],
+                    stages=[totals[key].get(stage, StageTotals()).funnel(stage) for stage in ProcessStage],
+                )
+                for key in sorted(totals, key=lambda key: (key[0] or 0, key[1] or 0))
+            ],
+        )
+
+def get_stage_analytics_service(session: Session = Depends(get_db_session)) -> StageAnalyticsService:
+    """Dependencia que construye el servicio del embudo de etapas."""
+    return StageAnalyticsService(StageRollupRepository(session))
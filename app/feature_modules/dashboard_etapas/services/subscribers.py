@@ -0,0 +1,16 @@
+"""
+Suscriptor del change feed del embudo de etapas.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import subscribe
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+
+@subscribe(ProcessStageRecord)
+def refresh_stage_rollups(session: Session, changes: dict[type, set[int]]) -> None:
+    """Mantiene el resumen diario al día en la misma transacción que el historial de etapas."""
+    from app.feature_modules.dashboard_etapas.repository.repository import StageRollupRepository # pylint: disable=import-outside-toplevel
+    from app.feature_modules.dashboard_etapas.services.service import StageAnalyticsService # pylint: disable=import-outside-toplevel
+    repository = StageRollupRepository(session)
+    StageAnalyticsService(repository).refresh(repository.touched_days(changes[ProcessStageRecord]))
@@ -1,3 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.feature_modules.designacion_de_jurados.schemas.schema import JuryProposalReport, JuryProposalRequest
+from app.feature_modules.designacion_de_jurados.services.service import JuryService, get_jury_service
+
+router = APIRouter()
+
+@router.post("/propuesta", response_model=JuryProposalReport)
+async def propose_juries(
+    request: JuryProposalRequest,
+    service: JuryService = Depends(get_jury_service),
+):
+    """Propone (y opcionalmente registra) jurados para un lote de procesos, equilibrando la carga."""
+    return await run_db(service.propose, request)
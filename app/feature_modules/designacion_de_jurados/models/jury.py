@@ -0,0 +1,18 @@
+"""Modelo de datos para los jurados designados a un proceso."""
+from typing import ClassVar
+
+from datetime import date
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index
+
+class JuryMember(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'jurado_proceso'
+
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), primary_key=True))
+    id_teacher: int = Field(sa_column=Column("id_docente", Integer, ForeignKey("docente.id_docente"), primary_key=True))
+    defense_date: date = Field(sa_column=Column("fecha_sustentacion", Date, nullable=False))
+
+    __table_args__ = (
+        # Carga vigente de cada docente al balancear nuevas designaciones
+        Index("ix_jurado_proceso_docente", "id_docente"),
+    )
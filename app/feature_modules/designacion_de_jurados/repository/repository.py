@@ -0,0 +1,67 @@
+"""Repositorio de la designación de jurados."""
+from datetime import date
+from sqlalchemy import func, insert, or_
+from sqlmodel import Session, select
+
+from app.shared.bulk import id_in
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.modules.docentes.models.teacher import Teacher, StatusTeacher
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+
+class JuryRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def processes(self, ids: list[int] | None) -> list:
+        """
+        Procesos a resolver con su asesor, el grado del programa y si ya tienen jurado.
+        Sin ids, todos los procesos en curso en la etapa de designación de jurados.
+        Returns:
+            list: Filas (id, id_advisor, degree, current_stage, general_status, has_jury).
+        """
+        has_jury = select(JuryMember.id_process).where(JuryMember.id_process == Process.id).exists()
+        statement = (
+            select(Process.id, Process.id_advisor, Program.degree, Process.current_stage, Process.general_status, has_jury.label("has_jury"))
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+        )
+        if ids is None:
+            statement = statement.where(
+                Process.current_stage == ProcessStage.JURY_ASSIGNMENT,
+                Process.general_status == ProcessStatus.IN_PROCESS,
+                ~has_jury,
+            )
+        else:
+            statement = statement.where(id_in(self.session, Process.id, ids))
+        return list(self.session.exec(statement.order_by(Process.id)).all()) # type: ignore[arg-type]
+
+    def available_teachers(self, defense_date: date) -> list:
+        """Docentes activos sin licencia que cubra la fecha de sustentación: filas (id, academic_degree)."""
+        return list(self.session.exec(
+            select(Teacher.id, Teacher.academic_degree)
+            .where(
+                Teacher.status == StatusTeacher.ACTIVE,
+                or_(
+                    Teacher.license_start_date.is_(None), Teacher.license_end_date.is_(None), # type: ignore[union-attr]
+                    Teacher.license_start_date > defense_date, Teacher.license_end_date < defense_date, # type: ignore[operator]
+                ),
+            )
+            .order_by(Teacher.id) # type: ignore[arg-type]
+        ).all())
+
+    def current_load(self) -> dict[int, int]:
+        """Jurados vigentes (procesos en curso) por docente."""
+        rows = self.session.exec(
+            select(JuryMember.id_teacher, func.count())
+            .join(Process, Process.id == JuryMember.id_process) # type: ignore[arg-type]
+            .where(Process.general_status == ProcessStatus.IN_PROCESS)
+            .group_by(JuryMember.id_teacher)
+        ).all()
+        return dict(rows)
+
+    def add_members(self, rows: list[dict]) -> None:
+        """Registra jurados en bloque (claves por nombre de columna)."""
+        if rows:
+            self.session.connection().execute(insert(JuryMember.__table__), rows) # type: ignore[attr-defined]
@@ -0,0 +1,30 @@
+"""Esquemas para la designación de jurados"""
+from datetime import date
+from pydantic import BaseModel, Field
+
+class JuryProposalRequest(BaseModel):
+    """Lote a resolver; sin process_ids se toman todos los procesos en designación sin jurado"""
+    process_ids: list[int] | None = Field(default=None, max_length=5000)
+    defense_date: date
+    jury_size: int = Field(default=3, ge=1, le=7)
+    apply: bool = Field(default=False, description="Registra la propuesta en jurado_proceso")
+
+
+class JuryProposal(BaseModel):
+    process_id: int
+    teacher_ids: list[int] = []
+    error: str | None = None
+
+
+class TeacherLoad(BaseModel):
+    min: int
+    max: int
+    mean: float
+
+
+class JuryProposalReport(BaseModel):
+    assigned: int
+    unassigned: int
+    applied: bool
+    load: TeacherLoad | None = None
+    proposals: list[JuryProposal]
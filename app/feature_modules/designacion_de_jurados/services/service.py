@@ -0,0 +1,69 @@
+"""Servicios de la designación de jurados."""
+from statistics import fmean
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.feature_modules.designacion_de_jurados.repository.repository import JuryRepository
+from app.feature_modules.designacion_de_jurados.schemas.schema import (
+    JuryProposal, JuryProposalReport, JuryProposalRequest, TeacherLoad,
+)
+from app.feature_modules.designacion_de_jurados.services.solver import EligibilityIndex, JuryCase, solve
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+
+class JuryService:
+    def __init__(self, repository: JuryRepository) -> None:
+        self.repository = repository
+
+    def propose(self, request: JuryProposalRequest) -> JuryProposalReport:
+        """
+        Propone jurados para un lote de procesos con una sola resolución conjunta.
+        Los procesos que no están en designación, están detenidos o ya tienen jurado se
+        reportan con su motivo. Con `apply` la propuesta se registra en la misma transacción.
+        """
+        ids = None if request.process_ids is None else list(dict.fromkeys(request.process_ids))
+        rows = {row.id: row for row in self.repository.processes(ids)}
+        errors: dict[int, str] = {}
+        cases = []
+        for process_id in ids if ids is not None else list(rows):
+            row = rows.get(process_id)
+            if row is None:
+                errors[process_id] = "El proceso no existe"
+            elif row.current_stage != ProcessStage.JURY_ASSIGNMENT:
+                errors[process_id] = f"El proceso está en la etapa {row.current_stage.value}"
+            elif row.general_status != ProcessStatus.IN_PROCESS:
+                errors[process_id] = f"El proceso está {row.general_status.value}"
+            elif row.has_jury:
+                errors[process_id] = "El proceso ya tiene jurado"
+            else:
+                cases.append(JuryCase(process_id=row.id, advisor_id=row.id_advisor, degree=row.degree))
+
+        index = EligibilityIndex(self.repository.available_teachers(request.defense_date))
+        solution = solve(cases, index, request.jury_size, self.repository.current_load())
+        errors.update(solution.errors)
+
+        if request.apply and solution.assignments:
+            self.repository.add_members([
+                {"id_proceso": process_id, "id_docente": teacher_id, "fecha_sustentacion": request.defense_date}
+                for process_id, teacher_ids in solution.assignments.items()
+                for teacher_id in teacher_ids
+            ])
+            self.repository.session.commit()
+
+        order = ids if ids is not None else list(rows)
+        loads = list(solution.loads.values())
+        return JuryProposalReport(
+            assigned=len(solution.assignments),
+            unassigned=len(errors),
+            applied=request.apply and bool(solution.assignments),
+            load=TeacherLoad(min=min(loads), max=max(loads), mean=round(fmean(loads), 2)) if loads else None,
+            proposals=[
+                JuryProposal(process_id=process_id, teacher_ids=solution.assignments.get(process_id, []), error=errors.get(process_id))
+                for process_id in order
+            ],
+        )
+
+def get_jury_service(session: Session = Depends(get_db_session)) -> JuryService:
+    """Dependencia que construye el servicio de designación de jurados."""
+    return JuryService(JuryRepository(session))
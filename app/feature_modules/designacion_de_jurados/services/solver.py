@@ -0,0 +1,157 @@
+"""
+Asignación de jurados en lote: índice de elegibilidad en bitsets y voraz con reparación.
+
+Cada docente elegible ocupa un bit. La elegibilidad de un proceso es una máscara (docentes
+con el grado requerido, menos su asesor) y la carga se guarda como una máscara por nivel
+de carga, así "el docente elegible menos cargado" es un AND entre enteros.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from app.modules.docentes.models.teacher import AcademicDegree
+from app.modules.estudiantes.models.program import DegreeProgram
+
+# Grados de docente aceptados como jurado según el grado del programa
+ACCEPTED_DEGREES: dict[DegreeProgram, frozenset[AcademicDegree]] = {
+    DegreeProgram.MASTER: frozenset({AcademicDegree.MASTER, AcademicDegree.DOCTORATE}),
+    DegreeProgram.DOCTORATE: frozenset({AcademicDegree.DOCTORATE}),
+}
+
+@dataclass(frozen=True)
+class JuryCase:
+    process_id: int
+    advisor_id: int
+    degree: DegreeProgram
+
+@dataclass
+class JurySolution:
+    assignments: dict[int, list[int]]
+    errors: dict[int, str]
+    loads: dict[int, int]
+
+def bits(mask: int) -> Iterator[int]:
+    """Posiciones de los bits encendidos, de menor a mayor."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class EligibilityIndex:
+    """
+    Docentes habilitados para el día de la sustentación, indexados por grado requerido.
+    Args:
+        teachers (Iterable[tuple[int, AcademicDegree]]): (id_docente, grado) ya filtrados por estado y licencia.
+    """
+
+    def __init__(self, teachers: Iterable[tuple[int, AcademicDegree]]) -> None:
+        self.teacher_ids: list[int] = []
+        self.position: dict[int, int] = {}
+        self.by_degree: dict[DegreeProgram, int] = dict.fromkeys(ACCEPTED_DEGREES, 0)
+        for teacher_id, degree in teachers:
+            bit = 1 << len(self.teacher_ids)
+            self.position[teacher_id] = len(self.teacher_ids)
+            self.teacher_ids.append(teacher_id)
+            for program_degree, accepted in ACCEPTED_DEGREES.items():
+                if degree in accepted:
+                    self.by_degree[program_degree] |= bit
+
+    def __len__(self) -> int:
+        return len(self.teacher_ids)
+
+    def eligible(self, case: JuryCase) -> int:
+        """Máscara de docentes que pueden ser jurado del proceso."""
+        mask = self.by_degree[case.degree]
+        if case.advisor_id in self.position:
+            mask &= ~(1 << self.position[case.advisor_id])
+        return mask
+
+def solve(cases: list[JuryCase], index: EligibilityIndex, jury_size: int, initial_load: dict[int, int] | None = None) -> JurySolution:
+    """
+    Propone `jury_size` jurados por proceso equilibrando la carga.
+
+    1. Voraz: los procesos con menos candidatos van primero y cada uno toma a los
+       elegibles con menor carga.
+    2. Reparación: mientras un docente con la carga máxima L tenga un proceso que pueda
+       pasar a un elegible con carga <= L - 2, se mueve. Cada movimiento reduce la suma de
+       cuadrados de las cargas, así que termina; al final no quedan mejoras de ese tipo.
+    Args:
+        cases (list[JuryCase]): Procesos a resolver.
+        index (EligibilityIndex): Docentes elegibles.
+        jury_size (int): Jurados por proceso.
+        initial_load (dict[int, int] | None): Designaciones vigentes por docente.
+    """
+    load = [0] * len(index)
+    for teacher_id, count in (initial_load or {}).items():
+        if teacher_id in index.position:
+            load[index.position[teacher_id]] = count
+    levels: list[int] = [0] * (max(load, default=0) + 1)
+    for position, count in enumerate(load):
+        levels[count] |= 1 << position
+
+    def move(position: int, delta: int) -> None:
+        bit = 1 << position
+        levels[load[position]] &= ~bit
+        load[position] += delta
+        if load[position] == len(levels):
+            levels.append(0)
+        levels[load[position]] |= bit
+
+    masks = {case.process_id: index.eligible(case) for case in cases}
+    juries: dict[int, int] = {}
+    errors: dict[int, str] = {}
+    for case in sorted(cases, key=lambda case: (masks[case.process_id].bit_count(), case.process_id)):
+        mask = masks[case.process_id]
+        if mask.bit_count() < jury_size:
+            errors[case.process_id] = f"Solo hay {mask.bit_count()} docentes elegibles para {jury_size} jurados"
+            continue
+        jury = 0
+        for level in range(len(levels)):
+            candidates = levels[level] & mask & ~jury
+            while candidates and jury.bit_count() < jury_size:
+                low = candidates & -candidates
+                candidates ^= low
+                jury |= low
+            if jury.bit_count() == jury_size:
+                break
+        for position in bits(jury):
+            move(position, 1)
+        juries[case.process_id] = jury
+
+    serving: dict[int, list[int]] = {}
+    for process_id, jury in juries.items():
+        for position in bits(jury):
+            serving.setdefault(position, []).append(process_id)
+    improved = True
+    while improved:
+        improved = False
+        top = max((level for level, mask in enumerate(levels) if mask), default=0)
+        lighter = 0
+        for level in range(max(top - 1, 0)):
+            lighter |= levels[level]
+        if not lighter:
+            break
+        for position in bits(levels[top]):
+            # La carga puede venir solo de designaciones vigentes: sin procesos del lote no hay qué mover
+            for process_id in serving.get(position, ()):
+                candidates = masks[process_id] & ~juries[process_id] & lighter
+                if not candidates:
+                    continue
+                target = min(bits(candidates), key=lambda candidate: (load[candidate], candidate))
+                juries[process_id] ^= (1 << position) | (1 << target)
+                serving[position].remove(process_id)
+                serving.setdefault(target, []).append(process_id)
+                move(position, -1)
+                move(target, 1)
+                improved = True
+                break
+            if improved:
+                break
+
+    return JurySolution(
+        assignments={
+            process_id: [index.teacher_ids[position] for position in bits(jury)]
+            for process_id, jury in juries.items()
+        },
+        errors=errors,
+        loads={teacher_id: load[position] for position, teacher_id in enumerate(index.teacher_ids)},
+    )
@@ -1,3 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
-router = APIRouter()
\ No newline at end of file
+from app.feature_modules.otorgamiento.schemas.schema import GrantingBatchRequest
+from app.feature_modules.otorgamiento.services.service import GrantingService, get_granting_service
+
+router = APIRouter()
+
+@router.post("/documentos", response_class=StreamingResponse)
+def generate_documents(
+    request: GrantingBatchRequest,
+    service: GrantingService = Depends(get_granting_service),
+):
+    """Resoluciones y constancias de una sesión de consejo, en un ZIP que se escribe mientras se generan."""
+    return StreamingResponse(
+        service.documents(request),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="otorgamiento_{request.session_date:%Y%m%d}.zip"'},
+    )
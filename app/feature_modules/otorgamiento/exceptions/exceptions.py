@@ -0,0 +1,10 @@
+"""Excepciones del otorgamiento de grado."""
+from app.core.exceptions import AppError
+
+class GrantingProcessNotFoundError(AppError):
+    """Error cuando un proceso pedido no existe o no hay procesos en otorgamiento de grado."""
+    status_code = 404
+
+class ProcessNotInGrantingError(AppError):
+    """Error cuando un proceso pedido no está en curso en la etapa de otorgamiento de grado."""
+    status_code = 409
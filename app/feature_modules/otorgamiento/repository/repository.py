@@ -0,0 +1,46 @@
+"""Repositorio del otorgamiento de grado."""
+from sqlmodel import Session, select
+
+from app.shared.bulk import id_in
+from app.feature_modules.acto_publico.models.defense import Defense
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.estudiantes.models.student import Student
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+
+class GrantingRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def candidates(self, ids: list[int] | None) -> list:
+        """
+        Procesos con los datos que llevan sus documentos, en una sola consulta.
+        Sin ids, los procesos en curso en la etapa de otorgamiento de grado.
+        Returns:
+            list: Filas (id, current_stage, general_status, thesis_title, name, paternal_surname,
+            maternal_surname, type_document, identity_document, code, program, degree, mention,
+            advisor_name, advisor_paternal_surname, advisor_maternal_surname, defense_start).
+        """
+        statement = (
+            select(
+                Process.id, Process.current_stage, Process.general_status, Process.current_thesis_title,
+                Student.name, Student.paternal_surname, Student.maternal_surname, Student.type_document, Student.identity_document,
+                ProgramStudent.code, Program.name.label("program"), Program.degree, Program.mention, # type: ignore[attr-defined]
+                Teacher.name.label("advisor_name"), Teacher.paternal_surname.label("advisor_paternal_surname"), # type: ignore[attr-defined]
+                Teacher.maternal_surname.label("advisor_maternal_surname"), Defense.start.label("defense_start"), # type: ignore[attr-defined]
+            )
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .join(Student, Student.id == ProgramStudent.student_id) # type: ignore[arg-type]
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+            .join(Teacher, Teacher.id == Process.id_advisor) # type: ignore[arg-type]
+            .outerjoin(Defense, Defense.id_process == Process.id) # type: ignore[arg-type]
+        )
+        if ids is None:
+            statement = statement.where(
+                Process.current_stage == ProcessStage.DEGREE_GRANTING,
+                Process.general_status == ProcessStatus.IN_PROCESS,
+            )
+        else:
+            statement = statement.where(id_in(self.session, Process.id, ids))
+        return list(self.session.exec(statement.order_by(Process.id)).all()) # type: ignore[arg-type]
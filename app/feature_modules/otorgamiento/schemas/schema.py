@@ -0,0 +1,18 @@
+"""Esquemas para el otorgamiento de grado"""
+from datetime import date
+from enum import Enum
+from pydantic import BaseModel, Field
+
+class GrantingDocument(str, Enum):
+    RESOLUTION = "resolucion"
+    CERTIFICATE = "constancia"
+
+
+class GrantingBatchRequest(BaseModel):
+    """Sesión de consejo; sin process_ids se toman todos los procesos en curso en otorgamiento de grado"""
+    session_date: date
+    first_resolution_number: int = Field(ge=1, description="Las resoluciones siguientes son correlativas")
+    process_ids: list[int] | None = Field(default=None, max_length=5000)
+    documents: list[GrantingDocument] = Field(
+        default=[GrantingDocument.RESOLUTION, GrantingDocument.CERTIFICATE], min_length=1,
+    )
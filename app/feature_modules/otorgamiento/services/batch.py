@@ -0,0 +1,100 @@
+"""
+Generación de documentos en lote: reparte el render en un pool de procesos y escribe el ZIP a
+medida que llegan los resultados. Solo hay `window` lotes en vuelo, así la memoria depende del
+tamaño de la ventana y no de la cantidad de documentos.
+"""
+import itertools
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from loguru import logger
+
+from app.shared.spreadsheets import ChunkSink
+from app.feature_modules.otorgamiento.services.templates import render_chunk
+
+DocumentItem = tuple[str, str, dict[str, Any]]
+
+@dataclass
+class BatchStats:
+    documents: int = 0
+    pages: int = 0
+    size: int = 0
+    seconds: float = 0.0
+
+    def reset(self) -> None:
+        """Vuelve los totales a cero, p. ej. antes de repetir el lote."""
+        self.documents = self.pages = self.size = 0
+        self.seconds = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+def _completed(function: Callable, *args) -> Future:
+    """Ejecuta en este proceso y devuelve el resultado como un Future ya resuelto."""
+    future: Future = Future()
+    future.set_result(function(*args))
+    return future
+
+def render_zip(
+    items: Iterable[DocumentItem],
+    pool: Executor | None = None,
+    chunk_size: int = 25,
+    window: int = 4,
+    stats: BatchStats | None = None,
+) -> Iterator[bytes]:
+    """
+    Genera un ZIP con un PDF por documento, en el orden de `items`.
+    Los PDF ya vienen comprimidos, así que se guardan sin volver a comprimir.
+    Args:
+        items (Iterable[DocumentItem]): (nombre del archivo, tipo de documento, campos).
+        pool (Executor | None): Pool iniciado con init_worker; si es None se renderiza en este proceso.
+        chunk_size (int): Documentos por tarea; amortiza el envío de datos entre procesos.
+        window (int): Tareas en vuelo como máximo (conviene el doble de procesos del pool).
+        stats (BatchStats | None): Se completa con los totales al terminar.
+    """
+    stats = stats if stats is not None else BatchStats()
+    submit = pool.submit if pool is not None else _completed
+    window = window if pool is not None else 1
+    started = time.perf_counter()
+    stamp = time.localtime()[:6]
+    iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+    pending: deque[Future] = deque()
+    sink = ChunkSink()
+
+    def write(archive: zipfile.ZipFile, future: Future) -> bytes:
+        for name, data, pages in future.result():
+            archive.writestr(zipfile.ZipInfo(name, stamp), data)
+            stats.documents += 1
+            stats.pages += pages
+        return sink.drain()
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        try:
+            for chunk in chunks:
+                pending.append(submit(render_chunk, chunk))
+                if len(pending) >= window:
+                    data = write(archive, pending.popleft())
+                    stats.size += len(data)
+                    yield data
+            while pending:
+                data = write(archive, pending.popleft())
+                stats.size += len(data)
+                yield data
+        finally:
+            # Si el cliente corta la descarga, los lotes que aún no empezaron no se renderizan
+            for future in pending:
+                future.cancel()
+    data = sink.drain()
+    stats.size += len(data)
+    stats.seconds = time.perf_counter() - started
+    logger.info(
+        f"Lote de {stats.documents} documentos ({stats.pages} páginas) en {stats.seconds:.2f} s: "
+        f"{stats.pages_per_second:.0f} páginas/s."
+    )
+    yield data
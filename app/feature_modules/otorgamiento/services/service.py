@@ -0,0 +1,160 @@
+"""Servicios del otorgamiento de grado: resoluciones y constancias en lote."""
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+from fastapi import Depends
+from loguru import logger
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_session
+from app.feature_modules.otorgamiento.exceptions.exceptions import GrantingProcessNotFoundError, ProcessNotInGrantingError
+from app.feature_modules.otorgamiento.repository.repository import GrantingRepository
+from app.feature_modules.otorgamiento.schemas.schema import GrantingBatchRequest
+from app.feature_modules.otorgamiento.services.batch import BatchStats, DocumentItem, render_zip
+from app.feature_modules.otorgamiento.services.templates import init_worker
+from app.modules.estudiantes.models.program import DegreeProgram
+from app.modules.estudiantes.models.student import TypeDocumentStudent
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+
+MONTHS = (
+    "enero", "febrero", "marzo", "abril", "mayo", "junio",
+    "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre",
+)
+
+DEGREES = {DegreeProgram.MASTER: "Maestro", DegreeProgram.DOCTORATE: "Doctor"}
+
+DOCUMENT_TYPES = {
+    TypeDocumentStudent.DNI: "DNI",
+    TypeDocumentStudent.PASSPORT: "pasaporte",
+    TypeDocumentStudent.FOREIGN_IDENTITY: "cédula de identidad",
+}
+
+def long_date(value: date) -> str:
+    """Fecha como "5 de junio de 2026"."""
+    return f"{value.day} de {MONTHS[value.month - 1]} de {value.year}"
+
+@lru_cache(maxsize=1)
+def rendering_pool() -> Executor | None:
+    """
+    Pool de procesos de render, creado en el primer lote y compartido por los siguientes.
+    Con GRANTING_WORKERS en 0 compila las plantillas en este proceso y devuelve None.
+    """
+    logo = Path(settings.GRANTING_LOGO_PATH).read_bytes() if settings.GRANTING_LOGO_PATH else None
+    if settings.GRANTING_WORKERS <= 0:
+        init_worker(logo)
+        return None
+    # spawn: los hijos no heredan el pool de conexiones ni los hilos de la API
+    return ProcessPoolExecutor(
+        settings.GRANTING_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker, initargs=(logo,),
+    )
+
+def close_rendering_pool(pool: Executor | None = None, wait: bool = True) -> None:
+    """
+    Cierra el pool compartido para que el próximo lote cree uno nuevo.
+    Args:
+        pool (Executor | None): Si se indica, solo se cierra cuando sigue siendo el compartido.
+        wait (bool): Espera a que terminen los procesos hijos.
+    """
+    if not rendering_pool.cache_info().currsize:
+        return
+    current = rendering_pool()
+    if pool is not None and current is not pool:
+        return
+    rendering_pool.cache_clear()
+    if current is not None:
+        current.shutdown(wait=wait, cancel_futures=True)
+
+class GrantingService:
+    def __init__(
+        self,
+        repository: GrantingRepository,
+        pool: Executor | None = None,
+        chunk_size: int = settings.GRANTING_CHUNK_SIZE,
+        window: int = 2 * max(settings.GRANTING_WORKERS, 1),
+    ) -> None:
+        self.repository = repository
+        self.pool = pool
+        self.chunk_size = chunk_size
+        self.window = window
+
+    def items(self, request: GrantingBatchRequest) -> list[DocumentItem]:
+        """
+        Documentos del lote con sus campos. Las resoluciones se numeran en orden de proceso desde
+        first_resolution_number; la constancia de cada proceso cita su resolución.
+        """
+        rows = self.repository.candidates(request.process_ids)
+        if request.process_ids is not None:
+            missing = set(request.process_ids) - {row.id for row in rows}
+            if missing:
+                raise GrantingProcessNotFoundError(f"Procesos inexistentes: {', '.join(map(str, sorted(missing)))}")
+            outside = [
+                row.id for row in rows
+                if row.current_stage != ProcessStage.DEGREE_GRANTING or row.general_status != ProcessStatus.IN_PROCESS
+            ]
+            if outside:
+                raise ProcessNotInGrantingError(f"Procesos fuera de otorgamiento de grado: {', '.join(map(str, outside))}")
+        elif not rows:
+            raise GrantingProcessNotFoundError("No hay procesos en curso en otorgamiento de grado")
+
+        session_date = long_date(request.session_date)
+        items = []
+        for number, row in enumerate(rows, start=request.first_resolution_number):
+            resolution = f"{number:04d}-{request.session_date.year}"
+            values = {
+                "institution": settings.GRANTING_INSTITUTION,
+                "resolution": resolution,
+                "session_date": session_date,
+                "process_id": row.id,
+                "student_name": f"{row.name} {row.paternal_surname} {row.maternal_surname}",
+                "document": f"{DOCUMENT_TYPES[row.type_document]} {row.identity_document}",
+                "code": row.code,
+                "program": row.program,
+                "degree": DEGREES[row.degree],
+                "mention": f", mención en {row.mention}" if row.mention else "",
+                "thesis_title": row.current_thesis_title or "sin título registrado",
+                "advisor": f"{row.advisor_name} {row.advisor_paternal_surname} {row.advisor_maternal_surname}",
+                "defense": f", el {long_date(row.defense_start.date())}" if row.defense_start else "",
+            }
+            for document in request.documents:
+                items.append((f"{document.value}_{resolution}_{row.code}.pdf", document.value, values))
+        return items
+
+    def documents(self, request: GrantingBatchRequest, stats: BatchStats | None = None) -> Iterator[bytes]:
+        """
+        ZIP con los documentos del lote. Los procesos se validan antes de devolver el iterador;
+        el render ocurre mientras se consume.
+        """
+        items = self.items(request)
+        return self._render(items, stats)
+
+    def _render(self, items: list[DocumentItem], stats: BatchStats | None) -> Iterator[bytes]:
+        """
+        Si murió un hijo del pool, este queda roto para siempre: se descarta y, si todavía no
+        se envió nada al cliente, el lote se repite con un pool nuevo.
+        """
+        sent = False
+        try:
+            for data in render_zip(items, self.pool, self.chunk_size, self.window, stats):
+                sent = True
+                yield data
+        except BrokenProcessPool:
+            logger.warning("Pool de render roto; se reemplaza por uno nuevo.")
+            close_rendering_pool(self.pool, wait=False)
+            if sent:
+                raise
+            self.pool = rendering_pool()
+            # Los documentos ya contados del intento fallido no deben sumarse a los del nuevo
+            if stats is not None:
+                stats.reset()
+            yield from render_zip(items, self.pool, self.chunk_size, self.window, stats)
+
+def get_granting_service(session: Session = Depends(get_session)) -> GrantingService:
+    """Dependencia que construye el servicio de otorgamiento con el pool de render compartido."""
+    return GrantingService(GrantingRepository(session), rendering_pool())
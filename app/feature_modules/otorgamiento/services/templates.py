@@ -0,0 +1,102 @@
+"""
+Plantillas de la resolución y la constancia de otorgamiento de grado, y su render en los
+procesos del pool. Este módulo no depende de la configuración ni de la base de datos para que
+los procesos hijos lo importen rápido; cada uno compila las plantillas una vez al iniciar.
+"""
+from typing import Any, Sequence
+
+from app.shared.pdf import (
+    A4, A4_LANDSCAPE, CompiledTemplate, Image, ImageAsset, Line, Paragraph, Rect, Template, Text, jpeg_asset,
+)
+from app.feature_modules.otorgamiento.schemas.schema import GrantingDocument
+
+def _resolution(logo: bool) -> Template:
+    center, left, width = A4[0] / 2, 72, A4[0] - 144
+    return Template(size=A4, title="Resolución N.° {resolution}", pages=[[
+        Rect(36, 36, A4[0] - 72, A4[1] - 72, 1.2),
+        Rect(41, 41, A4[0] - 82, A4[1] - 82, 0.4),
+        *([Image("logo", left, 738, 56, 56)] if logo else []),
+        Text(center, 770, "{institution}", 14, "bold", "center"),
+        Text(center, 752, "Consejo de Posgrado", 11, align="center"),
+        Text(center, 712, "RESOLUCIÓN N.° {resolution}", 13, "bold", "center"),
+        Text(center, 694, "Sesión del {session_date}", 10.5, align="center"),
+        Line(left, 680, left + width, 680),
+        Text(left, 650, "VISTO:", 11, "bold"),
+        Paragraph(left, 632, width, (
+            "El expediente del proceso de tesis N.° {process_id} de {student_name}, identificado(a) con "
+            "{document} y código de estudiante {code}, del programa {program}; y"
+        )),
+        Text(left, 550, "CONSIDERANDO:", 11, "bold"),
+        # Hasta ocho líneas para títulos de tesis largos antes del considerando fijo
+        Paragraph(left, 532, width, (
+            "Que el(la) graduando(a) sustentó y aprobó en acto público la tesis titulada «{thesis_title}», "
+            "bajo la asesoría de {advisor}{defense}, y depositó la tesis en el repositorio institucional;"
+        )),
+        Paragraph(left, 392, width, (
+            "Que, conforme al reglamento de grados y títulos, corresponde conferir el grado académico a quien "
+            "cumple los requisitos de la etapa de otorgamiento;"
+        )),
+        Text(left, 340, "SE RESUELVE:", 11, "bold"),
+        Paragraph(left, 322, width, (
+            "Artículo único.- Otorgar el grado académico de {degree} a {student_name}, "
+            "del programa {program}{mention}."
+        )),
+        Text(left, 250, "Regístrese, comuníquese y archívese.", 11),
+        Line(90, 140, 260, 140),
+        Text(175, 126, "Secretaría Académica", 10, align="center"),
+        Line(A4[0] - 260, 140, A4[0] - 90, 140),
+        Text(A4[0] - 175, 126, "Presidencia del Consejo", 10, align="center"),
+    ]])
+
+def _certificate(logo: bool) -> Template:
+    width, height = A4_LANDSCAPE
+    center, left = width / 2, 120
+    return Template(size=A4_LANDSCAPE, title="Constancia de grado - {student_name}", pages=[[
+        Rect(30, 30, width - 60, height - 60, 2),
+        Rect(38, 38, width - 76, height - 76, 0.5),
+        *([Image("logo", 64, height - 124, 60, 60)] if logo else []),
+        Text(center, 505, "{institution}", 16, "bold", "center"),
+        Text(center, 440, "CONSTANCIA DE OTORGAMIENTO DE GRADO", 22, "bold", "center"),
+        Text(center, 395, "Se hace constar que", 13, align="center"),
+        Text(center, 360, "{student_name}", 20, "bold", "center"),
+        Paragraph(left, 325, width - 2 * left, (
+            "identificado(a) con {document}, ha obtenido el grado académico de {degree} en el programa "
+            "{program}{mention}, conferido por Resolución N.° {resolution} en la sesión del {session_date}."
+        ), 13, align="center"),
+        Paragraph(left, 245, width - 2 * left, "Tesis: «{thesis_title}»", 11, align="center"),
+        Line(center - 110, 130, center + 110, 130),
+        Text(center, 116, "Dirección de la Escuela de Posgrado", 10, align="center"),
+        Text(center, 60, "Código de estudiante {code} · Proceso N.° {process_id}", 8, align="center"),
+    ]])
+
+def compile_templates(logo: ImageAsset | None = None) -> dict[str, CompiledTemplate]:
+    """Compila las plantillas por tipo de documento, con el logo si se indica."""
+    assets = {"logo": logo} if logo is not None else {}
+    return {
+        GrantingDocument.RESOLUTION: CompiledTemplate(_resolution(logo is not None), assets),
+        GrantingDocument.CERTIFICATE: CompiledTemplate(_certificate(logo is not None), assets),
+    }
+
+# Plantillas compiladas de este proceso; se reutilizan en todos los lotes que recibe
+_templates: dict[str, CompiledTemplate] = {}
+
+def init_worker(logo: bytes | None = None) -> None:
+    """Inicializador del pool: compila las plantillas y el logo (JPEG) una sola vez por proceso."""
+    _templates.clear()
+    _templates.update(compile_templates(jpeg_asset(logo) if logo else None))
+
+def render_chunk(items: Sequence[tuple[str, str, dict[str, Any]]]) -> list[tuple[str, bytes, int]]:
+    """
+    Renderiza un lote de documentos.
+    Args:
+        items (Sequence[tuple]): (nombre del archivo, tipo de documento, campos) por documento.
+    Returns:
+        list[tuple]: (nombre del archivo, PDF, páginas) en el mismo orden.
+    """
+    if not _templates:
+        init_worker()
+    rendered = []
+    for name, kind, values in items:
+        template = _templates[kind]
+        rendered.append((name, template.render(values), template.page_count))
+    return rendered
@@ -1,6 +1,7 @@
 """Aplicación principal de FastAPI para el backend de Posgrado."""
 # Sistema
 import sys
+import argparse
 
 # Logging
 from loguru import logger
@@ -34,4 +35,11 @@ except Exception as e: # pylint: disable=broad-except
     sys.exit(1)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backend de Posgrado")
+    parser.add_argument("--profile-startup", action="store_true", help="Muestra el tiempo de carga de config y de cada router, y termina.")
+    args = parser.parse_args()
+    if args.profile_startup:
+        print(app.state.startup_profile.table())
+        sys.exit(0)
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, log_config=None)
@@ -4,40 +4,72 @@
 import time
 
 # Tipado
-from typing import Callable
 import uuid
 
 # Logging
 from loguru import logger
 
-# FastAPI
-from fastapi import Request, Response
+# ASGI puro de Starlette
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware
+class LoguruMiddleware:
+    """
+    Middleware ASGI puro: no envuelve la respuesta en tareas ni streams adicionales,
+    por lo que no agrega overhead por petición y respeta las respuestas en streaming.
+    """
 
-class LoguruMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Intercepta la petición, agrega un Request ID único y contexto al logger."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        request_id=request.headers.get("X-Request-ID", "Desconocido")
+        request_id = Headers(scope=scope).get("X-Request-ID", "Desconocido")
         if not request_id or request_id == "Desconocido":
             request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        # Equivalente a request.state.request_id para los handlers de excepciones
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        status_code = 500
+        response_size = 0
+        first_byte_ns = 0
+        start_ns = time.perf_counter_ns()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size, first_byte_ns
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            elif message["type"] == "http.response.body":
+                if not first_byte_ns:
+                    first_byte_ns = time.perf_counter_ns()
+                response_size += len(message.get("body", b""))
+            await send(message)
 
         with logger.contextualize(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else "Desconocido",
+            method=method,
+            path=path,
+            client_ip=client[0] if client else "Desconocido",
         ):
+            await self.app(scope, receive, send_wrapper)
 
-            start_time = time.time()
-
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            response.headers["X-Request-ID"] = request_id
-            logger.info(
-                f"{request.method} {request.url.path} | Request: {response.status_code} "
-                f"(Tiempo: {process_time:.2f}s)"
+            end_ns = time.perf_counter_ns()
+            process_ms = (end_ns - start_ns) / 1_000_000
+            ttfb_ms = ((first_byte_ns or end_ns) - start_ns) / 1_000_000
+            logger.bind(
+                status_code=status_code,
+                process_ms=process_ms,
+                ttfb_ms=ttfb_ms,
+                response_size=response_size,
+            ).info(
+                f"{method} {path} | Request: {status_code} "
+                f"(Tiempo: {process_ms:.3f} ms | TTFB: {ttfb_ms:.3f} ms | Tamaño: {response_size} B)"
             )
-            return response
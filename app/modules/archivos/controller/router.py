@@ -0,0 +1,64 @@
+from typing import Iterator
+
+import anyio
+from fastapi import APIRouter, Depends, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.modules.archivos.schemas.schema import ProcessFileManagement, UploadCreate, UploadManagement
+from app.modules.archivos.services.service import UploadService, get_upload_service
+
+router = APIRouter()
+
+def _body_chunks(request: Request) -> Iterator[bytes]:
+    """Cuerpo de la petición pieza a pieza, consumido desde un hilo del threadpool."""
+    stream = request.stream().__aiter__()
+    while True:
+        try:
+            yield anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+
+@router.post("/cargas", response_model=UploadManagement, status_code=201)
+def create_upload(data: UploadCreate, service: UploadService = Depends(get_upload_service)):
+    """Inicia una carga por partes para un proceso (y opcionalmente un documento externo)."""
+    return service.create(data)
+
+@router.get("/cargas/{upload_id}", response_model=UploadManagement)
+def get_upload(upload_id: str, service: UploadService = Depends(get_upload_service)):
+    """Estado de la carga; `received` es el offset desde donde reanudar."""
+    return service.status(upload_id)
+
+@router.put("/cargas/{upload_id}", response_model=UploadManagement)
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    offset: int = Header(..., alias="Upload-Offset", ge=0),
+    service: UploadService = Depends(get_upload_service),
+):
+    """
+    Agrega el cuerpo (application/octet-stream) a partir de Upload-Offset.
+    El cuerpo se escribe al almacenamiento mientras llega; la carga se completa con el último byte.
+    """
+    return await run_in_threadpool(service.append, upload_id, offset, _body_chunks(request))
+
+@router.delete("/cargas/{upload_id}", status_code=204)
+def cancel_upload(upload_id: str, service: UploadService = Depends(get_upload_service)):
+    """Cancela una carga en curso."""
+    service.cancel(upload_id)
+    return Response(status_code=204)
+
+@router.get("/procesos/{process_id}", response_model=list[ProcessFileManagement])
+def list_process_files(process_id: int, service: UploadService = Depends(get_upload_service)):
+    """Archivos entregados en el proceso, del más reciente al más antiguo."""
+    return service.process_files(process_id)
+
+@router.get("/{file_id}/contenido")
+def download_file(file_id: int, service: UploadService = Depends(get_upload_service)):
+    """Descarga el contenido leyéndolo por bloques desde el almacenamiento."""
+    stored, chunks = service.content(file_id)
+    return StreamingResponse(
+        chunks,
+        media_type=stored.content_type or "application/octet-stream",
+        headers={"Content-Length": str(stored.size), "ETag": f'"{stored.sha256}"'},
+    )
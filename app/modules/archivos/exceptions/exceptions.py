@@ -0,0 +1,30 @@
+"""Excepciones del módulo de archivos."""
+from app.core.exceptions import AppError
+
+class UploadNotFoundError(AppError):
+    """Error cuando la carga no existe."""
+    status_code = 404
+
+class StoredFileNotFoundError(AppError):
+    """Error cuando el archivo no existe."""
+    status_code = 404
+
+class UploadProcessNotFoundError(AppError):
+    """Error cuando el proceso o el documento de la carga no existe o no corresponden."""
+    status_code = 404
+
+class InvalidUploadError(AppError):
+    """Error cuando la carga declarada no es aceptable: extensión o tamaño."""
+    status_code = 400
+
+class UploadOffsetError(AppError):
+    """Error cuando la parte enviada no empieza donde terminó lo recibido, o la carga está ocupada."""
+    status_code = 409
+
+class UploadClosedError(AppError):
+    """Error cuando la carga ya se completó o se canceló."""
+    status_code = 409
+
+class UploadIntegrityError(AppError):
+    """Error cuando el contenido excede el tamaño declarado o su SHA-256 no coincide."""
+    status_code = 422
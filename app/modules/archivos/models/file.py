@@ -0,0 +1,60 @@
+"""Modelo de datos para los archivos almacenados, sus cargas y su vínculo con los procesos."""
+from enum import Enum
+from typing import ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum
+
+from app.modules.proceso.models.process import ProcessStage
+
+class UploadStatus(str, Enum):
+    IN_PROGRESS = "en_curso"
+    COMPLETED = "completada"
+    CANCELLED = "cancelada"
+
+class StoredFile(SQLModel, table=True):
+    """Contenido almacenado una sola vez por SHA-256; varias cargas iguales lo comparten."""
+    __tablename__: ClassVar[str] = 'archivo'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_archivo", Integer, primary_key=True))
+    sha256: str = Field(sa_column=Column("sha256", String(64), unique=True, nullable=False))
+    size: int = Field(sa_column=Column("tamano", BigInteger, nullable=False))
+    storage_key: str = Field(sa_column=Column("clave", String(300), nullable=False))
+    content_type: Optional[str] = Field(default=None, sa_column=Column("tipo_contenido", String(100), nullable=True))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_creacion", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+class Upload(SQLModel, table=True):
+    """Carga por partes en curso; el avance real es el tamaño del área temporal del almacenamiento."""
+    __tablename__: ClassVar[str] = 'carga_archivo'
+
+    id: str = Field(sa_column=Column("id_carga", String(32), primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), nullable=False))
+    id_document: Optional[int] = Field(default=None, sa_column=Column("id_doc_ext_proceso", Integer, ForeignKey("documento_externo_proceso.id_doc_ext_proceso"), nullable=True))
+    stage: ProcessStage = Field(sa_column=Column("etapa", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=False))
+    filename: str = Field(sa_column=Column("nombre_archivo", String(255), nullable=False))
+    size: int = Field(sa_column=Column("tamano", BigInteger, nullable=False))
+    expected_sha256: Optional[str] = Field(default=None, sa_column=Column("sha256_esperado", String(64), nullable=True))
+    received: int = Field(default=0, sa_column=Column("recibido", BigInteger, nullable=False))
+    status: UploadStatus = Field(default=UploadStatus.IN_PROGRESS, sa_column=Column("estado", PgEnum(UploadStatus, name="carga_archivo_estado"), nullable=False))
+    id_file: Optional[int] = Field(default=None, sa_column=Column("id_archivo", Integer, ForeignKey("archivo.id_archivo"), nullable=True))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_creacion", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+class ProcessFile(SQLModel, table=True):
+    """Archivo entregado en una etapa de un proceso, opcionalmente como un documento externo."""
+    __tablename__: ClassVar[str] = 'archivo_proceso'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_archivo_proceso", Integer, primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), nullable=False))
+    id_file: int = Field(sa_column=Column("id_archivo", Integer, ForeignKey("archivo.id_archivo"), nullable=False))
+    id_document: Optional[int] = Field(default=None, sa_column=Column("id_doc_ext_proceso", Integer, ForeignKey("documento_externo_proceso.id_doc_ext_proceso"), nullable=True))
+    stage: ProcessStage = Field(sa_column=Column("etapa", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=False))
+    filename: str = Field(sa_column=Column("nombre_archivo", String(255), nullable=False))
+    uploaded_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_carga", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+    __table_args__ = (
+        # Archivos de un proceso, del más reciente al más antiguo
+        Index("ix_archivo_proceso_proceso_fecha", "id_proceso", "fecha_carga"),
+        Index("ix_archivo_proceso_documento", "id_doc_ext_proceso"),
+    )
@@ -0,0 +1,59 @@
+"""Repositorio de archivos y cargas."""
+from sqlalchemy import desc
+from sqlmodel import Session, select
+
+from app.shared.bulk import to_columns, upsert
+from app.modules.archivos.models.file import ProcessFile, StoredFile, Upload
+from app.modules.documentos.models.document import ExternalProcessDocument
+from app.modules.proceso.models.process import Process, ProcessStage
+
+class UploadRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_upload(self, upload_id: str) -> Upload | None:
+        return self.session.get(Upload, upload_id)
+
+    def get_file(self, file_id: int) -> StoredFile | None:
+        return self.session.get(StoredFile, file_id)
+
+    def process_stage(self, process_id: int) -> ProcessStage | None:
+        """Etapa actual del proceso, o None si no existe."""
+        return self.session.exec(select(Process.current_stage).where(Process.id == process_id)).first()
+
+    def document_process(self, document_id: int) -> int | None:
+        """Proceso al que pertenece el documento externo, o None si no existe."""
+        return self.session.exec(select(ExternalProcessDocument.id_process).where(ExternalProcessDocument.id == document_id)).first()
+
+    def save(self, upload: Upload) -> Upload:
+        self.session.add(upload)
+        self.session.commit()
+        self.session.refresh(upload)
+        return upload
+
+    def file_by_digest(self, digest: str) -> StoredFile | None:
+        return self.session.exec(select(StoredFile).where(StoredFile.sha256 == digest)).first()
+
+    def register_file(self, values: dict) -> tuple[int, str]:
+        """
+        Registra el contenido o, si otra carga con el mismo SHA-256 se adelantó, devuelve el existente.
+        Returns:
+            tuple[int, str]: (id_archivo, clave) de la fila que quedó registrada.
+        """
+        row = upsert(
+            self.session, StoredFile.__table__, [to_columns(StoredFile, values)], # type: ignore[attr-defined]
+            conflict=["sha256"], update=["sha256"], returning=["id_archivo", "clave"],
+        )[0]
+        return row.id_archivo, row.clave
+
+    def link(self, process_file: ProcessFile) -> None:
+        self.session.add(process_file)
+
+    def process_files(self, process_id: int) -> list:
+        """Archivos del proceso con su contenido, del más reciente al más antiguo: filas (ProcessFile, StoredFile)."""
+        return list(self.session.exec(
+            select(ProcessFile, StoredFile)
+            .join(StoredFile, StoredFile.id == ProcessFile.id_file) # type: ignore[arg-type]
+            .where(ProcessFile.id_process == process_id)
+            .order_by(desc(ProcessFile.uploaded_at), desc(ProcessFile.id)) # type: ignore[arg-type]
+        ).all())
@@ -0,0 +1,39 @@
+"""Esquemas para las cargas y archivos"""
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from app.modules.archivos.models.file import UploadStatus
+from app.modules.proceso.models.process import ProcessStage
+
+class UploadCreate(BaseModel):
+    """Carga a iniciar; sin stage se usa la etapa actual del proceso"""
+    process_id: int
+    document_id: int | None = None
+    stage: ProcessStage | None = None
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(gt=0)
+    sha256: str | None = Field(default=None, pattern="^[0-9a-f]{64}$", description="Si se indica, se verifica al completar")
+
+
+class UploadManagement(BaseModel):
+    id: str
+    process_id: int
+    document_id: int | None = None
+    filename: str
+    size: int
+    received: int
+    status: UploadStatus
+    file_id: int | None = None
+    sha256: str | None = None
+
+
+class ProcessFileManagement(BaseModel):
+    id: int
+    file_id: int
+    process_id: int
+    document_id: int | None = None
+    stage: ProcessStage
+    filename: str
+    size: int
+    sha256: str
+    uploaded_at: datetime
@@ -0,0 +1,26 @@
+"""Trabajos en segundo plano del módulo de archivos."""
+import hashlib
+
+from app.modules.archivos.repository.repository import UploadRepository
+from app.modules.archivos.services import service
+from app.modules.trabajos.services.registry import JobContext, job_handler
+
+@job_handler("archivos.verificar_integridad")
+def verify_integrity(context: JobContext) -> dict:
+    """
+    Relee un archivo almacenado y compara su SHA-256 con el registrado (p. ej. antes del depósito en Cybertesis).
+    Parámetros: file_id.
+    """
+    file_id = int(context.params["file_id"])
+    with context.session() as session:
+        stored = UploadRepository(session).get_file(file_id)
+    if stored is None:
+        raise ValueError(f"El archivo {file_id} no existe")
+
+    hasher = hashlib.sha256()
+    read = 0
+    for chunk in service.upload_storage().read(stored.storage_key):
+        hasher.update(chunk)
+        read += len(chunk)
+        context.report(read * 100 // max(stored.size, 1), f"{read // (1024 * 1024)} de {stored.size // (1024 * 1024)} MiB")
+    return {"file_id": file_id, "sha256": hasher.hexdigest(), "size": read, "ok": hasher.hexdigest() == stored.sha256 and read == stored.size}
@@ -0,0 +1,197 @@
+"""Servicios de cargas de archivos por partes, con SHA-256 al vuelo y deduplicación."""
+import hashlib
+import mimetypes
+import uuid
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_session
+from app.shared.cache import TTLCache
+from app.shared.storage import BlobStorage, StagingConflictError, create_storage
+from app.modules.archivos.exceptions.exceptions import (
+    InvalidUploadError, StoredFileNotFoundError, UploadClosedError, UploadIntegrityError,
+    UploadNotFoundError, UploadOffsetError, UploadProcessNotFoundError,
+)
+from app.modules.archivos.models.file import ProcessFile, StoredFile, Upload, UploadStatus
+from app.modules.archivos.repository.repository import UploadRepository
+from app.modules.archivos.schemas.schema import ProcessFileManagement, UploadCreate, UploadManagement
+
+# Estado del SHA-256 por carga en curso: (bytes ya digeridos, hasher). hashlib no se puede
+# serializar; si la parte siguiente llega a otro worker o tras un reinicio, el estado se
+# reconstruye leyendo una vez el área temporal.
+_hashers = TTLCache(ttl=3600, maxsize=256)
+
+@lru_cache(maxsize=1)
+def upload_storage() -> BlobStorage:
+    """Almacenamiento configurado en UPLOAD_STORAGE."""
+    return create_storage(
+        settings.UPLOAD_STORAGE, root=settings.UPLOAD_LOCAL_ROOT,
+        account_url=settings.UPLOAD_AZURE_ACCOUNT_URL, container=settings.UPLOAD_AZURE_CONTAINER,
+    )
+
+class UploadService:
+    """
+    Cargas reanudables: cada parte se escribe al almacenamiento en bloques de `chunk_size`
+    mientras llega y actualiza el SHA-256, sin retener el archivo en memoria.
+    """
+
+    def __init__(self, repository: UploadRepository, storage: BlobStorage, chunk_size: int = settings.UPLOAD_CHUNK_SIZE) -> None:
+        self.repository = repository
+        self.storage = storage
+        self.chunk_size = chunk_size
+
+    def create(self, data: UploadCreate) -> UploadManagement:
+        """Valida el destino y el tamaño declarado e inicia una carga vacía."""
+        if not data.filename.lower().endswith(settings.UPLOAD_ALLOWED_EXTENSIONS):
+            raise InvalidUploadError(f"Formato no permitido: use {', '.join(settings.UPLOAD_ALLOWED_EXTENSIONS)}")
+        if data.size > settings.UPLOAD_MAX_SIZE:
+            raise InvalidUploadError(f"El archivo supera el máximo de {settings.UPLOAD_MAX_SIZE // (1024 * 1024)} MB")
+        current_stage = self.repository.process_stage(data.process_id)
+        if current_stage is None:
+            raise UploadProcessNotFoundError(f"El proceso {data.process_id} no existe")
+        if data.document_id is not None and self.repository.document_process(data.document_id) != data.process_id:
+            raise UploadProcessNotFoundError(f"El documento {data.document_id} no pertenece al proceso {data.process_id}")
+
+        upload = self.repository.save(Upload(
+            id=uuid.uuid4().hex, id_process=data.process_id, id_document=data.document_id,
+            stage=data.stage or current_stage, filename=data.filename, size=data.size, expected_sha256=data.sha256,
+        ))
+        return self.to_management(upload)
+
+    def _get(self, upload_id: str) -> Upload:
+        upload = self.repository.get_upload(upload_id)
+        if upload is None:
+            raise UploadNotFoundError(f"La carga {upload_id} no existe")
+        return upload
+
+    def status(self, upload_id: str) -> UploadManagement:
+        """Estado de la carga; en curso, el offset desde donde reanudar es lo que ya guardó el almacenamiento."""
+        upload = self._get(upload_id)
+        if upload.status == UploadStatus.IN_PROGRESS:
+            upload.received = self.storage.staged_size(upload_id)
+        stored = self.repository.get_file(upload.id_file) if upload.id_file is not None else None
+        return self.to_management(upload, stored.sha256 if stored is not None else None)
+
+    def _hasher(self, upload_id: str, offset: int):
+        """SHA-256 de los primeros `offset` bytes ya guardados, desde la caché o releyendo el área temporal."""
+        staged = self.storage.staged_size(upload_id)
+        if staged != offset:
+            raise UploadOffsetError(f"La carga va en el byte {staged}; envíe la parte desde ese offset")
+        cached = _hashers.get(upload_id)
+        if cached is not None and cached[0] == offset:
+            return cached[1].copy()
+        hasher = hashlib.sha256()
+        if offset:
+            for chunk in self.storage.read_staged(upload_id):
+                hasher.update(chunk)
+        return hasher
+
+    def append(self, upload_id: str, offset: int, chunks: Iterable[bytes]) -> UploadManagement:
+        """
+        Agrega una parte desde `offset`. Lo escrito se conserva aunque la petición se corte,
+        así el cliente consulta el estado y reanuda desde el offset que devuelve.
+        Al recibir el último byte la carga se completa en la misma llamada.
+        """
+        upload = self._get(upload_id)
+        if upload.status != UploadStatus.IN_PROGRESS:
+            raise UploadClosedError(f"La carga {upload_id} está {upload.status.value}")
+        hasher = self._hasher(upload_id, offset)
+        received = offset
+        try:
+            with self.storage.append(upload_id, offset) as writer:
+                buffer = bytearray()
+                for piece in chunks:
+                    if received + len(buffer) + len(piece) > upload.size:
+                        raise UploadIntegrityError(f"El contenido excede el tamaño declarado de {upload.size} bytes")
+                    buffer += piece
+                    if len(buffer) >= self.chunk_size:
+                        writer.write(bytes(buffer))
+                        hasher.update(buffer)
+                        received += len(buffer)
+                        buffer.clear()
+                if buffer:
+                    writer.write(bytes(buffer))
+                    hasher.update(buffer)
+                    received += len(buffer)
+        except StagingConflictError as e:
+            raise UploadOffsetError(f"La carga va en el byte {e.size} o la está escribiendo otra petición") from e
+        finally:
+            _hashers.set(upload_id, (received, hasher))
+
+        upload.received = received
+        if received == upload.size:
+            return self._complete(upload, hasher.hexdigest())
+        return self.to_management(self.repository.save(upload))
+
+    def _complete(self, upload: Upload, digest: str) -> UploadManagement:
+        """Verifica el SHA-256, deduplica el contenido y lo vincula al proceso y al documento."""
+        _hashers.invalidate([upload.id])
+        if upload.expected_sha256 is not None and upload.expected_sha256 != digest:
+            self.storage.discard(upload.id)
+            upload.status = UploadStatus.CANCELLED
+            self.repository.save(upload)
+            raise UploadIntegrityError("El SHA-256 del contenido no coincide con el declarado; la carga se canceló")
+
+        existing = self.repository.file_by_digest(digest)
+        if existing is not None:
+            self.storage.discard(upload.id)
+            file_id = existing.id
+        else:
+            key = self.storage.promote(upload.id, digest)
+            file_id, registered_key = self.repository.register_file({
+                "sha256": digest, "size": upload.size, "storage_key": key,
+                "content_type": mimetypes.guess_type(upload.filename)[0],
+            })
+            if registered_key != key:
+                # Otra carga idéntica se registró primero; su objeto es el que queda
+                self.storage.discard(upload.id)
+
+        upload.id_file, upload.status = file_id, UploadStatus.COMPLETED
+        self.repository.link(ProcessFile(
+            id_process=upload.id_process, id_file=file_id, id_document=upload.id_document,
+            stage=upload.stage, filename=upload.filename,
+        ))
+        return self.to_management(self.repository.save(upload), digest)
+
+    def cancel(self, upload_id: str) -> None:
+        """Cancela una carga en curso y libera su área temporal."""
+        upload = self._get(upload_id)
+        if upload.status != UploadStatus.IN_PROGRESS:
+            raise UploadClosedError(f"La carga {upload_id} está {upload.status.value}")
+        self.storage.discard(upload_id)
+        _hashers.invalidate([upload_id])
+        upload.status = UploadStatus.CANCELLED
+        self.repository.save(upload)
+
+    def process_files(self, process_id: int) -> list[ProcessFileManagement]:
+        if self.repository.process_stage(process_id) is None:
+            raise UploadProcessNotFoundError(f"El proceso {process_id} no existe")
+        return [
+            ProcessFileManagement(
+                id=link.id, file_id=stored.id, process_id=link.id_process, document_id=link.id_document,
+                stage=link.stage, filename=link.filename, size=stored.size, sha256=stored.sha256, uploaded_at=link.uploaded_at,
+            )
+            for link, stored in self.repository.process_files(process_id)
+        ]
+
+    def content(self, file_id: int) -> tuple[StoredFile, Iterator[bytes]]:
+        """Archivo y un iterador perezoso sobre su contenido."""
+        stored = self.repository.get_file(file_id)
+        if stored is None:
+            raise StoredFileNotFoundError(f"El archivo {file_id} no existe")
+        return stored, self.storage.read(stored.storage_key)
+
+    @staticmethod
+    def to_management(upload: Upload, digest: str | None = None) -> UploadManagement:
+        return UploadManagement(
+            id=upload.id, process_id=upload.id_process, document_id=upload.id_document, filename=upload.filename,
+            size=upload.size, received=upload.received, status=upload.status, file_id=upload.id_file, sha256=digest,
+        )
+
+def get_upload_service(session: Session = Depends(get_session)) -> UploadService:
+    """Dependencia que construye el servicio de cargas."""
+    return UploadService(UploadRepository(session), upload_storage())
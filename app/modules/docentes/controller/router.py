@@ -1,3 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends, Query
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.modules.docentes.schemas.schema import TeacherSearchResult
+from app.modules.docentes.services.service import TeacherService, get_teacher_service
+
+router = APIRouter()
+
+@router.get("/buscar", response_model=list[TeacherSearchResult])
+async def search_teachers(
+    q: str = Query(..., min_length=2, max_length=100, description="Nombre, apellidos o DNI"),
+    limit: int = Query(default=20, ge=1, le=100),
+    service: TeacherService = Depends(get_teacher_service),
+):
+    """Búsqueda aproximada de docentes, insensible a tildes y mayúsculas."""
+    return await run_db(service.search, q, limit)
@@ -1,12 +1,15 @@
 """Modelo de datos para la gestión de profesores."""
 from enum import Enum
 from datetime import date
-from typing import ClassVar, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
-from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Integer, String, Date, CheckConstraint
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, Integer, String, Date, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum
 
+if TYPE_CHECKING:
+    from app.modules.proceso.models.process import Process
+
 class StatusTeacher(str, Enum):
     ACTIVE = "activo"
     INACTIVE = "inactivo"
@@ -32,7 +35,15 @@ class Teacher(SQLModel, table=True):
     license_end_date: Optional[date] = Field(default=None, sa_column=Column("fecha_fin_licencia", Date, nullable=True))
     status: StatusTeacher = Field(default=StatusTeacher.ACTIVE, sa_column=Column("estado", PgEnum(StatusTeacher, name="docente_estado"), nullable=False))
 
+    advised_processes: list["Process"] = Relationship(back_populates="advisor")
+
     __table_args__ = (
-        CheckConstraint("celular ~ '^[0-9]{9}$'", name="chk_docente_celular"),
-        CheckConstraint("dni ~ '^[0-9]{8}$'", name="chk_docente_dni"),
+        CheckConstraint("celular ~ '^[0-9]{9}$'", name="chk_docente_celular").ddl_if(dialect="postgresql"),
+        CheckConstraint("dni ~ '^[0-9]{8}$'", name="chk_docente_dni").ddl_if(dialect="postgresql"),
+        # Búsqueda por nombre o DNI; la expresión coincide con search_document()
+        Index(
+            "ix_docente_busqueda_trgm",
+            text("f_unaccent(lower(nombres || ' ' || apellido_paterno || ' ' || apellido_materno || ' ' || dni)) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
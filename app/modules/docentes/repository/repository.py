@@ -0,0 +1,26 @@
+"""Repositorio de docentes."""
+from sqlmodel import Session, select
+
+from app.shared.search import FallbackIndex, search_ids
+from app.modules.docentes.models.teacher import Teacher
+
+# Índice en memoria para motores sin pg_trgm (SQLite en pruebas)
+_search_fallback = FallbackIndex()
+
+class TeacherRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def search(self, query: str, limit: int) -> list[tuple[Teacher, float]]:
+        """
+        Busca docentes por nombre, apellidos o DNI usando trigramas.
+        Args:
+            query (str): Texto a buscar.
+            limit (int): Máximo de resultados.
+        Returns:
+            list[tuple[Teacher, float]]: Docentes con su puntaje, de mayor a menor.
+        """
+        columns = (Teacher.name, Teacher.paternal_surname, Teacher.maternal_surname, Teacher.dni)
+        ranked = dict(search_ids(self.session, Teacher.id, columns, query, limit, _search_fallback))
+        teachers = {teacher.id: teacher for teacher in self.session.exec(select(Teacher).where(Teacher.id.in_(list(ranked))))} # type: ignore[union-attr]
+        return [(teachers[teacher_id], score) for teacher_id, score in ranked.items() if teacher_id in teachers]
@@ -39,3 +39,15 @@ class TeacherDashboard(TeacherBase):
     license_end_date: date | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+class TeacherSearchResult(BaseModel):
+    """Resultado de búsqueda de docentes"""
+    id: int
+    dni: str
+    name: str
+    paternal_surname: str
+    maternal_surname: str
+    status: StatusTeacher
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,30 @@
+"""Servicios del módulo de docentes."""
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.modules.docentes.repository.repository import TeacherRepository
+from app.modules.docentes.schemas.schema import TeacherSearchResult
+
+class TeacherService:
+    def __init__(self, repository: TeacherRepository) -> None:
+        self.repository = repository
+
+    def search(self, query: str, limit: int) -> list[TeacherSearchResult]:
+        """Busca docentes por nombre o DNI, ordenados por relevancia."""
+        return [
+            TeacherSearchResult(
+                id=teacher.id, # type: ignore[arg-type]
+                dni=teacher.dni,
+                name=teacher.name,
+                paternal_surname=teacher.paternal_surname,
+                maternal_surname=teacher.maternal_surname,
+                status=teacher.status,
+                score=round(score, 4),
+            )
+            for teacher, score in self.repository.search(query.strip(), limit)
+        ]
+
+def get_teacher_service(session: Session = Depends(get_db_session)) -> TeacherService:
+    """Dependencia que construye el servicio de docentes."""
+    return TeacherService(TeacherRepository(session))
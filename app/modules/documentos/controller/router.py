@@ -1,3 +1,63 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import date
 
-router = APIRouter()
\ No newline at end of file
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from app.core.database import run_db
+from app.shared.response_cache import cached_json
+from app.modules.documentos.schemas.schema import (
+    CatalogDocument, CatalogDocumentCreate, CatalogDocumentUpdate,
+    DocumentBoardPage, DocumentStatusBatch, DocumentStatusReport,
+)
+from app.modules.documentos.services.service import (
+    DocumentCategoryService, DocumentService, category_cache, get_document_category_service, get_document_service,
+)
+from app.modules.proceso.models.process import ProcessStage
+
+router = APIRouter()
+
+@router.get("/categorias", response_model=list[CatalogDocument])
+async def list_categories(
+    request: Request,
+    active: bool | None = Query(default=None),
+    service: DocumentCategoryService = Depends(get_document_category_service),
+) -> Response:
+    """Catálogo de categorías de documentos externos; admite If-None-Match."""
+    return await run_db(cached_json, request, category_cache, f"active={active}", lambda: service.list_categories(active))
+
+@router.post("/categorias", response_model=CatalogDocument, status_code=201)
+async def create_category(
+    data: CatalogDocumentCreate,
+    service: DocumentCategoryService = Depends(get_document_category_service),
+):
+    """Registra una categoría de documento externo."""
+    return await run_db(service.create, data)
+
+@router.patch("/categorias/{category_id}", response_model=CatalogDocument)
+async def update_category(
+    category_id: int,
+    data: CatalogDocumentUpdate,
+    service: DocumentCategoryService = Depends(get_document_category_service),
+):
+    """Actualiza una categoría de documento externo."""
+    return await run_db(service.update, category_id, data)
+
+@router.get("/tablero", response_model=DocumentBoardPage)
+async def document_board(
+    cursor: int | None = Query(default=None, description="Cursor devuelto en next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200),
+    overdue_only: bool = Query(default=True, description="Solo pendientes con fecha vencida"),
+    stage: ProcessStage | None = Query(default=None),
+    category_id: int | None = Query(default=None),
+    as_of: date | None = Query(default=None, description="Fecha de corte; por defecto hoy"),
+    service: DocumentService = Depends(get_document_service),
+):
+    """Documentos no recibidos o no entregados, con categoría y etapa, en una sola consulta por página."""
+    return await run_db(service.board, limit=limit, cursor=cursor, overdue_only=overdue_only, stage=stage, category_id=category_id, as_of=as_of)
+
+@router.patch("/estado", response_model=DocumentStatusReport)
+async def update_document_status(
+    batch: DocumentStatusBatch,
+    service: DocumentService = Depends(get_document_service),
+):
+    """Cambia el estado de muchos documentos en una sola sentencia."""
+    return await run_db(service.update_status, batch)
@@ -0,0 +1,10 @@
+"""Excepciones del módulo de documentos."""
+from app.core.exceptions import AppError
+
+class DocumentCategoryNotFoundError(AppError):
+    """Error cuando la categoría de documento externo no existe."""
+    status_code = 404
+
+class EmptyDocumentUpdateError(AppError):
+    """Error cuando un cambio de estado masivo no indica ningún campo a modificar."""
+    status_code = 400
@@ -3,7 +3,7 @@ from enum import Enum
 from typing import ClassVar, Optional
 from datetime import date
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum
 
 class ReceptionStatus(str, Enum):
@@ -14,6 +14,10 @@ class DeliveryStatus(str, Enum):
     ENTREGADO = "entregado"
     NO_ENTREGADO = "no_entregado"
 
+# Predicados de los índices parciales; el enum se guarda por nombre del miembro
+PENDING_RECEPTION = text("estado_recepcion = 'NO_RECIBIDO'")
+PENDING_DELIVERY = text("estado_entrega = 'NO_ENTREGADO'")
+
 class ExternalProcessDocument(SQLModel, table=True):
     __tablename__: ClassVar[str] = "documento_externo_proceso"
 
@@ -31,6 +35,19 @@ class ExternalProcessDocument(SQLModel, table=True):
     reception_date: Optional[date] = Field(default=None, sa_column=Column("fecha_recepcion", Date, nullable=True))
     delivery_date: Optional[date] = Field(default=None, sa_column=Column("fecha_entrega", Date, nullable=True))
 
+    __table_args__ = (
+        # Tablero de pendientes: índices parciales, solo con las filas aún no recibidas / no entregadas.
+        # La condición "pendiente y vencido" se resuelve con un BitmapOr de ambos.
+        Index(
+            "ix_doc_ext_pendiente_recepcion", "fecha_recepcion",
+            postgresql_where=PENDING_RECEPTION, sqlite_where=PENDING_RECEPTION,
+        ),
+        Index(
+            "ix_doc_ext_pendiente_entrega", "fecha_entrega",
+            postgresql_where=PENDING_DELIVERY, sqlite_where=PENDING_DELIVERY,
+        ),
+    )
+
     # Relationships a futuro
     # process: Optional["Process"] = Relationship()
     # stage: Optional["ProcessStage"] = Relationship()
@@ -0,0 +1,97 @@
+"""Repositorio de documentos externos y su catálogo de categorías."""
+from datetime import date
+from typing import Any
+
+from sqlalchemy import and_, or_, update
+from sqlmodel import Session, select
+
+from app.shared.bulk import id_in
+from app.modules.documentos.models.document import PENDING_DELIVERY, PENDING_RECEPTION, ExternalProcessDocument
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.proceso.models.process import ProcessStage
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+
+class DocumentCategoryRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def list_categories(self, active: bool | None = None) -> list[ExternalDocumentCategory]:
+        """Lista las categorías ordenadas por nombre, opcionalmente solo activas o inactivas."""
+        statement = select(ExternalDocumentCategory)
+        if active is not None:
+            statement = statement.where(ExternalDocumentCategory.is_active == active)
+        return list(self.session.exec(statement.order_by(ExternalDocumentCategory.full_name)).all()) # type: ignore[arg-type]
+
+    def get(self, category_id: int) -> ExternalDocumentCategory | None:
+        """Busca una categoría por clave primaria."""
+        return self.session.get(ExternalDocumentCategory, category_id)
+
+    def save(self, category: ExternalDocumentCategory) -> ExternalDocumentCategory:
+        """Crea o actualiza una categoría; la transacción la confirma get_session al terminar la petición."""
+        self.session.add(category)
+        self.session.flush()
+        self.session.refresh(category)
+        return category
+
+class DocumentRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def board(
+        self,
+        as_of: date,
+        limit: int,
+        after: int | None = None,
+        overdue_only: bool = True,
+        stage: ProcessStage | None = None,
+        category_id: int | None = None,
+    ) -> list:
+        """
+        Documentos no recibidos o no entregados, con su categoría y etapa, en una sola consulta.
+        Cada rama del OR repite literalmente el predicado de un índice parcial
+        (ix_doc_ext_pendiente_recepcion / ix_doc_ext_pendiente_entrega); con un parámetro
+        enlazado el planificador no siempre puede probar que el índice aplica.
+        Args:
+            as_of (date): Fecha de corte; vence lo que tenía fecha anterior.
+            limit (int): Cantidad máxima de documentos.
+            after (int | None): Último id de la página anterior.
+            overdue_only (bool): Solo los pendientes ya vencidos.
+            stage (ProcessStage | None): Filtra por la etapa del documento.
+            category_id (int | None): Filtra por categoría.
+        Returns:
+            list: Filas (documento, categoría, etapa).
+        """
+        if overdue_only:
+            condition = or_(
+                and_(PENDING_RECEPTION, ExternalProcessDocument.reception_date < as_of), # type: ignore[operator]
+                and_(PENDING_DELIVERY, ExternalProcessDocument.delivery_date < as_of), # type: ignore[operator]
+            )
+        else:
+            condition = or_(PENDING_RECEPTION, PENDING_DELIVERY)
+        statement = (
+            select(ExternalProcessDocument, ExternalDocumentCategory, ProcessStageRecord.stage)
+            .join(ExternalDocumentCategory, ExternalDocumentCategory.id == ExternalProcessDocument.id_external_doc_category) # type: ignore[arg-type]
+            .join(ProcessStageRecord, ProcessStageRecord.id == ExternalProcessDocument.id_process_stage) # type: ignore[arg-type]
+            .where(condition)
+        )
+        if after is not None:
+            statement = statement.where(ExternalProcessDocument.id > after) # type: ignore[operator]
+        if stage is not None:
+            statement = statement.where(ProcessStageRecord.stage == stage)
+        if category_id is not None:
+            statement = statement.where(ExternalProcessDocument.id_external_doc_category == category_id)
+        statement = statement.order_by(ExternalProcessDocument.id).limit(limit) # type: ignore[arg-type]
+        return list(self.session.exec(statement).all())
+
+    def update_status(self, ids: list[int], values: dict[str, Any]) -> list[int]:
+        """
+        Aplica los mismos valores a todos los documentos indicados con un único UPDATE.
+        Returns:
+            list[int]: Ids actualizados (los inexistentes no aparecen).
+        """
+        return list(self.session.exec(
+            update(ExternalProcessDocument)
+            .where(id_in(self.session, ExternalProcessDocument.id, ids))
+            .values(values)
+            .returning(ExternalProcessDocument.id)
+        ).scalars())
@@ -1,6 +1,7 @@
 """Esquemas para los documentos"""
 from pydantic import BaseModel, ConfigDict, Field
 from app.modules.documentos.models.document import ReceptionStatus, DeliveryStatus
+from app.modules.proceso.models.process import ProcessStage
 from datetime import date
 
 class DocumentBase(BaseModel):
@@ -34,9 +35,43 @@ class DocumentManagement(BaseModel):
     id_task_delivery: int
     sender_actor: str | None
     recipient_actor: str | None
-    reception_status: ReceptionStatus
-    delivery_status: DeliveryStatus
+    reception_status: ReceptionStatus | None
+    delivery_status: DeliveryStatus | None
     reception_date: date | None
     delivery_date: date | None
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class DocumentBoardItem(DocumentManagement):
+    """Documento pendiente en el tablero, con la etapa a la que pertenece"""
+    stage: ProcessStage
+    overdue: bool
+
+
+class DocumentBoardPage(BaseModel):
+    """Página del tablero de documentos paginada por cursor (id_doc_ext_proceso)"""
+    items: list[DocumentBoardItem]
+    next_cursor: int | None = None
+
+
+class DocumentStatusBatch(BaseModel):
+    """Cambio de estado aplicado a muchos documentos con un solo UPDATE"""
+    ids: list[int] = Field(..., min_length=1, max_length=2000)
+    reception_status: ReceptionStatus | None = None
+    delivery_status: DeliveryStatus | None = None
+    reception_date: date | None = None
+    delivery_date: date | None = None
+
+
+class DocumentStatusReport(BaseModel):
+    updated: int
+    not_found: list[int] = []
+
+class CatalogDocumentCreate(BaseModel):
+    full_name: str = Field(..., min_length=1, max_length=200)
+    active_status: bool = Field(default=True)
+
+
+class CatalogDocumentUpdate(BaseModel):
+    full_name: str | None = Field(default=None, min_length=1, max_length=200)
+    active_status: bool | None = None
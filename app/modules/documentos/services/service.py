@@ -0,0 +1,134 @@
+"""Servicios del módulo de documentos."""
+from datetime import date
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.shared.events import publish
+from app.shared.response_cache import ResponseCache, shared_backend
+from app.modules.documentos.exceptions.exceptions import DocumentCategoryNotFoundError, EmptyDocumentUpdateError
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.documentos.repository.repository import DocumentCategoryRepository, DocumentRepository
+from app.modules.documentos.schemas.schema import (
+    CatalogDocument, CatalogDocumentCreate, CatalogDocumentUpdate,
+    DocumentBoardItem, DocumentBoardPage, DocumentStatusBatch, DocumentStatusReport,
+)
+from app.modules.proceso.models.process import ProcessStage
+
+# Respuestas del catálogo de categorías, por filtro
+category_cache = ResponseCache("documentos:categorias", ttl=settings.CATALOG_CACHE_TTL, backend=shared_backend())
+
+class DocumentCategoryService:
+    def __init__(self, repository: DocumentCategoryRepository) -> None:
+        self.repository = repository
+
+    def list_categories(self, active: bool | None = None) -> list[CatalogDocument]:
+        """Lista el catálogo de categorías de documentos externos."""
+        return [to_catalog(category) for category in self.repository.list_categories(active)]
+
+    def create(self, data: CatalogDocumentCreate) -> CatalogDocument:
+        """Registra una categoría."""
+        category = ExternalDocumentCategory(full_name=data.full_name, is_active=data.active_status)
+        return to_catalog(self.repository.save(category))
+
+    def update(self, category_id: int, data: CatalogDocumentUpdate) -> CatalogDocument:
+        """Actualiza el nombre o el estado de una categoría."""
+        category = self.repository.get(category_id)
+        if category is None:
+            raise DocumentCategoryNotFoundError(f"No existe la categoría {category_id}.")
+        if data.full_name is not None:
+            category.full_name = data.full_name
+        if data.active_status is not None:
+            category.is_active = data.active_status
+        return to_catalog(self.repository.save(category))
+
+class DocumentService:
+    def __init__(self, repository: DocumentRepository) -> None:
+        self.repository = repository
+
+    def board(
+        self,
+        limit: int,
+        cursor: int | None = None,
+        overdue_only: bool = True,
+        stage: ProcessStage | None = None,
+        category_id: int | None = None,
+        as_of: date | None = None,
+    ) -> DocumentBoardPage:
+        """Página del tablero de documentos pendientes y el cursor para la siguiente."""
+        as_of = as_of or date.today()
+        rows = self.repository.board(
+            as_of, limit=limit + 1, after=cursor, overdue_only=overdue_only, stage=stage, category_id=category_id,
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return DocumentBoardPage(
+            items=[to_board_item(document, category, document_stage, as_of) for document, category, document_stage in rows],
+            next_cursor=rows[-1][0].id if has_more else None,
+        )
+
+    def update_status(self, batch: DocumentStatusBatch) -> DocumentStatusReport:
+        """
+        Cambia estado y fechas de muchos documentos con un solo UPDATE.
+        Marcar como recibido o entregado sin fecha registra la fecha de hoy.
+        """
+        values = batch.model_dump(exclude={"ids"}, exclude_none=True)
+        if not values:
+            raise EmptyDocumentUpdateError("Indique al menos un estado o fecha a modificar.")
+        if batch.reception_status == ReceptionStatus.RECIBIDO:
+            values.setdefault("reception_date", date.today())
+        if batch.delivery_status == DeliveryStatus.ENTREGADO:
+            values.setdefault("delivery_date", date.today())
+
+        ids = list(dict.fromkeys(batch.ids))
+        updated = self.repository.update_status(ids, values)
+        if updated:
+            # UPDATE masivo: fuera del ORM, se avisa al change feed
+            publish(self.repository.session, {ExternalProcessDocument: updated})
+        self.repository.session.commit()
+        found = set(updated)
+        return DocumentStatusReport(updated=len(updated), not_found=[document_id for document_id in ids if document_id not in found])
+
+def to_board_item(
+    document: ExternalProcessDocument, category: ExternalDocumentCategory, stage: ProcessStage, as_of: date,
+) -> DocumentBoardItem:
+    """Construye la fila del tablero a partir del documento, su categoría y su etapa."""
+    overdue = (
+        (document.reception_status == ReceptionStatus.NO_RECIBIDO and document.reception_date is not None and document.reception_date < as_of)
+        or (document.delivery_status == DeliveryStatus.NO_ENTREGADO and document.delivery_date is not None and document.delivery_date < as_of)
+    )
+    return DocumentBoardItem(
+        id=document.id, # type: ignore[arg-type]
+        id_process=document.id_process,
+        id_stage_process=document.id_process_stage,
+        catalog_document=to_catalog(category),
+        id_task_reception=document.id_reception_task,
+        id_task_delivery=document.id_delivery_task,
+        sender_actor=document.actor_emitter,
+        recipient_actor=document.actor_addressee,
+        reception_status=document.reception_status,
+        delivery_status=document.delivery_status,
+        reception_date=document.reception_date,
+        delivery_date=document.delivery_date,
+        stage=stage,
+        overdue=overdue,
+    )
+
+def to_catalog(category: ExternalDocumentCategory) -> CatalogDocument:
+    """Construye CatalogDocument a partir del modelo."""
+    return CatalogDocument(
+        id_cat_doc_ext=category.id, # type: ignore[arg-type]
+        full_name=category.full_name or "",
+        active_status=bool(category.is_active),
+    )
+
+def get_document_category_service(session: Session = Depends(get_db_session)) -> DocumentCategoryService:
+    """Dependencia que construye el servicio del catálogo de categorías."""
+    return DocumentCategoryService(DocumentCategoryRepository(session))
+
+def get_document_service(session: Session = Depends(get_db_session)) -> DocumentService:
+    """Dependencia que construye el servicio de documentos."""
+    return DocumentService(DocumentRepository(session))
@@ -0,0 +1,14 @@
+"""
+Suscriptor del change feed del catálogo de categorías.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import on_commit, subscribe
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+
+@subscribe(ExternalDocumentCategory)
+def invalidate_category_cache(session: Session, _changes: dict[type, set[int]]) -> None:
+    """Toda escritura del catálogo invalida sus respuestas al confirmarse."""
+    from app.modules.documentos.services.service import category_cache # pylint: disable=import-outside-toplevel
+    on_commit(session, category_cache.invalidate)
@@ -1,8 +1,87 @@
-from fastapi import APIRouter, HTTPException, Depends
-from app.core.exceptions import AppError
-from loguru import logger
+from typing import Literal
+
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+
+from app.core.database import run_db
+from app.shared.response_cache import cached_json
+from app.shared.spreadsheets import export_response
+from app.modules.estudiantes.models.program import StatusProgram
+from app.modules.estudiantes.models.program_student import StatusStudentProgram
+from app.modules.estudiantes.schemas.schema import (
+    ProgramCatalog, ProgramCreate, ProgramUpdate, StudentImportReport, StudentPage, StudentSearchResult,
+)
+from app.modules.estudiantes.services.service import (
+    ProgramService, StudentImportService, StudentService,
+    get_program_service, get_student_export_service, get_student_import_service, get_student_service, program_cache,
+)
+
 router = APIRouter()
 
 @router.get("/ping")
 def ping():
     return {"status": "ok", "module": "estudiantes"}
+
+@router.get("/programas", response_model=list[ProgramCatalog])
+async def list_programs(
+    request: Request,
+    status: StatusProgram | None = Query(default=None),
+    service: ProgramService = Depends(get_program_service),
+) -> Response:
+    """Catálogo de programas; admite If-None-Match."""
+    return await run_db(cached_json, request, program_cache, f"status={status}", lambda: service.list_programs(status))
+
+@router.post("/programas", response_model=ProgramCatalog, status_code=201)
+async def create_program(data: ProgramCreate, service: ProgramService = Depends(get_program_service)):
+    """Registra un programa."""
+    return await run_db(service.create, data)
+
+@router.patch("/programas/{program_id}", response_model=ProgramCatalog)
+async def update_program(program_id: int, data: ProgramUpdate, service: ProgramService = Depends(get_program_service)):
+    """Actualiza un programa."""
+    return await run_db(service.update, program_id, data)
+
+@router.post("/importar", response_model=StudentImportReport)
+def import_students(
+    file: UploadFile = File(..., description="CSV o XLSX con una fila por matrícula"),
+    service: StudentImportService = Depends(get_student_import_service),
+):
+    """Importa estudiantes y matrículas en lote; devuelve los errores por fila."""
+    return service.import_file(file.file, file.filename or "")
+
+@router.get("/exportar")
+def export_students(
+    file_format: Literal["csv", "xlsx"] = Query(default="csv", alias="format"),
+    program_id: int | None = Query(default=None),
+    status: StatusStudentProgram | None = Query(default=None),
+    admission_year: int | None = Query(default=None),
+    service: StudentService = Depends(get_student_export_service),
+):
+    """Exporta estudiantes con su programa en CSV o XLSX, escribiendo fila a fila."""
+    header, rows = service.export(program_id=program_id, status=status, admission_year=admission_year)
+    return export_response("estudiantes", file_format, header, rows)
+
+@router.get("/buscar", response_model=list[StudentSearchResult])
+async def search_students(
+    q: str = Query(..., min_length=2, max_length=100, description="Nombre, apellidos, documento o código de alumno"),
+    limit: int = Query(default=20, ge=1, le=100),
+    service: StudentService = Depends(get_student_service),
+):
+    """Búsqueda aproximada de estudiantes, insensible a tildes y mayúsculas."""
+    return await run_db(service.search, q, limit)
+
+@router.get("/", response_model=StudentPage)
+async def list_students(
+    cursor: str | None = Query(default=None, description="Cursor devuelto en next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200),
+    program_id: int | None = Query(default=None),
+    status: StatusStudentProgram | None = Query(default=None),
+    admission_year: int | None = Query(default=None),
+    q: str | None = Query(default=None, min_length=2, max_length=100, description="Código de alumno o nombre"),
+    service: StudentService = Depends(get_student_service),
+):
+    """Lista estudiantes con su programa, paginando por cursor sobre id_estudiante."""
+    return await run_db(
+        service.list_students,
+        limit=limit, cursor=cursor, program_id=program_id,
+        status=status, admission_year=admission_year, search=q,
+    )
@@ -0,0 +1,14 @@
+"""Excepciones del módulo de estudiantes."""
+from app.core.exceptions import AppError
+
+class InvalidCursorError(AppError):
+    """Error cuando el cursor de paginación no es válido."""
+    status_code = 400
+
+class ProgramNotFoundError(AppError):
+    """Error cuando el programa no existe."""
+    status_code = 404
+
+class ImportFileError(AppError):
+    """Error cuando el archivo de importación no se puede leer."""
+    status_code = 400
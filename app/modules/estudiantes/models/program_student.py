@@ -1,11 +1,17 @@
 """Modelo de datos para la gestión de Estudiantes matriculados en Programas."""
 from enum import Enum
-from typing import ClassVar, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
-from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Integer, String, CheckConstraint, ForeignKey
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, Integer, String, CheckConstraint, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum
 
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.student import Student
+
+if TYPE_CHECKING:
+    from app.modules.proceso.models.process import Process
+
 class StatusStudentProgram(str, Enum):
     ACTIVE = "activo"
     INACTIVE = "inactivo"
@@ -23,6 +29,15 @@ class ProgramStudent(SQLModel, table=True):
     admission_year: int = Field(sa_column=Column("fecha_inicio", Integer, nullable=False))
     graduation_year: Optional[int] = Field(default=None, sa_column=Column("fecha_fin", Integer, nullable=True))
 
+    student: Optional[Student] = Relationship()
+    program: Optional[Program] = Relationship()
+    processes: list["Process"] = Relationship(back_populates="student_program")
+
     __table_args__ = (
-        CheckConstraint("codigo_alumno ~ '^[0-9]{8}$'", name="chk_codigo_alumno"),
+        CheckConstraint("codigo_alumno ~ '^[0-9]{8}$'", name="chk_codigo_alumno").ddl_if(dialect="postgresql"),
+        # Join con estudiante y paginación por cursor sobre id_estudiante
+        Index("ix_programa_estudiante_estudiante", "id_estudiante"),
+        Index("ix_programa_estudiante_filtros", "id_programa", "estado", "fecha_inicio"),
+        # LIKE 'prefijo%' sobre el código con cualquier collation
+        Index("ix_programa_estudiante_codigo_prefijo", "codigo_alumno", postgresql_ops={"codigo_alumno": "text_pattern_ops"}),
     )
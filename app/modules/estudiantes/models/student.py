@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import ClassVar, Optional
 
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Integer, String, DateTime, CheckConstraint
+from sqlalchemy import Column, Integer, String, DateTime, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum
 
 class StatusStudent(str, Enum):
@@ -34,5 +34,11 @@ class Student(SQLModel, table=True):
     updated_at: Optional[datetime] = Field(default=None, sa_column=Column("fecha_modificacion", DateTime, nullable=True))
 
     __table_args__ = (
-        CheckConstraint("celular ~ '^[0-9]{9}$'", name="chk_estudiante_celular"),
+        CheckConstraint("celular ~ '^[0-9]{9}$'", name="chk_estudiante_celular").ddl_if(dialect="postgresql"),
+        # Búsqueda por nombre o documento; la expresión coincide con search_document()
+        Index(
+            "ix_estudiante_busqueda_trgm",
+            text("f_unaccent(lower(nombre || ' ' || apellido_paterno || ' ' || apellido_materno || ' ' || documento_identidad)) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
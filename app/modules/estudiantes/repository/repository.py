@@ -0,0 +1,210 @@
+"""Repositorio de estudiantes."""
+from typing import Iterator
+
+from sqlmodel import Session, select, or_, and_, func, tuple_
+
+from app.shared.bulk import upsert
+from app.shared.search import FallbackIndex, search_ids
+from app.modules.estudiantes.models.student import Student
+from app.modules.estudiantes.models.program import DegreeProgram, Program, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+
+# Filas que se piden al cursor de servidor por cada viaje
+EXPORT_CHUNK_SIZE = 1000
+
+# Índice en memoria para motores sin pg_trgm (SQLite en pruebas)
+_search_fallback = FallbackIndex()
+
+class StudentRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def list_students(
+        self,
+        limit: int,
+        after: tuple[int, int] | None = None,
+        program_id: int | None = None,
+        status: StatusStudentProgram | None = None,
+        admission_year: int | None = None,
+        search: str | None = None,
+    ) -> list:
+        """
+        Lista estudiantes con su programa en una sola consulta, paginando por cursor.
+        Args:
+            limit (int): Cantidad máxima de filas.
+            after (tuple[int, int] | None): Última clave (id_estudiante, id_programa_estudiante) de la página anterior.
+            program_id (int | None): Filtra por programa.
+            status (StatusStudentProgram | None): Filtra por estado en el programa.
+            admission_year (int | None): Filtra por año de ingreso.
+            search (str | None): Prefijo de código de alumno o fragmento del nombre completo.
+        Returns:
+            list: Filas con los campos de StudentManagement y la clave del cursor.
+        """
+        statement = (
+            select(
+                Student.id,
+                ProgramStudent.id.label("program_student_id"), # type: ignore[union-attr]
+                ProgramStudent.code,
+                Student.type_document,
+                Student.identity_document,
+                Student.name,
+                Student.paternal_surname,
+                Student.maternal_surname,
+                Program.name.label("program_name"), # type: ignore[attr-defined]
+                Program.degree,
+                Program.mention,
+                ProgramStudent.status,
+            )
+            .join(ProgramStudent, ProgramStudent.student_id == Student.id) # type: ignore[arg-type]
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+        )
+
+        filters = []
+        if after is not None:
+            filters.append(tuple_(Student.id, ProgramStudent.id) > tuple_(*after))
+        if program_id is not None:
+            filters.append(ProgramStudent.program_id == program_id)
+        if status is not None:
+            filters.append(ProgramStudent.status == status)
+        if admission_year is not None:
+            filters.append(ProgramStudent.admission_year == admission_year)
+        if search:
+            full_name = func.lower(Student.name + " " + Student.paternal_surname + " " + Student.maternal_surname)
+            filters.append(or_(
+                ProgramStudent.code.startswith(search), # type: ignore[attr-defined]
+                full_name.contains(search.lower()),
+            ))
+        if filters:
+            statement = statement.where(and_(*filters))
+
+        statement = statement.order_by(Student.id, ProgramStudent.id).limit(limit) # type: ignore[arg-type]
+        return list(self.session.exec(statement).all())
+
+    def search(self, query: str, limit: int) -> list[tuple[Student, float]]:
+        """
+        Busca estudiantes por código de alumno (prefijo) o por nombre y documento (trigramas).
+        Las coincidencias por código van primero con puntaje 1.
+        Args:
+            query (str): Texto a buscar.
+            limit (int): Máximo de resultados.
+        Returns:
+            list[tuple[Student, float]]: Estudiantes con su puntaje, de mayor a menor.
+        """
+        ranked: dict[int, float] = {}
+        if query.isdigit():
+            code_matches = self.session.exec(
+                select(ProgramStudent.student_id)
+                .where(ProgramStudent.code.startswith(query)) # type: ignore[attr-defined]
+                .order_by(ProgramStudent.code)
+                .limit(limit)
+            ).all()
+            ranked.update((student_id, 1.0) for student_id in code_matches)
+
+        columns = (Student.name, Student.paternal_surname, Student.maternal_surname, Student.identity_document)
+        for student_id, score in search_ids(self.session, Student.id, columns, query, limit, _search_fallback):
+            ranked.setdefault(student_id, score)
+
+        ids = list(ranked)[:limit]
+        students = {student.id: student for student in self.session.exec(select(Student).where(Student.id.in_(ids)))} # type: ignore[union-attr]
+        return [(students[student_id], ranked[student_id]) for student_id in ids if student_id in students]
+
+    def iter_export(
+        self,
+        program_id: int | None = None,
+        status: StatusStudentProgram | None = None,
+        admission_year: int | None = None,
+    ) -> Iterator:
+        """
+        Recorre las matrículas con datos del estudiante y del programa usando un cursor de servidor.
+        Yields:
+            Filas planas, una por matrícula, ordenadas por estudiante.
+        """
+        statement = (
+            select(
+                Student.id, ProgramStudent.code, Student.type_document, Student.identity_document,
+                Student.paternal_surname, Student.maternal_surname, Student.name,
+                Student.academic_email, Student.personal_email, Student.phone,
+                Program.name.label("program_name"), Program.degree, Program.mention, # type: ignore[attr-defined]
+                ProgramStudent.status, ProgramStudent.admission_year, ProgramStudent.graduation_year,
+            )
+            .join(ProgramStudent, ProgramStudent.student_id == Student.id) # type: ignore[arg-type]
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+        )
+        if program_id is not None:
+            statement = statement.where(ProgramStudent.program_id == program_id)
+        if status is not None:
+            statement = statement.where(ProgramStudent.status == status)
+        if admission_year is not None:
+            statement = statement.where(ProgramStudent.admission_year == admission_year)
+        statement = statement.order_by(Student.id, ProgramStudent.id).execution_options(yield_per=EXPORT_CHUNK_SIZE) # type: ignore[arg-type]
+        yield from self.session.exec(statement)
+
+    def upsert_students(self, rows: list[dict]) -> dict[str, int]:
+        """
+        Inserta o actualiza estudiantes por documento de identidad.
+        Args:
+            rows (list[dict]): Filas con nombres de columna; sin documentos repetidos.
+        Returns:
+            dict[str, int]: id_estudiante por documento de identidad.
+        """
+        update = [column for column in rows[0] if column not in ("documento_identidad", "fecha_creacion")] if rows else []
+        written = upsert(
+            self.session, Student.__table__, rows, # type: ignore[attr-defined]
+            conflict=["documento_identidad"], update=update, returning=["id_estudiante", "documento_identidad"],
+        )
+        return {document: student_id for student_id, document in written}
+
+    def enrollment_owners(self, codes: list[str]) -> dict[str, int]:
+        """Estudiante dueño de cada código de alumno ya registrado."""
+        rows = self.session.exec(
+            select(ProgramStudent.code, ProgramStudent.student_id).where(ProgramStudent.code.in_(codes)) # type: ignore[attr-defined]
+        ).all()
+        return dict(rows) # type: ignore[arg-type]
+
+    def upsert_enrollments(self, rows: list[dict]) -> list[int]:
+        """
+        Inserta o actualiza matrículas por código de alumno.
+        Returns:
+            list[int]: id_programa_estudiante de las filas escritas.
+        """
+        update = [column for column in rows[0] if column != "codigo_alumno"] if rows else []
+        written = upsert(
+            self.session, ProgramStudent.__table__, rows, # type: ignore[attr-defined]
+            conflict=["codigo_alumno"], update=update, returning=["id_programa_estudiante"],
+        )
+        return [row[0] for row in written]
+
+class ProgramRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def list_programs(self, status: StatusProgram | None = None) -> list[Program]:
+        """Lista los programas ordenados por nombre, opcionalmente por estado."""
+        statement = select(Program)
+        if status is not None:
+            statement = statement.where(Program.status == status)
+        return list(self.session.exec(statement.order_by(Program.name, Program.id)).all()) # type: ignore[arg-type]
+
+    def get(self, program_id: int) -> Program | None:
+        """Busca un programa por clave primaria."""
+        return self.session.get(Program, program_id)
+
+    def save(self, program: Program) -> Program:
+        """Crea o actualiza un programa; la transacción la confirma get_session al terminar la petición."""
+        self.session.add(program)
+        self.session.flush()
+        self.session.refresh(program)
+        return program
+
+    def index(self) -> dict[tuple[str, DegreeProgram, str | None], int]:
+        """Programas existentes por (nombre, grado, mención) normalizados en minúsculas."""
+        return {
+            (program.name.lower(), program.degree, program.mention.lower() if program.mention else None): program.id # type: ignore[misc]
+            for program in self.session.exec(select(Program))
+        }
+
+    def add(self, program: Program) -> Program:
+        """Agrega un programa sin confirmar la transacción."""
+        self.session.add(program)
+        self.session.flush()
+        return program
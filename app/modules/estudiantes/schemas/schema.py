@@ -2,6 +2,7 @@
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from app.modules.estudiantes.models.student import StatusStudent, TypeDocumentStudent
 from app.modules.estudiantes.models.program_student import StatusStudentProgram
+from app.modules.estudiantes.models.program import DegreeProgram, StatusProgram
 
 class PersonBase(BaseModel):
     name: str = Field(...,min_length=2, max_length=100)
@@ -40,6 +41,20 @@ class ProgramInfo(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class ProgramCreate(BaseModel):
+    name: str = Field(..., min_length=2, max_length=50)
+    degree: DegreeProgram
+    mention: str | None = Field(default=None, max_length=100)
+    status: StatusProgram = Field(default=StatusProgram.ACTIVE)
+
+class ProgramUpdate(BaseModel):
+    name: str | None = Field(default=None, min_length=2, max_length=50)
+    mention: str | None = Field(default=None, max_length=100)
+    status: StatusProgram | None = None
+
+class ProgramCatalog(ProgramInfo):
+    status: StatusProgram
+
 class AcademicInfo(AcademicCommon):
     program: ProgramInfo
 
@@ -87,3 +102,35 @@ class StudentDashboard(BaseModel):
     academic: AcademicInfo
 
     model_config = ConfigDict(from_attributes=True)
+
+class StudentPage(BaseModel):
+    """Página de estudiantes paginada por cursor"""
+    items: list[StudentManagement]
+    next_cursor: str | None = None
+
+class StudentSearchResult(BaseModel):
+    """Resultado de búsqueda de estudiantes"""
+    id: int
+    name: str
+    paternal_surname: str
+    maternal_surname: str
+    identity_document: str | None = None
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+class StudentImportError(BaseModel):
+    """Error de una fila del archivo de importación"""
+    row: int
+    field: str | None = None
+    message: str
+
+class StudentImportReport(BaseModel):
+    """Resultado de la importación masiva de estudiantes"""
+    total_rows: int = 0
+    imported_rows: int = 0
+    students_upserted: int = 0
+    enrollments_upserted: int = 0
+    programs_created: int = 0
+    error_count: int = 0
+    errors: list[StudentImportError] = []
@@ -0,0 +1,325 @@
+"""Servicios del módulo de estudiantes."""
+import base64
+import binascii
+import zipfile
+from datetime import datetime
+from typing import BinaryIO, Iterator, NamedTuple
+
+from fastapi import Depends
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session, get_session
+from app.shared.bulk import to_columns
+from app.shared.events import publish
+from app.shared.response_cache import ResponseCache, shared_backend
+from app.shared.spreadsheets import read_rows
+from app.modules.estudiantes.exceptions.exceptions import ImportFileError, InvalidCursorError, ProgramNotFoundError
+from app.modules.estudiantes.models.program import Program, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student
+from app.modules.estudiantes.repository.repository import ProgramRepository, StudentRepository
+from app.modules.estudiantes.schemas.schema import (
+    AcademicCommon, PersonBase, ProgramCatalog, ProgramCreate, ProgramUpdate, StudentImportError,
+    StudentImportReport, StudentManagement, StudentPage, StudentSearchResult,
+)
+
+# Respuestas del catálogo de programas, por filtro
+program_cache = ResponseCache("estudiantes:programas", ttl=settings.CATALOG_CACHE_TTL, backend=shared_backend())
+
+# Columnas de la exportación, en el orden de StudentRepository.iter_export
+EXPORT_HEADER = [
+    "ID estudiante", "Código", "Tipo de documento", "Documento", "Apellido paterno", "Apellido materno", "Nombres",
+    "Correo académico", "Correo personal", "Celular", "Programa", "Grado", "Mención", "Estado", "Año de ingreso", "Año de egreso",
+]
+
+class StudentService:
+    def __init__(self, repository: StudentRepository) -> None:
+        self.repository = repository
+
+    def list_students(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        program_id: int | None = None,
+        status: StatusStudentProgram | None = None,
+        admission_year: int | None = None,
+        search: str | None = None,
+    ) -> StudentPage:
+        """Obtiene una página de estudiantes y el cursor para la siguiente."""
+        rows = self.repository.list_students(
+            limit=limit + 1,
+            after=decode_cursor(cursor) if cursor else None,
+            program_id=program_id,
+            status=status,
+            admission_year=admission_year,
+            search=search.strip() if search else None,
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id, rows[-1].program_student_id) if has_more else None
+        return StudentPage(
+            items=[StudentManagement.model_validate(row._mapping) for row in rows], # pylint: disable=protected-access
+            next_cursor=next_cursor,
+        )
+
+    def export(
+        self,
+        program_id: int | None = None,
+        status: StatusStudentProgram | None = None,
+        admission_year: int | None = None,
+    ) -> tuple[list[str], Iterator]:
+        """Cabecera y filas perezosas de la exportación de estudiantes."""
+        return EXPORT_HEADER, self.repository.iter_export(program_id, status, admission_year)
+
+    def search(self, query: str, limit: int) -> list[StudentSearchResult]:
+        """Busca estudiantes por código, nombre o documento, ordenados por relevancia."""
+        return [
+            StudentSearchResult(
+                id=student.id, # type: ignore[arg-type]
+                name=student.name,
+                paternal_surname=student.paternal_surname,
+                maternal_surname=student.maternal_surname,
+                identity_document=student.identity_document,
+                score=round(score, 4),
+            )
+            for student, score in self.repository.search(query.strip(), limit)
+        ]
+
+def encode_cursor(student_id: int, program_student_id: int) -> str:
+    """Codifica la última clave de la página como cursor opaco."""
+    return base64.urlsafe_b64encode(f"{student_id}:{program_student_id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """Decodifica un cursor generado por encode_cursor."""
+    try:
+        student_id, program_student_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return int(student_id), int(program_student_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Cursor de paginación inválido.") from e
+
+class ProgramService:
+    def __init__(self, repository: ProgramRepository) -> None:
+        self.repository = repository
+
+    def list_programs(self, status: StatusProgram | None = None) -> list[ProgramCatalog]:
+        """Lista el catálogo de programas."""
+        return [ProgramCatalog.model_validate(program) for program in self.repository.list_programs(status)]
+
+    def create(self, data: ProgramCreate) -> ProgramCatalog:
+        """Registra un programa."""
+        return ProgramCatalog.model_validate(self.repository.save(Program(**data.model_dump())))
+
+    def update(self, program_id: int, data: ProgramUpdate) -> ProgramCatalog:
+        """Actualiza nombre, mención o estado de un programa."""
+        program = self.repository.get(program_id)
+        if program is None:
+            raise ProgramNotFoundError(f"No existe el programa {program_id}.")
+        for field, value in data.model_dump(exclude_unset=True).items():
+            setattr(program, field, value)
+        return ProgramCatalog.model_validate(self.repository.save(program))
+
+# Columnas académicas del archivo -> campos de AcademicCommon
+ACADEMIC_COLUMNS = {
+    "code": "code",
+    "academic_status": "status",
+    "curriculum": "curriculum",
+    "admission_year": "admission_year",
+    "graduation_year": "graduation_year",
+}
+
+class ImportRow(NamedTuple):
+    number: int
+    person: PersonBase
+    academic: AcademicCommon
+    program_id: int
+
+class StudentImportService:
+    """
+    Importación masiva de estudiantes desde CSV o XLSX.
+
+    El archivo se recorre fila a fila; cada fila se valida con PersonBase y AcademicCommon
+    y las válidas se escriben por lotes con INSERT ... ON CONFLICT (estudiante por documento
+    de identidad, matrícula por código de alumno). Cada lote se confirma por separado; si
+    falla en la BD se reintenta fila a fila para reportar solo las filas culpables.
+    """
+
+    batch_size = 1000
+    max_reported_errors = 1000
+
+    def __init__(self, students: StudentRepository, programs: ProgramRepository) -> None:
+        self.students = students
+        self.programs = programs
+        self.session = students.session
+
+    def import_file(self, stream: BinaryIO, filename: str) -> StudentImportReport:
+        """
+        Importa el archivo y devuelve el reporte con los errores por fila.
+        Columnas: las de PersonBase, las de ACADEMIC_COLUMNS y el programa como
+        program_id o como program_name, degree y mention (se crea si no existe).
+        """
+        report = StudentImportReport()
+        program_index = self.programs.index()
+        program_ids = set(program_index.values())
+        seen_codes: dict[str, int] = {}
+        batch: list[ImportRow] = []
+        for number, values in self._rows(stream, filename):
+            report.total_rows += 1
+            row = self._parse(number, values, report, program_index, program_ids, seen_codes)
+            if row is not None:
+                batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch, report)
+                batch = []
+        self._write_batch(batch, report)
+        return report
+
+    @staticmethod
+    def _rows(stream: BinaryIO, filename: str) -> Iterator[tuple[int, dict[str, str | None]]]:
+        try:
+            yield from read_rows(stream, filename)
+        except (ValueError, zipfile.BadZipFile) as e:
+            raise ImportFileError(f"No se pudo leer el archivo: {e}") from e
+
+    def _parse(
+        self,
+        number: int,
+        values: dict[str, str | None],
+        report: StudentImportReport,
+        program_index: dict,
+        program_ids: set[int],
+        seen_codes: dict[str, int],
+    ) -> ImportRow | None:
+        """Valida una fila; registra sus errores y devuelve None si no es importable."""
+        errors: list[tuple[str | None, str]] = []
+        person = academic = None
+        try:
+            person = PersonBase.model_validate({field: values[field] for field in PersonBase.model_fields if values.get(field) is not None})
+        except ValidationError as e:
+            errors.extend((str(error["loc"][0]) if error["loc"] else None, error["msg"]) for error in e.errors())
+        try:
+            academic = AcademicCommon.model_validate({field: values[column] for column, field in ACADEMIC_COLUMNS.items() if values.get(column) is not None})
+        except ValidationError as e:
+            columns = {field: column for column, field in ACADEMIC_COLUMNS.items()}
+            errors.extend((columns.get(str(error["loc"][0])) if error["loc"] else None, error["msg"]) for error in e.errors())
+
+        for field in ("identity_document", "type_document"):
+            if not values.get(field):
+                errors.append((field, "Campo obligatorio para la importación"))
+        if not values.get("admission_year"):
+            errors.append(("admission_year", "Campo obligatorio para la importación"))
+        if academic is not None:
+            if academic.code in seen_codes:
+                errors.append(("code", f"Código repetido en la fila {seen_codes[academic.code]}"))
+            else:
+                seen_codes[academic.code] = number
+
+        program_id = self._resolve_program(values, report, program_index, program_ids, errors)
+        if errors or person is None or academic is None or program_id is None:
+            for field, message in errors:
+                self._error(report, number, field, message)
+            return None
+        return ImportRow(number, person, academic, program_id)
+
+    def _resolve_program(self, values, report, program_index, program_ids, errors) -> int | None:
+        """Obtiene el id del programa de la fila, creándolo si se indicó por nombre y no existe."""
+        if values.get("program_id"):
+            try:
+                program_id = int(values["program_id"]) # type: ignore[arg-type]
+            except ValueError:
+                errors.append(("program_id", "Debe ser un número entero"))
+                return None
+            if program_id not in program_ids:
+                errors.append(("program_id", f"No existe el programa {program_id}"))
+                return None
+            return program_id
+        if not values.get("program_name") or not values.get("degree"):
+            errors.append(("program_id", "Indique program_id o program_name y degree"))
+            return None
+        try:
+            data = ProgramCreate.model_validate({"name": values["program_name"], "degree": values["degree"], "mention": values.get("mention")})
+        except ValidationError as e:
+            errors.extend((f"program_{error['loc'][0]}" if error["loc"] else None, error["msg"]) for error in e.errors())
+            return None
+        key = (data.name.lower(), data.degree, data.mention.lower() if data.mention else None)
+        if key not in program_index:
+            program = self.programs.add(Program(**data.model_dump()))
+            program_index[key] = program.id
+            program_ids.add(program.id) # type: ignore[arg-type]
+            report.programs_created += 1
+        return program_index[key]
+
+    def _write_batch(self, batch: list[ImportRow], report: StudentImportReport) -> None:
+        """Escribe un lote en bloque o, si la BD lo rechaza, fila a fila."""
+        results = []
+        try:
+            with self.session.begin_nested():
+                results.append(self._write_rows(batch))
+        except IntegrityError:
+            for row in batch:
+                try:
+                    with self.session.begin_nested():
+                        results.append(self._write_rows([row]))
+                except IntegrityError as e:
+                    self._error(report, row.number, None, str(e.orig).splitlines()[0])
+        self.session.commit()
+
+        for errors, imported, students, enrollments in results:
+            for number, field, message in errors:
+                self._error(report, number, field, message)
+            report.imported_rows += imported
+            report.students_upserted += students
+            report.enrollments_upserted += enrollments
+
+    def _write_rows(self, rows: list[ImportRow]) -> tuple[list[tuple[int, str, str]], int, int, int]:
+        """
+        Escribe estudiantes y matrículas de las filas.
+        Returns:
+            tuple: (errores por fila, filas importadas, estudiantes escritos, matrículas escritas).
+        """
+        if not rows:
+            return [], 0, 0, 0
+        now = datetime.now()
+        students = {
+            row.person.identity_document: to_columns(Student, {**row.person.model_dump(), "created_at": now, "updated_at": now})
+            for row in rows
+        }
+        student_ids = self.students.upsert_students(list(students.values()))
+
+        owners = self.students.enrollment_owners([row.academic.code for row in rows])
+        errors, enrollments = [], []
+        for row in rows:
+            student_id = student_ids[row.person.identity_document]
+            owner = owners.get(row.academic.code)
+            if owner is not None and owner != student_id:
+                errors.append((row.number, "code", "El código de alumno pertenece a otro estudiante"))
+                continue
+            enrollments.append(to_columns(ProgramStudent, {**row.academic.model_dump(), "program_id": row.program_id, "student_id": student_id}))
+        enrollment_ids = self.students.upsert_enrollments(enrollments)
+
+        # Las sentencias Core no pasan por el ORM: se avisa al change feed explícitamente
+        publish(self.session, {Student: student_ids.values(), ProgramStudent: enrollment_ids})
+        return errors, len(enrollments), len(student_ids), len(enrollment_ids)
+
+    def _error(self, report: StudentImportReport, number: int, field: str | None, message: str) -> None:
+        report.error_count += 1
+        if len(report.errors) < self.max_reported_errors:
+            report.errors.append(StudentImportError(row=number, field=field, message=message))
+
+def get_student_service(session: Session = Depends(get_db_session)) -> StudentService:
+    """Dependencia que construye el servicio de estudiantes."""
+    return StudentService(StudentRepository(session))
+
+def get_student_export_service(session: Session = Depends(get_session)) -> StudentService:
+    """Servicio de estudiantes sobre la sesión síncrona: la exportación lee filas mientras se envía la respuesta."""
+    return StudentService(StudentRepository(session))
+
+def get_program_service(session: Session = Depends(get_db_session)) -> ProgramService:
+    """Dependencia que construye el servicio del catálogo de programas."""
+    return ProgramService(ProgramRepository(session))
+
+def get_student_import_service(session: Session = Depends(get_session)) -> StudentImportService:
+    """Dependencia que construye el servicio de importación de estudiantes."""
+    return StudentImportService(StudentRepository(session), ProgramRepository(session))
@@ -0,0 +1,14 @@
+"""
+Suscriptor del change feed del catálogo de programas.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import on_commit, subscribe
+from app.modules.estudiantes.models.program import Program
+
+@subscribe(Program)
+def invalidate_program_cache(session: Session, _changes: dict[type, set[int]]) -> None:
+    """Toda escritura del catálogo invalida sus respuestas al confirmarse."""
+    from app.modules.estudiantes.services.service import program_cache # pylint: disable=import-outside-toplevel
+    on_commit(session, program_cache.invalidate)
@@ -0,0 +1,32 @@
+"""
+Registro de todos los modelos SQLModel.
+
+Las relaciones entre módulos se declaran con el nombre de la clase ("Process") y SQLAlchemy
+las resuelve al configurar los mappers, así que todos los modelos deben estar cargados antes
+de la primera consulta: lo importan una vez la fábrica de la app, el worker y quienes
+necesitan la metadata completa (create_all en pruebas y benchmarks).
+"""
+# pylint: disable=unused-import
+from sqlmodel import SQLModel
+
+from app.shared.search import register_search_ddl
+from app.feature_modules.dashboard_estudiantes.models.dashboard import StudentDashboardProjection
+from app.feature_modules.dashboard_etapas.models.rollup import StageDailyRollup
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.feature_modules.acto_publico.models.defense import Room, Defense
+from app.modules.archivos.models.file import ProcessFile, StoredFile, Upload
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.documentos.models.document import ExternalProcessDocument
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.estudiantes.models.student import Student
+from app.modules.proceso.models.process import Process
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.proceso.models.process_transition import ProcessTransition
+from app.modules.recordatorios.models.reminder import Reminder
+from app.modules.tareas.models.task import Task, TaskDependency
+from app.modules.trabajos.models.job import Job
+
+# Extensiones pg_trgm/unaccent requeridas por los índices de búsqueda
+register_search_ddl(SQLModel.metadata)
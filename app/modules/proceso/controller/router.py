@@ -1,3 +1,45 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import date
+from typing import Literal
 
-router = APIRouter()
\ No newline at end of file
+from fastapi import APIRouter, Depends, Query
+
+from app.core.database import run_db
+from app.shared.spreadsheets import export_response
+from app.modules.proceso.models.process import ProcessStage, ProcessStatus
+from app.modules.proceso.schemas.schema import ProcessPage, StageTransitionBatch, StageTransitionReport
+from app.modules.proceso.services.service import ProcessService, get_process_export_service, get_process_service
+
+router = APIRouter()
+
+@router.get("/", response_model=ProcessPage)
+async def list_processes(
+    cursor: int | None = Query(default=None, description="Cursor devuelto en next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200),
+    stage: ProcessStage | None = Query(default=None),
+    status: ProcessStatus | None = Query(default=None),
+    advisor_id: int | None = Query(default=None),
+    service: ProcessService = Depends(get_process_service),
+):
+    """Lista procesos con estudiante y asesor, en una sola consulta por página."""
+    return await run_db(service.list_processes, limit=limit, cursor=cursor, stage=stage, status=status, advisor_id=advisor_id)
+
+@router.get("/exportar")
+def export_processes(
+    file_format: Literal["csv", "xlsx"] = Query(default="csv", alias="format"),
+    stage: ProcessStage | None = Query(default=None),
+    status: ProcessStatus | None = Query(default=None),
+    started_from: date | None = Query(default=None, description="Fecha de inicio desde (inclusive)"),
+    started_to: date | None = Query(default=None, description="Fecha de inicio hasta (inclusive)"),
+    service: ProcessService = Depends(get_process_export_service),
+):
+    """Exporta procesos con estudiante y asesor en CSV o XLSX, escribiendo fila a fila."""
+    header, rows = service.export(stage=stage, status=status, started_from=started_from, started_to=started_to)
+    return export_response("procesos", file_format, header, rows)
+
+@router.post("/transiciones", response_model=StageTransitionReport)
+async def transition_processes(
+    batch: StageTransitionBatch,
+    service: ProcessService = Depends(get_process_service),
+):
+    """Cambia de etapa un lote de procesos en una transacción; devuelve el resultado por ítem."""
+    return await run_db(service.transition, batch)
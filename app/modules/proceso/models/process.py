@@ -3,10 +3,13 @@ from enum import Enum
 from typing import ClassVar, Optional
 
 from datetime import datetime
-from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Integer, Text, DateTime, func, ForeignKey
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, Integer, Text, DateTime, func, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum
 
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.estudiantes.models.program_student import ProgramStudent
+
 class ProcessStatus(str, Enum):
     IN_PROCESS = "en_proceso"
     PAUSED = "pausado"
@@ -24,11 +27,25 @@ class ProcessStage(str, Enum):
     SUNEDU_DIPLOMA = "diploma_sunedu"
     FINALIZED = "finalizado"
 
+# Máquina de estados de ProcessStage: etapas a las que se puede pasar desde cada una.
+# El flujo es lineal; un proceso solo avanza a la etapa siguiente.
+STAGE_TRANSITIONS: dict[ProcessStage, frozenset[ProcessStage]] = {
+    ProcessStage.ENROLLMENT: frozenset({ProcessStage.TURNITIN}),
+    ProcessStage.TURNITIN: frozenset({ProcessStage.CLEARED}),
+    ProcessStage.CLEARED: frozenset({ProcessStage.JURY_ASSIGNMENT}),
+    ProcessStage.JURY_ASSIGNMENT: frozenset({ProcessStage.PUBLIC_DEFENSE}),
+    ProcessStage.PUBLIC_DEFENSE: frozenset({ProcessStage.CYBERTESIS}),
+    ProcessStage.CYBERTESIS: frozenset({ProcessStage.DEGREE_GRANTING}),
+    ProcessStage.DEGREE_GRANTING: frozenset({ProcessStage.SUNEDU_DIPLOMA}),
+    ProcessStage.SUNEDU_DIPLOMA: frozenset({ProcessStage.FINALIZED}),
+    ProcessStage.FINALIZED: frozenset(),
+}
+
 class Process(SQLModel, table=True):
     __tablename__: ClassVar[str] = 'proceso_tesis'
 
     id: Optional[int] = Field(default=None, sa_column=Column("id_proceso", Integer, primary_key=True))
-    id_student_program: int = Field(sa_column=Column("id_estudiante_programa",Integer, ForeignKey("estudiante_programa.id_estudiante_programa"), nullable=False))
+    id_student_program: int = Field(sa_column=Column("id_estudiante_programa",Integer, ForeignKey("programa_estudiante.id_programa_estudiante"), nullable=False))
     id_advisor: int = Field(sa_column=Column("id_asesor",Integer, ForeignKey("docente.id_docente"), nullable=False))
     current_thesis_title: Optional[str] = Field(default=None, sa_column=Column("titulo_tesis_actual", Text, nullable=True))
     general_status: ProcessStatus = Field(default=ProcessStatus.IN_PROCESS, sa_column=Column("estado_general", PgEnum(ProcessStatus, name="proceso_tesis_estado_general"), nullable=False))
@@ -36,6 +53,10 @@ class Process(SQLModel, table=True):
     start_date: datetime = Field(sa_column=Column("fecha_inicio", DateTime(timezone=False), server_default=func.now(), nullable=False))
     end_date: Optional[datetime] = Field(default=None, sa_column=Column("fecha_finalizacion", DateTime(timezone=False), nullable=True))
 
-    # Relationship a futuro
-    # student_program: Optional["ProgramStudent"] = Relationship()
-    # advisor: Optional["Teacher"] = Relationship()
+    student_program: Optional["ProgramStudent"] = Relationship(back_populates="processes")
+    advisor: Optional["Teacher"] = Relationship(back_populates="advised_processes")
+
+    __table_args__ = (
+        # Agregación del dashboard docente: WHERE id_asesor = ? GROUP BY etapa_actual, estado_general
+        Index("ix_proceso_tesis_asesor_etapa_estado", "id_asesor", "etapa_actual", "estado_general"),
+    )
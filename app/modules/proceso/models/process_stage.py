@@ -0,0 +1,29 @@
+"""Modelo de datos para las etapas recorridas por un proceso."""
+from typing import ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum
+
+from app.modules.proceso.models.process import ProcessStage
+
+class ProcessStageRecord(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'etapa_proceso'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_etapa_proceso", Integer, primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), nullable=False, index=True))
+    stage: ProcessStage = Field(sa_column=Column("etapa", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=False))
+    start_date: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_inicio", DateTime(timezone=False), server_default=func.now(), nullable=False))
+    end_date: Optional[datetime] = Field(default=None, sa_column=Column("fecha_fin", DateTime(timezone=False), nullable=True))
+
+    __table_args__ = (
+        # Una sola etapa abierta por proceso; es la fila que se cierra en cada transición
+        Index(
+            "ux_etapa_proceso_abierta", "id_proceso", unique=True,
+            postgresql_where=text("fecha_fin IS NULL"), sqlite_where=text("fecha_fin IS NULL"),
+        ),
+        # Recálculo de los resúmenes diarios: entradas y salidas de una etapa en un día
+        Index("ix_etapa_proceso_etapa_inicio", "etapa", "fecha_inicio"),
+        Index("ix_etapa_proceso_etapa_fin", "etapa", "fecha_fin"),
+    )
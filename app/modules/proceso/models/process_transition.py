@@ -0,0 +1,24 @@
+"""Modelo de datos para la auditoría de cambios de etapa de un proceso."""
+from typing import ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum
+
+from app.modules.proceso.models.process import ProcessStage
+
+class ProcessTransition(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'transicion_proceso'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_transicion", Integer, primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), nullable=False))
+    from_stage: ProcessStage = Field(sa_column=Column("etapa_origen", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=False))
+    to_stage: ProcessStage = Field(sa_column=Column("etapa_destino", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=False))
+    actor: Optional[str] = Field(default=None, sa_column=Column("usuario", String(100), nullable=True))
+    note: Optional[str] = Field(default=None, sa_column=Column("observacion", Text, nullable=True))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+    __table_args__ = (
+        Index("ix_transicion_proceso_proceso_fecha", "id_proceso", "fecha"),
+    )
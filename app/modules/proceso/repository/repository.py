@@ -0,0 +1,178 @@
+"""Repositorio de procesos."""
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+from sqlmodel import Session, select
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import joinedload
+
+from app.shared.bulk import id_in
+
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.estudiantes.models.program import Program
+from app.modules.estudiantes.models.program_student import ProgramStudent
+from app.modules.estudiantes.models.student import Student
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.proceso.models.process_transition import ProcessTransition
+
+# Filas que se piden al cursor de servidor por cada viaje
+EXPORT_CHUNK_SIZE = 1000
+
+class ProcessRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def list_processes(
+        self,
+        limit: int,
+        after: int | None = None,
+        stage: ProcessStage | None = None,
+        status: ProcessStatus | None = None,
+        advisor_id: int | None = None,
+    ) -> list[Process]:
+        """
+        Lista procesos con estudiante, programa y asesor cargados en la misma consulta.
+        Todas las relaciones son muchos-a-uno con FK obligatoria, por lo que se resuelven
+        con INNER JOIN: una página de N procesos cuesta una sola sentencia.
+        Args:
+            limit (int): Cantidad máxima de procesos.
+            after (int | None): Último id_proceso de la página anterior.
+            stage (ProcessStage | None): Filtra por etapa actual.
+            status (ProcessStatus | None): Filtra por estado general.
+            advisor_id (int | None): Filtra por asesor.
+        Returns:
+            list[Process]: Procesos con sus relaciones ya cargadas.
+        """
+        statement = select(Process).options(
+            joinedload(Process.student_program, innerjoin=True).joinedload(ProgramStudent.student, innerjoin=True), # type: ignore[arg-type]
+            joinedload(Process.student_program, innerjoin=True).joinedload(ProgramStudent.program, innerjoin=True), # type: ignore[arg-type]
+            joinedload(Process.advisor, innerjoin=True), # type: ignore[arg-type]
+        )
+        if after is not None:
+            statement = statement.where(Process.id > after) # type: ignore[operator]
+        if stage is not None:
+            statement = statement.where(Process.current_stage == stage)
+        if status is not None:
+            statement = statement.where(Process.general_status == status)
+        if advisor_id is not None:
+            statement = statement.where(Process.id_advisor == advisor_id)
+        statement = statement.order_by(Process.id).limit(limit) # type: ignore[arg-type]
+        return list(self.session.exec(statement).all())
+
+    def iter_export(
+        self,
+        stage: ProcessStage | None = None,
+        status: ProcessStatus | None = None,
+        started_from: date | None = None,
+        started_to: date | None = None,
+    ) -> Iterator:
+        """
+        Recorre los procesos para exportación con un cursor de servidor (yield_per),
+        de modo que la memoria no crece con la cantidad de filas.
+        Args:
+            stage (ProcessStage | None): Filtra por etapa actual.
+            status (ProcessStatus | None): Filtra por estado general.
+            started_from (date | None): Fecha de inicio mínima (inclusive).
+            started_to (date | None): Fecha de inicio máxima (inclusive).
+        Yields:
+            Filas planas con proceso, estudiante, programa y asesor.
+        """
+        statement = (
+            select(
+                Process.id, ProgramStudent.code, Student.identity_document,
+                Student.paternal_surname, Student.maternal_surname, Student.name,
+                Program.name.label("program_name"), Program.degree, # type: ignore[attr-defined]
+                (Teacher.paternal_surname + " " + Teacher.maternal_surname + ", " + Teacher.name).label("advisor"),
+                Process.current_thesis_title, Process.current_stage, Process.general_status,
+                Process.start_date, Process.end_date,
+            )
+            .join(ProgramStudent, ProgramStudent.id == Process.id_student_program) # type: ignore[arg-type]
+            .join(Student, Student.id == ProgramStudent.student_id) # type: ignore[arg-type]
+            .join(Program, Program.id == ProgramStudent.program_id) # type: ignore[arg-type]
+            .join(Teacher, Teacher.id == Process.id_advisor) # type: ignore[arg-type]
+        )
+        if stage is not None:
+            statement = statement.where(Process.current_stage == stage)
+        if status is not None:
+            statement = statement.where(Process.general_status == status)
+        if started_from is not None:
+            statement = statement.where(Process.start_date >= started_from)
+        if started_to is not None:
+            statement = statement.where(Process.start_date < started_to + timedelta(days=1))
+        statement = statement.order_by(Process.id).execution_options(yield_per=EXPORT_CHUNK_SIZE) # type: ignore[arg-type]
+        yield from self.session.exec(statement)
+
+    def lock_stages(self, ids: list[int]) -> dict[int, tuple[ProcessStage, ProcessStatus]]:
+        """
+        Lee etapa y estado de los procesos bloqueando sus filas hasta el fin de la transacción.
+        Las filas se bloquean en orden de id, así dos lotes que se solapan no se esperan en ciclo.
+        Returns:
+            dict[int, tuple]: (etapa_actual, estado_general) por id_proceso.
+        """
+        rows = self.session.exec(
+            select(Process.id, Process.current_stage, Process.general_status)
+            .where(id_in(self.session, Process.id, ids))
+            .order_by(Process.id) # type: ignore[arg-type]
+            .with_for_update()
+        ).all()
+        return {process_id: (stage, status) for process_id, stage, status in rows}
+
+    def move_stage(self, ids: list[int], from_stage: ProcessStage, to_stage: ProcessStage, now: datetime) -> int:
+        """
+        Cambia la etapa de todos los procesos indicados con un único UPDATE.
+        Solo afecta a los que siguen en `from_stage`; al llegar a FINALIZED también cierra el proceso.
+        Returns:
+            int: Filas actualizadas.
+        """
+        values: dict = {Process.current_stage: to_stage}
+        if to_stage == ProcessStage.FINALIZED:
+            values.update({Process.general_status: ProcessStatus.FINALIZED, Process.end_date: now})
+        result = self.session.exec(
+            update(Process)
+            .where(id_in(self.session, Process.id, ids), Process.current_stage == from_stage)
+            .values(values)
+        )
+        return result.rowcount # type: ignore[union-attr]
+
+    def add_transitions(self, rows: list[dict]) -> None:
+        """Inserta las filas de auditoría en bloque (claves por nombre de columna)."""
+        if rows:
+            self.session.connection().execute(insert(ProcessTransition.__table__), rows) # type: ignore[attr-defined]
+
+    def close_stages(self, ids: list[int], now: datetime) -> dict[int, int]:
+        """
+        Cierra con un único UPDATE la etapa abierta de cada proceso indicado.
+        Returns:
+            dict[int, int]: id_etapa_proceso cerrada por id_proceso; faltan los procesos sin etapa abierta.
+        """
+        rows = self.session.exec(
+            update(ProcessStageRecord)
+            .where(id_in(self.session, ProcessStageRecord.id_process, ids), ProcessStageRecord.end_date.is_(None)) # type: ignore[union-attr]
+            .values({ProcessStageRecord.end_date: now})
+            .returning(ProcessStageRecord.id_process, ProcessStageRecord.id)
+        ).all()
+        return {process_id: record_id for process_id, record_id in rows}
+
+    def stage_entry_dates(self, ids: list[int], stage: ProcessStage) -> dict[int, datetime]:
+        """
+        Fecha en que cada proceso entró a `stage` según la auditoría de transiciones, o su fecha
+        de inicio si no hay transición registrada (p. ej. la inscripción o datos previos al historial).
+        """
+        rows = self.session.exec(
+            select(Process.id, func.coalesce(func.max(ProcessTransition.created_at), Process.start_date))
+            .outerjoin(
+                ProcessTransition,
+                (ProcessTransition.id_process == Process.id) & (ProcessTransition.to_stage == stage), # type: ignore[arg-type]
+            )
+            .where(id_in(self.session, Process.id, ids))
+            .group_by(Process.id, Process.start_date) # type: ignore[arg-type]
+        ).all()
+        return {process_id: entered for process_id, entered in rows}
+
+    def add_stage_records(self, rows: list[dict]) -> list[int]:
+        """Inserta filas del historial de etapas en bloque (claves por nombre de columna) y devuelve sus ids."""
+        if not rows:
+            return []
+        table = ProcessStageRecord.__table__ # type: ignore[attr-defined]
+        return list(self.session.connection().execute(insert(table).returning(table.c.id_etapa_proceso), rows).scalars())
@@ -21,10 +21,42 @@ class ProcessManagement(BaseModel):
     id: int
     student: StudentManagement
     teacher: TeacherManagement
-    current_thesis_title: str
+    current_thesis_title: str | None
     general_status: ProcessStatus
     current_stage: ProcessStage
     start_date: datetime
     end_date: datetime | None
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProcessPage(BaseModel):
+    """Página de procesos paginada por cursor (id_proceso)"""
+    items: list[ProcessManagement]
+    next_cursor: int | None = None
+
+
+class StageTransitionItem(BaseModel):
+    process_id: int = Field(..., gt=0)
+    to_stage: ProcessStage
+
+
+class StageTransitionBatch(BaseModel):
+    """Lote de cambios de etapa aplicado en una sola transacción"""
+    items: list[StageTransitionItem] = Field(..., min_length=1, max_length=2000)
+    actor: str | None = Field(default=None, max_length=100)
+    note: str | None = None
+
+
+class StageTransitionResult(BaseModel):
+    process_id: int
+    from_stage: ProcessStage | None = None
+    to_stage: ProcessStage
+    applied: bool
+    error: str | None = None
+
+
+class StageTransitionReport(BaseModel):
+    applied: int
+    rejected: int
+    results: list[StageTransitionResult]
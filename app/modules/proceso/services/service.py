@@ -0,0 +1,166 @@
+"""Servicios del módulo de procesos."""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterator
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session, get_session
+from app.shared.bulk import to_columns
+from app.shared.events import publish
+from app.modules.docentes.schemas.schema import TeacherManagement
+from app.modules.estudiantes.schemas.schema import StudentManagement
+from app.modules.proceso.models.process import STAGE_TRANSITIONS, Process, ProcessStage, ProcessStatus
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.proceso.models.process_transition import ProcessTransition
+from app.modules.proceso.repository.repository import ProcessRepository
+from app.modules.proceso.schemas.schema import (
+    ProcessManagement, ProcessPage, StageTransitionBatch, StageTransitionReport, StageTransitionResult,
+)
+
+# Columnas de la exportación, en el orden de ProcessRepository.iter_export
+EXPORT_HEADER = [
+    "ID proceso", "Código", "Documento", "Apellido paterno", "Apellido materno", "Nombres",
+    "Programa", "Grado", "Asesor", "Título de tesis", "Etapa", "Estado", "Fecha de inicio", "Fecha de finalización",
+]
+
+class ProcessService:
+    def __init__(self, repository: ProcessRepository) -> None:
+        self.repository = repository
+
+    def list_processes(
+        self,
+        limit: int,
+        cursor: int | None = None,
+        stage: ProcessStage | None = None,
+        status: ProcessStatus | None = None,
+        advisor_id: int | None = None,
+    ) -> ProcessPage:
+        """Obtiene una página de procesos y el cursor para la siguiente."""
+        processes = self.repository.list_processes(
+            limit=limit + 1, after=cursor, stage=stage, status=status, advisor_id=advisor_id,
+        )
+        has_more = len(processes) > limit
+        processes = processes[:limit]
+        return ProcessPage(
+            items=[to_management(process) for process in processes],
+            next_cursor=processes[-1].id if has_more else None,
+        )
+
+    def transition(self, batch: StageTransitionBatch) -> StageTransitionReport:
+        """
+        Aplica un lote de cambios de etapa en una sola transacción.
+
+        Las filas se bloquean y validan contra STAGE_TRANSITIONS; los cambios válidos se
+        agrupan por (origen, destino) y cada grupo es un único UPDATE (normalmente hay uno
+        solo, pues en una sesión de comité todos avanzan a la misma etapa). La auditoría
+        se inserta en bloque, igual que el historial de etapas (etapa_proceso). Los ítems
+        rechazados no impiden aplicar los demás.
+        """
+        ids = [item.process_id for item in batch.items]
+        current = self.repository.lock_stages(ids)
+
+        results: list[StageTransitionResult] = []
+        groups: dict[tuple[ProcessStage, ProcessStage], list[int]] = defaultdict(list)
+        seen: set[int] = set()
+        for item in batch.items:
+            from_stage, status = current.get(item.process_id, (None, None))
+            error = None
+            if item.process_id in seen:
+                error = "Proceso repetido en el lote"
+            elif from_stage is None:
+                error = "El proceso no existe"
+            elif status != ProcessStatus.IN_PROCESS:
+                error = f"El proceso está {status.value}" # type: ignore[union-attr]
+            elif item.to_stage not in STAGE_TRANSITIONS[from_stage]:
+                error = f"Transición no permitida: {from_stage.value} -> {item.to_stage.value}"
+            seen.add(item.process_id)
+            results.append(StageTransitionResult(
+                process_id=item.process_id, from_stage=from_stage, to_stage=item.to_stage,
+                applied=error is None, error=error,
+            ))
+            if error is None:
+                groups[(from_stage, item.to_stage)].append(item.process_id) # type: ignore[index]
+
+        now = datetime.now()
+        audit = []
+        history = []
+        stage_records: list[int] = []
+        for (from_stage, to_stage), group in groups.items():
+            self.repository.move_stage(group, from_stage, to_stage, now)
+            # Historial: se cierra la etapa abierta y se abre la nueva. Los procesos sin etapa
+            # abierta (anteriores al historial) reciben la de origen ya cerrada.
+            closed = self.repository.close_stages(group, now)
+            stage_records.extend(closed.values())
+            missing = [process_id for process_id in group if process_id not in closed]
+            for process_id, entered in (self.repository.stage_entry_dates(missing, from_stage) if missing else {}).items():
+                history.append(to_columns(ProcessStageRecord, {
+                    "id_process": process_id, "stage": from_stage, "start_date": entered, "end_date": now,
+                }))
+            history.extend(
+                to_columns(ProcessStageRecord, {"id_process": process_id, "stage": to_stage, "start_date": now, "end_date": None})
+                for process_id in group
+            )
+            audit.extend(
+                to_columns(ProcessTransition, {
+                    "id_process": process_id, "from_stage": from_stage, "to_stage": to_stage,
+                    "actor": batch.actor, "note": batch.note, "created_at": now,
+                })
+                for process_id in group
+            )
+        self.repository.add_transitions(audit)
+        stage_records.extend(self.repository.add_stage_records(history))
+
+        applied = [result.process_id for result in results if result.applied]
+        if applied:
+            # UPDATE masivo: fuera del ORM, se avisa al change feed
+            publish(self.repository.session, {Process: applied, ProcessStageRecord: stage_records})
+        self.repository.session.commit()
+        return StageTransitionReport(applied=len(applied), rejected=len(results) - len(applied), results=results)
+
+    def export(
+        self,
+        stage: ProcessStage | None = None,
+        status: ProcessStatus | None = None,
+        started_from: date | None = None,
+        started_to: date | None = None,
+    ) -> tuple[list[str], Iterator]:
+        """Cabecera y filas perezosas de la exportación de procesos."""
+        return EXPORT_HEADER, self.repository.iter_export(stage, status, started_from, started_to)
+
+def to_management(process: Process) -> ProcessManagement:
+    """Construye ProcessManagement a partir de un proceso con sus relaciones cargadas."""
+    program_student = process.student_program
+    student = program_student.student # type: ignore[union-attr]
+    program = program_student.program # type: ignore[union-attr]
+    return ProcessManagement(
+        id=process.id, # type: ignore[arg-type]
+        student=StudentManagement(
+            id=student.id, # type: ignore[union-attr]
+            code=program_student.code, # type: ignore[union-attr]
+            type_document=student.type_document, # type: ignore[union-attr]
+            identity_document=student.identity_document, # type: ignore[union-attr]
+            name=student.name, # type: ignore[union-attr]
+            paternal_surname=student.paternal_surname, # type: ignore[union-attr]
+            maternal_surname=student.maternal_surname, # type: ignore[union-attr]
+            program_name=program.name, # type: ignore[union-attr]
+            degree=program.degree, # type: ignore[union-attr]
+            mention=program.mention, # type: ignore[union-attr]
+            status=program_student.status, # type: ignore[union-attr]
+        ),
+        teacher=TeacherManagement.model_validate(process.advisor),
+        current_thesis_title=process.current_thesis_title,
+        general_status=process.general_status,
+        current_stage=process.current_stage,
+        start_date=process.start_date,
+        end_date=process.end_date,
+    )
+
+def get_process_service(session: Session = Depends(get_db_session)) -> ProcessService:
+    """Dependencia que construye el servicio de procesos."""
+    return ProcessService(ProcessRepository(session))
+
+def get_process_export_service(session: Session = Depends(get_session)) -> ProcessService:
+    """Servicio de procesos sobre la sesión síncrona: la exportación lee filas mientras se envía la respuesta."""
+    return ProcessService(ProcessRepository(session))
@@ -1,3 +1,23 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends, Query
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.modules.recordatorios.models.reminder import ReminderStatus
+from app.modules.recordatorios.schemas.schema import ReminderPage, ReminderSyncReport
+from app.modules.recordatorios.services.service import ReminderService, get_reminder_service
+
+router = APIRouter()
+
+@router.get("/", response_model=ReminderPage)
+async def list_reminders(
+    cursor: int | None = Query(default=None, description="Cursor devuelto en next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200),
+    status: ReminderStatus | None = Query(default=None),
+    service: ReminderService = Depends(get_reminder_service),
+):
+    """Lista los recordatorios generados, opcionalmente por estado."""
+    return await run_db(service.list_reminders, limit=limit, cursor=cursor, status=status)
+
+@router.post("/sincronizar", response_model=ReminderSyncReport)
+async def sync_reminders(service: ReminderService = Depends(get_reminder_service)):
+    """Genera los recordatorios de todas las filas de origen (carga inicial o reparación)."""
+    return await run_db(service.sync_all)
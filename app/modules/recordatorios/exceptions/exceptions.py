@@ -0,0 +1,6 @@
+"""Excepciones del módulo de recordatorios."""
+from app.core.exceptions import AppError
+
+class ReminderSenderError(AppError):
+    """Error cuando el canal de envío configurado no existe o no puede cargarse."""
+    status_code = 500
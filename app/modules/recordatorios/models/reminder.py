@@ -0,0 +1,49 @@
+"""Modelo de datos para los recordatorios programados."""
+from enum import Enum
+from typing import ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum
+
+class ReminderKind(str, Enum):
+    DOCUMENT_DELIVERY = "entrega_documento"
+    LICENSE_EXPIRATION = "fin_licencia"
+    STAGE_DEADLINE = "plazo_etapa"
+
+class ReminderStatus(str, Enum):
+    PENDING = "pendiente"
+    SENT = "enviado"
+    FAILED = "fallido"
+    CANCELLED = "cancelado"
+
+# Predicado del índice de vencimientos; el enum se guarda por nombre del miembro
+PENDING_REMINDER = text("estado = 'PENDING'")
+
+class Reminder(SQLModel, table=True):
+    """
+    Un aviso a enviar en `due_at` sobre un documento, un docente o una etapa (según `kind`).
+    Lo generan los suscriptores de app.modules.recordatorios.services.service y lo envía el planificador.
+    """
+    __tablename__: ClassVar[str] = 'recordatorio'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_recordatorio", Integer, primary_key=True))
+    kind: ReminderKind = Field(sa_column=Column("tipo", PgEnum(ReminderKind, name="recordatorio_tipo"), nullable=False))
+    reference_id: int = Field(sa_column=Column("id_referencia", Integer, nullable=False))
+    recipient: Optional[str] = Field(default=None, sa_column=Column("destinatario", String(100), nullable=True))
+    message: str = Field(sa_column=Column("mensaje", Text, nullable=False))
+    due_at: datetime = Field(sa_column=Column("fecha_programada", DateTime(timezone=False), nullable=False))
+    status: ReminderStatus = Field(default=ReminderStatus.PENDING, sa_column=Column("estado", PgEnum(ReminderStatus, name="recordatorio_estado"), nullable=False))
+    attempts: int = Field(default=0, sa_column=Column("intentos", Integer, nullable=False, server_default="0"))
+    last_error: Optional[str] = Field(default=None, sa_column=Column("error", Text, nullable=True))
+    sent_at: Optional[datetime] = Field(default=None, sa_column=Column("fecha_envio", DateTime(timezone=False), nullable=True))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_creacion", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+    __table_args__ = (
+        # Cola de vencimientos: solo las filas pendientes, ordenadas por fecha.
+        # El planificador lee el frente con LIMIT, sin recorrer enviados ni cancelados.
+        Index("ix_recordatorio_pendiente", "fecha_programada", postgresql_where=PENDING_REMINDER, sqlite_where=PENDING_REMINDER),
+        # Sincronización con las filas de origen
+        Index("ix_recordatorio_referencia", "tipo", "id_referencia"),
+    )
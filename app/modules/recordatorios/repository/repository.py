@@ -0,0 +1,126 @@
+"""Repositorio de recordatorios."""
+from typing import Iterable
+
+from datetime import date, datetime
+from sqlalchemy import func, insert, update
+from sqlmodel import Session, select
+
+from app.shared.bulk import id_in
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.recordatorios.models.reminder import PENDING_REMINDER, Reminder, ReminderKind, ReminderStatus
+
+class ReminderRepository:
+    """
+    Cola de recordatorios y lectura de sus filas de origen.
+    Las escrituras de sincronización son sentencias Core, así pueden ejecutarse dentro de un flush.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def claim_due(self, now: datetime, limit: int) -> list[Reminder]:
+        """
+        Toma los recordatorios vencidos más antiguos y bloquea sus filas hasta el fin de la transacción.
+        SKIP LOCKED salta las filas ya tomadas por otro worker, así varias instancias
+        reparten la cola sin enviar dos veces. El filtro coincide con ix_recordatorio_pendiente.
+        """
+        return list(self.session.exec(
+            select(Reminder)
+            .where(PENDING_REMINDER, Reminder.due_at <= now)
+            .order_by(Reminder.due_at) # type: ignore[arg-type]
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all())
+
+    def next_due(self) -> datetime | None:
+        """Fecha del próximo recordatorio pendiente (lectura del primer elemento del índice)."""
+        return self.session.exec(select(func.min(Reminder.due_at)).where(PENDING_REMINDER)).one()
+
+    def list_reminders(self, limit: int, after: int | None = None, status: ReminderStatus | None = None) -> list[Reminder]:
+        """Lista recordatorios por id, opcionalmente filtrados por estado."""
+        statement = select(Reminder)
+        if after is not None:
+            statement = statement.where(Reminder.id > after) # type: ignore[operator]
+        if status is not None:
+            statement = statement.where(Reminder.status == status)
+        return list(self.session.exec(statement.order_by(Reminder.id).limit(limit)).all()) # type: ignore[arg-type]
+
+    def existing(self, kind: ReminderKind, reference_ids: Iterable[int] | None) -> list:
+        """
+        Recordatorios ya generados (pendientes, enviados o fallidos) de las filas de origen indicadas.
+        Returns:
+            list: Filas (id, reference_id, due_at, status); con reference_ids None, todas las del tipo.
+        """
+        statement = (
+            select(Reminder.id, Reminder.reference_id, Reminder.due_at, Reminder.status)
+            .where(Reminder.kind == kind, Reminder.status != ReminderStatus.CANCELLED)
+        )
+        if reference_ids is not None:
+            statement = statement.where(id_in(self.session, Reminder.reference_id, list(reference_ids)))
+        return list(self.session.exec(statement).all())
+
+    def cancel(self, ids: list[int]) -> None:
+        """Cancela recordatorios pendientes con un único UPDATE."""
+        if ids:
+            self.session.exec(
+                update(Reminder)
+                .where(id_in(self.session, Reminder.id, ids), Reminder.status == ReminderStatus.PENDING)
+                .values({Reminder.status: ReminderStatus.CANCELLED})
+            )
+
+    def add(self, rows: list[dict]) -> None:
+        """Inserta recordatorios en bloque (claves por nombre de columna)."""
+        if rows:
+            self.session.connection().execute(insert(Reminder.__table__), rows) # type: ignore[attr-defined]
+
+    def undelivered_documents(self, ids: Iterable[int] | None) -> list:
+        """Documentos no entregados con fecha de entrega, con su categoría y el correo del asesor."""
+        statement = (
+            select(
+                ExternalProcessDocument.id, ExternalProcessDocument.id_process, ExternalProcessDocument.delivery_date,
+                ExternalDocumentCategory.full_name.label("category"), Teacher.academic_email, # type: ignore[union-attr]
+            )
+            .join(ExternalDocumentCategory, ExternalDocumentCategory.id == ExternalProcessDocument.id_external_doc_category) # type: ignore[arg-type]
+            .join(Process, Process.id == ExternalProcessDocument.id_process) # type: ignore[arg-type]
+            .join(Teacher, Teacher.id == Process.id_advisor) # type: ignore[arg-type]
+            .where(
+                ExternalProcessDocument.delivery_status == DeliveryStatus.NO_ENTREGADO,
+                ExternalProcessDocument.delivery_date.is_not(None), # type: ignore[union-attr]
+            )
+        )
+        if ids is not None:
+            statement = statement.where(id_in(self.session, ExternalProcessDocument.id, list(ids)))
+        return list(self.session.exec(statement).all())
+
+    def expiring_licenses(self, ids: Iterable[int] | None, today: date) -> list:
+        """Docentes con una licencia que aún no termina."""
+        statement = (
+            select(Teacher.id, Teacher.name, Teacher.paternal_surname, Teacher.license_end_date, Teacher.academic_email)
+            .where(Teacher.license_end_date >= today) # type: ignore[operator]
+        )
+        if ids is not None:
+            statement = statement.where(id_in(self.session, Teacher.id, list(ids)))
+        return list(self.session.exec(statement).all())
+
+    def open_stages(self, ids: Iterable[int] | None) -> list:
+        """Etapas abiertas de procesos en curso, con el correo del asesor."""
+        statement = (
+            select(
+                ProcessStageRecord.id, ProcessStageRecord.id_process, ProcessStageRecord.stage,
+                ProcessStageRecord.start_date, Teacher.academic_email,
+            )
+            .join(Process, Process.id == ProcessStageRecord.id_process) # type: ignore[arg-type]
+            .join(Teacher, Teacher.id == Process.id_advisor) # type: ignore[arg-type]
+            .where(
+                ProcessStageRecord.end_date.is_(None), # type: ignore[union-attr]
+                ProcessStageRecord.stage != ProcessStage.FINALIZED,
+                Process.general_status == ProcessStatus.IN_PROCESS,
+            )
+        )
+        if ids is not None:
+            statement = statement.where(id_in(self.session, ProcessStageRecord.id, list(ids)))
+        return list(self.session.exec(statement).all())
@@ -0,0 +1,30 @@
+"""Esquemas para los recordatorios"""
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+
+from app.modules.recordatorios.models.reminder import ReminderKind, ReminderStatus
+
+class ReminderManagement(BaseModel):
+    id: int
+    kind: ReminderKind
+    reference_id: int
+    recipient: str | None = None
+    message: str
+    due_at: datetime
+    status: ReminderStatus
+    attempts: int
+    last_error: str | None = None
+    sent_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReminderPage(BaseModel):
+    """Página de recordatorios pendientes por fecha programada"""
+    items: list[ReminderManagement]
+    next_cursor: int | None = None
+
+
+class ReminderSyncReport(BaseModel):
+    created: int
+    cancelled: int
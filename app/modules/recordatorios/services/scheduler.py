@@ -0,0 +1,122 @@
+"""Planificador asíncrono que envía los recordatorios vencidos."""
+import asyncio
+from typing import Callable
+
+from datetime import datetime, timedelta
+from loguru import logger
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.modules.recordatorios.models.reminder import ReminderStatus
+from app.modules.recordatorios.repository.repository import ReminderRepository
+from app.modules.recordatorios.services.sender import ReminderSender, load_sender
+
+# Espera máxima entre reintentos de un envío fallido
+MAX_RETRY_DELAY = timedelta(hours=1)
+# Espera mínima entre revisiones; evita girar en vacío si otro worker tiene las filas vencidas
+MIN_POLL_DELAY = 1.0
+
+class ReminderScheduler:
+    """
+    Toma lotes de recordatorios vencidos y los entrega por el canal configurado.
+
+    Cada lote es una transacción: las filas se bloquean con FOR UPDATE SKIP LOCKED,
+    se envían y se marcan antes del commit, así varias instancias pueden ejecutar el
+    planificador a la vez sin duplicar envíos. Entre lotes solo se consulta el próximo
+    vencimiento (mínimo del índice parcial), nunca la tabla completa.
+    Args:
+        session_factory (Callable[[], Session]): Crea una sesión nueva por lote.
+        sender (ReminderSender): Canal de envío.
+        batch_size (int): Recordatorios por lote.
+        poll_interval (float): Espera máxima en segundos entre revisiones de la cola.
+        max_attempts (int): Intentos antes de marcar el recordatorio como fallido.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sender: ReminderSender,
+        batch_size: int = 200,
+        poll_interval: float = 30.0,
+        max_attempts: int = 5,
+    ) -> None:
+        self.session_factory = session_factory
+        self.sender = sender
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    @classmethod
+    def from_settings(cls) -> "ReminderScheduler":
+        """Planificador con el motor de la aplicación y los valores de configuración."""
+        from app.core.database import engine # pylint: disable=import-outside-toplevel
+
+        return cls(
+            session_factory=lambda: Session(engine),
+            sender=load_sender(settings.REMINDER_SENDER),
+            batch_size=settings.REMINDER_BATCH_SIZE,
+            poll_interval=settings.REMINDER_POLL_INTERVAL,
+            max_attempts=settings.REMINDER_MAX_ATTEMPTS,
+        )
+
+    def run_once(self, now: datetime | None = None) -> tuple[int, datetime | None]:
+        """
+        Procesa un lote de recordatorios vencidos.
+        Returns:
+            tuple[int, datetime | None]: Recordatorios tomados y el próximo vencimiento pendiente.
+        """
+        now = now or datetime.now()
+        with self.session_factory() as session:
+            repository = ReminderRepository(session)
+            reminders = repository.claim_due(now, self.batch_size)
+            for reminder in reminders:
+                try:
+                    self.sender.send(reminder)
+                except Exception as e: # pylint: disable=broad-except
+                    reminder.attempts += 1
+                    reminder.last_error = str(e)[:500]
+                    if reminder.attempts >= self.max_attempts:
+                        reminder.status = ReminderStatus.FAILED
+                        logger.warning(f"Recordatorio {reminder.id} descartado tras {reminder.attempts} intentos: {e}")
+                    else:
+                        reminder.due_at = now + min(timedelta(minutes=2 ** reminder.attempts), MAX_RETRY_DELAY)
+                else:
+                    reminder.attempts += 1
+                    reminder.status = ReminderStatus.SENT
+                    reminder.sent_at = now
+            session.commit()
+            return len(reminders), repository.next_due()
+
+    async def run(self) -> None:
+        """Bucle del planificador: lotes seguidos mientras haya vencidos; si no, duerme hasta el próximo."""
+        logger.info("Planificador de recordatorios iniciado.")
+        while not self._stopping.is_set():
+            try:
+                claimed, next_due = await asyncio.to_thread(self.run_once)
+            except Exception as e: # pylint: disable=broad-except
+                logger.exception(f"Error en el planificador de recordatorios: {e}")
+                claimed, next_due = 0, None
+            if claimed >= self.batch_size:
+                continue
+            delay = self.poll_interval
+            if next_due is not None:
+                delay = min(delay, max((next_due - datetime.now()).total_seconds(), MIN_POLL_DELAY))
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        logger.info("Planificador de recordatorios detenido.")
+
+    def start(self) -> None:
+        """Lanza el bucle en el event loop actual."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run(), name="reminder-scheduler")
+
+    async def stop(self) -> None:
+        """Detiene el bucle tras el lote en curso."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,31 @@
+"""Canales de envío de recordatorios."""
+import importlib
+from typing import Protocol
+
+from loguru import logger
+
+from app.modules.recordatorios.exceptions.exceptions import ReminderSenderError
+from app.modules.recordatorios.models.reminder import Reminder
+
+class ReminderSender(Protocol):
+    """Entrega un recordatorio; debe lanzar una excepción si no pudo enviarlo."""
+
+    def send(self, reminder: Reminder) -> None: ...
+
+class LogSender:
+    """Canal local: registra el recordatorio en el log en lugar de enviarlo."""
+
+    def send(self, reminder: Reminder) -> None:
+        logger.info(f"Recordatorio {reminder.id} ({reminder.kind.value}) para {reminder.recipient or 'sin destinatario'}: {reminder.message}")
+
+def load_sender(path: str) -> ReminderSender:
+    """
+    Instancia el canal configurado en REMINDER_SENDER.
+    Args:
+        path (str): Ruta "modulo:Clase" de una clase sin argumentos que cumpla ReminderSender.
+    """
+    module_path, _, name = path.partition(":")
+    try:
+        return getattr(importlib.import_module(module_path), name)()
+    except (ImportError, AttributeError, TypeError) as e:
+        raise ReminderSenderError(f"No se pudo cargar el canal de recordatorios '{path}': {e}") from e
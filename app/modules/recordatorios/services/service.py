@@ -0,0 +1,104 @@
+"""Servicios del módulo de recordatorios."""
+from typing import Iterable
+
+from datetime import date, datetime, time, timedelta
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.shared.bulk import to_columns
+from app.modules.recordatorios.models.reminder import Reminder, ReminderKind, ReminderStatus
+from app.modules.recordatorios.repository.repository import ReminderRepository
+from app.modules.recordatorios.schemas.schema import ReminderManagement, ReminderPage, ReminderSyncReport
+
+def at_send_hour(day: date) -> datetime:
+    """Momento de envío de los recordatorios de un día."""
+    return datetime.combine(day, time(hour=settings.REMINDER_SEND_HOUR))
+
+class ReminderService:
+    def __init__(self, repository: ReminderRepository) -> None:
+        self.repository = repository
+
+    def list_reminders(self, limit: int, cursor: int | None = None, status: ReminderStatus | None = None) -> ReminderPage:
+        """Obtiene una página de recordatorios y el cursor para la siguiente."""
+        reminders = self.repository.list_reminders(limit=limit + 1, after=cursor, status=status)
+        has_more = len(reminders) > limit
+        reminders = reminders[:limit]
+        return ReminderPage(
+            items=[ReminderManagement.model_validate(reminder) for reminder in reminders],
+            next_cursor=reminders[-1].id if has_more else None,
+        )
+
+    def sync(self, kind: ReminderKind, reference_ids: Iterable[int] | None = None) -> ReminderSyncReport:
+        """
+        Alinea los recordatorios de un tipo con sus filas de origen.
+        Crea los que faltan, cancela los pendientes que ya no aplican o cambiaron de fecha,
+        y no repite uno ya enviado (o agotado) para la misma fecha.
+        Args:
+            kind (ReminderKind): Tipo de recordatorio.
+            reference_ids (Iterable[int] | None): Filas de origen cambiadas; None recorre todas.
+        """
+        ids = None if reference_ids is None else list(reference_ids)
+        desired = self._desired(kind, ids)
+
+        cancelled: list[int] = []
+        scheduled: set[tuple[int, datetime]] = set()
+        for reminder_id, reference_id, due_at, status in self.repository.existing(kind, ids):
+            wanted = desired.get(reference_id)
+            if status == ReminderStatus.PENDING and (wanted is None or wanted[0] != due_at):
+                cancelled.append(reminder_id)
+            else:
+                scheduled.add((reference_id, due_at))
+
+        created = [
+            to_columns(Reminder, {
+                "kind": kind, "reference_id": reference_id, "due_at": due_at, "recipient": recipient,
+                "message": message, "status": ReminderStatus.PENDING, "attempts": 0, "created_at": datetime.now(),
+            })
+            for reference_id, (due_at, recipient, message) in desired.items()
+            if (reference_id, due_at) not in scheduled
+        ]
+        self.repository.cancel(cancelled)
+        self.repository.add(created)
+        return ReminderSyncReport(created=len(created), cancelled=len(cancelled))
+
+    def sync_all(self) -> ReminderSyncReport:
+        """Recorre todas las filas de origen; sirve para poblar la cola por primera vez."""
+        reports = [self.sync(kind) for kind in ReminderKind]
+        self.repository.session.commit()
+        return ReminderSyncReport(
+            created=sum(report.created for report in reports),
+            cancelled=sum(report.cancelled for report in reports),
+        )
+
+    def _desired(self, kind: ReminderKind, ids: list[int] | None) -> dict[int, tuple[datetime, str | None, str]]:
+        """Recordatorio que corresponde a cada fila de origen: (fecha, destinatario, mensaje)."""
+        if kind == ReminderKind.DOCUMENT_DELIVERY:
+            return {
+                row.id: (
+                    at_send_hour(row.delivery_date + timedelta(days=1)), row.academic_email,
+                    f"El documento '{row.category}' del proceso {row.id_process} no fue entregado; vencía el {row.delivery_date:%d/%m/%Y}.",
+                )
+                for row in self.repository.undelivered_documents(ids)
+            }
+        if kind == ReminderKind.LICENSE_EXPIRATION:
+            return {
+                row.id: (
+                    at_send_hour(row.license_end_date - timedelta(days=settings.REMINDER_LICENSE_NOTICE_DAYS)), row.academic_email,
+                    f"La licencia de {row.name} {row.paternal_surname} termina el {row.license_end_date:%d/%m/%Y}.",
+                )
+                for row in self.repository.expiring_licenses(ids, date.today())
+            }
+        deadline = timedelta(days=settings.REMINDER_STAGE_DEADLINE_DAYS)
+        return {
+            row.id: (
+                at_send_hour((row.start_date + deadline).date()), row.academic_email,
+                f"El proceso {row.id_process} lleva {deadline.days} días en la etapa {row.stage.value}.",
+            )
+            for row in self.repository.open_stages(ids)
+        }
+
+def get_reminder_service(session: Session = Depends(get_db_session)) -> ReminderService:
+    """Dependencia que construye el servicio de recordatorios."""
+    return ReminderService(ReminderRepository(session))
@@ -0,0 +1,27 @@
+"""
+Suscriptor del change feed de recordatorios.
+Solo importa modelos; el servicio se carga en el primer cambio, no al arrancar.
+"""
+from sqlmodel import Session
+
+from app.shared.events import subscribe
+from app.modules.docentes.models.teacher import Teacher
+from app.modules.documentos.models.document import ExternalProcessDocument
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.recordatorios.models.reminder import ReminderKind
+
+# Modelo de origen de cada tipo de recordatorio
+SOURCES: dict[type, ReminderKind] = {
+    ExternalProcessDocument: ReminderKind.DOCUMENT_DELIVERY,
+    Teacher: ReminderKind.LICENSE_EXPIRATION,
+    ProcessStageRecord: ReminderKind.STAGE_DEADLINE,
+}
+
+@subscribe(*SOURCES)
+def sync_reminders(session: Session, changes: dict[type, set[int]]) -> None:
+    """Reprograma los recordatorios de las filas de origen cambiadas, en la misma transacción."""
+    from app.modules.recordatorios.repository.repository import ReminderRepository # pylint: disable=import-outside-toplevel
+    from app.modules.recordatorios.services.service import ReminderService # pylint: disable=import-outside-toplevel
+    service = ReminderService(ReminderRepository(session))
+    for model, ids in changes.items():
+        service.sync(SOURCES[model], ids)
@@ -1,3 +1,55 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends, Query
 
-router = APIRouter()
\ No newline at end of file
+from app.core.database import run_db
+from app.modules.tareas.schemas.schema import (
+    TaskBatchCreate, TaskDependencyCreate, TaskManagement, TaskPage, TaskStatusReport, TaskStatusUpdate,
+)
+from app.modules.tareas.services.service import TaskService, get_task_service
+
+router = APIRouter()
+
+@router.get("/", response_model=TaskPage)
+async def list_assigned_tasks(
+    assignee: str = Query(..., min_length=1, max_length=100, description="Responsable de las tareas"),
+    actionable_only: bool = Query(default=True, description="Solo tareas sin dependencias pendientes"),
+    cursor: int | None = Query(default=None, description="Cursor devuelto en next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200),
+    service: TaskService = Depends(get_task_service),
+):
+    """Tareas abiertas de un responsable, desde el índice parcial de tareas abiertas."""
+    return await run_db(service.assigned_to, assignee, limit=limit, cursor=cursor, actionable_only=actionable_only)
+
+@router.post("/procesos/{process_id}", response_model=list[TaskManagement], status_code=201)
+async def create_tasks(
+    process_id: int,
+    batch: TaskBatchCreate,
+    service: TaskService = Depends(get_task_service),
+):
+    """Crea tareas de un proceso con sus dependencias."""
+    return await run_db(service.create_tasks, process_id, batch)
+
+@router.get("/procesos/{process_id}/siguientes", response_model=list[TaskManagement])
+async def next_tasks(
+    process_id: int,
+    service: TaskService = Depends(get_task_service),
+):
+    """Tareas del proceso que ya no esperan a ninguna otra."""
+    return await run_db(service.next_for_process, process_id)
+
+@router.patch("/{task_id}/estado", response_model=TaskStatusReport)
+async def update_task_status(
+    task_id: int,
+    data: TaskStatusUpdate,
+    service: TaskService = Depends(get_task_service),
+):
+    """Cambia el estado de una tarea y devuelve las que quedaron accionables."""
+    return await run_db(service.update_status, task_id, data.status)
+
+@router.post("/{task_id}/dependencias", response_model=TaskManagement)
+async def add_task_dependency(
+    task_id: int,
+    data: TaskDependencyCreate,
+    service: TaskService = Depends(get_task_service),
+):
+    """Agrega una dependencia entre dos tareas del mismo proceso."""
+    return await run_db(service.add_dependency, task_id, data.depends_on)
@@ -0,0 +1,14 @@
+"""Excepciones del módulo de tareas."""
+from app.core.exceptions import AppError
+
+class TaskNotFoundError(AppError):
+    """Error cuando la tarea no existe."""
+    status_code = 404
+
+class TaskProcessNotFoundError(AppError):
+    """Error cuando el proceso al que se agregan tareas no existe."""
+    status_code = 404
+
+class TaskDependencyError(AppError):
+    """Error cuando una dependencia es inválida: otro proceso, la misma tarea, un ciclo o una tarea que ya no está pendiente."""
+    status_code = 400
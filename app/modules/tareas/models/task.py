@@ -0,0 +1,58 @@
+"""Modelo de datos para las tareas de un proceso y sus dependencias."""
+from enum import Enum
+from typing import ClassVar, Optional
+
+from datetime import date, datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum
+
+from app.modules.proceso.models.process import ProcessStage
+
+class TaskStatus(str, Enum):
+    PENDING = "pendiente"
+    IN_PROGRESS = "en_progreso"
+    DONE = "completada"
+    CANCELLED = "cancelada"
+
+# Estados en los que la tarea sigue abierta; completar o cancelar libera a sus dependientes
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+# Predicado de los índices parciales; el enum se guarda por nombre del miembro
+OPEN_TASK = text("estado IN ('PENDING', 'IN_PROGRESS')")
+
+class Task(SQLModel, table=True):
+    __tablename__: ClassVar[str] = 'tarea'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_tarea", Integer, primary_key=True))
+    id_process: int = Field(sa_column=Column("id_proceso", Integer, ForeignKey("proceso_tesis.id_proceso"), nullable=False, index=True))
+    name: str = Field(sa_column=Column("nombre", String(200), nullable=False))
+    stage: Optional[ProcessStage] = Field(default=None, sa_column=Column("etapa", PgEnum(ProcessStage, name="proceso_tesis_etapa_actual", create_type=False), nullable=True))
+    assignee: Optional[str] = Field(default=None, sa_column=Column("responsable", String(100), nullable=True))
+    status: TaskStatus = Field(default=TaskStatus.PENDING, sa_column=Column("estado", PgEnum(TaskStatus, name="tarea_estado"), nullable=False, server_default="PENDING"))
+    due_date: Optional[date] = Field(default=None, sa_column=Column("fecha_limite", Date, nullable=True))
+    # Dependencias aún abiertas; la tarea es accionable cuando llega a 0
+    pending_dependencies: int = Field(default=0, sa_column=Column("dependencias_pendientes", Integer, nullable=False, server_default="0"))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_creacion", DateTime(timezone=False), server_default=func.now(), nullable=False))
+    completed_at: Optional[datetime] = Field(default=None, sa_column=Column("fecha_cierre", DateTime(timezone=False), nullable=True))
+
+    __table_args__ = (
+        # "Mis tareas": solo las abiertas, por responsable; las accionables son el prefijo con 0
+        # pendientes y ya vienen en el orden del cursor (id_tarea)
+        Index(
+            "ix_tarea_responsable_abierta", "responsable", "dependencias_pendientes", "id_tarea",
+            postgresql_where=OPEN_TASK, sqlite_where=OPEN_TASK,
+        ),
+    )
+
+class TaskDependency(SQLModel, table=True):
+    """La tarea `id_task` no puede empezar hasta que se cierre `id_prerequisite`."""
+    __tablename__: ClassVar[str] = 'tarea_dependencia'
+
+    id_task: int = Field(sa_column=Column("id_tarea", Integer, ForeignKey("tarea.id_tarea", ondelete="CASCADE"), primary_key=True))
+    id_prerequisite: int = Field(sa_column=Column("id_tarea_previa", Integer, ForeignKey("tarea.id_tarea", ondelete="CASCADE"), primary_key=True))
+
+    __table_args__ = (
+        # Al cerrar una tarea se buscan sus dependientes
+        Index("ix_tarea_dependencia_previa", "id_tarea_previa"),
+    )
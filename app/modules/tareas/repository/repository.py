@@ -0,0 +1,92 @@
+"""Repositorio de tareas."""
+from sqlmodel import Session, select
+from sqlalchemy import insert, update
+
+from app.shared.bulk import id_in
+from app.modules.proceso.models.process import Process
+from app.modules.tareas.models.task import OPEN_STATUSES, OPEN_TASK, Task, TaskDependency
+
+class TaskRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, task_id: int, lock: bool = False) -> Task | None:
+        """Busca una tarea por clave primaria; con `lock` bloquea su fila hasta el fin de la transacción."""
+        if not lock:
+            return self.session.get(Task, task_id)
+        return self.session.exec(select(Task).where(Task.id == task_id).with_for_update()).first()
+
+    def process_exists(self, process_id: int) -> bool:
+        """Indica si existe el proceso."""
+        return self.session.get(Process, process_id) is not None
+
+    def lock_tasks(self, ids: list[int]) -> dict[int, Task]:
+        """Tareas por id, con sus filas bloqueadas (p. ej. las previas de un lote nuevo)."""
+        if not ids:
+            return {}
+        tasks = self.session.exec(select(Task).where(id_in(self.session, Task.id, ids)).with_for_update()).all()
+        return {task.id: task for task in tasks} # type: ignore[misc]
+
+    def add_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Inserta tareas y les asigna su id."""
+        self.session.add_all(tasks)
+        self.session.flush()
+        return tasks
+
+    def add_dependencies(self, rows: list[dict]) -> None:
+        """Inserta aristas del grafo en bloque (claves por nombre de columna)."""
+        if rows:
+            self.session.connection().execute(insert(TaskDependency.__table__), rows) # type: ignore[attr-defined]
+
+    def process_edges(self, process_id: int) -> list[tuple[int, int]]:
+        """Aristas (tarea, previa) del grafo de un proceso, para detectar ciclos."""
+        return list(self.session.exec(
+            select(TaskDependency.id_task, TaskDependency.id_prerequisite)
+            .join(Task, Task.id == TaskDependency.id_task) # type: ignore[arg-type]
+            .where(Task.id_process == process_id)
+        ).all())
+
+    def shift_dependents(self, prerequisite_id: int, delta: int) -> list[int]:
+        """
+        Suma `delta` al contador de dependencias pendientes de todas las tareas que dependen de
+        `prerequisite_id`, con un único UPDATE atómico (dos cierres concurrentes no se pisan).
+        Returns:
+            list[int]: Ids de las tareas abiertas que quedaron sin dependencias pendientes.
+        """
+        dependents = select(TaskDependency.id_task).where(TaskDependency.id_prerequisite == prerequisite_id)
+        rows = self.session.exec(
+            update(Task)
+            .where(Task.id.in_(dependents)) # type: ignore[union-attr]
+            .values({Task.pending_dependencies: Task.pending_dependencies + delta})
+            .returning(Task.id, Task.pending_dependencies, Task.status)
+            .execution_options(synchronize_session="fetch")
+        ).all()
+        return [task_id for task_id, pending, status in rows if pending == 0 and status in OPEN_STATUSES]
+
+    def actionable_for_process(self, process_id: int) -> list[Task]:
+        """Tareas abiertas del proceso sin dependencias pendientes, por fecha límite."""
+        return list(self.session.exec(
+            select(Task)
+            .where(Task.id_process == process_id, OPEN_TASK, Task.pending_dependencies == 0)
+            .order_by(Task.due_date, Task.id) # type: ignore[arg-type]
+        ).all())
+
+    def open_for_assignee(self, assignee: str, actionable_only: bool, limit: int, after: int | None = None) -> list[Task]:
+        """
+        Tareas abiertas de un responsable, leídas desde ix_tarea_responsable_abierta. Las
+        accionables salen del índice ya ordenadas por id: el costo depende de las tareas
+        devueltas, no del total. Sin `actionable_only` se ordenan las abiertas del responsable.
+        """
+        statement = select(Task).where(OPEN_TASK, Task.assignee == assignee)
+        if actionable_only:
+            statement = statement.where(Task.pending_dependencies == 0)
+        if after is not None:
+            statement = statement.where(Task.id > after) # type: ignore[operator]
+        return list(self.session.exec(statement.order_by(Task.id).limit(limit)).all()) # type: ignore[arg-type]
+
+    def save(self, task: Task) -> Task:
+        """Guarda una tarea y confirma la transacción."""
+        self.session.add(task)
+        self.session.commit()
+        self.session.refresh(task)
+        return task
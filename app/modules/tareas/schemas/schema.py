@@ -0,0 +1,54 @@
+"""Esquemas para las tareas"""
+from datetime import date, datetime
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.modules.proceso.models.process import ProcessStage
+from app.modules.tareas.models.task import TaskStatus
+
+class TaskCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=200)
+    stage: ProcessStage | None = None
+    assignee: str | None = Field(default=None, max_length=100)
+    due_date: date | None = None
+    depends_on: list[int] = Field(default=[], description="Ids de tareas existentes del mismo proceso")
+    depends_on_items: list[int] = Field(default=[], description="Posiciones de tareas anteriores del mismo lote")
+
+
+class TaskBatchCreate(BaseModel):
+    """Tareas de un proceso creadas junto con sus dependencias"""
+    items: list[TaskCreate] = Field(..., min_length=1, max_length=500)
+
+
+class TaskStatusUpdate(BaseModel):
+    status: TaskStatus
+
+
+class TaskDependencyCreate(BaseModel):
+    depends_on: int
+
+
+class TaskManagement(BaseModel):
+    id: int
+    id_process: int
+    name: str
+    stage: ProcessStage | None = None
+    assignee: str | None = None
+    status: TaskStatus
+    due_date: date | None = None
+    pending_dependencies: int
+    created_at: datetime
+    completed_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskPage(BaseModel):
+    """Página de tareas paginada por cursor (id_tarea)"""
+    items: list[TaskManagement]
+    next_cursor: int | None = None
+
+
+class TaskStatusReport(BaseModel):
+    """Tarea actualizada y las tareas que quedaron accionables por el cambio"""
+    task: TaskManagement
+    unblocked: list[int] = []
@@ -0,0 +1,133 @@
+"""Servicios del módulo de tareas."""
+from datetime import datetime
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.core.database import get_db_session
+from app.modules.tareas.exceptions.exceptions import TaskDependencyError, TaskNotFoundError, TaskProcessNotFoundError
+from app.modules.tareas.models.task import OPEN_STATUSES, Task, TaskStatus
+from app.modules.tareas.repository.repository import TaskRepository
+from app.modules.tareas.schemas.schema import (
+    TaskBatchCreate, TaskManagement, TaskPage, TaskStatusReport,
+)
+
+class TaskService:
+    """
+    Motor de tareas. Cada tarea guarda cuántas de sus previas siguen abiertas; cerrar o reabrir
+    una tarea ajusta ese contador en sus dependientes con un UPDATE, así "accionable" es
+    un filtro indexado (contador en 0) en lugar de recorrer el grafo en cada consulta.
+    """
+
+    def __init__(self, repository: TaskRepository) -> None:
+        self.repository = repository
+
+    def create_tasks(self, process_id: int, batch: TaskBatchCreate) -> list[TaskManagement]:
+        """
+        Crea las tareas de un proceso con sus dependencias en una transacción.
+        Dentro del lote solo se puede depender de posiciones anteriores, por lo que no hay ciclos.
+        """
+        if not self.repository.process_exists(process_id):
+            raise TaskProcessNotFoundError(f"No existe el proceso {process_id}.")
+        prerequisites = self.repository.lock_tasks(sorted({task_id for item in batch.items for task_id in item.depends_on}))
+        for task_id in {task_id for item in batch.items for task_id in item.depends_on}:
+            task = prerequisites.get(task_id)
+            if task is None or task.id_process != process_id:
+                raise TaskDependencyError(f"La tarea {task_id} no existe en el proceso {process_id}.")
+
+        tasks = []
+        for position, item in enumerate(batch.items):
+            if any(not 0 <= index < position for index in item.depends_on_items):
+                raise TaskDependencyError(f"La tarea en la posición {position} solo puede depender de tareas anteriores del lote.")
+            tasks.append(Task(
+                id_process=process_id, name=item.name, stage=item.stage, assignee=item.assignee, due_date=item.due_date,
+                pending_dependencies=(
+                    len(set(item.depends_on_items))
+                    + sum(prerequisites[task_id].status in OPEN_STATUSES for task_id in set(item.depends_on))
+                ),
+            ))
+        self.repository.add_tasks(tasks)
+        self.repository.add_dependencies([
+            {"id_tarea": task.id, "id_tarea_previa": prerequisite}
+            for task, item in zip(tasks, batch.items)
+            for prerequisite in {*item.depends_on, *(tasks[index].id for index in item.depends_on_items)}
+        ])
+        self.repository.session.commit()
+        return [TaskManagement.model_validate(task) for task in tasks]
+
+    def update_status(self, task_id: int, status: TaskStatus) -> TaskStatusReport:
+        """
+        Cambia el estado de una tarea. Cerrarla (completada o cancelada) descuenta una dependencia
+        pendiente a cada dependiente; reabrirla la vuelve a sumar.
+        """
+        task = self.repository.get(task_id, lock=True)
+        if task is None:
+            raise TaskNotFoundError(f"No existe la tarea {task_id}.")
+        if status in (TaskStatus.IN_PROGRESS, TaskStatus.DONE) and task.pending_dependencies:
+            raise TaskDependencyError(f"La tarea {task_id} tiene {task.pending_dependencies} dependencias pendientes.")
+
+        was_open, is_open = task.status in OPEN_STATUSES, status in OPEN_STATUSES
+        task.status = status
+        task.completed_at = None if is_open else datetime.now()
+        self.repository.session.add(task)
+        self.repository.session.flush()
+        unblocked: list[int] = []
+        if was_open and not is_open:
+            unblocked = self.repository.shift_dependents(task_id, -1)
+        elif is_open and not was_open:
+            self.repository.shift_dependents(task_id, 1)
+        self.repository.session.commit()
+        self.repository.session.refresh(task)
+        return TaskStatusReport(task=TaskManagement.model_validate(task), unblocked=unblocked)
+
+    def add_dependency(self, task_id: int, prerequisite_id: int) -> TaskManagement:
+        """
+        Hace que `task_id` dependa de `prerequisite_id`, rechazando dependencias entre procesos,
+        ciclos y tareas que ya empezaron o se cerraron.
+        """
+        tasks = self.repository.lock_tasks(sorted({task_id, prerequisite_id}))
+        task, prerequisite = tasks.get(task_id), tasks.get(prerequisite_id)
+        if task is None or prerequisite is None:
+            raise TaskNotFoundError(f"No existe la tarea {task_id if task is None else prerequisite_id}.")
+        if task_id == prerequisite_id or task.id_process != prerequisite.id_process:
+            raise TaskDependencyError("Una tarea solo puede depender de otra tarea del mismo proceso.")
+        if task.status != TaskStatus.PENDING:
+            raise TaskDependencyError(f"La tarea {task_id} ya está {task.status.value}; solo una tarea pendiente admite dependencias nuevas.")
+
+        edges = self.repository.process_edges(task.id_process)
+        if (task_id, prerequisite_id) in edges:
+            return TaskManagement.model_validate(task)
+        requires: dict[int, list[int]] = {}
+        for dependent, previous in edges:
+            requires.setdefault(dependent, []).append(previous)
+        # Hay ciclo si la previa ya depende (directa o indirectamente) de la tarea
+        stack, seen = [prerequisite_id], set()
+        while stack:
+            current = stack.pop()
+            if current == task_id:
+                raise TaskDependencyError(f"La dependencia {task_id} -> {prerequisite_id} formaría un ciclo.")
+            if current not in seen:
+                seen.add(current)
+                stack.extend(requires.get(current, ()))
+
+        self.repository.add_dependencies([{"id_tarea": task_id, "id_tarea_previa": prerequisite_id}])
+        if prerequisite.status in OPEN_STATUSES:
+            task.pending_dependencies += 1
+        return TaskManagement.model_validate(self.repository.save(task))
+
+    def next_for_process(self, process_id: int) -> list[TaskManagement]:
+        """Tareas del proceso que se pueden empezar ya."""
+        return [TaskManagement.model_validate(task) for task in self.repository.actionable_for_process(process_id)]
+
+    def assigned_to(self, assignee: str, limit: int, cursor: int | None = None, actionable_only: bool = True) -> TaskPage:
+        """Tareas abiertas de un responsable (solo las accionables por defecto) y el cursor para la siguiente página."""
+        tasks = self.repository.open_for_assignee(assignee, actionable_only, limit=limit + 1, after=cursor)
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+        return TaskPage(
+            items=[TaskManagement.model_validate(task) for task in tasks],
+            next_cursor=tasks[-1].id if has_more else None,
+        )
+
+def get_task_service(session: Session = Depends(get_db_session)) -> TaskService:
+    """Dependencia que construye el servicio de tareas."""
+    return TaskService(TaskRepository(session))
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+
+from app.core.database import run_db
+from app.modules.trabajos.schemas.schema import JobCreate, JobManagement
+from app.modules.trabajos.services.service import JobService, get_job_service
+
+router = APIRouter()
+
+@router.post("/", response_model=JobManagement, status_code=202)
+async def enqueue_job(data: JobCreate, service: JobService = Depends(get_job_service)):
+    """Encola un trabajo y responde de inmediato; el avance se consulta en GET /{id}."""
+    return await run_db(service.enqueue, data)
+
+@router.get("/{job_id}", response_model=JobManagement)
+async def get_job(job_id: int, service: JobService = Depends(get_job_service)):
+    """Estado, progreso y resultado del trabajo."""
+    return await run_db(service.get, job_id)
+
+@router.post("/{job_id}/cancelar", response_model=JobManagement)
+async def cancel_job(job_id: int, service: JobService = Depends(get_job_service)):
+    """Cancela un trabajo pendiente o en ejecución."""
+    return await run_db(service.cancel, job_id)
@@ -0,0 +1,17 @@
+"""Excepciones del módulo de trabajos."""
+from app.core.exceptions import AppError
+
+class JobNotFoundError(AppError):
+    """Error cuando el trabajo no existe."""
+    status_code = 404
+
+class UnknownJobKindError(AppError):
+    """Error cuando no hay un manejador registrado para el tipo de trabajo."""
+    status_code = 400
+
+class JobClosedError(AppError):
+    """Error cuando el trabajo ya terminó y no se puede cancelar."""
+    status_code = 409
+
+class JobInterruptedError(Exception):
+    """El trabajo se canceló o su toma venció mientras se ejecutaba; el manejador debe detenerse."""
@@ -0,0 +1,51 @@
+"""Modelo de datos para la cola de trabajos en segundo plano."""
+from enum import Enum
+from typing import Any, ClassVar, Optional
+
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, func, text
+from sqlalchemy.dialects.postgresql import ENUM as PgEnum, JSONB
+
+class JobStatus(str, Enum):
+    PENDING = "pendiente"
+    RUNNING = "en_ejecucion"
+    DONE = "completado"
+    FAILED = "fallido"
+    CANCELLED = "cancelado"
+
+# Predicados de los índices parciales; el enum se guarda por nombre del miembro
+PENDING_JOB = text("estado = 'PENDING'")
+RUNNING_JOB = text("estado = 'RUNNING'")
+
+class Job(SQLModel, table=True):
+    """
+    Trabajo lento de una etapa (p. ej. verificación de archivos o generación de documentos).
+    Lo encola la API y lo ejecuta app.worker; `kind` elige el manejador registrado con @job_handler.
+    """
+    __tablename__: ClassVar[str] = 'trabajo'
+
+    id: Optional[int] = Field(default=None, sa_column=Column("id_trabajo", Integer, primary_key=True))
+    kind: str = Field(sa_column=Column("tipo", String(100), nullable=False))
+    idempotency_key: Optional[str] = Field(default=None, sa_column=Column("clave_idempotencia", String(200), unique=True, nullable=True))
+    params: dict[str, Any] = Field(default_factory=dict, sa_column=Column("parametros", JSON().with_variant(JSONB(), "postgresql"), nullable=False))
+    status: JobStatus = Field(default=JobStatus.PENDING, sa_column=Column("estado", PgEnum(JobStatus, name="trabajo_estado"), nullable=False))
+    attempts: int = Field(default=0, sa_column=Column("intentos", Integer, nullable=False, server_default="0"))
+    max_attempts: int = Field(default=5, sa_column=Column("max_intentos", Integer, nullable=False))
+    progress: int = Field(default=0, sa_column=Column("progreso", Integer, nullable=False, server_default="0"))
+    progress_message: Optional[str] = Field(default=None, sa_column=Column("mensaje_progreso", String(200), nullable=True))
+    result: Optional[dict[str, Any]] = Field(default=None, sa_column=Column("resultado", JSON().with_variant(JSONB(), "postgresql"), nullable=True))
+    last_error: Optional[str] = Field(default=None, sa_column=Column("error", Text, nullable=True))
+    run_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_programada", DateTime(timezone=False), nullable=False))
+    # Vigencia de la toma por un worker; se renueva con cada reporte de progreso
+    locked_until: Optional[datetime] = Field(default=None, sa_column=Column("bloqueado_hasta", DateTime(timezone=False), nullable=True))
+    started_at: Optional[datetime] = Field(default=None, sa_column=Column("fecha_inicio", DateTime(timezone=False), nullable=True))
+    finished_at: Optional[datetime] = Field(default=None, sa_column=Column("fecha_fin", DateTime(timezone=False), nullable=True))
+    created_at: datetime = Field(default_factory=datetime.now, sa_column=Column("fecha_creacion", DateTime(timezone=False), server_default=func.now(), nullable=False))
+
+    __table_args__ = (
+        # Frente de la cola: solo pendientes, por fecha programada
+        Index("ix_trabajo_pendiente", "fecha_programada", postgresql_where=PENDING_JOB, sqlite_where=PENDING_JOB),
+        # Tomas vencidas (worker caído): solo en ejecución, por vigencia
+        Index("ix_trabajo_en_ejecucion", "bloqueado_hasta", postgresql_where=RUNNING_JOB, sqlite_where=RUNNING_JOB),
+    )
@@ -0,0 +1,91 @@
+"""Repositorio de la cola de trabajos."""
+from typing import Any, Sequence
+
+from datetime import datetime
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.modules.trabajos.models.job import PENDING_JOB, RUNNING_JOB, Job, JobStatus
+
+class JobRepository:
+    """
+    Cola de trabajos. Cada operación del worker es una transacción corta: el trabajo se toma
+    con una vigencia (`locked_until`) y se ejecuta fuera de la transacción. Las escrituras
+    del worker se condicionan al número de intento, así un worker cuya toma venció no pisa
+    el resultado del que lo retomó.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, job_id: int) -> Job | None:
+        return self.session.get(Job, job_id)
+
+    def by_key(self, idempotency_key: str) -> Job | None:
+        return self.session.exec(select(Job).where(Job.idempotency_key == idempotency_key)).first()
+
+    def add(self, job: Job) -> Job:
+        self.session.add(job)
+        self.session.flush()
+        return job
+
+    def release_expired(self, now: datetime) -> int:
+        """
+        Devuelve a la cola los trabajos cuya toma venció (worker caído) y da por fallidos
+        los que ya agotaron sus intentos. Recorre solo ix_trabajo_en_ejecucion.
+        """
+        expired = [RUNNING_JOB, Job.locked_until < now] # type: ignore[operator]
+        requeued = self.session.exec(
+            update(Job)
+            .where(*expired, Job.attempts < Job.max_attempts) # type: ignore[arg-type]
+            .values(status=JobStatus.PENDING, locked_until=None, run_at=now)
+            .returning(Job.id)
+        ).all()
+        failed = self.session.exec(
+            update(Job)
+            .where(*expired, Job.attempts >= Job.max_attempts) # type: ignore[arg-type]
+            .values(status=JobStatus.FAILED, locked_until=None, finished_at=now, last_error="La toma del trabajo venció sin terminar")
+            .returning(Job.id)
+        ).all()
+        return len(requeued) + len(failed)
+
+    def claim(self, now: datetime, limit: int, lease_until: datetime, kinds: Sequence[str] | None = None) -> list:
+        """
+        Toma los trabajos pendientes más antiguos en una sola sentencia.
+        SKIP LOCKED salta las filas que otro worker está tomando en ese momento.
+        Returns:
+            list: Filas (id, kind, params, attempts, max_attempts) ya marcadas en ejecución; attempts es el intento actual.
+        """
+        due = select(Job.id).where(PENDING_JOB, Job.run_at <= now) # type: ignore[operator]
+        if kinds:
+            due = due.where(Job.kind.in_(kinds)) # type: ignore[attr-defined]
+        due = due.order_by(Job.run_at).limit(limit).with_for_update(skip_locked=True) # type: ignore[arg-type]
+        return list(self.session.exec(
+            update(Job)
+            .where(Job.id.in_(due.scalar_subquery())) # type: ignore[union-attr]
+            .values(
+                status=JobStatus.RUNNING, attempts=Job.attempts + 1, locked_until=lease_until,
+                started_at=now, progress=0, progress_message=None,
+            )
+            .returning(Job.id, Job.kind, Job.params, Job.attempts, Job.max_attempts)
+        ).all())
+
+    def next_due(self, kinds: Sequence[str] | None = None) -> datetime | None:
+        """Fecha del próximo trabajo pendiente (lectura del primer elemento del índice)."""
+        statement = select(func.min(Job.run_at)).where(PENDING_JOB)
+        if kinds:
+            statement = statement.where(Job.kind.in_(kinds)) # type: ignore[attr-defined]
+        return self.session.exec(statement).one()
+
+    def update_running(self, job_id: int, attempt: int, values: dict[str, Any]) -> bool:
+        """
+        Actualiza un trabajo solo si sigue en ejecución en el intento `attempt`.
+        Returns:
+            bool: False si se canceló o lo retomó otro worker.
+        """
+        return self.session.exec(
+            update(Job)
+            .where(Job.id == job_id, RUNNING_JOB, Job.attempts == attempt) # type: ignore[arg-type]
+            .values(**values)
+            .returning(Job.id)
+        ).first() is not None
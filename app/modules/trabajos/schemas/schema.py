@@ -0,0 +1,29 @@
+"""Esquemas para los trabajos en segundo plano"""
+from datetime import datetime
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.modules.trabajos.models.job import JobStatus
+
+class JobCreate(BaseModel):
+    kind: str = Field(min_length=1, max_length=100)
+    params: dict[str, Any] = {}
+    idempotency_key: str | None = Field(default=None, max_length=200, description="Repetir la clave devuelve el trabajo ya encolado")
+    run_at: datetime | None = None
+
+
+class JobManagement(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    progress: int
+    progress_message: str | None = None
+    result: dict[str, Any] | None = None
+    last_error: str | None = None
+    run_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,75 @@
+"""
+Registro de manejadores de trabajos y contexto que reciben al ejecutarse.
+
+Un manejador es una función síncrona ``(context) -> dict | None`` registrada con
+``@job_handler("tipo")``; el worker la ejecuta en un hilo. Los módulos que definen
+manejadores se listan en JOB_HANDLERS (app.factory) para que la API y el worker los conozcan.
+"""
+import time
+from typing import Any, Callable, ContextManager
+
+from sqlmodel import Session
+
+from app.modules.trabajos.exceptions.exceptions import JobInterruptedError
+
+JobHandler = Callable[["JobContext"], dict[str, Any] | None]
+
+_handlers: dict[str, JobHandler] = {}
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Registra el manejador de un tipo de trabajo."""
+    def decorator(handler: JobHandler) -> JobHandler:
+        if _handlers.get(kind, handler) is not handler:
+            raise ValueError(f"El tipo de trabajo '{kind}' ya tiene manejador")
+        _handlers[kind] = handler
+        return handler
+    return decorator
+
+def get_handler(kind: str) -> JobHandler | None:
+    return _handlers.get(kind)
+
+def registered_kinds() -> list[str]:
+    return sorted(_handlers)
+
+class JobContext:
+    """
+    Parámetros e intento del trabajo, sesión de BD y reporte de progreso.
+    Args:
+        job_id (int): Trabajo en ejecución.
+        attempt (int): Intento actual (1 en la primera ejecución).
+        params (dict): Parámetros con los que se encoló.
+        session (Callable[[], Session]): Crea sesiones para el manejador.
+        report (Callable[[int, str | None], bool]): Guarda el progreso y renueva la toma;
+            devuelve False si el trabajo se canceló o lo retomó otro worker.
+        min_interval (float): Segundos mínimos entre escrituras de progreso.
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        attempt: int,
+        params: dict[str, Any],
+        session: Callable[[], ContextManager[Session]],
+        report: Callable[[int, str | None], bool],
+        min_interval: float = 1.0,
+    ) -> None:
+        self.job_id = job_id
+        self.attempt = attempt
+        self.params = params
+        self.session = session
+        self._report = report
+        self._min_interval = min_interval
+        self._last_report = float("-inf")
+
+    def report(self, progress: int, message: str | None = None) -> None:
+        """
+        Informa el avance (0-100). Las escrituras se espacian `min_interval` segundos.
+        Raises:
+            JobInterruptedError: Si el trabajo se canceló o su toma venció; el manejador debe terminar.
+        """
+        now = time.monotonic()
+        if now - self._last_report < self._min_interval and progress < 100:
+            return
+        self._last_report = now
+        if not self._report(max(0, min(progress, 100)), message[:200] if message else None):
+            raise JobInterruptedError(f"El trabajo {self.job_id} se canceló o lo retomó otro worker")
@@ -0,0 +1,71 @@
+"""Servicios de la cola de trabajos."""
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.modules.trabajos.exceptions.exceptions import JobClosedError, JobNotFoundError, UnknownJobKindError
+from app.modules.trabajos.models.job import Job, JobStatus
+from app.modules.trabajos.repository.repository import JobRepository
+from app.modules.trabajos.schemas.schema import JobCreate
+from app.modules.trabajos.services.registry import get_handler, registered_kinds
+
+class JobService:
+    def __init__(self, repository: JobRepository) -> None:
+        self.repository = repository
+
+    def enqueue(self, data: JobCreate, commit: bool = True) -> Job:
+        """
+        Encola un trabajo: un solo INSERT, que es todo lo que espera la petición.
+        Con `idempotency_key` repetida devuelve el trabajo ya encolado, aunque dos peticiones lleguen a la vez.
+        Args:
+            data (JobCreate): Tipo, parámetros y clave de idempotencia.
+            commit (bool): False para encolar dentro de la transacción del llamador
+                (el trabajo se ve recién cuando el llamador confirma).
+        """
+        if get_handler(data.kind) is None:
+            raise UnknownJobKindError(f"Tipo de trabajo desconocido: {data.kind}. Disponibles: {', '.join(registered_kinds())}")
+        if data.idempotency_key is not None:
+            existing = self.repository.by_key(data.idempotency_key)
+            if existing is not None:
+                return existing
+        job = Job(
+            kind=data.kind, params=data.params, idempotency_key=data.idempotency_key,
+            max_attempts=settings.JOB_MAX_ATTEMPTS, run_at=data.run_at or datetime.now(),
+        )
+        try:
+            with self.repository.session.begin_nested():
+                self.repository.add(job)
+        except IntegrityError:
+            existing = self.repository.by_key(data.idempotency_key) if data.idempotency_key is not None else None
+            if existing is None:
+                raise
+            return existing
+        if commit:
+            self.repository.session.commit()
+            self.repository.session.refresh(job)
+        return job
+
+    def get(self, job_id: int) -> Job:
+        job = self.repository.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"El trabajo {job_id} no existe")
+        return job
+
+    def cancel(self, job_id: int) -> Job:
+        """Cancela un trabajo pendiente o en ejecución; el manejador en curso se detiene en su próximo reporte."""
+        job = self.get(job_id)
+        if job.status not in (JobStatus.PENDING, JobStatus.RUNNING):
+            raise JobClosedError(f"El trabajo {job_id} ya está {job.status.value}")
+        job.status, job.finished_at, job.locked_until = JobStatus.CANCELLED, datetime.now(), None
+        self.repository.session.add(job)
+        self.repository.session.commit()
+        self.repository.session.refresh(job)
+        return job
+
+def get_job_service(session: Session = Depends(get_db_session)) -> JobService:
+    """Dependencia que construye el servicio de trabajos."""
+    return JobService(JobRepository(session))
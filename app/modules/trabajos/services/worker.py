@@ -0,0 +1,178 @@
+"""Worker asíncrono que ejecuta los trabajos de la cola."""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from datetime import datetime, timedelta
+from loguru import logger
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.modules.trabajos.exceptions.exceptions import JobInterruptedError
+from app.modules.trabajos.models.job import JobStatus
+from app.modules.trabajos.repository.repository import JobRepository
+from app.modules.trabajos.services.registry import JobContext, get_handler
+
+# Espera mínima entre revisiones; evita girar en vacío si otro worker tiene las filas vencidas
+MIN_POLL_DELAY = 0.5
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    id: int
+    kind: str
+    params: dict[str, Any]
+    attempt: int
+    max_attempts: int
+
+class JobWorker:
+    """
+    Toma trabajos pendientes y los ejecuta en hilos, hasta `concurrency` a la vez.
+
+    La toma es una transacción corta (UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED))
+    y deja el trabajo en ejecución con una vigencia que se renueva con cada reporte de progreso.
+    Si el worker cae, al vencer la vigencia otro worker lo devuelve a la cola. Un fallo se
+    reintenta con espera exponencial hasta agotar los intentos del trabajo.
+    Args:
+        session_factory (Callable[[], Session]): Crea una sesión nueva por operación.
+        concurrency (int): Trabajos simultáneos.
+        poll_interval (float): Espera máxima en segundos entre revisiones de la cola.
+        lease (timedelta): Vigencia de la toma sin reportes de progreso.
+        retry_base (timedelta): Espera antes del primer reintento; se duplica en cada uno.
+        retry_max (timedelta): Espera máxima entre reintentos.
+        kinds (Sequence[str] | None): Tipos que atiende este worker; None para todos.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        concurrency: int = 4,
+        poll_interval: float = 5.0,
+        lease: timedelta = timedelta(minutes=5),
+        retry_base: timedelta = timedelta(seconds=30),
+        retry_max: timedelta = timedelta(hours=1),
+        kinds: Sequence[str] | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.kinds = list(kinds) if kinds else None
+        self._stopping = asyncio.Event()
+
+    @classmethod
+    def from_settings(cls, kinds: Sequence[str] | None = None) -> "JobWorker":
+        """Worker con el motor de la aplicación y los valores de configuración."""
+        from app.core.database import engine # pylint: disable=import-outside-toplevel
+
+        return cls(
+            session_factory=lambda: Session(engine),
+            concurrency=settings.JOB_CONCURRENCY,
+            poll_interval=settings.JOB_POLL_INTERVAL,
+            lease=timedelta(seconds=settings.JOB_LEASE_SECONDS),
+            retry_base=timedelta(seconds=settings.JOB_RETRY_BASE_SECONDS),
+            retry_max=timedelta(seconds=settings.JOB_RETRY_MAX_SECONDS),
+            kinds=kinds,
+        )
+
+    def claim(self, limit: int, now: datetime | None = None) -> tuple[list[ClaimedJob], datetime | None]:
+        """
+        Libera las tomas vencidas y toma hasta `limit` trabajos.
+        Returns:
+            tuple: Trabajos tomados y la fecha del próximo pendiente.
+        """
+        now = now or datetime.now()
+        with self.session_factory() as session:
+            repository = JobRepository(session)
+            repository.release_expired(now)
+            rows = repository.claim(now, limit, now + self.lease, self.kinds)
+            session.commit()
+            jobs = [ClaimedJob(job_id, kind, params or {}, attempt, max_attempts) for job_id, kind, params, attempt, max_attempts in rows]
+            return jobs, repository.next_due(self.kinds)
+
+    def _update(self, job: ClaimedJob, values: dict[str, Any]) -> bool:
+        with self.session_factory() as session:
+            updated = JobRepository(session).update_running(job.id, job.attempt, values)
+            session.commit()
+            return updated
+
+    def execute(self, job: ClaimedJob) -> JobStatus | None:
+        """
+        Ejecuta un trabajo tomado y registra el resultado.
+        Returns:
+            JobStatus | None: Estado en que quedó, o None si se interrumpió (cancelado o retomado).
+        """
+        handler = get_handler(job.kind)
+        if handler is None:
+            self._update(job, {"status": JobStatus.FAILED, "finished_at": datetime.now(), "locked_until": None,
+                               "last_error": f"No hay manejador para el tipo '{job.kind}'"})
+            return JobStatus.FAILED
+
+        def report(progress: int, message: str | None) -> bool:
+            return self._update(job, {"progress": progress, "progress_message": message, "locked_until": datetime.now() + self.lease})
+
+        context = JobContext(job.id, job.attempt, job.params, self.session_factory, report)
+        try:
+            result = handler(context)
+        except JobInterruptedError:
+            logger.info(f"Trabajo {job.id} ({job.kind}) interrumpido en el intento {job.attempt}.")
+            return None
+        except Exception as e: # pylint: disable=broad-except
+            now = datetime.now()
+            values: dict[str, Any] = {"locked_until": None, "last_error": f"{type(e).__name__}: {e}"[:2000]}
+            if job.attempt >= job.max_attempts:
+                status = JobStatus.FAILED
+                values.update(status=status, finished_at=now)
+                logger.warning(f"Trabajo {job.id} ({job.kind}) fallido tras {job.attempt} intentos: {e}")
+            else:
+                status = JobStatus.PENDING
+                values.update(status=status, run_at=now + min(self.retry_base * 2 ** (job.attempt - 1), self.retry_max))
+            return status if self._update(job, values) else None
+
+        done = self._update(job, {"status": JobStatus.DONE, "progress": 100, "result": result,
+                                  "finished_at": datetime.now(), "locked_until": None, "last_error": None})
+        return JobStatus.DONE if done else None
+
+    def run_once(self, now: datetime | None = None) -> int:
+        """Toma un lote y lo ejecuta en este hilo, uno tras otro. Devuelve cuántos trabajos tomó."""
+        jobs, _ = self.claim(self.concurrency, now)
+        for job in jobs:
+            self.execute(job)
+        return len(jobs)
+
+    async def run(self) -> None:
+        """
+        Bucle del worker: mantiene hasta `concurrency` trabajos en hilos y vuelve a tomar apenas
+        se libera un hueco; con la cola vacía duerme hasta el próximo programado o `poll_interval`.
+        Al detenerse deja de tomar trabajos y espera a los que están en curso.
+        """
+        logger.info(f"Worker de trabajos iniciado (concurrencia {self.concurrency}, tipos: {', '.join(self.kinds or ['todos'])}).")
+        running: set[asyncio.Task] = set()
+        while not self._stopping.is_set():
+            free = self.concurrency - len(running)
+            delay = self.poll_interval
+            if free > 0:
+                try:
+                    jobs, next_due = await asyncio.to_thread(self.claim, free)
+                except Exception as e: # pylint: disable=broad-except
+                    logger.exception(f"Error al tomar trabajos: {e}")
+                    jobs, next_due = [], None
+                for job in jobs:
+                    task = asyncio.create_task(asyncio.to_thread(self.execute, job), name=f"job-{job.id}")
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+                # Con la cola llena se vuelve a tomar en cuanto termine un trabajo (ver la espera abajo)
+                if len(jobs) < free and next_due is not None:
+                    delay = min(delay, max((next_due - datetime.now()).total_seconds(), MIN_POLL_DELAY))
+            stopping = asyncio.create_task(self._stopping.wait())
+            await asyncio.wait({stopping, *running}, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            stopping.cancel()
+        if running:
+            logger.info(f"Esperando {len(running)} trabajos en curso...")
+            await asyncio.wait(running)
+        logger.info("Worker de trabajos detenido.")
+
+    def stop(self) -> None:
+        """Pide detener el bucle; los trabajos en curso terminan normalmente."""
+        self._stopping.set()
@@ -0,0 +1,62 @@
+"""Escrituras masivas con INSERT ... ON CONFLICT de varias filas por sentencia."""
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Integer, Table, any_, bindparam, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import Session
+
+def id_in(session: Session, column, ids: Sequence[int]) -> ColumnElement:
+    """
+    Filtro por lista de ids. En Postgres es ``columna = ANY(:ids)`` con un solo parámetro
+    de tipo arreglo (plan y sentencia estables sin importar la cantidad); en otros motores, IN.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return column == any_(bindparam(None, list(ids), type_=postgresql.ARRAY(Integer)))
+    return column.in_(list(ids))
+
+def to_columns(model: type, values: dict[str, Any]) -> dict[str, Any]:
+    """Traduce nombres de atributo del modelo (``name``) a nombres de columna (``nombre``)."""
+    attributes = inspect(model).mapper.column_attrs
+    return {attributes[key].columns[0].name: value for key, value in values.items()}
+
+def upsert(
+    session: Session,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    conflict: Iterable[str],
+    update: Iterable[str],
+    returning: Iterable[str] = (),
+) -> list:
+    """
+    Inserta filas y actualiza las que ya existen según la restricción única `conflict`.
+    SQLAlchemy agrupa las filas en sentencias VALUES de varias filas (insertmanyvalues).
+    Args:
+        session (Session): Sesión de base de datos; se usa su conexión actual.
+        table (Table): Tabla destino; las claves de `rows` son nombres de columna.
+        rows (Sequence[dict]): Filas a escribir; no deben repetir la clave de conflicto.
+        conflict (Iterable[str]): Columnas de la restricción única.
+        update (Iterable[str]): Columnas a sobrescribir cuando la fila ya existe.
+        returning (Iterable[str]): Columnas a devolver por cada fila escrita.
+    Returns:
+        list: Filas con las columnas de `returning` (sin orden garantizado), o lista vacía.
+    """
+    if not rows:
+        return []
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(table)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(table)
+    else:
+        raise NotImplementedError(f"upsert no soportado para {dialect}")
+
+    statement = statement.on_conflict_do_update(
+        index_elements=list(conflict),
+        set_={column: statement.excluded[column] for column in update},
+    )
+    columns = [table.c[column] for column in returning]
+    if columns:
+        statement = statement.returning(*columns)
+    result = session.connection().execute(statement, list(rows))
+    return list(result.all()) if columns else []
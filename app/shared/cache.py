@@ -0,0 +1,138 @@
+"""
+Caché en memoria con expiración por TTL y desalojo LRU, y backends compartidos opcionales.
+
+Un backend es cualquier objeto con ``get``, ``set`` e ``invalidate`` (ver CacheBackend);
+TTLCache ya cumple la interfaz y es el backend por defecto.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterable, Protocol
+
+from loguru import logger
+
+try:
+    import redis
+except ImportError: # pragma: no cover - dependencia opcional
+    redis = None
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    Caché acotada y segura entre hilos.
+
+    Cada entrada vence ``ttl`` segundos después de escribirse; al superar ``maxsize``
+    se descarta la menos usada recientemente.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Devuelve el valor vigente o `default`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Guarda un valor con el TTL indicado o, por defecto, el de la caché."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Devuelve el valor en caché o lo calcula con `load` y lo guarda."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = load()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """Descarta las claves indicadas."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Aciertos, fallos y tamaño actual."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+class CacheBackend(Protocol):
+    """Almacenamiento clave-valor con expiración usado por las cachés de respuestas."""
+
+    def get(self, key: str, default: Any = None) -> Any: ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    def invalidate(self, keys: Iterable[str]) -> None: ...
+
+class RedisBackend:
+    """
+    Backend compartido entre procesos sobre Redis (o un servidor compatible).
+    Solo guarda bytes; ante errores de conexión se comporta como una caché vacía.
+    """
+
+    def __init__(self, url: str, prefix: str = "posgrado:") -> None:
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requiere instalar el paquete 'redis'.")
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            value = self._client.get(self.prefix + key)
+        except redis.RedisError as e:
+            logger.warning(f"Caché Redis no disponible: {e}")
+            return default
+        return default if value is None else value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        try:
+            self._client.set(self.prefix + key, value, px=int(ttl * 1000) if ttl else None)
+        except redis.RedisError as e:
+            logger.warning(f"Caché Redis no disponible: {e}")
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        names = [self.prefix + key for key in keys]
+        if not names:
+            return
+        try:
+            self._client.delete(*names)
+        except redis.RedisError as e:
+            logger.warning(f"Caché Redis no disponible: {e}")
+
+def create_backend(kind: str, url: str | None = None, maxsize: int = 1024) -> CacheBackend:
+    """
+    Construye el backend configurado.
+    Args:
+        kind (str): "memory" (por proceso) o "redis" (compartido).
+        url (str | None): URL de Redis cuando kind es "redis".
+        maxsize (int): Entradas máximas del backend en memoria.
+    """
+    if kind == "redis":
+        return RedisBackend(url or "redis://localhost:6379/0")
+    return TTLCache(ttl=300, maxsize=maxsize)
@@ -0,0 +1,120 @@
+"""
+Notificación de cambios en modelos para mantener proyecciones y cachés al día.
+
+Los cambios hechos con el ORM se detectan en cada flush. Las actualizaciones masivas
+(``UPDATE ... WHERE id IN ...``) no pasan por el ORM y deben llamar a ``publish``.
+Los suscriptores reciben ``{modelo: {ids}}`` y corren en la misma transacción; lo que
+no deba verse antes del commit (p. ej. invalidar cachés) se difiere con ``on_commit``.
+
+Un suscriptor puede declarar ``references``: columnas cuyo valor (el nuevo y el anterior, o
+el de la fila borrada) se le entrega como ids de otro modelo. Así una fila eliminada o
+reasignada sigue llegando a su padre aunque ya no pueda encontrarse después del flush.
+"""
+from collections import defaultdict
+from typing import Callable, Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+ChangeHandler = Callable[[Session, dict[type, set[int]]], None]
+# {modelo: (atributo, modelo referenciado)}
+References = dict[type, tuple[str, type]]
+
+_subscribers: list[tuple[frozenset[type], References, ChangeHandler]] = []
+
+_PENDING_KEY = "pending_changes"
+_REFERENCES_KEY = "pending_references"
+_ON_COMMIT_KEY = "on_commit"
+
+def subscribe(*models: type, references: References | None = None) -> Callable[[ChangeHandler], ChangeHandler]:
+    """
+    Registra un suscriptor para los cambios de los modelos indicados.
+    Args:
+        references (References | None): Por modelo, el atributo cuyos valores antes y después
+            del flush se entregan como ids del modelo referenciado.
+    """
+    def decorator(handler: ChangeHandler) -> ChangeHandler:
+        _subscribers.append((frozenset(models), dict(references or {}), handler))
+        return handler
+    return decorator
+
+def publish(session: Session, changes: dict[type, Iterable[int]]) -> None:
+    """Notifica cambios hechos fuera del ORM (p. ej. UPDATE masivos) y despacha de inmediato."""
+    pending = _pending(session)
+    for model, ids in changes.items():
+        pending[model].update(ids)
+    _dispatch(session)
+
+def on_commit(session: Session, callback: Callable[[], None]) -> None:
+    """Ejecuta `callback` cuando la transacción actual se confirme; se descarta si hay rollback."""
+    session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+def _pending(session: Session) -> dict[type, set[int]]:
+    return session.info.setdefault(_PENDING_KEY, defaultdict(set))
+
+def _pending_references(session: Session) -> dict[tuple[type, str], set[int]]:
+    return session.info.setdefault(_REFERENCES_KEY, defaultdict(set))
+
+def _referenced() -> dict[type, set[str]]:
+    referenced: dict[type, set[str]] = defaultdict(set)
+    for _, references, _ in _subscribers:
+        for model, (attribute, _) in references.items():
+            referenced[model].add(attribute)
+    return referenced
+
+@event.listens_for(Session, "before_flush")
+def _load_references(session: Session, _flush_context, _instances) -> None:
+    """Carga las referencias de las filas por borrar mientras aún existen (pueden estar expiradas)."""
+    referenced = _referenced()
+    for instance in session.deleted:
+        for attribute in referenced.get(type(instance), ()):
+            getattr(instance, attribute)
+
+@event.listens_for(Session, "after_flush")
+def _collect(session: Session, _flush_context) -> None:
+    """Acumula las claves de los objetos escritos en el flush y los valores de sus referencias."""
+    watched = frozenset().union(*(models for models, _, _ in _subscribers))
+    referenced = _referenced()
+    if not watched and not referenced:
+        return
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        model = type(instance)
+        if model not in watched and model not in referenced:
+            continue
+        state = inspect(instance)
+        if model in watched:
+            # La identidad de los objetos nuevos aún no está asignada en after_flush
+            key = state.mapper.primary_key_from_instance(instance)[0]
+            if key is not None:
+                _pending(session)[model].add(key)
+        # El historial sigue activo en after_flush: trae el valor anterior de una reasignación
+        # y el de la fila borrada, que ya no se encontraría consultando la base
+        for attribute in referenced.get(model, ()):
+            values = state.attrs[attribute].history.sum()
+            _pending_references(session)[(model, attribute)].update(value for value in values if value is not None)
+
+@event.listens_for(Session, "after_flush_postexec")
+def _dispatch(session: Session, _flush_context=None) -> None:
+    """Entrega los cambios acumulados a cada suscriptor interesado."""
+    pending = session.info.pop(_PENDING_KEY, None) or {}
+    pending_references = session.info.pop(_REFERENCES_KEY, None) or {}
+    if not pending and not pending_references:
+        return
+    for models, references, handler in _subscribers:
+        changes = {model: ids for model, ids in pending.items() if model in models and ids}
+        for model, (attribute, target) in references.items():
+            if values := pending_references.get((model, attribute)):
+                changes[target] = changes.get(target, set()) | values
+        if changes:
+            handler(session, changes)
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    for callback in session.info.pop(_ON_COMMIT_KEY, ()):
+        callback()
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_commit(session: Session) -> None:
+    session.info.pop(_ON_COMMIT_KEY, None)
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_REFERENCES_KEY, None)
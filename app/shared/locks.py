@@ -0,0 +1,30 @@
+"""
+Bloqueos consultivos de transacción (pg_advisory_xact_lock) para serializar operaciones que
+leen un estado y escriben en función de él, como los recálculos de proyecciones.
+"""
+from enum import IntEnum
+from typing import Iterable
+
+from sqlalchemy import func, select
+from sqlmodel import Session
+
+class LockNamespace(IntEnum):
+    """Primer argumento del bloqueo; separa las claves de cada uso."""
+    STAGE_ROLLUP = 1
+    DEFENSE_SCHEDULE = 2
+
+def advisory_xact_lock(session: Session, namespace: LockNamespace, keys: Iterable[int]) -> None:
+    """
+    Toma un bloqueo exclusivo por clave hasta el fin de la transacción actual.
+    Las claves se bloquean en orden para que dos transacciones no se esperen en ciclo.
+    En otros motores no hace nada (SQLite ya serializa las escrituras).
+    Args:
+        session (Session): Sesión cuya transacción retiene los bloqueos.
+        namespace (LockNamespace): Uso del bloqueo.
+        keys (Iterable[int]): Claves de 32 bits dentro del espacio de nombres.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    connection = session.connection()
+    for key in sorted(set(keys)):
+        connection.execute(select(func.pg_advisory_xact_lock(int(namespace), key)))
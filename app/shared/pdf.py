@@ -0,0 +1,328 @@
+"""
+Escritura de PDF sin dependencias externas, pensada para documentos generados en lote.
+
+Una plantilla se compila una sola vez: lo que no depende de los datos (marcos, textos fijos,
+imágenes) se serializa y comprime como un Form XObject, y el inicio del archivo con el
+catálogo, las fuentes, las imágenes y esos fondos queda armado en bytes. Por documento solo se
+escriben los textos con campos, la tabla xref y el trailer. Las fuentes son Helvetica estándar
+(sin incrustar) con codificación WinAnsi, que cubre el español.
+"""
+import string
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Sequence, Union
+
+A4 = (595.28, 841.89)
+A4_LANDSCAPE = (841.89, 595.28)
+
+# Anchos de los caracteres 32-126 en milésimas del cuerpo, según las métricas AFM de Adobe
+_ASCII_WIDTHS = {
+    "regular": (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, 1015,
+        667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833,
+        722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611,
+        278, 278, 278, 469, 556, 333,
+        556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833,
+        556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500,
+        334, 260, 334, 584,
+    ),
+    "bold": (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611, 975,
+        722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833,
+        722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611,
+        333, 278, 333, 584, 556, 333,
+        556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889,
+        611, 611, 611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500,
+        389, 280, 389, 584,
+    ),
+}
+
+_FONTS = {"regular": (b"/F1", b"Helvetica"), "bold": (b"/F2", b"Helvetica-Bold")}
+
+def _byte_widths(ascii_widths: tuple[int, ...]) -> tuple[int, ...]:
+    """Anchos por byte WinAnsi; las letras acentuadas miden lo mismo que su letra base."""
+    widths = [0] * 256
+    for code in range(32, 127):
+        widths[code] = ascii_widths[code - 32]
+    for code in range(128, 256):
+        try:
+            base = unicodedata.normalize("NFD", bytes([code]).decode("cp1252"))[0]
+        except UnicodeDecodeError:
+            continue
+        widths[code] = ascii_widths[ord(base) - 32] if 32 <= ord(base) < 127 else 556
+    return tuple(widths)
+
+_WIDTHS = {font: _byte_widths(widths) for font, widths in _ASCII_WIDTHS.items()}
+
+def encode_text(text: str) -> bytes:
+    """Texto en WinAnsi; los caracteres sin equivalente se reemplazan por '?'."""
+    return " ".join(text.split()).encode("cp1252", "replace")
+
+def _width(data: bytes, font: str, size: float) -> float:
+    widths = _WIDTHS[font]
+    return sum(widths[byte] for byte in data) * size / 1000
+
+def text_width(text: str, font: str = "regular", size: float = 11) -> float:
+    """Ancho en puntos de una línea de texto."""
+    return _width(encode_text(text), font, size)
+
+def _num(value: float) -> bytes:
+    return (f"{value:.2f}".rstrip("0").rstrip(".") or "0").encode()
+
+def _literal(data: bytes) -> bytes:
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+@dataclass(frozen=True)
+class Text:
+    """Una línea de texto; `x` es el borde izquierdo, el centro o el borde derecho según `align`."""
+    x: float
+    y: float
+    text: str
+    size: float = 11
+    font: str = "regular"
+    align: str = "left"
+
+@dataclass(frozen=True)
+class Paragraph:
+    """Texto partido en líneas de hasta `width` puntos, desde la línea base `y` hacia abajo."""
+    x: float
+    y: float
+    width: float
+    text: str
+    size: float = 11
+    font: str = "regular"
+    leading: float = 1.4
+    align: str = "left"
+
+@dataclass(frozen=True)
+class Rect:
+    x: float
+    y: float
+    width: float
+    height: float
+    line_width: float = 1.0
+
+@dataclass(frozen=True)
+class Line:
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    line_width: float = 0.75
+
+@dataclass(frozen=True)
+class Image:
+    """Imagen registrada como recurso al compilar la plantilla (ver jpeg_asset)."""
+    name: str
+    x: float
+    y: float
+    width: float
+    height: float
+
+Element = Union[Text, Paragraph, Rect, Line, Image]
+
+@dataclass(frozen=True)
+class Template:
+    """Documento de una o más páginas; los textos admiten campos de str.format, como ``{nombre}``."""
+    pages: Sequence[Sequence[Element]]
+    size: tuple[float, float] = A4
+    title: str = ""
+
+@dataclass(frozen=True)
+class ImageAsset:
+    width: int
+    height: int
+    data: bytes
+    color_space: str = "DeviceRGB"
+
+def jpeg_asset(data: bytes) -> ImageAsset:
+    """
+    Imagen JPEG que se incrusta tal cual (DCTDecode); lee tamaño y canales del marcador SOF.
+    Raises:
+        ValueError: Si los bytes no son un JPEG válido.
+    """
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("La imagen no es un JPEG")
+    index = 2
+    while index + 9 < len(data):
+        if data[index] != 0xFF:
+            raise ValueError("JPEG mal formado")
+        marker = data[index + 1]
+        if marker == 0xFF:
+            index += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(data[index + 5:index + 7], "big")
+            width = int.from_bytes(data[index + 7:index + 9], "big")
+            spaces = {1: "DeviceGray", 3: "DeviceRGB", 4: "DeviceCMYK"}
+            if data[index + 9] not in spaces:
+                raise ValueError("JPEG con una cantidad de canales no soportada")
+            return ImageAsset(width, height, data, spaces[data[index + 9]])
+        index += 2 + int.from_bytes(data[index + 2:index + 4], "big")
+    raise ValueError("JPEG sin marcador de inicio de cuadro")
+
+_FORMATTER = string.Formatter()
+
+def _compile_format(text: str) -> Callable[[Mapping[str, Any]], str] | None:
+    """Función que rellena los campos de `text`, o None si no tiene campos."""
+    parts = [(literal, name, spec) for literal, name, spec, _ in _FORMATTER.parse(text)]
+    if all(name is None for _, name, _ in parts):
+        return None
+
+    def fill(values: Mapping[str, Any]) -> str:
+        return "".join(literal + (format(values[name], spec) if name is not None else "") for literal, name, spec in parts)
+    return fill
+
+def _line(data: bytes, x: float, y: float, size: float, font: str, align: str) -> bytes:
+    if align != "left":
+        width = _width(data, font, size)
+        x -= width if align == "right" else width / 2
+    return b"BT %s %s Tf %s %s Td %s Tj ET\n" % (_FONTS[font][0], _num(size), _num(x), _num(y), _literal(data))
+
+def _wrap(data: bytes, font: str, size: float, width: float) -> list[bytes]:
+    space = _WIDTHS[font][32] * size / 1000
+    lines: list[bytes] = []
+    current: list[bytes] = []
+    current_width = 0.0
+    for word in data.split():
+        word_width = _width(word, font, size)
+        if current and current_width + space + word_width > width:
+            lines.append(b" ".join(current))
+            current, current_width = [word], word_width
+        else:
+            current_width += word_width + (space if current else 0)
+            current.append(word)
+    if current:
+        lines.append(b" ".join(current))
+    return lines
+
+def _draw(element: Element, text: str, images: Mapping[str, bytes]) -> bytes:
+    """Operadores de contenido de un elemento; `text` es su texto ya con los campos rellenos."""
+    if isinstance(element, Text):
+        return _line(encode_text(text), element.x, element.y, element.size, element.font, element.align)
+    if isinstance(element, Paragraph):
+        x = element.x + element.width / 2 if element.align == "center" else element.x
+        step = element.size * element.leading
+        return b"".join(
+            _line(line, x, element.y - number * step, element.size, element.font, element.align)
+            for number, line in enumerate(_wrap(encode_text(text), element.font, element.size, element.width))
+        )
+    if isinstance(element, Rect):
+        return b"%s w %s %s %s %s re S\n" % (
+            _num(element.line_width), _num(element.x), _num(element.y), _num(element.width), _num(element.height),
+        )
+    if isinstance(element, Line):
+        return b"%s w %s %s m %s %s l S\n" % (
+            _num(element.line_width), _num(element.x1), _num(element.y1), _num(element.x2), _num(element.y2),
+        )
+    return b"q %s 0 0 %s %s %s cm %s Do Q\n" % (
+        _num(element.width), _num(element.height), _num(element.x), _num(element.y), images[element.name],
+    )
+
+def _object(number: int, body: bytes) -> bytes:
+    return b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+def _stream(entries: bytes, data: bytes) -> bytes:
+    return b"<< %s /Length %d >>\nstream\n%s\nendstream" % (entries, len(data), data)
+
+class CompiledTemplate:
+    """
+    Plantilla lista para renderizar muchas veces; compilarla cuesta lo mismo que varios
+    documentos, así que conviene hacerlo una vez por proceso y reutilizarla.
+    Args:
+        template (Template): Definición de páginas y elementos.
+        assets (Mapping[str, ImageAsset] | None): Imágenes usadas por los elementos Image.
+    """
+
+    def __init__(self, template: Template, assets: Mapping[str, ImageAsset] | None = None) -> None:
+        assets = assets or {}
+        used = sorted({element.name for page in template.pages for element in page if isinstance(element, Image)})
+        missing = [name for name in used if name not in assets]
+        if missing:
+            raise ValueError(f"Imágenes no registradas: {', '.join(missing)}")
+
+        # Numeración: 1 catálogo, 2 árbol de páginas, 3-4 fuentes, imágenes, un fondo por página,
+        # y por página su objeto y su contenido; la información del documento va al final
+        images = {name: b"/Im%d" % number for number, name in enumerate(used, start=1)}
+        first_background = 5 + len(used)
+        first_page = first_background + len(template.pages)
+        self.page_count = len(template.pages)
+        self._width, self._height = template.size
+        self._info_number = first_page + 2 * self.page_count
+        self._title = _compile_format(template.title) or (lambda _, title=template.title: title)
+
+        fonts = b"/Font << " + b" ".join(b"%s %d 0 R" % (resource, number) for number, (resource, _) in enumerate(_FONTS.values(), start=3)) + b" >>"
+        image_refs = b" ".join(b"%s %d 0 R" % (images[name], 5 + index) for index, name in enumerate(used))
+        media_box = b"[0 0 %s %s]" % (_num(self._width), _num(self._height))
+
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+                b" ".join(b"%d 0 R" % (first_page + 2 * index) for index in range(self.page_count)), self.page_count,
+            ),
+            *(b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % name for _, name in _FONTS.values()),
+            *(
+                _stream(b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /%s /BitsPerComponent 8 /Filter /DCTDecode" % (
+                    assets[name].width, assets[name].height, assets[name].color_space.encode(),
+                ), assets[name].data)
+                for name in used
+            ),
+        ]
+        self._pages: list[tuple[int, bytes, list[tuple[Element, Callable]]]] = []
+        for index, elements in enumerate(template.pages):
+            static = []
+            dynamic = []
+            for element in elements:
+                fill = _compile_format(element.text) if isinstance(element, (Text, Paragraph)) else None
+                if fill is None:
+                    static.append(_draw(element, getattr(element, "text", ""), images))
+                else:
+                    dynamic.append((element, fill))
+            objects.append(_stream(
+                b"/Type /XObject /Subtype /Form /BBox %s /Resources << %s /XObject << %s >> >> /Filter /FlateDecode" % (media_box, fonts, image_refs),
+                zlib.compress(b"".join(static)),
+            ))
+            page_number = first_page + 2 * index
+            page = b"<< /Type /Page /Parent 2 0 R /MediaBox %s /Resources << %s /XObject << /Fondo %d 0 R >> >> /Contents %d 0 R >>" % (
+                media_box, fonts, first_background + index, page_number + 1,
+            )
+            self._pages.append((page_number, page, dynamic))
+
+        head = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
+        self._offsets: list[int] = []
+        position = len(head[0])
+        for number, body in enumerate(objects, start=1):
+            self._offsets.append(position)
+            head.append(_object(number, body))
+            position += len(head[-1])
+        self._head = b"".join(head)
+
+    def render(self, values: Mapping[str, Any]) -> bytes:
+        """
+        Genera el documento con los campos de `values`.
+        Raises:
+            KeyError: Si falta un campo usado por la plantilla.
+        """
+        parts = [self._head]
+        offsets = list(self._offsets)
+        position = len(self._head)
+        for page_number, page, dynamic in self._pages:
+            content = b"q /Fondo Do Q\n" + b"".join(_draw(element, fill(values), {}) for element, fill in dynamic)
+            for number, body in ((page_number, page), (page_number + 1, _stream(b"/Filter /FlateDecode", zlib.compress(content)))):
+                offsets.append(position)
+                parts.append(_object(number, body))
+                position += len(parts[-1])
+
+        offsets.append(position)
+        parts.append(_object(self._info_number, b"<< /Producer (PosgradoBackend) /Title %s >>" % _literal(encode_text(self._title(values)))))
+        position += len(parts[-1])
+
+        parts.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+        parts.append(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+        parts.append(b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(offsets) + 1, self._info_number, position,
+        ))
+        return b"".join(parts)
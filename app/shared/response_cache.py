@@ -0,0 +1,100 @@
+"""
+Caché de respuestas JSON para endpoints de solo lectura, con ETag fuerte y 304.
+
+Cada ResponseCache tiene un espacio de nombres. Invalidarlo cambia su generación,
+así las entradas anteriores quedan inaccesibles también en un backend compartido.
+"""
+import hashlib
+import json
+import uuid
+from functools import lru_cache
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.shared.cache import CacheBackend, TTLCache, create_backend
+
+@lru_cache(maxsize=1)
+def shared_backend() -> CacheBackend | None:
+    """Backend compartido configurado en CACHE_BACKEND, o None si la caché es solo local."""
+    if settings.CACHE_BACKEND == "memory":
+        return None
+    return create_backend(settings.CACHE_BACKEND, settings.CACHE_REDIS_URL)
+
+class ResponseCache:
+    """
+    Cuerpos JSON ya serializados y su ETag, por clave.
+    Args:
+        namespace (str): Prefijo de las claves y unidad de invalidación.
+        ttl (float): Vigencia de las entradas en segundos.
+        backend (CacheBackend | None): Backend compartido; si es None se usa solo memoria local.
+        local_ttl (float): Vigencia de la copia local cuando hay backend compartido.
+    """
+
+    def __init__(self, namespace: str, ttl: float, backend: CacheBackend | None = None, local_ttl: float = 5.0) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.backend = backend
+        self._local = TTLCache(ttl=min(ttl, local_ttl) if backend is not None else ttl, maxsize=256)
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> tuple[str, bytes]:
+        """
+        Devuelve (etag, cuerpo) desde la caché o serializa el resultado de `build`.
+        """
+        entry = self._local.get(key)
+        if entry is not None:
+            return entry
+
+        shared_key = f"{self.namespace}:{self._generation()}:{key}" if self.backend is not None else None
+        if shared_key is not None:
+            stored = self.backend.get(shared_key) # type: ignore[union-attr]
+            if stored is not None:
+                etag, _, body = stored.partition(b"\n")
+                entry = (etag.decode(), body)
+                self._local.set(key, entry)
+                return entry
+
+        body = json.dumps(jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")).encode()
+        entry = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        self._local.set(key, entry)
+        if shared_key is not None:
+            self.backend.set(shared_key, entry[0].encode() + b"\n" + body, self.ttl) # type: ignore[union-attr]
+        return entry
+
+    def invalidate(self) -> None:
+        """Descarta todas las entradas del espacio de nombres."""
+        self._local.clear()
+        if self.backend is not None:
+            self.backend.set(f"{self.namespace}:gen", uuid.uuid4().hex.encode(), None)
+
+    def _generation(self) -> str:
+        generation = self.backend.get(f"{self.namespace}:gen") # type: ignore[union-attr]
+        if generation is None:
+            generation = uuid.uuid4().hex.encode()
+            self.backend.set(f"{self.namespace}:gen", generation, None) # type: ignore[union-attr]
+        return generation.decode()
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Compara If-None-Match con el ETag (comparación débil, como exige RFC 9110 para 304)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+def cached_json(request: Request, cache: ResponseCache, key: str, build: Callable[[], Any]) -> Response:
+    """
+    Responde desde la caché con ETag; devuelve 304 sin cuerpo si el cliente ya tiene la versión.
+    Args:
+        request (Request): Petición entrante (se lee If-None-Match).
+        cache (ResponseCache): Caché del endpoint.
+        key (str): Clave de la respuesta (p. ej. los parámetros de consulta).
+        build (Callable): Calcula el contenido cuando no está en caché.
+    """
+    etag, body = cache.get_or_build(key, build)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
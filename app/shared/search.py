@@ -0,0 +1,179 @@
+"""Búsqueda aproximada por trigramas: pg_trgm en Postgres y un índice en memoria para SQLite."""
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from threading import Lock
+from typing import Callable, Hashable, Iterable
+
+from sqlalchemy import DDL, MetaData, event, func, literal, literal_column, or_
+from sqlmodel import Session, select
+from sqlalchemy.sql.elements import ColumnElement
+
+# Función inmutable para poder indexar expresiones con unaccent
+SEARCH_EXTENSIONS_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent', $1) $$",
+)
+
+def register_search_ddl(metadata: MetaData) -> None:
+    """Crea las extensiones y la función f_unaccent antes de las tablas (solo Postgres)."""
+    for statement in SEARCH_EXTENSIONS_DDL:
+        event.listen(metadata, "before_create", DDL(statement).execute_if(dialect="postgresql"))
+
+def search_document(*columns) -> ColumnElement:
+    """
+    Expresión normalizada sobre la que se indexa y se busca en Postgres.
+    Debe coincidir textualmente con la expresión del índice GIN para que el planificador lo use.
+    """
+    document = columns[0]
+    for column in columns[1:]:
+        document = document.op("||")(literal_column("' '")).op("||")(column)
+    return func.f_unaccent(func.lower(document))
+
+def normalize(text: str) -> str:
+    """Minúsculas, sin tildes y con espacios colapsados."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return re.sub(r"\s+", " ", stripped).strip()
+
+def trigrams(text: str) -> set[str]:
+    """Trigramas por palabra con el mismo relleno que pg_trgm."""
+    grams: set[str] = set()
+    for word in re.findall(r"\w+", text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas en memoria.
+
+    El puntaje se aproxima a ``word_similarity`` de pg_trgm: la fracción de trigramas
+    de la consulta presentes en el documento; una coincidencia literal puntúa 1.
+    """
+
+    def __init__(self, threshold: float = 0.5) -> None:
+        self.threshold = threshold
+        self._documents: dict[Hashable, str] = {}
+        self._postings: dict[str, set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Indexa (o reindexa) un documento."""
+        self.remove(key)
+        document = normalize(text)
+        self._documents[key] = document
+        for gram in trigrams(document):
+            self._postings[gram].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Quita un documento del índice."""
+        document = self._documents.pop(key, None)
+        if document is None:
+            return
+        for gram in trigrams(document):
+            self._postings[gram].discard(key)
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[Hashable, float]]:
+        """Devuelve (clave, puntaje) ordenado de mayor a menor puntaje."""
+        normalized = normalize(query)
+        query_grams = trigrams(normalized)
+        if not query_grams:
+            return []
+        hits: Counter[Hashable] = Counter()
+        for gram in query_grams:
+            hits.update(self._postings.get(gram, ()))
+
+        results = []
+        for key, shared in hits.items():
+            score = 1.0 if normalized in self._documents[key] else shared / len(query_grams)
+            if score >= self.threshold:
+                results.append((key, score))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:limit]
+
+class FallbackIndex:
+    """
+    TrigramIndex que se reconstruye cuando cambia la firma de la tabla.
+    Solo se usa cuando la BD no es Postgres (p. ej. SQLite en pruebas).
+    """
+
+    def __init__(self, threshold: float = 0.5) -> None:
+        self.threshold = threshold
+        self._index: TrigramIndex | None = None
+        self._signature: Hashable = None
+        self._lock = Lock()
+
+    def invalidate(self) -> None:
+        """Fuerza la reconstrucción en la próxima búsqueda."""
+        with self._lock:
+            self._index = None
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        signature: Hashable,
+        load: Callable[[], Iterable[tuple[Hashable, str]]],
+    ) -> list[tuple[Hashable, float]]:
+        """
+        Busca en el índice, reconstruyéndolo con `load` si la firma cambió.
+        Args:
+            query (str): Texto a buscar.
+            limit (int): Máximo de resultados.
+            signature (Hashable): Firma actual de la tabla (p. ej. conteo y máximo id).
+            load (Callable): Devuelve pares (clave, texto) para reconstruir el índice.
+        """
+        with self._lock:
+            if self._index is None or signature != self._signature:
+                index = TrigramIndex(self.threshold)
+                for key, text in load():
+                    index.add(key, text)
+                self._index, self._signature = index, signature
+            return self._index.search(query, limit)
+
+def search_ids(
+    session: Session,
+    id_column,
+    columns: tuple,
+    query: str,
+    limit: int,
+    fallback: FallbackIndex,
+) -> list[tuple[int, float]]:
+    """
+    Busca filas por similitud de trigramas y devuelve (id, puntaje) ordenado.
+    En Postgres usa el índice GIN sobre search_document(*columns); en otros motores
+    recurre al índice en memoria `fallback`.
+    Args:
+        session (Session): Sesión de base de datos.
+        id_column: Columna de clave primaria a devolver.
+        columns (tuple): Columnas que forman el documento, en el mismo orden que el índice.
+        query (str): Texto a buscar.
+        limit (int): Máximo de resultados.
+        fallback (FallbackIndex): Índice en memoria para motores sin pg_trgm.
+    """
+    normalized = normalize(query)
+    if session.get_bind().dialect.name == "postgresql":
+        document = search_document(*columns)
+        score = func.word_similarity(normalized, document)
+        statement = (
+            select(id_column, score)
+            .where(or_(literal(normalized).op("<%")(document), document.contains(normalized, autoescape=True)))
+            .order_by(score.desc())
+            .limit(limit)
+        )
+        return [(row[0], float(row[1])) for row in session.exec(statement)]
+
+    # Firma barata de la tabla: detecta altas, bajas y la mayoría de ediciones
+    lengths = [func.coalesce(func.sum(func.length(column)), 0) for column in columns]
+    signature = tuple(session.exec(select(func.count(), func.max(id_column), *lengths)).one())
+
+    def load():
+        for row in session.exec(select(id_column, *columns)):
+            yield row[0], " ".join(str(value) for value in row[1:] if value)
+
+    return fallback.search(normalized, limit, signature, load) # type: ignore[return-value]
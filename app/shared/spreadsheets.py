@@ -0,0 +1,222 @@
+"""Lectura y escritura fila a fila de archivos CSV y XLSX sin cargarlos completos en memoria."""
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
+from xml.sax.saxutils import escape
+
+from fastapi.responses import StreamingResponse
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx")
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+def read_rows(stream: BinaryIO, filename: str) -> Iterator[tuple[int, dict[str, str | None]]]:
+    """
+    Recorre las filas de datos de un CSV o XLSX.
+    Args:
+        stream (BinaryIO): Archivo binario con soporte de seek (p. ej. UploadFile.file).
+        filename (str): Nombre original; su extensión decide el formato.
+    Yields:
+        tuple[int, dict]: Número de fila en el archivo (la cabecera es la 1) y valores por columna;
+        las celdas vacías se devuelven como None.
+    Raises:
+        ValueError: Si la extensión no es compatible o el archivo no tiene cabecera.
+    """
+    extension = "." + filename.lower().rpartition(".")[2]
+    if extension == ".csv":
+        yield from _read_csv(stream)
+    elif extension == ".xlsx":
+        yield from _read_xlsx(stream)
+    else:
+        raise ValueError(f"Formato no soportado: use {' o '.join(SUPPORTED_EXTENSIONS)}.")
+
+def _clean(value) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+def _read_csv(stream: BinaryIO) -> Iterator[tuple[int, dict[str, str | None]]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        sample = text.read(8192)
+        text.seek(0)
+        # Excel en configuración regional es-PE exporta con ";"
+        try:
+            dialect: type[csv.Dialect] | csv.Dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(text, dialect)
+        header = next(reader, None)
+        if not header:
+            raise ValueError("El archivo no tiene cabecera.")
+        columns = [column.strip() for column in header]
+        for number, values in enumerate(reader, start=2):
+            if not any(values):
+                continue
+            yield number, {column: _clean(value) for column, value in zip(columns, values)}
+    finally:
+        # El stream pertenece al llamador
+        text.detach()
+
+def _read_xlsx(stream: BinaryIO) -> Iterator[tuple[int, dict[str, str | None]]]:
+    from openpyxl import load_workbook # pylint: disable=import-outside-toplevel
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True) # type: ignore[union-attr]
+        header = next(rows, None)
+        if not header or not any(header):
+            raise ValueError("El archivo no tiene cabecera.")
+        columns = [str(column).strip() if column is not None else "" for column in header]
+        for number, values in enumerate(rows, start=2):
+            if not any(value is not None for value in values):
+                continue
+            yield number, {column: _clean(value) for column, value in zip(columns, values) if column}
+    finally:
+        workbook.close()
+
+def _plain(value: Any) -> Any:
+    """Convierte enums y fechas a valores simples para una celda."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+def write_csv(header: Sequence[str], rows: Iterable[Sequence[Any]], chunk_rows: int = 500) -> Iterator[bytes]:
+    """
+    Genera un CSV por trozos de `chunk_rows` filas, con BOM para que Excel detecte UTF-8.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow([_plain(value) for value in row])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode()
+
+_ILLEGAL_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Hoja1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+class ChunkSink(io.RawIOBase):
+    """Destino no buscable para zipfile: acumula lo escrito hasta que se drena."""
+
+    def __init__(self) -> None:
+        # Un solo búfer: zipfile hace muchas escrituras pequeñas (cabeceras, directorio central)
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int: # type: ignore[override]
+        self._buffer += data
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+def _xlsx_cell(value: Any) -> str:
+    value = _plain(value)
+    if value is None:
+        return "<c/>"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"<c><v>{value}</v></c>"
+    text = _ILLEGAL_XML.sub("", escape(str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def write_xlsx(header: Sequence[str], rows: Iterable[Sequence[Any]], chunk_rows: int = 500) -> Iterator[bytes]:
+    """
+    Genera un XLSX de una hoja por trozos, sin construir el libro en memoria.
+    La hoja usa cadenas en línea (sin sharedStrings), así cada fila se escribe y comprime al vuelo.
+    """
+    sink = ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        yield sink.drain()
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            lines = ["<row>" + "".join(_xlsx_cell(value) for value in header) + "</row>"]
+            for row in rows:
+                lines.append("<row>" + "".join(_xlsx_cell(value) for value in row) + "</row>")
+                if len(lines) >= chunk_rows:
+                    sheet.write("".join(lines).encode())
+                    lines.clear()
+                    if data := sink.drain():
+                        yield data
+            sheet.write("".join(lines).encode() + b"</sheetData></worksheet>")
+    yield sink.drain()
+
+def write_table(file_format: str, header: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    """Elige el escritor según el formato ("csv" o "xlsx")."""
+    if file_format == "xlsx":
+        return write_xlsx(header, rows)
+    return write_csv(header, rows)
+
+def export_response(name: str, file_format: str, header: Sequence[str], rows: Iterable[Sequence[Any]]) -> StreamingResponse:
+    """
+    Respuesta de descarga que escribe las filas a medida que se envían.
+    Args:
+        name (str): Nombre base del archivo (sin extensión).
+        file_format (str): "csv" o "xlsx".
+        header (Sequence[str]): Títulos de columna.
+        rows (Iterable[Sequence]): Filas, idealmente un iterador perezoso sobre un cursor de servidor.
+    """
+    filename = f"{name}_{date.today():%Y%m%d}.{file_format}"
+    return StreamingResponse(
+        write_table(file_format, header, rows),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,203 @@
+"""
+Almacenamiento de archivos con cargas por partes reanudables.
+
+Una carga se escribe primero en un área temporal identificada por su id, a medida que
+llegan los bytes y sin retenerlos en memoria; al completarse se hace definitiva con
+``promote``. Un backend es cualquier objeto que cumpla BlobStorage; LocalStorage es el
+backend por defecto.
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ContextManager, Iterator, Protocol
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover - Windows
+    fcntl = None # type: ignore[assignment]
+
+try:
+    from azure.core import MatchConditions
+    from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+    from azure.storage.blob import BlobServiceClient
+except ImportError: # pragma: no cover - dependencia opcional
+    BlobServiceClient = None
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+class StagingConflictError(Exception):
+    """El área temporal no está en el offset esperado o la está escribiendo otra petición."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(f"El área temporal tiene {size} bytes")
+        self.size = size
+
+def content_key(digest: str) -> str:
+    """Clave direccionada por contenido: ``sha256/ab/cd/<digest>``."""
+    return f"sha256/{digest[:2]}/{digest[2:4]}/{digest}"
+
+class StagedWriter(Protocol):
+    def write(self, data: bytes) -> Any: ...
+
+class BlobStorage(Protocol):
+    """Área temporal de cargas y objetos definitivos."""
+
+    def staged_size(self, upload_id: str) -> int: ...
+
+    def append(self, upload_id: str, offset: int) -> ContextManager[StagedWriter]: ...
+
+    def read_staged(self, upload_id: str) -> Iterator[bytes]: ...
+
+    def promote(self, upload_id: str, digest: str) -> str: ...
+
+    def discard(self, upload_id: str) -> None: ...
+
+    def read(self, key: str) -> Iterator[bytes]: ...
+
+def _read_file(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(READ_CHUNK_SIZE):
+            yield chunk
+
+class LocalStorage:
+    """
+    Disco local (o un volumen montado). Las cargas van a ``<root>/cargas/<id>`` y al
+    completarse se mueven a su clave por contenido, así dos cargas iguales comparten archivo.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.staging = self.root / "cargas"
+
+    def _staged(self, upload_id: str) -> Path:
+        return self.staging / upload_id
+
+    def staged_size(self, upload_id: str) -> int:
+        try:
+            return self._staged(upload_id).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @contextmanager
+    def append(self, upload_id: str, offset: int) -> Iterator[StagedWriter]:
+        """
+        Abre el área temporal para agregar bytes desde `offset`.
+        Un bloqueo exclusivo del archivo impide dos escrituras simultáneas de la misma carga.
+        Raises:
+            StagingConflictError: Si el archivo no mide `offset` bytes o ya está bloqueado.
+        """
+        path = self._staged(upload_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise StagingConflictError(self.staged_size(upload_id)) from None
+            size = os.fstat(file.fileno()).st_size
+            if size != offset:
+                raise StagingConflictError(size)
+            try:
+                yield file
+            finally:
+                # Lo escrito queda durable aunque la petición se corte: es el punto de reanudación
+                file.flush()
+                os.fsync(file.fileno())
+
+    def read_staged(self, upload_id: str) -> Iterator[bytes]:
+        return _read_file(self._staged(upload_id))
+
+    def promote(self, upload_id: str, digest: str) -> str:
+        key = content_key(digest)
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            self.discard(upload_id)
+        else:
+            os.replace(self._staged(upload_id), target)
+        return key
+
+    def discard(self, upload_id: str) -> None:
+        self._staged(upload_id).unlink(missing_ok=True)
+
+    def read(self, key: str) -> Iterator[bytes]:
+        return _read_file(self.root / key)
+
+class _AppendBlobWriter:
+    def __init__(self, blob, offset: int) -> None:
+        self._blob = blob
+        self.position = offset
+
+    def write(self, data: bytes) -> None:
+        try:
+            # La condición de posición hace atómica la verificación del offset
+            self._blob.append_block(data, appendpos_condition=self.position)
+        except HttpResponseError as e:
+            if e.status_code == 412:
+                raise StagingConflictError(self._blob.get_blob_properties().size) from e
+            raise
+        self.position += len(data)
+
+class AzureBlobStorage:
+    """
+    Azure Blob Storage. Cada carga es un append blob ``cargas/<id>``; cada escritura agrega
+    un bloque (hasta 4 MiB, ver UPLOAD_CHUNK_SIZE) y el blob completo queda como definitivo.
+    """
+
+    def __init__(self, account_url: str, container: str, credential: Any = None) -> None:
+        if BlobServiceClient is None:
+            raise RuntimeError("UPLOAD_STORAGE=azure requiere instalar el paquete 'azure-storage-blob'.")
+        if credential is None:
+            from azure.identity import DefaultAzureCredential # pylint: disable=import-outside-toplevel
+            credential = DefaultAzureCredential()
+        self._container = BlobServiceClient(account_url, credential=credential).get_container_client(container)
+
+    def _staged(self, upload_id: str):
+        return self._container.get_blob_client(f"cargas/{upload_id}")
+
+    def staged_size(self, upload_id: str) -> int:
+        try:
+            return self._staged(upload_id).get_blob_properties().size
+        except ResourceNotFoundError:
+            return 0
+
+    @contextmanager
+    def append(self, upload_id: str, offset: int) -> Iterator[StagedWriter]:
+        blob = self._staged(upload_id)
+        if offset == 0:
+            try:
+                blob.create_append_blob(etag="*", match_condition=MatchConditions.IfMissing)
+            except HttpResponseError as e:
+                # Ya existe: solo se puede seguir si quedó vacío de un intento anterior
+                size = self.staged_size(upload_id)
+                if size:
+                    raise StagingConflictError(size) from e
+        yield _AppendBlobWriter(blob, offset)
+
+    def read_staged(self, upload_id: str) -> Iterator[bytes]:
+        return self._staged(upload_id).download_blob().chunks()
+
+    def promote(self, upload_id: str, digest: str) -> str:
+        return self._staged(upload_id).blob_name
+
+    def discard(self, upload_id: str) -> None:
+        try:
+            self._staged(upload_id).delete_blob()
+        except ResourceNotFoundError:
+            pass
+
+    def read(self, key: str) -> Iterator[bytes]:
+        return self._container.get_blob_client(key).download_blob().chunks()
+
+def create_storage(kind: str, root: str = "./storage", account_url: str = "", container: str = "") -> BlobStorage:
+    """
+    Construye el almacenamiento configurado.
+    Args:
+        kind (str): "local" o "azure".
+        root (str): Directorio base cuando kind es "local".
+        account_url (str): URL de la cuenta cuando kind es "azure".
+        container (str): Contenedor cuando kind es "azure".
+    """
+    if kind == "azure":
+        return AzureBlobStorage(account_url, container)
+    return LocalStorage(root)
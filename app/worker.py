@@ -0,0 +1,64 @@
+"""
+Worker de la cola de trabajos en segundo plano, junto a app.main.
+
+Uso: python -m app.worker [--concurrency 4] [--kinds tipo1,tipo2] [--once]
+"""
+# Sistema
+import sys
+import signal
+import asyncio
+import argparse
+import importlib
+
+# Logging
+from loguru import logger
+
+# Configuración de logging
+from app.core.logger import setup, shutdown
+
+# Manejadores registrados, suscriptores del change feed y worker
+from app.factory import JOB_HANDLERS, MODELS, SUBSCRIBERS
+from app.modules.trabajos.services.registry import registered_kinds
+from app.modules.trabajos.services.worker import JobWorker
+
+async def serve(worker: JobWorker) -> None:
+    """Ejecuta el worker hasta recibir SIGINT o SIGTERM; los trabajos en curso terminan antes de salir."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError: # pragma: no cover - Windows
+            pass
+    await worker.run()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker de trabajos del backend de Posgrado")
+    parser.add_argument("--concurrency", type=int, default=None, help="Trabajos simultáneos (por defecto JOB_CONCURRENCY)")
+    parser.add_argument("--kinds", default=None, help="Tipos a atender, separados por comas (por defecto todos)")
+    parser.add_argument("--once", action="store_true", help="Procesa un lote y termina")
+    args = parser.parse_args()
+
+    setup()
+    importlib.import_module(MODELS)
+    # Los trabajos también escriben modelos observados: sin los suscriptores las proyecciones quedarían desactualizadas
+    for module_path in (*SUBSCRIBERS, *JOB_HANDLERS):
+        importlib.import_module(module_path)
+    kinds = [kind.strip() for kind in args.kinds.split(",")] if args.kinds else None
+    unknown = set(kinds or ()) - set(registered_kinds())
+    if unknown:
+        logger.error(f"Tipos de trabajo sin manejador: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    worker = JobWorker.from_settings(kinds)
+    if args.concurrency:
+        worker.concurrency = args.concurrency
+    try:
+        if args.once:
+            logger.info(f"Trabajos procesados: {worker.run_once()}")
+        else:
+            asyncio.run(serve(worker))
+    finally:
+        shutdown()
+
+if __name__ == "__main__":
+    main()
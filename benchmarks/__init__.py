@@ -0,0 +1 @@
+"""Micro-benchmarks de rendimiento. Se ejecutan con ``python -m benchmarks.<modulo>``."""
@@ -0,0 +1,110 @@
+"""
+Mide la programación de una temporada de actos públicos (agendas en bitsets) y la
+reprogramación incremental de un acto contra la temporada ya registrada.
+
+Uso: python -m benchmarks.defense_schedule [--defenses 400] [--teachers 150] [--rooms 4] [--weeks 6]
+"""
+
+# Sistema
+import time
+import random
+import argparse
+from datetime import date, datetime, timedelta
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlmodel import SQLModel, Session, create_engine, StaticPool, select
+
+# Modelos y servicio del acto público
+import app.modules.models # pylint: disable=unused-import
+from app.feature_modules.acto_publico.exceptions.exceptions import NoSlotAvailableError
+from app.feature_modules.acto_publico.models.defense import Room
+from app.feature_modules.acto_publico.repository.repository import DefenseRepository
+from app.feature_modules.acto_publico.schemas.schema import RescheduleRequest, ScheduleRequest
+from app.feature_modules.acto_publico.services.service import DefenseService
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+SEASON_START = date(2025, 6, 2)
+
+def seed(session: Session, defenses: int, teachers: int, rooms: int, rng: random.Random) -> None:
+    """Procesos en acto público con asesor y tres jurados al azar; algunos docentes con licencia."""
+    program = Program(name="Maestría", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    staff = [
+        Teacher(dni=f"{40_000_000 + i}", name="Docente", paternal_surname=f"P{i}", maternal_surname="S", academic_degree=AcademicDegree.MASTER)
+        for i in range(teachers)
+    ]
+    for teacher in rng.sample(staff, teachers // 10):
+        teacher.license_start_date = SEASON_START + timedelta(days=rng.randrange(30))
+        teacher.license_end_date = teacher.license_start_date + timedelta(days=7)
+    session.add_all([program, *staff, *(Room(name=f"Sala {i}") for i in range(rooms))])
+    session.flush()
+    students = [
+        Student(name=f"N{i}", paternal_surname="A", maternal_surname="B", identity_document=f"{70_000_000 + i}",
+                type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE)
+        for i in range(defenses)
+    ]
+    session.add_all(students)
+    session.flush()
+    enrollments = [
+        ProgramStudent(program_id=program.id, student_id=student.id, code=f"{20_000_000 + i}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        for i, student in enumerate(students)
+    ]
+    session.add_all(enrollments)
+    session.flush()
+    panels = [rng.sample(staff, 4) for _ in enrollments]
+    processes = [
+        Process(id_student_program=enrollment.id, id_advisor=panel[0].id, current_stage=ProcessStage.PUBLIC_DEFENSE, start_date=datetime(2025, 1, 1))
+        for enrollment, panel in zip(enrollments, panels)
+    ]
+    session.add_all(processes)
+    session.flush()
+    session.add_all([
+        JuryMember(id_process=process.id, id_teacher=teacher.id, defense_date=SEASON_START)
+        for process, panel in zip(processes, panels) for teacher in panel[1:]
+    ])
+    session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--defenses", type=int, default=400)
+    parser.add_argument("--teachers", type=int, default=150)
+    parser.add_argument("--rooms", type=int, default=4)
+    parser.add_argument("--weeks", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logger.remove()
+    rng = random.Random(args.seed)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.defenses, args.teachers, args.rooms, rng)
+        service = DefenseService(DefenseRepository(session))
+        end = SEASON_START + timedelta(weeks=args.weeks, days=-1)
+
+        start = time.perf_counter()
+        report = service.schedule(ScheduleRequest(start_date=SEASON_START, end_date=end, apply=True))
+        season = time.perf_counter() - start
+        print(f"{args.defenses} actos, {args.teachers} docentes, {args.rooms} salas, {args.weeks} semanas")
+        print(f"  temporada:     {season * 1000:8.1f} ms  programados {report.scheduled}, sin turno {report.unscheduled}, último día {report.last_day}")
+
+        process_ids = list(session.exec(select(Process.id)).all())
+        moves = []
+        for process_id in rng.sample(process_ids, 20):
+            start = time.perf_counter()
+            try:
+                service.reschedule(process_id, RescheduleRequest(not_before=datetime.combine(SEASON_START + timedelta(days=rng.randrange(14)), datetime.min.time()), until=end))
+            except NoSlotAvailableError:
+                session.rollback()
+            moves.append(time.perf_counter() - start)
+        print(f"  reprogramar 1: {sum(moves) / len(moves) * 1000:8.1f} ms en promedio ({len(moves)} movimientos)")
+
+if __name__ == "__main__":
+    main()
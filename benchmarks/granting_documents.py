@@ -0,0 +1,115 @@
+"""
+Mide páginas por segundo y el pico de memoria de la generación en lote de resoluciones y
+constancias de otorgamiento (render en un pool de procesos y ZIP en streaming), con distinta
+cantidad de procesos y dos tamaños de lote. El pico se mide en el proceso que arma el ZIP:
+crece solo con los datos de cada documento (filas y entradas del directorio del ZIP), no con
+los PDF, que se escriben y se sueltan por tarea; cada hijo retiene solo la tarea que renderiza.
+
+Uso: python -m benchmarks.granting_documents [--documents 1000] [--workers 0,1,2,4] [--chunk-size 25]
+"""
+
+# Sistema
+import time
+import argparse
+import multiprocessing
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, wait
+from datetime import date, datetime
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlmodel import SQLModel, Session, create_engine, StaticPool
+
+# Modelos y servicio de otorgamiento
+import app.modules.models # pylint: disable=unused-import
+from app.feature_modules.otorgamiento.repository.repository import GrantingRepository
+from app.feature_modules.otorgamiento.schemas.schema import GrantingBatchRequest
+from app.feature_modules.otorgamiento.services.batch import BatchStats
+from app.feature_modules.otorgamiento.services.service import GrantingService
+from app.feature_modules.otorgamiento.services.templates import init_worker, render_chunk
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+MIB = 1024 * 1024
+
+def seed(session: Session, processes: int) -> list[int]:
+    program = Program(name="Maestría en Gestión Pública", mention="Políticas Sociales", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000000", name="Rosa", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    session.add_all([program, advisor])
+    session.flush()
+    students = [
+        Student(
+            name=f"Nombre{i}", paternal_surname="Núñez", maternal_surname="Huamán",
+            identity_document=f"{70000000 + i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        for i in range(processes)
+    ]
+    session.add_all(students)
+    session.flush()
+    enrollments = [
+        ProgramStudent(program_id=program.id, student_id=student.id, code=f"{20000000 + i}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        for i, student in enumerate(students)
+    ]
+    session.add_all(enrollments)
+    session.flush()
+    rows = [
+        Process(
+            id_student_program=enrollment.id, id_advisor=advisor.id, current_stage=ProcessStage.DEGREE_GRANTING, start_date=datetime(2024, 1, 1),
+            current_thesis_title=f"Evaluación del impacto de los programas sociales en la gestión pública regional, caso {i}",
+        )
+        for i, enrollment in enumerate(enrollments)
+    ]
+    session.add_all(rows)
+    session.commit()
+    return [row.id for row in rows] # type: ignore[misc]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=1000, help="Documentos del lote (resolución y constancia por proceso)")
+    parser.add_argument("--workers", default="0,1,2,4", help="Procesos del pool a probar; 0 renderiza en este proceso")
+    parser.add_argument("--chunk-size", type=int, default=25)
+    args = parser.parse_args()
+
+    logger.remove()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        ids = seed(session, args.documents // 2)
+        repository = GrantingRepository(session)
+        print(f"Lotes de {args.documents // 4} y {args.documents} documentos, {args.chunk_size} por tarea")
+        for workers in (int(value) for value in args.workers.split(",")):
+            pool = None
+            if workers:
+                pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker)
+                # Arranque y compilación de plantillas fuera de la medición
+                wait([pool.submit(render_chunk, []) for _ in range(workers)])
+            else:
+                init_worker()
+            service = GrantingService(repository, pool, chunk_size=args.chunk_size, window=2 * max(workers, 1))
+            for documents in (args.documents // 4, args.documents):
+                request = GrantingBatchRequest(session_date=date(2026, 5, 15), first_resolution_number=1, process_ids=ids[:documents // 2])
+                stats = BatchStats()
+                start = time.perf_counter()
+                for _ in service.documents(request, stats):
+                    pass
+                elapsed = time.perf_counter() - start
+                # Segunda pasada para el pico: tracemalloc frena el render en este proceso
+                tracemalloc.start()
+                for _ in service.documents(request):
+                    pass
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    f"  procesos {workers}: {stats.documents:>5} documentos en {elapsed:6.2f} s  "
+                    f"{stats.pages / elapsed:7.0f} páginas/s  ZIP {stats.size / MIB:5.1f} MiB  pico de memoria {peak / MIB:5.2f} MiB"
+                )
+            if pool is not None:
+                pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Mide registros por segundo de logging estándar a través del InterceptHandler,
+comparando la versión anterior con la actual.
+
+Uso: python -m benchmarks.intercept [--records 50000]
+"""
+
+# Sistema
+import time
+import inspect
+import logging
+import argparse
+
+# Logging
+from loguru import logger
+
+# Handler actual
+from app.core.logger import InterceptHandler
+
+class LegacyInterceptHandler(logging.Handler):
+    """Copia de la implementación previa, solo como referencia del benchmark."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        level: str | int
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+def measure(handler: logging.Handler, root_level: int, log_level: int, total: int, name: str = "sqlalchemy.pool") -> float:
+    """Envía `total` registros al logger `name` y devuelve registros por segundo."""
+    logging.basicConfig(handlers=[handler], level=root_level, force=True)
+    std_logger = logging.getLogger(name)
+    start = time.perf_counter()
+    for i in range(total):
+        std_logger.log(log_level, "registro %s", i)
+    return total / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    args = parser.parse_args()
+
+    # Sink nulo a nivel INFO: se mide el paso por el handler, no la escritura
+    logger.remove()
+    logger.add(lambda _: None, level="INFO")
+
+    scenarios = {
+        "INFO (se emite)": logging.INFO,
+        "DEBUG (bajo el nivel del sink)": logging.DEBUG,
+    }
+    for scenario, level in scenarios.items():
+        legacy = measure(LegacyInterceptHandler(), 0, level, args.records)
+        current = measure(InterceptHandler(min_level=logging.INFO), logging.INFO, level, args.records)
+        print(f"{scenario:<32} anterior: {legacy:>10.0f} rec/s | actual: {current:>10.0f} rec/s ({current / legacy:.2f}x)")
+
+    legacy = measure(LegacyInterceptHandler(), 0, logging.INFO, args.records)
+    current = measure(InterceptHandler(min_level=logging.INFO, ignored=["sqlalchemy"]), logging.INFO, logging.INFO, args.records)
+    print(f"{'INFO (logger ignorado)':<32} anterior: {legacy:>10.0f} rec/s | actual: {current:>10.0f} rec/s ({current / legacy:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Mide la propuesta de jurados para un lote grande: construcción del índice de elegibilidad
+y resolución voraz con reparación, y la dispersión de carga resultante.
+
+Uso: python -m benchmarks.jury_assignment [--processes 1000] [--teachers 500] [--jury-size 3]
+"""
+
+# Sistema
+import time
+import random
+import argparse
+
+# Logging
+from loguru import logger
+
+# Solver de jurados
+from app.feature_modules.designacion_de_jurados.services.solver import EligibilityIndex, JuryCase, solve
+from app.modules.docentes.models.teacher import AcademicDegree
+from app.modules.estudiantes.models.program import DegreeProgram
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=1_000)
+    parser.add_argument("--teachers", type=int, default=500)
+    parser.add_argument("--jury-size", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logger.remove()
+    rng = random.Random(args.seed)
+    # Un tercio de doctores; uno de cada cinco procesos es de doctorado
+    teachers = [(i, AcademicDegree.DOCTORATE if rng.random() < 1 / 3 else AcademicDegree.MASTER) for i in range(args.teachers)]
+    cases = [
+        JuryCase(
+            process_id=p, advisor_id=rng.randrange(args.teachers),
+            degree=DegreeProgram.DOCTORATE if rng.random() < 0.2 else DegreeProgram.MASTER,
+        )
+        for p in range(args.processes)
+    ]
+    initial_load = {teacher_id: rng.randrange(4) for teacher_id, _ in teachers}
+
+    start = time.perf_counter()
+    index = EligibilityIndex(teachers)
+    built = time.perf_counter()
+    solution = solve(cases, index, args.jury_size, initial_load)
+    solved = time.perf_counter()
+
+    loads = list(solution.loads.values())
+    print(f"{args.processes} procesos x {args.teachers} docentes, {args.jury_size} jurados por proceso")
+    print(f"  índice:    {(built - start) * 1000:8.1f} ms")
+    print(f"  solución:  {(solved - built) * 1000:8.1f} ms")
+    print(f"  asignados: {len(solution.assignments)}  sin jurado: {len(solution.errors)}")
+    print(f"  carga (con designaciones previas): min {min(loads)}  max {max(loads)}  media {sum(loads) / len(loads):.2f}")
+
+if __name__ == "__main__":
+    main()
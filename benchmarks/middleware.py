@@ -0,0 +1,90 @@
+"""
+Compara peticiones por segundo entre el LoguruMiddleware ASGI puro y la
+implementación anterior basada en BaseHTTPMiddleware.
+
+Uso: python -m benchmarks.middleware [--requests 5000]
+"""
+
+# Sistema
+import time
+import uuid
+import asyncio
+import argparse
+from typing import Callable
+
+# Logging
+from loguru import logger
+
+# FastAPI y Starlette
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# Middleware actual
+from app.middleware import LoguruMiddleware
+
+class LegacyLoguruMiddleware(BaseHTTPMiddleware):
+    """Copia de la implementación previa, solo como referencia del benchmark."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-ID", "Desconocido")
+        if not request_id or request_id == "Desconocido":
+            request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+
+        with logger.contextualize(
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            client_ip=request.client.host if request.client else "Desconocido",
+        ):
+            start_time = time.time()
+            response = await call_next(request)
+            process_time = time.time() - start_time
+            response.headers["X-Request-ID"] = request_id
+            logger.info(
+                f"{request.method} {request.url.path} | Request: {response.status_code} "
+                f"(Tiempo: {process_time:.2f}s)"
+            )
+            return response
+
+def build_app(middleware) -> FastAPI:
+    """App mínima con un único endpoint para aislar el costo del middleware."""
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+async def measure(app: FastAPI, total: int) -> float:
+    """Ejecuta `total` peticiones secuenciales y devuelve peticiones por segundo."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/ping")
+        start = time.perf_counter()
+        for _ in range(total):
+            await client.get("/ping")
+        return total / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    # Sin sinks: se mide el middleware, no la escritura de logs
+    logger.remove()
+
+    results = {
+        "BaseHTTPMiddleware (anterior)": asyncio.run(measure(build_app(LegacyLoguruMiddleware), args.requests)),
+        "ASGI puro (actual)": asyncio.run(measure(build_app(LoguruMiddleware), args.requests)),
+    }
+    baseline = next(iter(results.values()))
+    for name, rps in results.items():
+        print(f"{name:<32} {rps:>10.0f} req/s  ({rps / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
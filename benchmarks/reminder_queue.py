@@ -0,0 +1,69 @@
+"""
+Mide el costo de tomar lotes de la cola de recordatorios con muchas filas pendientes a futuro:
+el planificador solo lee el frente de ix_recordatorio_pendiente, no la tabla completa.
+
+Uso: python -m benchmarks.reminder_queue [--pending 100000] [--due 2000]
+"""
+
+# Sistema
+import time
+import argparse
+from datetime import datetime, timedelta
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine, StaticPool
+
+# Modelos y planificador de recordatorios
+import app.modules.models # pylint: disable=unused-import
+from app.shared.bulk import to_columns
+from app.modules.recordatorios.models.reminder import Reminder, ReminderKind, ReminderStatus
+from app.modules.recordatorios.services.scheduler import ReminderScheduler
+
+class NullSender:
+    """Canal que no hace nada, para medir solo la cola."""
+
+    def send(self, reminder: Reminder) -> None:
+        pass
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pending", type=int, default=100_000)
+    parser.add_argument("--due", type=int, default=2_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    now = datetime(2025, 3, 1, 8)
+    with Session(engine) as session:
+        rows = [
+            to_columns(Reminder, {
+                "kind": ReminderKind.STAGE_DEADLINE, "reference_id": i, "message": "Aviso",
+                "status": ReminderStatus.PENDING, "attempts": 0, "created_at": now,
+                # Los primeros `due` ya vencieron; el resto queda repartido en el próximo año
+                "due_at": now - timedelta(minutes=i) if i < args.due else now + timedelta(minutes=i),
+            })
+            for i in range(args.pending)
+        ]
+        session.connection().execute(insert(Reminder.__table__), rows) # type: ignore[attr-defined]
+        session.commit()
+
+    scheduler = ReminderScheduler(lambda: Session(engine), NullSender(), batch_size=200)
+    batches = []
+    while True:
+        start = time.perf_counter()
+        claimed, _ = scheduler.run_once(now)
+        batches.append(time.perf_counter() - start)
+        if claimed == 0:
+            break
+    sent = (len(batches) - 1) * 200
+    print(f"{args.pending} pendientes, {args.due} vencidos: {len(batches) - 1} lotes en {sum(batches) * 1000:.0f} ms")
+    print(f"por lote: {sum(batches[:-1]) / max(len(batches) - 1, 1) * 1000:.1f} ms; revisión de cola vacía: {batches[-1] * 1000:.2f} ms")
+    print(f"~{sent / sum(batches):,.0f} recordatorios/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compara el cambio de etapa de N procesos ítem por ítem (una transacción por proceso,
+como al llamar N veces a un endpoint individual) contra el lote de ProcessService.transition.
+
+Uso: python -m benchmarks.stage_transitions [--processes 500]
+"""
+
+# Sistema
+import time
+import argparse
+from datetime import datetime
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlmodel import SQLModel, Session, create_engine, StaticPool, select
+
+# Modelos y servicio de procesos
+import app.modules.models # pylint: disable=unused-import
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import STAGE_TRANSITIONS, Process, ProcessStage
+from app.modules.proceso.models.process_transition import ProcessTransition
+from app.modules.proceso.repository.repository import ProcessRepository
+from app.modules.proceso.schemas.schema import StageTransitionBatch, StageTransitionItem
+from app.modules.proceso.services.service import ProcessService
+
+def seed(session: Session, total: int) -> list[int]:
+    """Crea `total` procesos en inscripción y devuelve sus ids."""
+    program = Program(name="Maestría", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000000", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    session.add_all([program, advisor])
+    session.flush()
+    students = [
+        Student(name=f"N{i}", paternal_surname="A", maternal_surname="B", identity_document=f"{70_000_000 + i}",
+                type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE)
+        for i in range(total)
+    ]
+    session.add_all(students)
+    session.flush()
+    enrollments = [
+        ProgramStudent(program_id=program.id, student_id=student.id, code=f"{20_000_000 + i}", status=StatusStudentProgram.ACTIVE, admission_year=2025)
+        for i, student in enumerate(students)
+    ]
+    session.add_all(enrollments)
+    session.flush()
+    session.add_all([
+        Process(id_student_program=enrollment.id, id_advisor=advisor.id, start_date=datetime(2025, 1, 1))
+        for enrollment in enrollments
+    ])
+    session.commit()
+    return list(session.exec(select(Process.id).order_by(Process.id)).all())
+
+def per_item(session: Session, ids: list[int], to_stage: ProcessStage) -> None:
+    """Ruta previa: leer, validar, actualizar y auditar un proceso por transacción."""
+    for process_id in ids:
+        process = session.get(Process, process_id)
+        if process is None or to_stage not in STAGE_TRANSITIONS[process.current_stage]:
+            continue
+        session.add(ProcessTransition(id_process=process_id, from_stage=process.current_stage, to_stage=to_stage))
+        process.current_stage = to_stage
+        session.commit()
+
+def batch(session: Session, ids: list[int], to_stage: ProcessStage) -> None:
+    """Ruta nueva: un lote validado, un UPDATE y auditoría en bloque."""
+    ProcessService(ProcessRepository(session)).transition(
+        StageTransitionBatch(items=[StageTransitionItem(process_id=process_id, to_stage=to_stage) for process_id in ids])
+    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=500)
+    args = parser.parse_args()
+
+    logger.remove()
+    results = {}
+    for name, run in (("ítem por ítem", per_item), ("lote", batch)):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            ids = seed(session, args.processes)
+            start = time.perf_counter()
+            run(session, ids, ProcessStage.TURNITIN)
+            results[name] = time.perf_counter() - start
+            moved = session.exec(select(Process.id).where(Process.current_stage == ProcessStage.TURNITIN)).all()
+            assert len(moved) == args.processes
+        print(f"{name:<14} {args.processes} procesos en {results[name] * 1000:8.1f} ms ({args.processes / results[name]:,.0f} procesos/s)")
+    print(f"Mejora: {results['ítem por ítem'] / results['lote']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Mide la importación masiva de estudiantes desde CSV sobre SQLite en memoria:
+una pasada de altas y una segunda de actualizaciones (upsert) del mismo archivo.
+
+Uso: python -m benchmarks.student_import [--rows 50000]
+"""
+
+# Sistema
+import io
+import time
+import argparse
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlmodel import SQLModel, Session, create_engine, StaticPool
+
+# Registro de modelos y servicio de importación
+import app.modules.models # pylint: disable=unused-import
+from app.modules.estudiantes.repository.repository import ProgramRepository, StudentRepository
+from app.modules.estudiantes.services.service import StudentImportService
+
+HEADER = "name,paternal_surname,maternal_surname,identity_document,type_document,academic_email,code,admission_year,program_name,degree\n"
+
+def build_csv(rows: int) -> bytes:
+    """Genera un CSV con `rows` estudiantes repartidos en cuatro programas."""
+    lines = [HEADER]
+    for i in range(rows):
+        lines.append(
+            f"Nombre{i},Apellido{i % 977},Materno{i % 499},{70_000_000 + i},dni,"
+            f"alumno{i}@unmsm.edu.pe,{20_000_000 + i},2025,Programa {i % 4},maestria\n"
+        )
+    return "".join(lines).encode()
+
+def run(session: Session, content: bytes) -> tuple[float, dict]:
+    """Importa el contenido y devuelve (segundos, reporte)."""
+    service = StudentImportService(StudentRepository(session), ProgramRepository(session))
+    start = time.perf_counter()
+    report = service.import_file(io.BytesIO(content), "alumnos.csv")
+    return time.perf_counter() - start, report.model_dump(exclude={"errors"})
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    content = build_csv(args.rows)
+
+    with Session(engine) as session:
+        for label in ("altas", "upsert"):
+            elapsed, report = run(session, content)
+            print(f"{label:<8} {args.rows:>7} filas en {elapsed:6.2f} s ({args.rows / elapsed:,.0f} filas/s) | {report}")
+
+if __name__ == "__main__":
+    main()
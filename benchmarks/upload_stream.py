@@ -0,0 +1,85 @@
+"""
+Mide el rendimiento y el pico de memoria de una carga grande por el servicio de archivos
+(SHA-256 al vuelo y escritura por bloques a LocalStorage) con distintos tamaños de bloque.
+
+Uso: python -m benchmarks.upload_stream [--size-mb 100] [--parts 4]
+"""
+
+# Sistema
+import time
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+# Logging
+from loguru import logger
+
+# Base de datos
+from sqlmodel import SQLModel, Session, create_engine, StaticPool
+
+# Modelos y servicio de archivos
+import app.modules.models # pylint: disable=unused-import
+from app.shared.storage import LocalStorage
+from app.modules.archivos.repository.repository import UploadRepository
+from app.modules.archivos.schemas.schema import UploadCreate
+from app.modules.archivos.services.service import UploadService
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process
+
+MIB = 1024 * 1024
+PIECE = 64 * 1024
+
+def seed(session: Session) -> int:
+    program = Program(name="Maestría", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000000", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(name="N", paternal_surname="A", maternal_surname="B", identity_document="70000000", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE)
+    session.add_all([program, advisor, student])
+    session.flush()
+    enrollment = ProgramStudent(program_id=program.id, student_id=student.id, code="20000000", status=StatusStudentProgram.ACTIVE, admission_year=2025)
+    session.add(enrollment)
+    session.flush()
+    process = Process(id_student_program=enrollment.id, id_advisor=advisor.id, start_date=datetime(2025, 1, 1))
+    session.add(process)
+    session.commit()
+    return process.id # type: ignore[return-value]
+
+def body(start: int, end: int, seed_byte: int):
+    """Piezas de 64 KiB como las de un cuerpo HTTP; el contenido cambia con `seed_byte` para no deduplicar."""
+    block = bytes((seed_byte + i) % 251 for i in range(PIECE))
+    for offset in range(start, end, PIECE):
+        yield block[: min(PIECE, end - offset)]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--parts", type=int, default=4, help="PUT por carga (reanudaciones)")
+    args = parser.parse_args()
+
+    logger.remove()
+    size = args.size_mb * MIB
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session, tempfile.TemporaryDirectory() as root:
+        process_id = seed(session)
+        print(f"Carga de {args.size_mb} MiB en {args.parts} partes")
+        for run, chunk_size in enumerate((64 * 1024, MIB, 4 * MIB)):
+            service = UploadService(UploadRepository(session), LocalStorage(root), chunk_size=chunk_size)
+            upload = service.create(UploadCreate(process_id=process_id, filename="tesis.pdf", size=size))
+            bounds = [size * part // args.parts for part in range(args.parts + 1)]
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            for first, last in zip(bounds, bounds[1:]):
+                result = service.append(upload.id, first, body(first, last, run))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert result.sha256 is not None
+            print(f"  bloque {chunk_size // 1024:>5} KiB: {size / MIB / elapsed:8.1f} MiB/s  pico de memoria {peak / MIB:5.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ from fastapi.testclient import TestClient
 # SQLModel para la base de datos de pruebas
 from sqlmodel import create_engine, StaticPool, SQLModel, Session
 
+# Registro de todos los modelos para que create_all cree el esquema completo
+import app.modules.models # pylint: disable=unused-import
+
 # Importar la aplicación FastAPI
 from app.main import app
 
@@ -35,7 +38,9 @@ def client_fixture(session: Session):
     Proporciona un cliente de prueba para la aplicación FastAPI.
     """
     def get_session_override():
-        return session
+        # Confirma al terminar la petición, como get_session
+        yield session
+        session.commit()
 
     app.dependency_overrides[get_session] = get_session_override
 
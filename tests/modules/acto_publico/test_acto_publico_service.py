@@ -0,0 +1,110 @@
+"""Pruebas de la programación de actos públicos."""
+from datetime import date, datetime, time
+
+import pytest
+from sqlmodel import Session, select
+
+from app.feature_modules.acto_publico.exceptions.exceptions import NoSlotAvailableError
+from app.feature_modules.acto_publico.models.defense import Defense, Room
+from app.feature_modules.acto_publico.repository.repository import DefenseRepository
+from app.feature_modules.acto_publico.schemas.schema import RescheduleRequest, ScheduleRequest
+from app.feature_modules.acto_publico.services.calendar import Calendar, DefenseNeeds, SlotGrid, pack, teacher_key
+from app.feature_modules.acto_publico.services.service import DefenseService
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+def test_pack_avoids_double_booking_and_licenses():
+    """Un docente en todos los actos los reparte en turnos distintos y respeta su licencia."""
+    # Lunes 2 y martes 3 de junio, 4 turnos de 2 horas por día
+    grid = SlotGrid(date(2025, 6, 2), date(2025, 6, 3), time(8), time(16), 120)
+    calendar = Calendar(grid)
+    calendar.block(teacher_key(1), grid.days_between(date(2025, 6, 2), date(2025, 6, 2)))
+    needs = [DefenseNeeds(p, (1, 10 + p, 20 + p), 100 + p) for p in range(5)]
+
+    placed, unplaced = pack(needs, calendar, rooms=[1, 2])
+
+    assert len(placed) == 4 and len(unplaced) == 1
+    slots = [slot for _, slot in placed.values()]
+    assert len(set(slots)) == 4
+    assert all(grid.start_of(slot).date() == date(2025, 6, 3) for slot in slots)
+
+@pytest.fixture(name="season")
+def season_fixture(session: Session):
+    """Tres procesos en acto público que comparten asesor, con jurados y dos salas."""
+    program = Program(name="Maestría en Gestión", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    teachers = [
+        Teacher(dni=f"4000000{i}", name="Docente", paternal_surname=f"P{i}", maternal_surname="S", academic_degree=AcademicDegree.MASTER)
+        for i in range(4)
+    ]
+    session.add_all([program, *teachers, Room(name="Sala 1"), Room(name="Sala 2")])
+    session.flush()
+    processes = []
+    for i in range(3):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(program_id=program.id, student_id=student.id, code=f"2024{i:04d}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        session.add(program_student)
+        session.flush()
+        processes.append(Process(
+            id_student_program=program_student.id, id_advisor=teachers[0].id,
+            current_stage=ProcessStage.PUBLIC_DEFENSE, start_date=datetime(2025, 1, 1),
+        ))
+    session.add_all(processes)
+    session.flush()
+    session.add_all([
+        JuryMember(id_process=process.id, id_teacher=teacher.id, defense_date=date(2025, 6, 1))
+        for process in processes for teacher in teachers[1:]
+    ])
+    session.commit()
+    return [process.id for process in processes]
+
+def test_schedule_and_reschedule(session: Session, season):
+    """La temporada no cruza al asesor ni a los jurados; reprogramar mueve solo un acto."""
+    service = DefenseService(DefenseRepository(session))
+    report = service.schedule(ScheduleRequest(start_date=date(2025, 6, 2), end_date=date(2025, 6, 6), apply=True))
+
+    assert (report.scheduled, report.unscheduled, report.applied) == (3, 0, True)
+    starts = sorted(defense.start for defense in report.defenses)
+    assert starts == [datetime(2025, 6, 2, 8), datetime(2025, 6, 2, 9, 30), datetime(2025, 6, 2, 11)]
+    assert service.schedule(ScheduleRequest(start_date=date(2025, 6, 2), end_date=date(2025, 6, 6))).defenses == []
+
+    # Ventana que empieza a las 8:30: los turnos de 9:30 y 11:00 están tomados por los otros actos
+    first = season[0]
+    moved = service.reschedule(first, RescheduleRequest(not_before=datetime(2025, 6, 2, 8, 30), until=date(2025, 6, 2)))
+    assert moved.start == datetime(2025, 6, 2, 12, 30)
+    assert {defense.start for defense in session.exec(select(Defense)).all()} == {
+        datetime(2025, 6, 2, 9, 30), datetime(2025, 6, 2, 11), datetime(2025, 6, 2, 12, 30),
+    }
+    juries = session.exec(select(JuryMember).where(JuryMember.id_process == first)).all()
+    assert {jury.defense_date for jury in juries} == {date(2025, 6, 2)}
+
+    with pytest.raises(NoSlotAvailableError):
+        service.reschedule(first, RescheduleRequest(not_before=datetime(2025, 6, 2, 19), until=date(2025, 6, 2)))
+
+def test_lock_days_covers_window_and_previous_day():
+    """En Postgres se bloquean, en orden, los días de la ventana y el anterior, que bookings() también lee."""
+    executed = []
+
+    class Connection:
+        def execute(self, statement):
+            executed.append(tuple(statement.compile().params.values()))
+
+    class PostgresSession:
+        def get_bind(self):
+            return type("Bind", (), {"dialect": type("Dialect", (), {"name": "postgresql"})})()
+
+        def connection(self):
+            return Connection()
+
+    day = date(2025, 6, 2)
+    DefenseRepository(PostgresSession()).lock_days(day, date(2025, 6, 3)) # type: ignore[arg-type]
+
+    assert executed == [(2, day.toordinal() - 1), (2, day.toordinal()), (2, day.toordinal() + 1)]
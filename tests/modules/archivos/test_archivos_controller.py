@@ -0,0 +1,51 @@
+"""Pruebas de los endpoints de archivos."""
+import hashlib
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.shared.storage import LocalStorage
+from app.modules.archivos.services import service as upload_service
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+def test_chunked_upload_over_http(client: TestClient, session: Session, tmp_path, monkeypatch):
+    """Dos PUT con Upload-Offset completan la carga; la descarga devuelve el mismo contenido."""
+    monkeypatch.setattr(upload_service, "upload_storage", lambda: LocalStorage(tmp_path))
+    program = Program(name="Maestría en Gestión", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Nombre", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000001", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    )
+    session.add_all([program, advisor, student])
+    session.flush()
+    program_student = ProgramStudent(program_id=program.id, student_id=student.id, code="20240001", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+    session.add(program_student)
+    session.flush()
+    process = Process(id_student_program=program_student.id, id_advisor=advisor.id, current_stage=ProcessStage.CYBERTESIS, start_date=datetime(2025, 1, 1))
+    session.add(process)
+    session.commit()
+
+    content = b"%PDF-1.7\n" + bytes(range(256)) * 4000
+    base = f"{settings.GLOBAL_PREFIX}/archivos"
+    created = client.post(f"{base}/cargas", json={"process_id": process.id, "filename": "tesis.pdf", "size": len(content)})
+    assert created.status_code == 201
+    upload_id = created.json()["id"]
+
+    half = len(content) // 2
+    first = client.put(f"{base}/cargas/{upload_id}", content=iter([content[:half]]), headers={"Upload-Offset": "0"})
+    assert first.json()["received"] == half
+    assert client.put(f"{base}/cargas/{upload_id}", content=content, headers={"Upload-Offset": "0"}).status_code == 409
+    done = client.put(f"{base}/cargas/{upload_id}", content=content[half:], headers={"Upload-Offset": str(half)}).json()
+    assert done["status"] == "completada" and done["sha256"] == hashlib.sha256(content).hexdigest()
+
+    files = client.get(f"{base}/procesos/{process.id}").json()
+    assert files[0]["stage"] == "cybertesis"
+    download = client.get(f"{base}/{done['file_id']}/contenido")
+    assert download.content == content and download.headers["content-type"] == "application/pdf"
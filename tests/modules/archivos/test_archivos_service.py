@@ -0,0 +1,118 @@
+"""Pruebas de las cargas por partes de archivos."""
+import hashlib
+import time
+import tracemalloc
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from app.shared.storage import LocalStorage
+from app.modules.archivos.exceptions.exceptions import UploadIntegrityError, UploadOffsetError
+from app.modules.archivos.models.file import ProcessFile, StoredFile, UploadStatus
+from app.modules.archivos.repository.repository import UploadRepository
+from app.modules.archivos.schemas.schema import UploadCreate
+from app.modules.archivos.services.service import UploadService, _hashers
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+MIB = 1024 * 1024
+
+def synthetic(size: int, piece: int = 64 * 1024, seed: int = 0):
+    """Contenido determinista generado al vuelo, en piezas como las de un cuerpo HTTP."""
+    block = hashlib.sha256(str(seed).encode()).digest() * (piece // 32)
+    for start in range(0, size, piece):
+        yield block[: min(piece, size - start)]
+
+def digest_of(size: int, seed: int = 0) -> str:
+    hasher = hashlib.sha256()
+    for piece in synthetic(size, seed=seed):
+        hasher.update(piece)
+    return hasher.hexdigest()
+
+@pytest.fixture(name="process_id")
+def process_fixture(session: Session) -> int:
+    program = Program(name="Maestría en Gestión", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Nombre", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000001", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    )
+    session.add_all([program, advisor, student])
+    session.flush()
+    program_student = ProgramStudent(program_id=program.id, student_id=student.id, code="20240001", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+    session.add(program_student)
+    session.flush()
+    process = Process(id_student_program=program_student.id, id_advisor=advisor.id, current_stage=ProcessStage.TURNITIN, start_date=datetime(2025, 1, 1))
+    session.add(process)
+    session.commit()
+    return process.id # type: ignore[return-value]
+
+@pytest.fixture(name="service")
+def service_fixture(session: Session, tmp_path) -> UploadService:
+    _hashers.clear()
+    return UploadService(UploadRepository(session), LocalStorage(tmp_path), chunk_size=MIB)
+
+def test_large_upload_streams_with_bounded_memory(service: UploadService, process_id: int):
+    """64 MiB pasan por la carga con un pico de memoria de pocos MiB y buen rendimiento."""
+    size = 64 * MIB
+    upload = service.create(UploadCreate(process_id=process_id, filename="tesis.pdf", size=size))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = service.append(upload.id, 0, synthetic(size))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result.status == UploadStatus.COMPLETED and result.sha256 == digest_of(size)
+    assert peak < 8 * MIB
+    assert size / MIB / elapsed > 20
+
+def test_resume_after_restart_and_dedup(session: Session, service: UploadService, process_id: int):
+    """Una carga cortada se reanuda (aun sin el hasher en memoria) y el mismo contenido no se guarda dos veces."""
+    size = 5 * MIB + 123
+    first = service.create(UploadCreate(process_id=process_id, filename="tesis.pdf", size=size, sha256=digest_of(size)))
+
+    def cut(pieces, limit):
+        for sent, piece in enumerate(pieces):
+            if sent * len(piece) >= limit:
+                raise ConnectionError("cliente desconectado")
+            yield piece
+
+    with pytest.raises(ConnectionError):
+        service.append(first.id, 0, cut(synthetic(size), 3 * MIB))
+    received = service.status(first.id).received
+    assert received == 3 * MIB
+
+    with pytest.raises(UploadOffsetError):
+        service.append(first.id, 0, synthetic(size))
+    _hashers.clear()
+    rest = b"".join(synthetic(size))[received:]
+    done = service.append(first.id, received, [rest])
+    assert done.status == UploadStatus.COMPLETED and done.sha256 == digest_of(size)
+
+    second = service.create(UploadCreate(process_id=process_id, filename="tesis-v2.pdf", size=size))
+    again = service.append(second.id, 0, synthetic(size))
+    assert again.file_id == done.file_id
+    assert len(session.exec(select(StoredFile)).all()) == 1
+    assert [item.filename for item in service.process_files(process_id)] == ["tesis-v2.pdf", "tesis.pdf"]
+
+    stored, chunks = service.content(done.file_id) # type: ignore[arg-type]
+    assert hashlib.sha256(b"".join(chunks)).hexdigest() == stored.sha256
+
+def test_upload_rejects_oversize_and_wrong_digest(session: Session, service: UploadService, process_id: int):
+    """Exceder el tamaño declarado falla sin guardar el exceso; un SHA-256 distinto cancela la carga."""
+    upload = service.create(UploadCreate(process_id=process_id, filename="tesis.pdf", size=1000))
+    with pytest.raises(UploadIntegrityError):
+        service.append(upload.id, 0, [b"x" * 600, b"x" * 600])
+    assert service.status(upload.id).received == 0
+
+    wrong = service.create(UploadCreate(process_id=process_id, filename="tesis.pdf", size=10, sha256="0" * 64))
+    with pytest.raises(UploadIntegrityError):
+        service.append(wrong.id, 0, [b"0123456789"])
+    assert service.status(wrong.id).status == UploadStatus.CANCELLED
+    assert not session.exec(select(ProcessFile)).all()
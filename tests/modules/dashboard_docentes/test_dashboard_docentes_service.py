@@ -0,0 +1,115 @@
+"""Pruebas del dashboard del docente."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.feature_modules.dashboard_docentes.repository.repository import TeacherDashboardRepository
+from app.feature_modules.dashboard_docentes.services.service import TeacherDashboardService, dashboard_cache
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage, ProcessStatus
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.tareas.models.task import Task
+
+@pytest.fixture(name="advisor")
+def advisor_fixture(session: Session):
+    """Un asesor con tres procesos (dos en turnitin) y dos documentos pendientes en uno de ellos."""
+    dashboard_cache.clear()
+    program = Program(name="Doctorado en Ciencias", degree=DegreeProgram.DOCTORATE, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    category = ExternalDocumentCategory(full_name="Informe de originalidad", is_active=True)
+    session.add_all([program, advisor, category])
+    session.flush()
+    processes = []
+    for i, stage in enumerate([ProcessStage.TURNITIN, ProcessStage.TURNITIN, ProcessStage.ENROLLMENT]):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(program_id=program.id, student_id=student.id, code=f"2024{i:04d}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        session.add(program_student)
+        session.flush()
+        process = Process(id_student_program=program_student.id, id_advisor=advisor.id, current_stage=stage, start_date=datetime(2025, 1, 1))
+        session.add(process)
+        processes.append(process)
+    session.flush()
+    stage = ProcessStageRecord(id_process=processes[0].id, stage=ProcessStage.TURNITIN)
+    task = Task(id_process=processes[0].id, name="Revisión")
+    session.add_all([stage, task])
+    session.flush()
+    for reception in (ReceptionStatus.NO_RECIBIDO, ReceptionStatus.RECIBIDO, ReceptionStatus.NO_RECIBIDO):
+        session.add(ExternalProcessDocument(
+            id_process=processes[0].id, id_process_stage=stage.id, id_external_doc_category=category.id,
+            id_reception_task=task.id, id_delivery_task=task.id,
+            reception_status=reception, delivery_status=DeliveryStatus.ENTREGADO,
+        ))
+    session.commit()
+    return advisor.id, processes[2].id
+
+def test_dashboard_groups_advisees_and_caches(session: Session, advisor):
+    """Cuenta por etapa y estado; la segunda lectura sale de la caché sin consultar la BD."""
+    advisor_id, _ = advisor
+    service = TeacherDashboardService(TeacherDashboardRepository(session))
+    view = service.get_dashboard(advisor_id)
+
+    groups = {(group.stage, group.status): (group.processes, group.pending_documents) for group in view.breakdown}
+    assert groups == {
+        (ProcessStage.ENROLLMENT, ProcessStatus.IN_PROCESS): (1, 0),
+        (ProcessStage.TURNITIN, ProcessStatus.IN_PROCESS): (2, 2),
+    }
+    assert (view.advisees, view.pending_documents) == (3, 2)
+
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        assert service.get_dashboard(advisor_id) is view
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+    assert not statements
+
+def test_dashboard_invalidated_on_commit(session: Session, advisor):
+    """Cambiar el proceso de un asesorado invalida la caché recién al confirmar."""
+    advisor_id, process_id = advisor
+    service = TeacherDashboardService(TeacherDashboardRepository(session))
+    service.get_dashboard(advisor_id)
+
+    process = session.get(Process, process_id)
+    process.general_status = ProcessStatus.PAUSED # type: ignore[union-attr]
+    session.flush()
+    assert dashboard_cache.get(advisor_id) is not None
+
+    session.commit()
+    assert dashboard_cache.get(advisor_id) is None
+    statuses = {group.status for group in service.get_dashboard(advisor_id).breakdown}
+    assert ProcessStatus.PAUSED in statuses
+
+def test_reassignment_invalidates_both_advisors(session: Session, advisor):
+    """Reasignar el asesor de un proceso descarta el dashboard del asesor anterior y del nuevo."""
+    advisor_id, process_id = advisor
+    other = Teacher(dni="40000002", name="Otra", paternal_surname="Vega", maternal_surname="Ruiz", academic_degree=AcademicDegree.MASTER)
+    session.add(other)
+    session.commit()
+    service = TeacherDashboardService(TeacherDashboardRepository(session))
+    service.get_dashboard(advisor_id)
+    service.get_dashboard(other.id) # type: ignore[arg-type]
+
+    process = session.get(Process, process_id)
+    process.id_advisor = other.id # type: ignore[union-attr, assignment]
+    session.commit()
+
+    assert dashboard_cache.get(advisor_id) is None
+    assert dashboard_cache.get(other.id) is None
+    assert service.get_dashboard(advisor_id).advisees == 2
+    assert service.get_dashboard(other.id).advisees == 1 # type: ignore[arg-type]
@@ -0,0 +1,124 @@
+"""Pruebas de la proyección del dashboard del estudiante."""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.feature_modules.dashboard_estudiantes.models.dashboard import StudentDashboardProjection
+from app.feature_modules.dashboard_estudiantes.repository.repository import StudentDashboardRepository
+from app.feature_modules.dashboard_estudiantes.services.service import StudentDashboardService
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.tareas.models.task import Task
+
+@pytest.fixture(name="student_process")
+def student_process_fixture(session: Session):
+    """Crea un estudiante matriculado con un proceso en inscripción y un documento pendiente."""
+    program = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Lucía", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000001", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    )
+    category = ExternalDocumentCategory(full_name="Constancia de matrícula", is_active=True)
+    session.add_all([program, advisor, student, category])
+    session.flush()
+    program_student = ProgramStudent(
+        program_id=program.id, student_id=student.id, code="20240001",
+        status=StatusStudentProgram.ACTIVE, admission_year=2024,
+    )
+    session.add(program_student)
+    session.flush()
+    process = Process(
+        id_student_program=program_student.id, id_advisor=advisor.id,
+        current_thesis_title="Tesis", start_date=datetime(2025, 1, 1),
+    )
+    session.add(process)
+    session.flush()
+    stage = ProcessStageRecord(id_process=process.id, stage=ProcessStage.ENROLLMENT)
+    task = Task(id_process=process.id, name="Recepción de constancia")
+    session.add_all([stage, task])
+    session.flush()
+    session.add(ExternalProcessDocument(
+        id_process=process.id, id_process_stage=stage.id, id_external_doc_category=category.id,
+        id_reception_task=task.id, id_delivery_task=task.id,
+        reception_status=ReceptionStatus.NO_RECIBIDO, delivery_status=DeliveryStatus.NO_ENTREGADO,
+    ))
+    session.commit()
+    return student.id, process.id
+
+def test_projection_follows_process_changes(session: Session, student_process):
+    """Cambiar la etapa del proceso actualiza la proyección sin recalcular en la lectura."""
+    student_id, process_id = student_process
+    projection = session.get(StudentDashboardProjection, student_id)
+    assert projection is not None
+    assert projection.data["process"]["current_stage"] == ProcessStage.ENROLLMENT.value
+    assert [doc["category"] for doc in projection.data["pending_documents"]] == ["Constancia de matrícula"]
+
+    process = session.get(Process, process_id)
+    process.current_stage = ProcessStage.TURNITIN # type: ignore[union-attr]
+    session.commit()
+    session.expire_all()
+
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        view = StudentDashboardService(StudentDashboardRepository(session)).get_dashboard(student_id)
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+
+    assert view.process is not None and view.process.current_stage == ProcessStage.TURNITIN
+    assert view.academic.code == "20240001"
+    assert len(statements) == 1
+
+def test_projection_follows_deletes(session: Session, student_process):
+    """Borrar un documento, el proceso o la matrícula actualiza o elimina la proyección."""
+    student_id, process_id = student_process
+    document = session.exec(select(ExternalProcessDocument).where(ExternalProcessDocument.id_process == process_id)).one()
+    session.delete(document)
+    session.commit()
+    session.expire_all()
+    assert session.get(StudentDashboardProjection, student_id).data["pending_documents"] == [] # type: ignore[union-attr]
+
+    process = session.get(Process, process_id)
+    program_student_id = process.id_student_program # type: ignore[union-attr]
+    for model in (ProcessStageRecord, Task):
+        for row in session.exec(select(model).where(model.id_process == process_id)).all(): # type: ignore[attr-defined]
+            session.delete(row)
+    session.delete(process)
+    session.commit()
+    session.expire_all()
+    assert session.get(StudentDashboardProjection, student_id).data["process"] is None # type: ignore[union-attr]
+
+    session.delete(session.get(ProgramStudent, program_student_id))
+    session.commit()
+    session.expire_all()
+    assert session.get(StudentDashboardProjection, student_id) is None
+
+def test_dashboard_endpoint_reports_freshness(client: TestClient, session: Session, student_process):
+    """El endpoint devuelve el dashboard con su antigüedad y reconstruye filas faltantes."""
+    student_id, _ = student_process
+    session.delete(session.get(StudentDashboardProjection, student_id))
+    session.commit()
+
+    response = client.get(f"{settings.DASHBOARD_PREFIX}/estudiantes/{student_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["personal"]["name"] == "Lucía"
+    assert body["academic"]["program"]["name"] == "Maestría en Educación"
+    assert body["freshness"]["age_seconds"] >= 0
+
+    assert client.get(f"{settings.DASHBOARD_PREFIX}/estudiantes/9999").status_code == 404
@@ -0,0 +1,113 @@
+"""Pruebas del embudo de etapas."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlmodel import Session, select
+
+from app.feature_modules.dashboard_etapas.models.rollup import StageDailyRollup
+from app.feature_modules.dashboard_etapas.repository.repository import StageRollupRepository
+from app.feature_modules.dashboard_etapas.services.service import StageAnalyticsService, percentile
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.proceso.repository.repository import ProcessRepository
+from app.modules.proceso.schemas.schema import StageTransitionBatch, StageTransitionItem
+from app.modules.proceso.services.service import ProcessService
+
+@pytest.fixture(name="process_ids")
+def process_ids_fixture(session: Session):
+    """Cuatro procesos en inscripción: dos de la cohorte 2023 y dos de la 2024."""
+    program = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    session.add_all([program, advisor])
+    session.flush()
+    processes = []
+    for i in range(4):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(
+            program_id=program.id, student_id=student.id, code=f"2024{i:04d}",
+            status=StatusStudentProgram.ACTIVE, admission_year=2023 + i // 2,
+        )
+        session.add(program_student)
+        session.flush()
+        process = Process(id_student_program=program_student.id, id_advisor=advisor.id, start_date=datetime(2025, 1, 1))
+        session.add(process)
+        processes.append(process)
+    session.commit()
+    return [process.id for process in processes]
+
+def test_rollups_follow_stage_history(session: Session, process_ids):
+    """Las filas del historial alimentan el resumen diario y el embudo calcula p50/p90 por cohorte."""
+    start = datetime(2025, 3, 1, 9)
+    for i, process_id in enumerate(process_ids):
+        session.add(ProcessStageRecord(
+            id_process=process_id, stage=ProcessStage.TURNITIN, start_date=start, end_date=start + timedelta(days=10 * (i + 1)),
+        ))
+    session.commit()
+
+    rollups = session.exec(select(StageDailyRollup).where(StageDailyRollup.day == date(2025, 3, 1))).all()
+    assert sorted((row.cohort, row.entered) for row in rollups) == [(2023, 2), (2024, 2)]
+
+    service = StageAnalyticsService(StageRollupRepository(session))
+    report = service.funnel()
+    turnitin = next(stage for stage in report.segments[0].stages if stage.stage == ProcessStage.TURNITIN)
+    assert (turnitin.entered, turnitin.exited) == (4, 4)
+    assert 14 <= turnitin.p50_days <= 30 # type: ignore[operator]
+    assert 30 <= turnitin.p90_days <= 60 # type: ignore[operator]
+
+    by_cohort = service.funnel(group_by="cohort", date_to=date(2025, 3, 25))
+    exits = {segment.cohort: segment.stages[1].exited for segment in by_cohort.segments}
+    assert exits == {2023: 2, 2024: 0}
+
+def test_transition_batch_records_history(session: Session, process_ids):
+    """Una transición por lote cierra la etapa de origen, abre la nueva y actualiza el resumen."""
+    service = ProcessService(ProcessRepository(session))
+    service.transition(StageTransitionBatch(items=[
+        StageTransitionItem(process_id=process_id, to_stage=ProcessStage.TURNITIN) for process_id in process_ids
+    ]))
+
+    records = session.exec(select(ProcessStageRecord).order_by(ProcessStageRecord.id)).all()
+    closed = [record for record in records if record.stage == ProcessStage.ENROLLMENT]
+    assert len(closed) == 4 and all(record.end_date is not None for record in closed)
+    assert all(record.start_date == datetime(2025, 1, 1) for record in closed)
+    assert len([record for record in records if record.stage == ProcessStage.TURNITIN and record.end_date is None]) == 4
+
+    stages = {stage.stage: stage for stage in StageAnalyticsService(StageRollupRepository(session)).funnel().segments[0].stages}
+    assert (stages[ProcessStage.ENROLLMENT].entered, stages[ProcessStage.ENROLLMENT].exited) == (4, 4)
+    assert stages[ProcessStage.TURNITIN].entered == 4
+    assert stages[ProcessStage.ENROLLMENT].p50_days is not None
+
+def test_percentile_interpolates_within_bucket():
+    """El percentil se interpola dentro de la cubeta y es None sin datos."""
+    assert percentile([], 0.5) is None
+    assert percentile([0, 0, 4], 0.5) == 5.0
+
+def test_lock_days_takes_advisory_locks_in_order():
+    """En Postgres se bloquea cada par (etapa, día) una vez y en orden de clave antes de recalcular."""
+    executed = []
+
+    class Connection:
+        def execute(self, statement):
+            executed.append(tuple(statement.compile().params.values()))
+
+    class PostgresSession:
+        def get_bind(self):
+            return type("Bind", (), {"dialect": type("Dialect", (), {"name": "postgresql"})})()
+
+        def connection(self):
+            return Connection()
+
+    day = date(2025, 3, 10)
+    StageRollupRepository(PostgresSession()).lock_days([ # type: ignore[arg-type]
+        (ProcessStage.TURNITIN, day), (ProcessStage.ENROLLMENT, day + timedelta(days=1)), (ProcessStage.TURNITIN, day),
+    ])
+
+    assert executed == [(1, day.toordinal() + 1), (1, 1_000_000 + day.toordinal())]
@@ -0,0 +1,113 @@
+"""Pruebas de la designación de jurados."""
+from datetime import date, datetime
+
+from sqlmodel import Session, select
+
+from app.feature_modules.designacion_de_jurados.models.jury import JuryMember
+from app.feature_modules.designacion_de_jurados.repository.repository import JuryRepository
+from app.feature_modules.designacion_de_jurados.schemas.schema import JuryProposalRequest
+from app.feature_modules.designacion_de_jurados.services.service import JuryService
+from app.feature_modules.designacion_de_jurados.services.solver import EligibilityIndex, JuryCase, solve
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree, StatusTeacher
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+def test_solver_balances_load_and_respects_eligibility():
+    """Nadie es jurado de su asesorado, los doctorados solo reciben doctores y la carga queda pareja."""
+    teachers = [(i, AcademicDegree.DOCTORATE if i < 4 else AcademicDegree.MASTER) for i in range(10)]
+    cases = [
+        JuryCase(process_id=p, advisor_id=p % 10, degree=DegreeProgram.DOCTORATE if p < 3 else DegreeProgram.MASTER)
+        for p in range(30)
+    ]
+    solution = solve(cases, EligibilityIndex(teachers), jury_size=3, initial_load={0: 4})
+
+    assert not solution.errors
+    for case in cases:
+        jury = solution.assignments[case.process_id]
+        assert len(set(jury)) == 3 and case.advisor_id not in jury
+        if case.degree == DegreeProgram.DOCTORATE:
+            assert all(teacher < 4 for teacher in jury)
+    loads = solution.loads.values()
+    assert sum(loads) == 4 + 90 and max(loads) - min(loads) <= 1
+
+    short = solve([JuryCase(process_id=1, advisor_id=0, degree=DegreeProgram.DOCTORATE)], EligibilityIndex(teachers[:3]), jury_size=3)
+    assert short.assignments == {} and 1 in short.errors
+
+def test_propose_filters_teachers_and_applies(session: Session):
+    """Los docentes inactivos o de licencia en la fecha no se proponen; con apply se registra el jurado."""
+    defense = date(2025, 6, 10)
+    program = Program(name="Maestría en Gestión", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    teachers = [
+        Teacher(dni=f"4000000{i}", name="Docente", paternal_surname=f"P{i}", maternal_surname="S", academic_degree=AcademicDegree.MASTER)
+        for i in range(6)
+    ]
+    teachers[4].status = StatusTeacher.INACTIVE
+    teachers[5].license_start_date, teachers[5].license_end_date = date(2025, 6, 1), date(2025, 6, 30)
+    session.add_all([program, *teachers])
+    session.flush()
+    processes = []
+    for i, stage in enumerate([ProcessStage.JURY_ASSIGNMENT, ProcessStage.JURY_ASSIGNMENT, ProcessStage.TURNITIN]):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(program_id=program.id, student_id=student.id, code=f"2024{i:04d}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        session.add(program_student)
+        session.flush()
+        processes.append(Process(id_student_program=program_student.id, id_advisor=teachers[i].id, current_stage=stage, start_date=datetime(2025, 1, 1)))
+    session.add_all(processes)
+    session.commit()
+
+    service = JuryService(JuryRepository(session))
+    report = service.propose(JuryProposalRequest(process_ids=[p.id for p in processes], defense_date=defense, apply=True))
+
+    available = {teacher.id for teacher in teachers[:4]}
+    proposals = {proposal.process_id: proposal for proposal in report.proposals}
+    assert (report.assigned, report.unassigned, report.applied) == (2, 1, True)
+    assert proposals[processes[2].id].error is not None
+    for process in processes[:2]:
+        jury = proposals[process.id].teacher_ids
+        assert set(jury) <= available and process.id_advisor not in jury
+    assert len(session.exec(select(JuryMember)).all()) == 6
+
+    # Ya tienen jurado: un nuevo lote sin ids no encuentra pendientes
+    assert service.propose(JuryProposalRequest(defense_date=defense)).proposals == []
+
+def test_propose_with_existing_load(session: Session):
+    """Un docente cargado solo por designaciones vigentes queda fuera de la propuesta sin romper el balance."""
+    defense = date(2025, 6, 10)
+    program = Program(name="Maestría en Gestión", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    teachers = [
+        Teacher(dni=f"4100000{i}", name="Docente", paternal_surname=f"P{i}", maternal_surname="S", academic_degree=AcademicDegree.MASTER)
+        for i in range(5)
+    ]
+    # El asesor no está disponible como jurado
+    teachers[4].status = StatusTeacher.INACTIVE
+    session.add_all([program, *teachers])
+    session.flush()
+    processes = []
+    for i in range(6):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7100000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(program_id=program.id, student_id=student.id, code=f"2025{i:04d}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        session.add(program_student)
+        session.flush()
+        stage = ProcessStage.JURY_ASSIGNMENT if i == 0 else ProcessStage.PUBLIC_DEFENSE
+        processes.append(Process(id_student_program=program_student.id, id_advisor=teachers[4].id, current_stage=stage, start_date=datetime(2025, 1, 1)))
+    session.add_all(processes)
+    session.flush()
+    session.add_all([JuryMember(id_process=process.id, id_teacher=teachers[3].id, defense_date=defense) for process in processes[1:]])
+    session.commit()
+
+    report = JuryService(JuryRepository(session)).propose(JuryProposalRequest(process_ids=[processes[0].id], defense_date=defense))
+
+    assert (report.assigned, report.unassigned) == (1, 0)
+    assert set(report.proposals[0].teacher_ids) == {teacher.id for teacher in teachers[:3]}
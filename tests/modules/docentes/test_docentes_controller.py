@@ -0,0 +1,23 @@
+"""Pruebas del controlador de docentes."""
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+
+URL = f"{settings.GLOBAL_PREFIX}/docentes/buscar"
+
+def test_search_teachers(client, session: Session):
+    """Busca docentes por apellido parcial, sin tildes, y por DNI."""
+    session.add_all([
+        Teacher(dni="41111111", name="María", paternal_surname="Gutiérrez", maternal_surname="León", academic_degree=AcademicDegree.DOCTORATE),
+        Teacher(dni="42222222", name="Carlos", paternal_surname="Mendoza", maternal_surname="Ríos", academic_degree=AcademicDegree.MASTER),
+    ])
+    session.commit()
+
+    by_surname = client.get(URL, params={"q": "gutierr"}).json()
+    assert [teacher["dni"] for teacher in by_surname] == ["41111111"]
+
+    by_dni = client.get(URL, params={"q": "4222"}).json()
+    assert by_dni[0]["name"] == "Carlos"
+
+    assert client.get(URL, params={"q": "zzzz"}).json() == []
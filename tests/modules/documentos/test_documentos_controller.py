@@ -0,0 +1,168 @@
+"""Pruebas del controlador de documentos."""
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.documentos.models.document import DeliveryStatus, ExternalProcessDocument, ReceptionStatus
+from app.modules.documentos.models.external_document_category import ExternalDocumentCategory
+from app.modules.documentos.services.service import category_cache
+from app.shared import cache
+from app.shared.response_cache import ResponseCache, shared_backend
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+from app.modules.proceso.models.process_stage import ProcessStageRecord
+from app.modules.tareas.models.task import Task
+
+CATEGORIES_URL = f"{settings.GLOBAL_PREFIX}/documentos/categorias"
+BOARD_URL = f"{settings.GLOBAL_PREFIX}/documentos/tablero"
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cada prueba parte de una caché vacía."""
+    category_cache.invalidate()
+
+def test_categories_etag_and_invalidation(client: TestClient):
+    """El catálogo responde 304 con el mismo ETag y cambia tras una escritura."""
+    created = client.post(CATEGORIES_URL, json={"full_name": "Constancia de matrícula"})
+    assert created.status_code == 201
+
+    first = client.get(CATEGORIES_URL)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert [item["full_name"] for item in first.json()] == ["Constancia de matrícula"]
+
+    not_modified = client.get(CATEGORIES_URL, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    category_id = created.json()["id_cat_doc_ext"]
+    assert client.patch(f"{CATEGORIES_URL}/{category_id}", json={"active_status": False}).status_code == 200
+
+    changed = client.get(CATEGORIES_URL, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["active_status"] is False
+
+class FakeRedis:
+    """Cliente Redis en memoria; `down` simula un servidor caído."""
+    down = False
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    def get(self, name: str):
+        if self.down:
+            raise ConnectionError("sin conexión")
+        return self.data.get(name)
+
+    def set(self, name: str, value: bytes, px: int | None = None) -> None:
+        if self.down:
+            raise ConnectionError("sin conexión")
+        self.data[name] = value
+
+    def delete(self, *names: str) -> None:
+        for name in names:
+            self.data.pop(name, None)
+
+def test_redis_backend_shared_between_workers(monkeypatch):
+    """Con CACHE_BACKEND=redis dos workers comparten respuestas e invalidaciones; sin Redis se recalcula."""
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis", SimpleNamespace(Redis=SimpleNamespace(from_url=lambda url: client), RedisError=ConnectionError))
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "redis")
+    shared_backend.cache_clear()
+    try:
+        backend = shared_backend()
+        assert isinstance(backend, cache.RedisBackend)
+        first, second = (ResponseCache("pruebas", ttl=60, backend=backend, local_ttl=0) for _ in range(2))
+        calls = []
+        def build():
+            calls.append(1)
+            return [len(calls)]
+
+        etag, body = first.get_or_build("k", build)
+        assert second.get_or_build("k", build) == (etag, body) and len(calls) == 1
+        second.invalidate()
+        assert first.get_or_build("k", build)[1] == b"[2]"
+
+        client.down = True
+        assert first.get_or_build("k", build)[1] == b"[3]"
+    finally:
+        shared_backend.cache_clear()
+
+def test_update_missing_category(client: TestClient):
+    """Actualizar una categoría inexistente devuelve 404."""
+    assert client.patch(f"{CATEGORIES_URL}/999", json={"active_status": False}).status_code == 404
+
+@pytest.fixture(name="documents")
+def documents_fixture(session: Session):
+    """Cinco documentos de un proceso en dos etapas: tres pendientes vencidos al 2025-03-01."""
+    program = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Nombre", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000001", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    )
+    categories = [ExternalDocumentCategory(full_name=name, is_active=True) for name in ("Informe de originalidad", "Acta")]
+    session.add_all([program, advisor, student, *categories])
+    session.flush()
+    program_student = ProgramStudent(program_id=program.id, student_id=student.id, code="20240001", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+    session.add(program_student)
+    session.flush()
+    process = Process(id_student_program=program_student.id, id_advisor=advisor.id, start_date=datetime(2025, 1, 1))
+    session.add(process)
+    session.flush()
+    stages = [
+        ProcessStageRecord(id_process=process.id, stage=ProcessStage.TURNITIN, end_date=datetime(2025, 2, 1)),
+        ProcessStageRecord(id_process=process.id, stage=ProcessStage.CLEARED),
+    ]
+    task = Task(id_process=process.id, name="Revisión")
+    session.add_all([*stages, task])
+    session.flush()
+    specs = [
+        (stages[0], categories[0], ReceptionStatus.NO_RECIBIDO, date(2025, 2, 1), DeliveryStatus.ENTREGADO, date(2025, 2, 1)),
+        (stages[0], categories[1], ReceptionStatus.RECIBIDO, date(2025, 2, 1), DeliveryStatus.NO_ENTREGADO, date(2025, 2, 15)),
+        (stages[1], categories[0], ReceptionStatus.NO_RECIBIDO, date(2025, 2, 20), None, None),
+        (stages[1], categories[0], ReceptionStatus.NO_RECIBIDO, date(2025, 4, 1), None, None),
+        (stages[1], categories[1], ReceptionStatus.RECIBIDO, date(2025, 1, 1), DeliveryStatus.ENTREGADO, date(2025, 1, 5)),
+    ]
+    for stage, category, reception, reception_date, delivery, delivery_date in specs:
+        session.add(ExternalProcessDocument(
+            id_process=process.id, id_process_stage=stage.id, id_external_doc_category=category.id,
+            id_reception_task=task.id, id_delivery_task=task.id,
+            reception_status=reception, reception_date=reception_date, delivery_status=delivery, delivery_date=delivery_date,
+        ))
+    session.commit()
+    return categories[0].id
+
+def test_document_board_filters(client: TestClient, documents):
+    """El tablero lista pendientes vencidos con su categoría y etapa, filtra y pagina por cursor."""
+    page = client.get(BOARD_URL, params={"as_of": "2025-03-01", "limit": 2}).json()
+    assert [item["overdue"] for item in page["items"]] == [True, True]
+    assert page["items"][0]["catalog_document"]["full_name"] == "Informe de originalidad"
+    assert page["items"][0]["stage"] == "turnitin"
+    rest = client.get(BOARD_URL, params={"as_of": "2025-03-01", "cursor": page["next_cursor"]}).json()
+    assert len(rest["items"]) == 1 and rest["next_cursor"] is None
+
+    by_stage = client.get(BOARD_URL, params={"as_of": "2025-03-01", "stage": "expedito"}).json()["items"]
+    assert len(by_stage) == 1
+    by_category = client.get(BOARD_URL, params={"as_of": "2025-03-01", "category_id": documents}).json()["items"]
+    assert len(by_category) == 2
+    pending = client.get(BOARD_URL, params={"as_of": "2025-03-01", "overdue_only": False}).json()["items"]
+    assert [item["overdue"] for item in pending] == [True, True, True, False]
+
+def test_bulk_document_status(client: TestClient, documents):
+    """Un solo PATCH marca varios documentos como recibidos (con fecha de hoy) y reporta los inexistentes."""
+    ids = [item["id"] for item in client.get(BOARD_URL, params={"as_of": "2025-03-01", "category_id": documents}).json()["items"]]
+    response = client.patch(f"{settings.GLOBAL_PREFIX}/documentos/estado", json={"ids": [*ids, 999], "reception_status": "recibido"})
+    assert response.json() == {"updated": 2, "not_found": [999]}
+
+    board = client.get(BOARD_URL, params={"as_of": "2025-03-01", "overdue_only": False}).json()["items"]
+    assert len(board) == 2
+    assert client.patch(f"{settings.GLOBAL_PREFIX}/documentos/estado", json={"ids": ids}).status_code == 400
@@ -0,0 +1,161 @@
+"""Pruebas del controlador de estudiantes."""
+import io
+
+import pytest
+from openpyxl import Workbook
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+
+URL = f"{settings.GLOBAL_PREFIX}/estudiantes/"
+
+@pytest.fixture(name="students")
+def students_fixture(session: Session):
+    """Crea dos programas y cinco estudiantes matriculados."""
+    master = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    doctorate = Program(name="Doctorado en Ciencias", degree=DegreeProgram.DOCTORATE, status=StatusProgram.ACTIVE)
+    session.add_all([master, doctorate])
+    session.flush()
+    for i in range(5):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Quispe" if i % 2 else "Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        session.add(ProgramStudent(
+            program_id=master.id if i < 3 else doctorate.id, student_id=student.id, code=f"2024000{i}",
+            status=StatusStudentProgram.ACTIVE, admission_year=2024 if i < 4 else 2023,
+        ))
+    session.commit()
+    return master, doctorate
+
+def test_list_students_paginates_by_cursor(client, students):
+    """Recorre todas las páginas siguiendo next_cursor sin repetir estudiantes."""
+    seen = []
+    response = client.get(URL, params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(item["id"] for item in page["items"])
+        if page["next_cursor"] is None:
+            break
+        response = client.get(URL, params={"limit": 2, "cursor": page["next_cursor"]})
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+def test_list_students_filters(client, students):
+    """Filtra por programa, año de ingreso y búsqueda por código o nombre."""
+    _, doctorate = students
+
+    by_program = client.get(URL, params={"program_id": doctorate.id}).json()["items"]
+    assert {item["code"] for item in by_program} == {"20240003", "20240004"}
+    assert by_program[0]["program_name"] == "Doctorado en Ciencias"
+
+    by_year = client.get(URL, params={"admission_year": 2023}).json()["items"]
+    assert [item["code"] for item in by_year] == ["20240004"]
+
+    by_code = client.get(URL, params={"q": "2024000"}).json()["items"]
+    assert len(by_code) == 5
+
+    by_name = client.get(URL, params={"q": "quispe"}).json()["items"]
+    assert {item["paternal_surname"] for item in by_name} == {"Quispe"}
+
+def test_list_students_invalid_cursor(client, students):
+    """Un cursor manipulado devuelve 400."""
+    response = client.get(URL, params={"cursor": "no-es-un-cursor"})
+    assert response.status_code == 400
+    assert response.json()["type"] == "InvalidCursorError"
+
+def test_search_students(client, session: Session, students):
+    """Busca por código, por apellido con o sin tildes y por documento."""
+    search_url = f"{URL}buscar"
+    session.add(Student(
+        name="José", paternal_surname="Ñahui", maternal_surname="Cáceres",
+        identity_document="71234567", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    ))
+    session.commit()
+
+    by_code = client.get(search_url, params={"q": "20240003"}).json()
+    assert by_code[0]["name"] == "Nombre3"
+    assert by_code[0]["score"] == 1.0
+
+    by_accent = client.get(search_url, params={"q": "jose caceres"}).json()
+    assert by_accent[0]["paternal_surname"] == "Ñahui"
+
+    by_partial = client.get(search_url, params={"q": "cacere"}).json()
+    assert [item["identity_document"] for item in by_partial] == ["71234567"]
+
+    by_document = client.get(search_url, params={"q": "7123456"}).json()
+    assert by_document[0]["identity_document"] == "71234567"
+
+def test_programs_catalog_etag(client, students):
+    """El catálogo de programas usa ETag y se invalida al actualizar un programa."""
+    programs_url = f"{URL}programas"
+    first = client.get(programs_url)
+    assert [item["name"] for item in first.json()] == ["Doctorado en Ciencias", "Maestría en Educación"]
+    etag = first.headers["ETag"]
+    assert client.get(programs_url, headers={"If-None-Match": f'W/{etag}'}).status_code == 304
+
+    program_id = first.json()[0]["id"]
+    updated = client.patch(f"{programs_url}/{program_id}", json={"status": "inactivo"})
+    assert updated.status_code == 200
+
+    active = client.get(programs_url, params={"status": "activo"}, headers={"If-None-Match": etag})
+    assert active.status_code == 200
+    assert [item["name"] for item in active.json()] == ["Maestría en Educación"]
+
+IMPORT_HEADER = "name;paternal_surname;maternal_surname;identity_document;type_document;academic_email;code;admission_year;program_id;program_name;degree\n"
+
+def test_import_students_csv(client, session: Session, students):
+    """Importa por lotes, actualiza existentes, crea programas por nombre y reporta errores por fila."""
+    program_id = session.exec(select(Program.id).where(Program.degree == DegreeProgram.MASTER)).one()
+    content = IMPORT_HEADER + "".join([
+        f"Ana;Torres;Vega;71000001;dni;ana@unmsm.edu.pe;20250001;2025;{program_id};;\n",
+        "Luis;Díaz;Mora;71000002;dni;;20250002;2025;;Maestría en Salud Pública;maestria\n",
+        "Nombre0;Rojas;Huamán;70000000;dni;;20240000;2024;;Maestría en Salud Pública;maestria\n",
+        "Eva;Paz;Soto;71000003;dni;correo-invalido;20250003;2025;;;\n",
+        f"Otra;Persona;Más;71000004;dni;;20250001;2025;{program_id};;\n",
+    ])
+    response = client.post(f"{URL}importar", files={"file": ("alumnos.csv", content.encode(), "text/csv")})
+    assert response.status_code == 200
+    report = response.json()
+
+    assert (report["total_rows"], report["imported_rows"], report["programs_created"]) == (5, 3, 1)
+    errors = {(error["row"], error["field"]) for error in report["errors"]}
+    assert {(5, "academic_email"), (5, "program_id"), (6, "code")} <= errors
+
+    # La fila 4 mueve la matrícula existente 20240000 al nuevo programa sin duplicar al estudiante
+    moved = session.exec(select(ProgramStudent).where(ProgramStudent.code == "20240000")).one()
+    assert session.get(Program, moved.program_id).name == "Maestría en Salud Pública"
+    assert len(session.exec(select(Student).where(Student.identity_document == "70000000")).all()) == 1
+
+def test_import_students_xlsx(client, session: Session, students):
+    """Los archivos XLSX se leen en modo streaming con las mismas columnas."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(IMPORT_HEADER.strip().split(";"))
+    sheet.append(["Ana", "Torres", "Vega", "71000001", "dni", None, 20250001, 2025, None, "Doctorado en Ciencias", "doctorado"])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    response = client.post(f"{URL}importar", files={"file": ("alumnos.xlsx", buffer.getvalue())})
+    assert response.json()["imported_rows"] == 1
+    assert response.json()["programs_created"] == 0
+
+def test_import_students_rejects_unknown_format(client):
+    """Un formato no soportado devuelve 400."""
+    response = client.post(f"{URL}importar", files={"file": ("alumnos.txt", b"hola")})
+    assert response.status_code == 400
+
+def test_export_students(client, students):
+    """Exporta una fila por matrícula, filtrando por año de ingreso."""
+    response = client.get(f"{URL}exportar", params={"admission_year": 2024})
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.content.decode("utf-8-sig").splitlines()
+    assert len(lines) == 1 + 4
+    assert lines[1].split(",")[1] == "20240000"
@@ -0,0 +1,42 @@
+"""Pruebas de los endpoints de otorgamiento de grado."""
+import io
+import zipfile
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.feature_modules.otorgamiento.services import service as granting_service
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+def test_documents_zip_over_http(client: TestClient, session: Session, monkeypatch):
+    """Sin procesos en otorgamiento responde 404; con uno, descarga el ZIP con sus dos documentos."""
+    monkeypatch.setattr(granting_service, "rendering_pool", lambda: None)
+    url = f"{settings.STAGE_PREFIX}/otorgamiento/documentos"
+    body = {"session_date": "2026-05-15", "first_resolution_number": 7}
+    assert client.post(url, json=body).status_code == 404
+
+    program = Program(name="Doctorado en Educación", degree=DegreeProgram.DOCTORATE, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000002", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Nombre", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000002", type_document=TypeDocumentStudent.PASSPORT, status=StatusStudent.ACTIVE,
+    )
+    session.add_all([program, advisor, student])
+    session.flush()
+    program_student = ProgramStudent(program_id=program.id, student_id=student.id, code="20240002", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+    session.add(program_student)
+    session.flush()
+    session.add(Process(id_student_program=program_student.id, id_advisor=advisor.id, current_stage=ProcessStage.DEGREE_GRANTING, start_date=datetime(2024, 1, 1)))
+    session.commit()
+
+    response = client.post(url, json=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.namelist() == ["resolucion_0007-2026_20240002.pdf", "constancia_0007-2026_20240002.pdf"]
@@ -0,0 +1,120 @@
+"""Pruebas de la generación en lote de documentos de otorgamiento de grado."""
+import io
+import multiprocessing
+import re
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+import pytest
+from sqlmodel import Session
+
+from app.feature_modules.otorgamiento.exceptions.exceptions import GrantingProcessNotFoundError, ProcessNotInGrantingError
+from app.feature_modules.otorgamiento.repository.repository import GrantingRepository
+from app.feature_modules.otorgamiento.schemas.schema import GrantingBatchRequest, GrantingDocument
+from app.core.config import settings
+from app.feature_modules.otorgamiento.services.batch import BatchStats
+from app.feature_modules.otorgamiento.services.service import GrantingService, close_rendering_pool, rendering_pool
+from app.feature_modules.otorgamiento.services.templates import init_worker, render_chunk
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+def check_pdf(data: bytes) -> bytes:
+    """Verifica la tabla xref y devuelve el contenido descomprimido de la página."""
+    assert data.startswith(b"%PDF-1.4") and data.endswith(b"%%EOF\n")
+    xref = int(data.rsplit(b"startxref\n", 1)[1].split(b"\n")[0])
+    assert data[xref:xref + 4] == b"xref"
+    for number, offset in enumerate(re.findall(rb"(\d{10}) 00000 n", data[xref:]), start=1):
+        assert data[int(offset):].startswith(b"%d 0 obj" % number)
+    streams = re.findall(rb"<< /Filter /FlateDecode /Length \d+ >>\nstream\n(.*?)\nendstream", data, re.S)
+    return b"".join(zlib.decompress(stream) for stream in streams)
+
+@pytest.fixture(name="granting")
+def granting_fixture(session: Session) -> list[int]:
+    """Dos procesos en otorgamiento de grado y uno todavía en Cybertesis."""
+    program = Program(name="Maestría en Gestión Pública", mention="Políticas Sociales", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000000", name="Rosa", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    session.add_all([program, advisor])
+    session.flush()
+    processes = []
+    for i, stage in enumerate([ProcessStage.DEGREE_GRANTING, ProcessStage.CYBERTESIS, ProcessStage.DEGREE_GRANTING]):
+        student = Student(
+            name=f"María{i}", paternal_surname="Núñez", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        enrollment = ProgramStudent(program_id=program.id, student_id=student.id, code=f"2024{i:04d}", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+        session.add(enrollment)
+        session.flush()
+        processes.append(Process(
+            id_student_program=enrollment.id, id_advisor=advisor.id, current_stage=stage,
+            current_thesis_title=f"Gestión (y evaluación) de programas sociales {i}", start_date=datetime(2024, 1, 1),
+        ))
+    session.add_all(processes)
+    session.commit()
+    return [process.id for process in processes] # type: ignore[misc]
+
+def test_batch_zip_numbers_resolutions_and_validates(session: Session, granting):
+    """El ZIP trae un PDF válido por documento, con resoluciones correlativas solo para procesos en otorgamiento."""
+    service = GrantingService(GrantingRepository(session))
+    request = GrantingBatchRequest(session_date=date(2026, 5, 15), first_resolution_number=41)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(service.documents(request))))
+
+    assert archive.namelist() == [
+        "resolucion_0041-2026_20240000.pdf", "constancia_0041-2026_20240000.pdf",
+        "resolucion_0042-2026_20240002.pdf", "constancia_0042-2026_20240002.pdf",
+    ]
+    resolution = check_pdf(archive.read("resolucion_0042-2026_20240002.pdf"))
+    assert "(RESOLUCIÓN N.° 0042-2026)".encode("cp1252") in resolution
+    assert "Sesión del 15 de mayo de 2026".encode("cp1252") in resolution
+    certificate = check_pdf(archive.read("constancia_0041-2026_20240000.pdf"))
+    assert "(María0 Núñez Huamán)".encode("cp1252") in certificate
+    assert b"Gesti\xf3n \\(y evaluaci\xf3n\\) de programas sociales 0" in certificate
+
+    with pytest.raises(ProcessNotInGrantingError):
+        service.items(GrantingBatchRequest(session_date=date(2026, 5, 15), first_resolution_number=1, process_ids=granting))
+    with pytest.raises(GrantingProcessNotFoundError):
+        service.items(GrantingBatchRequest(session_date=date(2026, 5, 15), first_resolution_number=1, process_ids=[999]))
+
+def test_process_pool_matches_inline_render(session: Session, granting):
+    """El pool de procesos produce los mismos documentos, en el mismo orden, que el render en proceso."""
+    request = GrantingBatchRequest(
+        session_date=date(2026, 5, 15), first_resolution_number=1,
+        process_ids=[granting[0], granting[2]], documents=[GrantingDocument.CERTIFICATE],
+    )
+    inline = zipfile.ZipFile(io.BytesIO(b"".join(GrantingService(GrantingRepository(session)).documents(request))))
+
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker) as pool:
+        service = GrantingService(GrantingRepository(session), pool, chunk_size=1, window=2)
+        pooled = zipfile.ZipFile(io.BytesIO(b"".join(service.documents(request))))
+
+    assert pooled.namelist() == inline.namelist()
+    assert all(pooled.read(name) == inline.read(name) for name in inline.namelist())
+
+def test_broken_pool_is_replaced(session: Session, granting, monkeypatch):
+    """Si muere un hijo del pool compartido, el lote se repite con un pool nuevo y el roto se descarta."""
+    monkeypatch.setattr(settings, "GRANTING_WORKERS", 1)
+    rendering_pool.cache_clear()
+    pool = rendering_pool()
+    try:
+        pool.submit(render_chunk, []).result()
+        for process in list(pool._processes.values()): # pylint: disable=protected-access
+            process.kill()
+            process.join()
+        request = GrantingBatchRequest(session_date=date(2026, 5, 15), first_resolution_number=1, process_ids=[granting[0]])
+
+        stats = BatchStats(documents=5, pages=5)
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(GrantingService(GrantingRepository(session), pool).documents(request, stats))))
+
+        assert len(archive.namelist()) == 2
+        assert stats.documents == 2
+        assert rendering_pool() is not pool
+    finally:
+        close_rendering_pool()
+        pool.shutdown()
@@ -0,0 +1,44 @@
+"""Fixtures compartidas por las pruebas de procesos."""
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session
+
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process, ProcessStage
+
+@pytest.fixture(name="processes")
+def processes_fixture(session: Session):
+    """Crea diez procesos, cada uno con su estudiante y repartidos entre dos asesores."""
+    program = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisors = [
+        Teacher(dni=f"4000000{i}", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+        for i in range(2)
+    ]
+    session.add_all([program, *advisors])
+    session.flush()
+    for i in range(10):
+        student = Student(
+            name=f"Nombre{i}", paternal_surname="Rojas", maternal_surname="Huamán",
+            identity_document=f"7000000{i}", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+        )
+        session.add(student)
+        session.flush()
+        program_student = ProgramStudent(
+            program_id=program.id, student_id=student.id, code=f"2024{i:04d}",
+            status=StatusStudentProgram.ACTIVE, admission_year=2024,
+        )
+        session.add(program_student)
+        session.flush()
+        session.add(Process(
+            id_student_program=program_student.id, id_advisor=advisors[i % 2].id,
+            current_thesis_title=f"Tesis {i}", start_date=datetime(2025, 1, 1),
+            current_stage=ProcessStage.TURNITIN if i < 4 else ProcessStage.ENROLLMENT,
+        ))
+    session.commit()
+    advisor_ids = [advisor.id for advisor in advisors]
+    session.expunge_all()
+    return advisor_ids
@@ -0,0 +1,60 @@
+"""Pruebas del controlador de procesos."""
+import csv
+import io
+
+from openpyxl import load_workbook
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.modules.proceso.models.process import Process, ProcessStage
+from app.modules.proceso.models.process_transition import ProcessTransition
+
+EXPORT_URL = f"{settings.GLOBAL_PREFIX}/procesos/exportar"
+
+def test_export_processes_csv(client, processes):
+    """Exporta en CSV con filtros por etapa y por rango de fechas de inicio."""
+    response = client.get(EXPORT_URL, params={"stage": "turnitin"})
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith('attachment; filename="procesos_')
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0][:2] == ["ID proceso", "Código"]
+    assert len(rows) == 1 + 4
+    assert {row[10] for row in rows[1:]} == {"turnitin"}
+    assert rows[1][8] == "Paz Soto, Docente"
+
+    later = client.get(EXPORT_URL, params={"started_from": "2025-01-02"})
+    assert len(later.content.decode("utf-8-sig").splitlines()) == 1
+
+def test_export_processes_xlsx(client, processes):
+    """El XLSX generado en streaming es un libro válido con todas las filas."""
+    response = client.get(EXPORT_URL, params={"format": "xlsx", "started_to": "2025-01-01"})
+    assert response.status_code == 200
+    sheet = load_workbook(io.BytesIO(response.content), read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert len(rows) == 1 + 10
+    assert rows[1][12] == "2025-01-01 00:00:00"
+
+def test_batch_transitions(client, session: Session, processes):
+    """Aplica las transiciones válidas en bloque, audita y reporta los rechazos por ítem."""
+    ids = {stage: list(session.exec(select(Process.id).where(Process.current_stage == stage).order_by(Process.id)).all())
+           for stage in (ProcessStage.ENROLLMENT, ProcessStage.TURNITIN)}
+    items = [{"process_id": process_id, "to_stage": "turnitin"} for process_id in ids[ProcessStage.ENROLLMENT]]
+    items += [
+        {"process_id": ids[ProcessStage.TURNITIN][0], "to_stage": "inscripcion"},
+        {"process_id": 9999, "to_stage": "turnitin"},
+        {"process_id": ids[ProcessStage.ENROLLMENT][0], "to_stage": "turnitin"},
+    ]
+    response = client.post(f"{settings.GLOBAL_PREFIX}/procesos/transiciones", json={"items": items, "actor": "secretaria"})
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["applied"], report["rejected"]) == (6, 3)
+    assert [result["error"] for result in report["results"][-3:]] == [
+        "Transición no permitida: turnitin -> inscripcion", "El proceso no existe", "Proceso repetido en el lote",
+    ]
+
+    session.expire_all()
+    stages = session.exec(select(Process.current_stage)).all()
+    assert set(stages) == {ProcessStage.TURNITIN}
+    audit = session.exec(select(ProcessTransition)).all()
+    assert len(audit) == 6
+    assert {(row.from_stage, row.to_stage, row.actor) for row in audit} == {(ProcessStage.ENROLLMENT, ProcessStage.TURNITIN, "secretaria")}
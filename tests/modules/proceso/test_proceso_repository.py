@@ -0,0 +1,38 @@
+"""Pruebas del repositorio de procesos."""
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.modules.proceso.models.process import ProcessStage
+from app.modules.proceso.repository.repository import ProcessRepository
+from app.modules.proceso.services.service import ProcessService
+
+def test_list_processes_constant_statement_count(session: Session, processes):
+    """Una página de N procesos con estudiante, programa y asesor cuesta una sola sentencia."""
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        page = ProcessService(ProcessRepository(session)).list_processes(limit=10)
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+
+    assert len(page.items) == 10
+    assert page.items[0].student.program_name == "Maestría en Educación"
+    assert page.items[0].teacher.dni == "40000000"
+    assert len(statements) == 1
+
+def test_list_processes_filters_and_cursor(session: Session, processes):
+    """Filtra por etapa y asesor y pagina por id_proceso."""
+    service = ProcessService(ProcessRepository(session))
+
+    turnitin = service.list_processes(limit=10, stage=ProcessStage.TURNITIN)
+    assert len(turnitin.items) == 4
+
+    first = service.list_processes(limit=3, advisor_id=processes[0])
+    second = service.list_processes(limit=3, advisor_id=processes[0], cursor=first.next_cursor)
+    assert first.next_cursor is not None
+    assert second.next_cursor is None
+    assert len(first.items) + len(second.items) == 5
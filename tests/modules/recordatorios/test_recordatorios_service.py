@@ -0,0 +1,68 @@
+"""Pruebas de la generación y el envío de recordatorios."""
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.recordatorios.models.reminder import Reminder, ReminderKind, ReminderStatus
+from app.modules.recordatorios.services.scheduler import ReminderScheduler
+
+class FlakySender:
+    """Falla el primer envío de cada recordatorio y registra los entregados."""
+
+    def __init__(self) -> None:
+        self.failed: set[int] = set()
+        self.sent: list[int] = []
+
+    def send(self, reminder: Reminder) -> None:
+        if reminder.id not in self.failed:
+            self.failed.add(reminder.id) # type: ignore[arg-type]
+            raise ConnectionError("canal no disponible")
+        self.sent.append(reminder.id) # type: ignore[arg-type]
+
+def test_license_reminders_follow_teacher(session: Session):
+    """Guardar un docente con licencia programa su aviso; cambiar la fecha lo reprograma."""
+    end = date.today() + timedelta(days=60)
+    teacher = Teacher(dni="40000001", name="Ana", paternal_surname="Paz", maternal_surname="Soto",
+                      academic_degree=AcademicDegree.DOCTORATE, academic_email="ana@unmsm.edu.pe", license_end_date=end)
+    session.add(teacher)
+    session.commit()
+
+    pending = session.exec(select(Reminder).where(Reminder.status == ReminderStatus.PENDING)).all()
+    assert [(reminder.kind, reminder.reference_id, reminder.recipient) for reminder in pending] == [
+        (ReminderKind.LICENSE_EXPIRATION, teacher.id, "ana@unmsm.edu.pe"),
+    ]
+    assert pending[0].due_at.date() == end - timedelta(days=15)
+
+    teacher.license_end_date = end + timedelta(days=30)
+    session.add(teacher)
+    session.commit()
+    statuses = sorted((reminder.status, reminder.due_at.date()) for reminder in session.exec(select(Reminder)).all())
+    assert statuses == [
+        (ReminderStatus.CANCELLED, end - timedelta(days=15)),
+        (ReminderStatus.PENDING, end + timedelta(days=15)),
+    ]
+
+def test_scheduler_claims_due_and_retries(session: Session):
+    """Solo se envían los vencidos; un fallo se reintenta más tarde y luego se marca enviado."""
+    now = datetime(2025, 3, 1, 8)
+    session.add_all([
+        Reminder(kind=ReminderKind.STAGE_DEADLINE, reference_id=i, message=f"Aviso {i}", due_at=now - timedelta(hours=i))
+        for i in range(3)
+    ] + [Reminder(kind=ReminderKind.STAGE_DEADLINE, reference_id=9, message="Futuro", due_at=now + timedelta(days=1))])
+    session.commit()
+
+    sender = FlakySender()
+    scheduler = ReminderScheduler(lambda: Session(session.get_bind()), sender, batch_size=2)
+    assert scheduler.run_once(now)[0] == 2
+    assert scheduler.run_once(now)[0] == 1
+    claimed, next_due = scheduler.run_once(now)
+    assert claimed == 0 and next_due == now + timedelta(minutes=2)
+
+    assert scheduler.run_once(now + timedelta(minutes=2))[0] == 2
+    claimed, next_due = scheduler.run_once(now + timedelta(minutes=2))
+    assert claimed == 1 and next_due == now + timedelta(days=1)
+    session.expire_all()
+    sent = session.exec(select(Reminder).where(Reminder.status == ReminderStatus.SENT)).all()
+    assert sorted(reminder.reference_id for reminder in sent) == [0, 1, 2]
+    assert all(reminder.attempts == 2 and reminder.last_error == "canal no disponible" for reminder in sent)
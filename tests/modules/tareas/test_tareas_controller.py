@@ -0,0 +1,86 @@
+"""Pruebas del controlador de tareas."""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.modules.docentes.models.teacher import Teacher, AcademicDegree
+from app.modules.estudiantes.models.program import Program, DegreeProgram, StatusProgram
+from app.modules.estudiantes.models.program_student import ProgramStudent, StatusStudentProgram
+from app.modules.estudiantes.models.student import Student, StatusStudent, TypeDocumentStudent
+from app.modules.proceso.models.process import Process
+
+TASKS_URL = f"{settings.GLOBAL_PREFIX}/tareas"
+
+@pytest.fixture(name="process_id")
+def process_id_fixture(session: Session):
+    """Un proceso sin tareas."""
+    program = Program(name="Maestría en Educación", degree=DegreeProgram.MASTER, status=StatusProgram.ACTIVE)
+    advisor = Teacher(dni="40000001", name="Docente", paternal_surname="Paz", maternal_surname="Soto", academic_degree=AcademicDegree.DOCTORATE)
+    student = Student(
+        name="Nombre", paternal_surname="Rojas", maternal_surname="Huamán",
+        identity_document="70000001", type_document=TypeDocumentStudent.DNI, status=StatusStudent.ACTIVE,
+    )
+    session.add_all([program, advisor, student])
+    session.flush()
+    program_student = ProgramStudent(program_id=program.id, student_id=student.id, code="20240001", status=StatusStudentProgram.ACTIVE, admission_year=2024)
+    session.add(program_student)
+    session.flush()
+    process = Process(id_student_program=program_student.id, id_advisor=advisor.id, start_date=datetime(2025, 1, 1))
+    session.add(process)
+    session.commit()
+    return process.id
+
+def test_dependencies_unblock_tasks(client: TestClient, process_id):
+    """Cerrar las previas libera a sus dependientes; "mis tareas" solo muestra las accionables."""
+    created = client.post(f"{TASKS_URL}/procesos/{process_id}", json={"items": [
+        {"name": "Recibir informe", "stage": "turnitin", "assignee": "secretaria"},
+        {"name": "Revisar originalidad", "stage": "turnitin", "assignee": "secretaria"},
+        {"name": "Emitir constancia", "stage": "turnitin", "assignee": "asesor", "depends_on_items": [0, 1]},
+    ]})
+    assert created.status_code == 201
+    first, second, third = [task["id"] for task in created.json()]
+    assert created.json()[2]["pending_dependencies"] == 2
+
+    next_ids = [task["id"] for task in client.get(f"{TASKS_URL}/procesos/{process_id}/siguientes").json()]
+    assert next_ids == [first, second]
+    assert client.get(TASKS_URL, params={"assignee": "asesor"}).json()["items"] == []
+    assert len(client.get(TASKS_URL, params={"assignee": "asesor", "actionable_only": False}).json()["items"]) == 1
+    assert client.patch(f"{TASKS_URL}/{third}/estado", json={"status": "completada"}).status_code == 400
+
+    assert client.patch(f"{TASKS_URL}/{first}/estado", json={"status": "completada"}).json()["unblocked"] == []
+    report = client.patch(f"{TASKS_URL}/{second}/estado", json={"status": "cancelada"}).json()
+    assert report["unblocked"] == [third]
+    assert [task["id"] for task in client.get(TASKS_URL, params={"assignee": "asesor"}).json()["items"]] == [third]
+
+    client.patch(f"{TASKS_URL}/{first}/estado", json={"status": "pendiente"})
+    assert client.get(TASKS_URL, params={"assignee": "asesor"}).json()["items"] == []
+
+def test_dependency_cycle_rejected(client: TestClient, process_id):
+    """No se permite una dependencia que cierre un ciclo ni una hacia otra tarea inexistente."""
+    created = client.post(f"{TASKS_URL}/procesos/{process_id}", json={"items": [
+        {"name": "A"}, {"name": "B", "depends_on_items": [0]}, {"name": "C", "depends_on_items": [1]},
+    ]}).json()
+    a, _, c = [task["id"] for task in created]
+    response = client.post(f"{TASKS_URL}/{a}/dependencias", json={"depends_on": c})
+    assert response.status_code == 400
+    assert "ciclo" in response.json()["message"]
+    assert client.post(f"{TASKS_URL}/{a}/dependencias", json={"depends_on": 999}).status_code == 404
+
+    added = client.post(f"{TASKS_URL}/procesos/{process_id}", json={"items": [{"name": "D", "depends_on": [c]}]}).json()[0]
+    assert added["pending_dependencies"] == 1
+    assert client.post(f"{TASKS_URL}/procesos/{process_id}", json={"items": [{"name": "E", "depends_on_items": [0]}]}).status_code == 400
+
+def test_dependency_on_started_task_rejected(client: TestClient, process_id):
+    """Una tarea en progreso o cerrada no puede ganar dependencias pendientes."""
+    first, second = [task["id"] for task in client.post(f"{TASKS_URL}/procesos/{process_id}", json={"items": [{"name": "A"}, {"name": "B"}]}).json()]
+    client.patch(f"{TASKS_URL}/{first}/estado", json={"status": "en_progreso"})
+    response = client.post(f"{TASKS_URL}/{first}/dependencias", json={"depends_on": second})
+    assert response.status_code == 400
+    assert "pendiente" in response.json()["message"]
+
+    client.patch(f"{TASKS_URL}/{first}/estado", json={"status": "completada"})
+    assert client.post(f"{TASKS_URL}/{first}/dependencias", json={"depends_on": second}).status_code == 400
+    assert client.post(f"{TASKS_URL}/{second}/dependencias", json={"depends_on": first}).json()["pending_dependencies"] == 0
@@ -0,0 +1,113 @@
+"""Pruebas de la cola de trabajos y su worker."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app.modules.trabajos.models.job import Job, JobStatus
+from app.modules.trabajos.repository.repository import JobRepository
+from app.modules.trabajos.schemas.schema import JobCreate
+from app.modules.trabajos.services.registry import JobContext, job_handler
+from app.modules.trabajos.services.service import JobService
+from app.modules.trabajos.services.worker import JobWorker
+
+calls: list[int] = []
+
+@job_handler("prueba.contar")
+def count_handler(context: JobContext) -> dict:
+    for step in range(1, 4):
+        context.report(step * 33, f"paso {step}")
+    calls.append(context.job_id)
+    return {"total": context.params["n"] * 2}
+
+@job_handler("prueba.falla")
+def failing_handler(context: JobContext) -> None:
+    raise RuntimeError(f"intento {context.attempt}")
+
+@job_handler("prueba.cancelable")
+def cancellable_handler(context: JobContext) -> None:
+    with context.session() as session:
+        JobService(JobRepository(session)).cancel(context.job_id)
+    context.report(100)
+
+@pytest.fixture(name="worker")
+def worker_fixture(session: Session) -> JobWorker:
+    calls.clear()
+    engine = session.get_bind()
+    return JobWorker(lambda: Session(engine), concurrency=2, poll_interval=0.05, retry_base=timedelta(seconds=30))
+
+def test_enqueue_is_idempotent_and_worker_completes(session: Session, worker: JobWorker):
+    """La misma clave devuelve el mismo trabajo; el worker lo ejecuta una vez y guarda progreso y resultado."""
+    service = JobService(JobRepository(session))
+    first = service.enqueue(JobCreate(kind="prueba.contar", params={"n": 21}, idempotency_key="acta-7"))
+    again = service.enqueue(JobCreate(kind="prueba.contar", params={"n": 21}, idempotency_key="acta-7"))
+    assert first.id == again.id
+
+    assert worker.run_once() == 1
+    assert worker.run_once() == 0
+    session.expire_all()
+    job = service.get(first.id) # type: ignore[arg-type]
+    assert (job.status, job.progress, job.result, job.attempts) == (JobStatus.DONE, 100, {"total": 42}, 1)
+    assert calls == [first.id]
+
+def test_retries_with_backoff_then_fails(session: Session, worker: JobWorker):
+    """Cada fallo reprograma con espera exponencial; al agotar los intentos queda fallido."""
+    service = JobService(JobRepository(session))
+    job_id = service.enqueue(JobCreate(kind="prueba.falla")).id
+    job = session.get(Job, job_id)
+    job.max_attempts = 3 # type: ignore[union-attr]
+    session.commit()
+
+    now = datetime.now()
+    delays = []
+    for _ in range(3):
+        assert worker.run_once(now) == 1
+        session.expire_all()
+        job = session.get(Job, job_id)
+        if job.status == JobStatus.PENDING: # type: ignore[union-attr]
+            delays.append(job.run_at - datetime.now()) # type: ignore[union-attr]
+            assert worker.run_once(now) == 0
+            now = job.run_at # type: ignore[union-attr]
+    assert [round(delay.total_seconds() / 30) for delay in delays] == [1, 2]
+    assert job.status == JobStatus.FAILED and job.last_error == "RuntimeError: intento 3" # type: ignore[union-attr]
+
+def test_expired_lease_is_requeued_and_cancel_interrupts(session: Session, worker: JobWorker):
+    """Un trabajo de un worker caído vuelve a la cola; cancelar detiene al manejador en su próximo reporte."""
+    service = JobService(JobRepository(session))
+    job_id = service.enqueue(JobCreate(kind="prueba.contar", params={"n": 1})).id
+    now = datetime.now()
+    claimed, _ = worker.claim(1, now)
+    assert [job.id for job in claimed] == [job_id]
+    assert worker.claim(1, now)[0] == []
+
+    # El worker que lo tenía no volvió a reportar: al vencer la toma lo retoma otro
+    retaken, _ = worker.claim(1, now + worker.lease + timedelta(seconds=1))
+    assert retaken[0].attempt == 2
+    assert worker.execute(claimed[0]) is None
+    assert worker.execute(retaken[0]) == JobStatus.DONE
+
+    cancelled = service.enqueue(JobCreate(kind="prueba.cancelable")).id
+    jobs, _ = worker.claim(1)
+    assert worker.execute(jobs[0]) is None
+    session.expire_all()
+    assert service.get(cancelled).status == JobStatus.CANCELLED # type: ignore[arg-type]
+
+def test_async_worker_drains_queue(session: Session, worker: JobWorker):
+    """El bucle asíncrono toma trabajos a medida que se liberan huecos y vacía la cola."""
+    service = JobService(JobRepository(session))
+    ids = [service.enqueue(JobCreate(kind="prueba.contar", params={"n": i})).id for i in range(5)]
+    # Las pruebas comparten una sola conexión SQLite (StaticPool); dos trabajos en hilos a la vez cruzarían sus commits
+    worker.concurrency = 1
+
+    async def scenario():
+        task = asyncio.create_task(worker.run())
+        for _ in range(200):
+            if len(calls) == len(ids):
+                break
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await task
+
+    asyncio.run(scenario())
+    assert sorted(calls) == ids
@@ -0,0 +1,76 @@
+"""Pruebas de las dependencias de sesión de base de datos."""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, StaticPool, create_engine
+
+from app.core import database
+from app.core.config import settings
+from app.core.exceptions import DatabaseIntegrityError
+from app.main import app
+
+def test_async_session_commits_and_maps_errors(monkeypatch):
+    """get_async_session confirma al terminar y traduce los errores de integridad."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    monkeypatch.setattr(database, "async_engine", engine)
+
+    async def scenario():
+        sessions = database.get_async_session()
+        session = await anext(sessions)
+        await session.exec(text("CREATE TABLE etiqueta (id INTEGER PRIMARY KEY)"))
+        await session.exec(text("INSERT INTO etiqueta (id) VALUES (1)"))
+        with pytest.raises(StopAsyncIteration):
+            await anext(sessions)
+
+        sessions = database.get_async_session()
+        session = await anext(sessions)
+        with pytest.raises(DatabaseIntegrityError):
+            try:
+                await session.exec(text("INSERT INTO etiqueta (id) VALUES (1)"))
+            except Exception as e: # pylint: disable=broad-except
+                await sessions.athrow(e)
+
+        async with engine.connect() as connection:
+            assert (await connection.execute(text("SELECT count(*) FROM etiqueta"))).scalar_one() == 1
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+def test_async_session_requires_engine(monkeypatch):
+    """Sin DATABASE_ASYNC la dependencia falla con un error de conexión claro."""
+    monkeypatch.setattr(database, "async_engine", None)
+
+    async def scenario():
+        await anext(database.get_async_session())
+
+    with pytest.raises(database.DatabaseConnectionError):
+        asyncio.run(scenario())
+
+def test_endpoints_run_on_async_engine(monkeypatch, tmp_path):
+    """Con DATABASE_ASYNC los endpoints ejecutan sus servicios sobre el motor asíncrono, sin threadpool."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    SQLModel.metadata.create_all(create_engine(url))
+    engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"), poolclass=NullPool)
+    monkeypatch.setattr(settings, "DATABASE_ASYNC", True)
+    monkeypatch.setattr(database, "async_engine", engine)
+    threadpool_calls = []
+    monkeypatch.setattr(database, "run_in_threadpool", lambda *args, **kwargs: threadpool_calls.append(args))
+
+    # Las rutas dependen de get_session porque la app se importó en modo síncrono
+    app.dependency_overrides[database.get_session] = database._get_async_backed_session # pylint: disable=protected-access
+    try:
+        with TestClient(app) as client:
+            rooms = f"{settings.STAGE_PREFIX}/acto_publico/salas"
+            assert client.post(rooms, json={"name": "Auditorio"}).status_code == 201
+            assert [room["name"] for room in client.get(rooms).json()] == ["Auditorio"]
+
+            categories = f"{settings.GLOBAL_PREFIX}/documentos/categorias"
+            assert client.post(categories, json={"full_name": "Acta"}).status_code == 201
+            assert [item["full_name"] for item in client.get(categories).json()] == ["Acta"]
+    finally:
+        app.dependency_overrides.clear()
+    assert threadpool_calls == []
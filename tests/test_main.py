@@ -64,4 +64,45 @@ def test_app_title():
     """
     Verifica que el título se haya cargado desde la configuración.
     """
-    assert app.title == settings.PROJECT_NAME
\ No newline at end of file
+    assert app.title == settings.PROJECT_NAME
+
+def test_db_pool_metrics(monkeypatch):
+    """
+    Verifica que el endpoint interno exponga el estado del pool de conexiones
+    solo si está habilitado y con el token configurado.
+    """
+    url = f"{settings.INTERNAL_PREFIX}/db-pool"
+    assert client.get(url).status_code == 404
+
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_ENABLED", True)
+    monkeypatch.setattr(settings, "INTERNAL_TOKEN", "token-interno")
+    internal_client = TestClient(create())
+    assert internal_client.get(url).status_code == 403
+    assert internal_client.get(url, headers={"X-Internal-Token": "otro"}).status_code == 403
+
+    response = internal_client.get(url, headers={"X-Internal-Token": "token-interno"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool_class"] == "InstrumentedQueuePool"
+    assert {"checked_out", "idle", "overflow", "connections_created", "wait_max_ms"} <= data.keys()
+
+def test_request_id_header():
+    """
+    Verifica que el middleware de logging propague o genere el X-Request-ID.
+    """
+    response = client.get("/", headers={"X-Request-ID": "abc-123"})
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+    response = client.get("/")
+    assert len(response.headers["X-Request-ID"]) == 36
+
+def test_create_with_module_subset():
+    """
+    Verifica que la factory monte solo los routers pedidos y registre su perfil de arranque.
+    """
+    stage_app = create(modules=["stage"])
+    response = TestClient(stage_app).get(f"{settings.GLOBAL_PREFIX}/estudiantes/ping")
+
+    assert response.status_code == 404
+    assert "mount:turnitin" in stage_app.state.startup_profile.timings
+    assert "mount:estudiantes" not in stage_app.state.startup_profile.timings